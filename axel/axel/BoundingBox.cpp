@@ -46,6 +46,12 @@ ScalarType BoundingBox<ScalarType>::squaredVolume() const {
   return aabb.diagonal().squaredNorm();
 }
 
+template <typename ScalarType>
+ScalarType BoundingBox<ScalarType>::surfaceArea() const {
+  const Eigen::Vector3<ScalarType> sizes = aabb.sizes();
+  return 2 * (sizes.x() * sizes.y() + sizes.y() * sizes.z() + sizes.z() * sizes.x());
+}
+
 // Reference:
 // https://www.scratchapixel.com/lessons/3d-basic-rendering/minimal-ray-tracer-rendering-simple-shapes/ray-box-intersection
 template <typename ScalarType>
@@ -29,6 +29,9 @@ struct BoundingBox {
   /// Returns the squared volume of the bounding box.
   [[nodiscard]] Scalar squaredVolume() const;
 
+  /// Returns the surface area of the bounding box.
+  [[nodiscard]] Scalar surfaceArea() const;
+
   void extend(const Eigen::Vector3<Scalar>& p);
   void extend(const BoundingBox& b);
 
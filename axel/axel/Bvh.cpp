@@ -22,8 +22,13 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 #include "axel/Bvh.h"
 
+#include <algorithm>
 #include <array>
 
+#ifndef AXEL_NO_DISPENSO
+#include <dispenso/parallel_for.h>
+#endif
+
 #include "axel/math/PointTriangleProjection.h"
 #include "axel/math/RayTriangleIntersection.h"
 
@@ -165,40 +170,69 @@ Size Bvh<S, LeafCapacity>::getPrimitiveCount() const {
   return buildPrimitives_.size();
 }
 
-namespace {
-
-template <typename S>
-void refitRecurse(
-    std::vector<BvhFlatNode<S>>& nodes,
-    const Index index,
-    const std::vector<BoundingBox<S>>& primitives) {
-  auto& node = nodes[index];
-  if (node.isLeaf()) {
-    node.bbox = primitives[node.start];
-    node.eachPrimitive(primitives, 1, [&](const BoundingBox<S>& prim) { node.bbox.extend(prim); });
+template <typename S, size_t LeafCapacity>
+void Bvh<S, LeafCapacity>::refit() {
+  if (nodeCount_ == 0) {
     return;
   }
 
-  const auto leftChildIndex = node.getLeftIndex(index);
-  const auto rightChildIndex = node.getRightIndex(index);
-  refitRecurse<S>(nodes, leftChildIndex, primitives);
-  refitRecurse<S>(nodes, rightChildIndex, primitives);
+  // Below this many nodes a tree level is refitted serially; the upper levels of the tree are too
+  // small to be worth scheduling.
+  constexpr uint32_t kMinParallelLevelSize = 1024;
 
-  const auto& leftChild = nodes[leftChildIndex];
-  const auto& rightChild = nodes[rightChildIndex];
-  node.bbox.extend(leftChild.bbox);
-  node.bbox.extend(rightChild.bbox);
-}
+  const auto refitNode = [this](const uint32_t index) {
+    auto& node = flatTree_[index];
+    if (node.isLeaf()) {
+      node.bbox = buildPrimitives_[node.start];
+      node.eachPrimitive(
+          buildPrimitives_, 1, [&](const BoundingBox<S>& prim) { node.bbox.extend(prim); });
+      return;
+    }
 
-} // namespace
+    // Reset from the children rather than extending the old bounds, so that the bounds can also
+    // shrink.
+    node.bbox = flatTree_[node.getLeftIndex(index)].bbox;
+    node.bbox.extend(flatTree_[node.getRightIndex(index)].bbox);
+  };
+
+  // Each level only depends on the levels below it, which have already been refitted.
+  for (size_t iLevel = 0; iLevel + 1 < refitLevelOffsets_.size(); ++iLevel) {
+    const uint32_t levelStart = refitLevelOffsets_[iLevel];
+    const uint32_t levelEnd = refitLevelOffsets_[iLevel + 1];
+#ifndef AXEL_NO_DISPENSO
+    if (levelEnd - levelStart >= kMinParallelLevelSize) {
+      dispenso::parallel_for(
+          dispenso::makeChunkedRange(levelStart, levelEnd, dispenso::ParForChunking::kAuto),
+          [&](const uint32_t chunkStart, const uint32_t chunkEnd) {
+            for (uint32_t i = chunkStart; i < chunkEnd; ++i) {
+              refitNode(refitOrder_[i]);
+            }
+          });
+      continue;
+    }
+#endif
+    for (uint32_t i = levelStart; i < levelEnd; ++i) {
+      refitNode(refitOrder_[i]);
+    }
+  }
+}
 
 template <typename S, size_t LeafCapacity>
-void Bvh<S, LeafCapacity>::refit() {
+S Bvh<S, LeafCapacity>::computeSurfaceAreaCost() const {
   if (nodeCount_ == 0) {
-    return;
+    return 0;
+  }
+
+  const S rootArea = flatTree_[0].bbox.surfaceArea();
+  if (rootArea <= 0) {
+    return 1;
   }
 
-  refitRecurse<S>(flatTree_, 0, buildPrimitives_);
+  S totalArea = 0;
+  for (const auto& node : flatTree_) {
+    totalArea += node.bbox.surfaceArea();
+  }
+  return totalArea / rootArea;
 }
 
 namespace {
@@ -214,6 +248,8 @@ struct BvhBuildEntry {
 template <typename S, size_t LeafCapacity>
 void Bvh<S, LeafCapacity>::build() {
   flatTree_.clear();
+  refitOrder_.clear();
+  refitLevelOffsets_.clear();
   nodeCount_ = 0;
 
   if (buildPrimitives_.empty()) {
@@ -318,6 +354,39 @@ void Bvh<S, LeafCapacity>::build() {
     todoStack[stackPtr].parent = nodeCount_ - 1;
     stackPtr++;
   }
+
+  buildRefitLevels();
+}
+
+template <typename S, size_t LeafCapacity>
+void Bvh<S, LeafCapacity>::buildRefitLevels() {
+  // Parents always precede their children in the flat tree, so a single forward pass assigns the
+  // depths.
+  std::vector<uint32_t> depths(flatTree_.size(), 0);
+  uint32_t maxDepth = 0;
+  for (uint32_t i = 0; i < flatTree_.size(); ++i) {
+    const auto& node = flatTree_[i];
+    if (!node.isLeaf()) {
+      depths[node.getLeftIndex(i)] = depths[i] + 1;
+      depths[node.getRightIndex(i)] = depths[i] + 1;
+      maxDepth = std::max(maxDepth, depths[i] + 1);
+    }
+  }
+
+  // Counting sort by decreasing depth.
+  refitLevelOffsets_.assign(maxDepth + 2, 0);
+  for (const uint32_t depth : depths) {
+    refitLevelOffsets_[maxDepth - depth + 1]++;
+  }
+  for (size_t i = 1; i < refitLevelOffsets_.size(); ++i) {
+    refitLevelOffsets_[i] += refitLevelOffsets_[i - 1];
+  }
+
+  refitOrder_.resize(flatTree_.size());
+  std::vector<uint32_t> next(refitLevelOffsets_.begin(), refitLevelOffsets_.end() - 1);
+  for (uint32_t i = 0; i < flatTree_.size(); ++i) {
+    refitOrder_[next[maxDepth - depths[i]]++] = i;
+  }
 }
 
 namespace {
@@ -22,10 +22,12 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 #pragma once
 
+#include <span>
 #include <vector>
 
 #include "axel/BvhBase.h"
 #include "axel/BvhCommon.h"
+#include "axel/Ray.h"
 #include "axel/common/Types.h"
 #include "axel/common/VectorizationTypes.h"
 
@@ -112,9 +114,15 @@ class Bvh final : public BvhBase<S> {
   [[nodiscard]] const std::vector<BoundingBox<S>>& getPrimitives() const;
 
   // Refits the tree to account for changes in the bounding boxes of leaf nodes. This is achieved
-  // by updating the entire tree in a bottom-up manner to ensure accurate collision detection.
+  // by updating the entire tree in a bottom-up manner, one tree level at a time with the nodes of
+  // each level processed in parallel, to ensure accurate collision detection.
   void refit();
 
+  // Returns the sum of the surface areas of all nodes relative to the surface area of the root.
+  // This is proportional to the expected cost of a query under the surface area heuristic, so it
+  // can be used to measure how much a refitted tree has degraded compared to a fresh build.
+  [[nodiscard]] S computeSurfaceAreaCost() const;
+
   // Queries the BVH for bounding boxes intersecting with the specified box.
   [[nodiscard]] std::vector<uint32_t> query(const BoundingBox<S>& box) const override;
 
@@ -156,6 +164,17 @@ class Bvh final : public BvhBase<S> {
       S maxT,
       RayPrimitiveIntersector&& func) const;
 
+  // Queries the BVH with a packet of rays that traverse the tree together, which amortizes the node
+  // visits over coherent rays such as the pixels of an image tile. A node is only visited by the
+  // rays that enter its bounding box within [ray.minT, maxT[i]], and nearer children are visited
+  // first. The callback is invoked with a primitive index and a ray index in the packet, and may
+  // shorten maxT[i] to cull the remaining traversal for that ray.
+  template <typename RayPacketPrimitiveIntersector>
+  void rayPacketQueryClosestHit(
+      std::span<const Ray3<S>> rays,
+      std::span<S> maxT,
+      RayPacketPrimitiveIntersector&& func) const;
+
   // Invokes the provided callback function for each pair of overlapping bounding boxes within this
   // BVH. The callback function should return false if the traversal should stop, or false
   // otherwise.
@@ -180,6 +199,9 @@ class Bvh final : public BvhBase<S> {
   [[nodiscard]] bool checkBoundingBoxes() const;
 
  private:
+  // Computes refitOrder_ and refitLevelOffsets_ from the flat tree.
+  void buildRefitLevels();
+
   // This bool is used to select either a scalar or a packet-based callback type.
   template <bool IsPacket, bool NeedBarycentric, typename ClosestSurfacePointFunc>
   S queryClosestHelper(
@@ -192,6 +214,11 @@ class Bvh final : public BvhBase<S> {
   std::vector<BvhFlatNode<S>> flatTree_;
   std::vector<BoundingBox<S>> buildPrimitives_;
 
+  // Node indices sorted from the deepest tree level to the root, and the offsets of each level into
+  // that list. Nodes within a level are independent, which lets refit() process them in parallel.
+  std::vector<uint32_t> refitOrder_;
+  std::vector<uint32_t> refitLevelOffsets_;
+
   Size nodeCount_{0};
 };
 
@@ -670,6 +697,91 @@ bool Bvh<S, LeafCapacity>::rayQueryAnyHit(
   return false;
 }
 
+template <typename S, size_t LeafCapacity>
+template <typename RayPacketPrimitiveIntersector>
+void Bvh<S, LeafCapacity>::rayPacketQueryClosestHit(
+    std::span<const Ray3<S>> rays,
+    std::span<S> maxT,
+    RayPacketPrimitiveIntersector&& func) const {
+  static_assert(
+      std::is_invocable_r_v<void, RayPacketPrimitiveIntersector, Index, Index, S&>,
+      "Callback function must be invocable with a primitive index, a ray index and the maximum distance of that ray to update.");
+  XR_CHECK(rays.size() == maxT.size());
+
+  const auto numRays = static_cast<Index>(rays.size());
+  if (numRays == 0 || nodeCount_ == 0) {
+    return;
+  }
+
+  std::vector<Eigen::Vector3<S>> dirInv(numRays);
+  for (Index i = 0; i < numRays; ++i) {
+    dirInv[i] = rays[i].direction.cwiseInverse();
+  }
+
+  // Returns the distance at which ray i enters the box, or infinity if it misses the box within its
+  // current range.
+  const auto entryDistance = [&](const BoundingBox<S>& box, const Index i) -> S {
+    const Eigen::Vector3<S>& bmin = box.aabb.min();
+    const Eigen::Vector3<S>& bmax = box.aabb.max();
+    const Eigen::Vector3<S>& origin = rays[i].origin;
+
+    S tmin = rays[i].minT;
+    S tmax = maxT[i];
+    for (int32_t k = 0; k < 3; ++k) {
+      const S t1 = (bmin[k] - origin[k]) * dirInv[i][k];
+      const S t2 = (bmax[k] - origin[k]) * dirInv[i][k];
+
+      // These mins and maxs rely on standard NaN comparison to work for all edge-cases.
+      tmin = std::min(std::max(tmin, t1), std::max(tmin, t2));
+      tmax = std::max(std::min(tmax, t1), std::min(tmax, t2));
+    }
+    return tmin <= tmax ? tmin : std::numeric_limits<S>::infinity();
+  };
+
+  // Each stack entry holds a node and the first ray of the packet that may still reach it. Rays
+  // before it already missed an ancestor, so they never need to be tested against the node again.
+  std::array<std::pair<uint32_t, Index>, kMaxStackDepth> todoStack{};
+  Index stackLevel = 0;
+  todoStack[stackLevel] = {0, 0}; // Start from the root, node 0, with the whole packet.
+
+  while (stackLevel >= 0) {
+    // Pop off the next node to work on.
+    const auto [currNode, firstCandidate] = todoStack[stackLevel--];
+    const auto& node(flatTree_[currNode]);
+
+    // The ranges of the rays may have shrunk since the node was pushed, so find the first ray that
+    // still enters it.
+    Index firstRay = firstCandidate;
+    while (firstRay < numRays &&
+           entryDistance(node.bbox, firstRay) == std::numeric_limits<S>::infinity()) {
+      ++firstRay;
+    }
+    if (firstRay == numRays) {
+      continue;
+    }
+
+    if (node.isLeaf()) {
+      for (Index i = firstRay; i < numRays; ++i) {
+        if (i == firstRay || entryDistance(node.bbox, i) != std::numeric_limits<S>::infinity()) {
+          node.eachPrimitive(
+              buildPrimitives_, [&](const BoundingBox<S>& prim) { func(prim.id, i, maxT[i]); });
+        }
+      }
+    } else { // Not a leaf => internal node with 2 children boxes.
+      uint32_t nearChild = node.getLeftIndex(currNode);
+      uint32_t farChild = node.getRightIndex(currNode);
+      if (entryDistance(flatTree_[farChild].bbox, firstRay) <
+          entryDistance(flatTree_[nearChild].bbox, firstRay)) {
+        std::swap(nearChild, farChild);
+      }
+      // Push the far child first, so that the near child is popped first and shortens the ranges
+      // of the rays before the far child is tested.
+      todoStack[++stackLevel] = {farChild, firstRay};
+      todoStack[++stackLevel] = {nearChild, firstRay};
+    }
+  }
+}
+
 template <typename S, size_t LeafCapacity>
 template <typename Callback>
 void Bvh<S, LeafCapacity>::traverseOverlappingPairs(Callback&& func) const {
@@ -8,8 +8,11 @@
 #include "axel/DualContouring.h"
 
 #include <algorithm>
+#include <cassert>
 #include <cmath>
-#include <unordered_set>
+#include <numeric>
+
+#include "axel/common/Parallel.h"
 
 namespace axel {
 
@@ -19,18 +22,6 @@ namespace axel {
 
 namespace detail {
 
-/**
- * Hash function for 3D grid indices.
- */
-struct GridIndexHash {
-  std::size_t operator()(const Eigen::Vector3<Index>& idx) const {
-    return std::hash<Index>{}(idx.x()) ^ (std::hash<Index>{}(idx.y()) << 1) ^
-        (std::hash<Index>{}(idx.z()) << 2);
-  }
-};
-
-using CellVertexMap = std::unordered_map<Eigen::Vector3<Index>, Index, GridIndexHash>;
-
 /**
  * Check if a value is inside the isosurface (negative side).
  *
@@ -43,6 +34,11 @@ bool isInside(ScalarType val, ScalarType isovalue) {
   return val <= isovalue;
 }
 
+/**
+ * Maximum distance a vertex is moved from its cell center, in units of the largest voxel size.
+ */
+constexpr double kMaxVertexOffset = 2.0;
+
 /**
  * Push a vertex toward the zero level set using gradient descent.
  * Uses Newton's method to iteratively move the vertex closer to the target isovalue.
@@ -81,7 +77,7 @@ Eigen::Vector3<ScalarType> pushVertexToSurface(
     position -= stepSize * gradient.normalized();
 
     const auto voxelSize = sdf.voxelSize();
-    const ScalarType maxOffset = voxelSize.maxCoeff() * ScalarType{2.0};
+    const ScalarType maxOffset = voxelSize.maxCoeff() * static_cast<ScalarType>(kMaxVertexOffset);
     const auto offset = position - startPosition;
     if (offset.norm() > maxOffset) {
       position = startPosition + offset.normalized() * maxOffset;
@@ -92,6 +88,30 @@ Eigen::Vector3<ScalarType> pushVertexToSurface(
   return position;
 }
 
+/**
+ * Number of cells along each axis around an edited voxel whose vertices or quads can change.
+ *
+ * A vertex samples the SDF up to kMaxVertexOffset * voxelSize.maxCoeff() away from its cell
+ * center, which is r = kMaxVertexOffset * voxelSize.maxCoeff() / voxelSize[axis] voxels along an
+ * axis. Each sample reads the value and gradient from the 8 voxels around it, so cells up to
+ * ceil(r) + 1 voxels away from an edited voxel can move or change, which in turn changes the quads
+ * of edges one voxel further.
+ *
+ * @param sdf The signed distance field
+ * @return Margin in cells along each axis
+ */
+template <typename ScalarType>
+Eigen::Vector3<Index> updateMargin(const SignedDistanceField<ScalarType>& sdf) {
+  const auto& voxelSize = sdf.voxelSize();
+  Eigen::Vector3<Index> margin;
+  for (int axis = 0; axis < 3; ++axis) {
+    const double reach = kMaxVertexOffset * static_cast<double>(voxelSize.maxCoeff()) /
+        static_cast<double>(voxelSize[axis]);
+    margin[axis] = static_cast<Index>(std::ceil(reach)) + 2;
+  }
+  return margin;
+}
+
 /**
  * Check if a cell intersects the isosurface by looking for sign changes.
  *
@@ -111,42 +131,116 @@ bool cellIntersectsIsosurface(const std::array<ScalarType, 8>& cornerValues, Sca
 }
 
 /**
- * Find all cells that intersect the isosurface and create vertices.
+ * Grid of blocks of cells, with the helpers shared by the full and incremental extraction.
+ */
+struct BlockGrid {
+  explicit BlockGrid(const Eigen::Vector3<Index>& resolution)
+      : resolution(resolution),
+        cellResolution((resolution.array() - 1).max(0).matrix()),
+        blockResolution(((cellResolution.array() + (kBlockSize - 1)) / kBlockSize).matrix()) {}
+
+  static constexpr Index kBlockSize = IncrementalDualContouring<float>::kBlockSize;
+
+  [[nodiscard]] Size numBlocks() const {
+    return static_cast<Size>(blockResolution.x()) * blockResolution.y() * blockResolution.z();
+  }
+
+  [[nodiscard]] Eigen::Vector3<Index> block(Size blockIndex) const {
+    return {
+        static_cast<Index>(blockIndex % blockResolution.x()),
+        static_cast<Index>((blockIndex / blockResolution.x()) % blockResolution.y()),
+        static_cast<Index>(
+            blockIndex / (static_cast<Size>(blockResolution.x()) * blockResolution.y()))};
+  }
+
+  [[nodiscard]] Size blockIndex(const Eigen::Vector3<Index>& block) const {
+    return static_cast<Size>(block.z()) * blockResolution.x() * blockResolution.y() +
+        static_cast<Size>(block.y()) * blockResolution.x() + block.x();
+  }
+
+  [[nodiscard]] Size linearIndex(Index i, Index j, Index k) const {
+    return static_cast<Size>(k) * resolution.x() * resolution.y() +
+        static_cast<Size>(j) * resolution.x() + i;
+  }
+
+  [[nodiscard]] bool isValidCell(Index i, Index j, Index k) const {
+    return i >= 0 && j >= 0 && k >= 0 && i < cellResolution.x() && j < cellResolution.y() &&
+        k < cellResolution.z();
+  }
+
+  const Eigen::Vector3<Index> resolution;
+  const Eigen::Vector3<Index> cellResolution;
+  const Eigen::Vector3<Index> blockResolution;
+};
+
+/**
+ * Find the vertex of a cell among the vertices of the blocks.
+ *
+ * @param grid The block grid
+ * @param blocks Mesh pieces of all blocks
+ * @param i Cell index in x dimension
+ * @param j Cell index in y dimension
+ * @param k Cell index in z dimension
+ * @return Pair of (block index, index of the vertex within the block), or a block index of -1 if
+ *   the cell has no vertex
+ */
+template <typename ScalarType>
+std::pair<Index, Index> findCellVertex(
+    const BlockGrid& grid,
+    const std::vector<DualContouringBlock<ScalarType>>& blocks,
+    Index i,
+    Index j,
+    Index k) {
+  if (!grid.isValidCell(i, j, k)) {
+    return {-1, -1};
+  }
+  const Size blockIndex = grid.blockIndex(Eigen::Vector3<Index>(i, j, k) / BlockGrid::kBlockSize);
+  const auto& cells = blocks[blockIndex].cells;
+  const auto it = std::lower_bound(cells.begin(), cells.end(), grid.linearIndex(i, j, k));
+  if (it == cells.end() || *it != grid.linearIndex(i, j, k)) {
+    return {-1, -1};
+  }
+  return {static_cast<Index>(blockIndex), static_cast<Index>(it - cells.begin())};
+}
+
+/**
+ * Find the cells of a block that intersect the isosurface and create their vertices.
  * Places one vertex per intersecting cell, positioned on the surface using gradient descent.
  *
  * @param sdf The signed distance field
  * @param isovalue The isovalue to extract
- * @return Pair of (vertices, cellToVertexIndex map)
+ * @param grid The block grid
+ * @param blockIndex Index of the block to process
+ * @param block Output block; its cells and vertices are replaced
  */
 template <typename ScalarType>
-std::pair<std::vector<Eigen::Vector3<ScalarType>>, CellVertexMap>
-findIntersectingCellsAndCreateVertices(
+void createBlockVertices(
     const SignedDistanceField<ScalarType>& sdf,
-    ScalarType isovalue) {
-  const auto& resolution = sdf.resolution();
+    ScalarType isovalue,
+    const BlockGrid& grid,
+    Size blockIndex,
+    DualContouringBlock<ScalarType>& block) {
   const auto& sdfData = sdf.data();
+  const Eigen::Vector3<Index> begin = grid.block(blockIndex) * BlockGrid::kBlockSize;
+  const Eigen::Vector3<Index> end =
+      (begin.array() + BlockGrid::kBlockSize).min(grid.cellResolution.array());
 
-  const auto linearIndex = [&](Index i, Index j, Index k) -> size_t {
-    return k * resolution.x() * resolution.y() + j * resolution.x() + i;
-  };
+  block.cells.clear();
+  block.vertices.clear();
 
-  CellVertexMap cellToVertexIndex;
-  std::vector<Eigen::Vector3<ScalarType>> vertices;
-  Index vertexIndex = 0;
-
-  for (Index k = 0; k < resolution.z() - 1; ++k) {
-    for (Index j = 0; j < resolution.y() - 1; ++j) {
-      for (Index i = 0; i < resolution.x() - 1; ++i) {
+  for (Index k = begin.z(); k < end.z(); ++k) {
+    for (Index j = begin.y(); j < end.y(); ++j) {
+      for (Index i = begin.x(); i < end.x(); ++i) {
         // Get the 8 corner values of this cell using direct data access
         const std::array<ScalarType, 8> cornerValues = {
-            {sdfData[linearIndex(i, j, k)], // 0: (0,0,0)
-             sdfData[linearIndex(i + 1, j, k)], // 1: (1,0,0)
-             sdfData[linearIndex(i + 1, j + 1, k)], // 2: (1,1,0)
-             sdfData[linearIndex(i, j + 1, k)], // 3: (0,1,0)
-             sdfData[linearIndex(i, j, k + 1)], // 4: (0,0,1)
-             sdfData[linearIndex(i + 1, j, k + 1)], // 5: (1,0,1)
-             sdfData[linearIndex(i + 1, j + 1, k + 1)], // 6: (1,1,1)
-             sdfData[linearIndex(i, j + 1, k + 1)]}}; // 7: (0,1,1)
+            {sdfData[grid.linearIndex(i, j, k)], // 0: (0,0,0)
+             sdfData[grid.linearIndex(i + 1, j, k)], // 1: (1,0,0)
+             sdfData[grid.linearIndex(i + 1, j + 1, k)], // 2: (1,1,0)
+             sdfData[grid.linearIndex(i, j + 1, k)], // 3: (0,1,0)
+             sdfData[grid.linearIndex(i, j, k + 1)], // 4: (0,0,1)
+             sdfData[grid.linearIndex(i + 1, j, k + 1)], // 5: (1,0,1)
+             sdfData[grid.linearIndex(i + 1, j + 1, k + 1)], // 6: (1,1,1)
+             sdfData[grid.linearIndex(i, j + 1, k + 1)]}}; // 7: (0,1,1)
 
         if (cellIntersectsIsosurface(cornerValues, isovalue)) {
           // This cell intersects the isosurface, create a vertex positioned on the surface
@@ -155,97 +249,78 @@ findIntersectingCellsAndCreateVertices(
               cellIdx.template cast<ScalarType>() + Eigen::Vector3<ScalarType>::Constant(0.5));
 
           // Push vertex toward the zero level set using gradient descent
-          auto surfacePosition = pushVertexToSurface(sdf, cellCenter, isovalue);
-
-          cellToVertexIndex[cellIdx] = vertexIndex++;
-          vertices.push_back(surfacePosition);
+          block.cells.push_back(grid.linearIndex(i, j, k));
+          block.vertices.push_back(pushVertexToSurface(sdf, cellCenter, isovalue));
         }
       }
     }
   }
-
-  return {std::move(vertices), std::move(cellToVertexIndex)};
 }
 
 /**
- * Generate quads for edges in the X direction that cross the isosurface.
+ * Generate the quads of the edges owned by a block, i.e. the edges starting at a grid point of one
+ * of its cells, that cross the isosurface. Requires the vertices of all blocks.
  *
  * @param sdf The signed distance field
  * @param isovalue The isovalue to check against
- * @param cellToVertexIndex Map from cell indices to vertex indices
- * @param quads Output vector to append generated quads
+ * @param grid The block grid
+ * @param blocks Mesh pieces of all blocks, with their vertices already created
+ * @param blockIndex Index of the block to process
+ * @param quads Output quads, replaced by those of the block
  */
 template <typename ScalarType>
-void generateQuadsForXEdges(
+void generateBlockQuads(
     const SignedDistanceField<ScalarType>& sdf,
     ScalarType isovalue,
-    const CellVertexMap& cellToVertexIndex,
-    std::vector<Eigen::Vector4i>& quads) {
-  const auto& resolution = sdf.resolution();
-  const auto& sdfData = sdf.data();
+    const BlockGrid& grid,
+    const std::vector<DualContouringBlock<ScalarType>>& blocks,
+    Size blockIndex,
+    std::vector<std::array<std::pair<Index, Index>, 4>>& quads) {
+  // The 4 cells sharing an edge from grid point (i,j,k) along each axis, ordered so that the
+  // default winding (0,1,2,3) produces a normal pointing in the +axis direction.
+  static constexpr std::array<std::array<std::array<Index, 3>, 4>, 3> kEdgeCells = {{
+      {{{0, -1, -1}, {0, 0, -1}, {0, 0, 0}, {0, -1, 0}}}, // X edges
+      {{{-1, 0, -1}, {-1, 0, 0}, {0, 0, 0}, {0, 0, -1}}}, // Y edges
+      {{{-1, -1, 0}, {0, -1, 0}, {0, 0, 0}, {-1, 0, 0}}}, // Z edges
+  }};
 
-  const auto linearIndex = [&](Index i, Index j, Index k) -> size_t {
-    return k * resolution.x() * resolution.y() + j * resolution.x() + i;
-  };
+  const auto& sdfData = sdf.data();
+  const Eigen::Vector3<Index> begin = grid.block(blockIndex) * BlockGrid::kBlockSize;
+  const Eigen::Vector3<Index> end =
+      (begin.array() + BlockGrid::kBlockSize).min(grid.cellResolution.array());
+
+  quads.clear();
+
+  for (Index k = begin.z(); k < end.z(); ++k) {
+    for (Index j = begin.y(); j < end.y(); ++j) {
+      for (Index i = begin.x(); i < end.x(); ++i) {
+        const ScalarType val1 = sdfData[grid.linearIndex(i, j, k)];
+
+        for (int axis = 0; axis < 3; ++axis) {
+          // Check if the edge from (i,j,k) to its neighbor along the axis crosses the isosurface
+          const ScalarType val2 = sdfData[grid.linearIndex(
+              i + (axis == 0 ? 1 : 0), j + (axis == 1 ? 1 : 0), k + (axis == 2 ? 1 : 0))];
+          if (isInside(val1, isovalue) == isInside(val2, isovalue)) {
+            continue;
+          }
 
-  const auto hasVertex = [&](Index i, Index j, Index k) -> std::pair<bool, Index> {
-    if (i < 0 || j < 0 || k < 0 || i >= resolution.x() - 1 || j >= resolution.y() - 1 ||
-        k >= resolution.z() - 1) {
-      return {false, static_cast<Index>(-1)};
-    }
-    auto it = cellToVertexIndex.find(Eigen::Vector3<Index>(i, j, k));
-    if (it != cellToVertexIndex.end()) {
-      return {true, it->second};
-    }
-    return {false, static_cast<Index>(-1)};
-  };
-
-  // X-direction edges: from grid point (i,j,k) to (i+1,j,k)
-  for (Index k = 0; k < resolution.z(); ++k) {
-    for (Index j = 0; j < resolution.y(); ++j) {
-      for (Index i = 0; i < resolution.x() - 1; ++i) {
-        // Check if this edge crosses the isosurface
-        const ScalarType val1 = sdfData[linearIndex(i, j, k)];
-        const ScalarType val2 = sdfData[linearIndex(i + 1, j, k)];
-
-        if (isInside(val1, isovalue) != isInside(val2, isovalue)) {
-          // This X-edge crosses the isosurface
-          // Find the 4 cells that share this edge (if they exist)
-          const std::array<std::pair<bool, Index>, 4> quadVertices = {
-              {hasVertex(i, j - 1, k - 1), // Cell (i, j-1, k-1)
-               hasVertex(i, j, k - 1), // Cell (i, j, k-1)
-               hasVertex(i, j, k), // Cell (i, j, k)
-               hasVertex(i, j - 1, k)}}; // Cell (i, j-1, k)
-
-          // Check if all 4 vertices exist
+          // Only edges whose 4 cells all have a vertex produce a quad
+          std::array<std::pair<Index, Index>, 4> quad{};
           bool allExist = true;
-          for (const auto& [exists, _] : quadVertices) {
-            if (!exists) {
-              allExist = false;
-              break;
-            }
+          for (int c = 0; c < 4 && allExist; ++c) {
+            const auto& offset = kEdgeCells[axis][c];
+            quad[c] = findCellVertex(grid, blocks, i + offset[0], j + offset[1], k + offset[2]);
+            allExist = quad[c].first >= 0;
+          }
+          if (!allExist) {
+            continue;
           }
 
-          if (allExist) {
-            // Determine winding order based on which side is inside (negative)
-            // Default winding (0,1,2,3) produces normal pointing in +X direction
-            if (val1 < val2) {
-              // val1 more negative (inside), val2 less negative (outside)
-              // Normal should point +X (toward val2/outside) - use default winding
-              quads.emplace_back(
-                  quadVertices[0].second,
-                  quadVertices[1].second,
-                  quadVertices[2].second,
-                  quadVertices[3].second);
-            } else {
-              // val2 more negative (inside), val1 less negative (outside)
-              // Normal should point -X (toward val1/outside) - flip winding
-              quads.emplace_back(
-                  quadVertices[0].second,
-                  quadVertices[3].second,
-                  quadVertices[2].second,
-                  quadVertices[1].second);
-            }
+          // Flip the winding if val2 is inside, so that the normal points toward the outside
+          if (val1 < val2) {
+            quads.push_back(quad);
+          } else {
+            quads.push_back({quad[0], quad[3], quad[2], quad[1]});
           }
         }
       }
@@ -254,176 +329,75 @@ void generateQuadsForXEdges(
 }
 
 /**
- * Generate quads for edges in the Y direction that cross the isosurface.
+ * Merge the mesh pieces of all blocks into a single mesh.
  *
- * @param sdf The signed distance field
- * @param isovalue The isovalue to check against
- * @param cellToVertexIndex Map from cell indices to vertex indices
- * @param quads Output vector to append generated quads
+ * @param blocks Mesh pieces of all blocks
+ * @param result Output result; its vertices and quads are replaced
  */
 template <typename ScalarType>
-void generateQuadsForYEdges(
-    const SignedDistanceField<ScalarType>& sdf,
-    ScalarType isovalue,
-    const CellVertexMap& cellToVertexIndex,
-    std::vector<Eigen::Vector4i>& quads) {
-  const auto& resolution = sdf.resolution();
-  const auto& sdfData = sdf.data();
-
-  const auto linearIndex = [&](Index i, Index j, Index k) -> size_t {
-    return k * resolution.x() * resolution.y() + j * resolution.x() + i;
-  };
-
-  const auto hasVertex = [&](Index i, Index j, Index k) -> std::pair<bool, Index> {
-    if (i < 0 || j < 0 || k < 0 || i >= resolution.x() - 1 || j >= resolution.y() - 1 ||
-        k >= resolution.z() - 1) {
-      return {false, static_cast<Index>(-1)};
-    }
-    auto it = cellToVertexIndex.find(Eigen::Vector3<Index>(i, j, k));
-    if (it != cellToVertexIndex.end()) {
-      return {true, it->second};
-    }
-    return {false, static_cast<Index>(-1)};
-  };
-
-  // Y-direction edges: from grid point (i,j,k) to (i,j+1,k)
-  for (Index k = 0; k < resolution.z(); ++k) {
-    for (Index j = 0; j < resolution.y() - 1; ++j) {
-      for (Index i = 0; i < resolution.x(); ++i) {
-        // Check if this edge crosses the isosurface
-        const ScalarType val1 = sdfData[linearIndex(i, j, k)];
-        const ScalarType val2 = sdfData[linearIndex(i, j + 1, k)];
-
-        if (isInside(val1, isovalue) != isInside(val2, isovalue)) {
-          // This Y-edge crosses the isosurface
-          // Find the 4 cells that share this edge
-          // Reorder to maintain consistent winding: (back-left, back-right, front-right,
-          // front-left)
-          const std::array<std::pair<bool, Index>, 4> quadVertices = {
-              {hasVertex(i - 1, j, k - 1), // Cell (i-1, j, k-1)
-               hasVertex(i - 1, j, k), // Cell (i-1, j, k)
-               hasVertex(i, j, k), // Cell (i, j, k)
-               hasVertex(i, j, k - 1)}}; // Cell (i, j, k-1)
-
-          // Check if all 4 vertices exist
-          bool allExist = true;
-          for (const auto& [exists, _] : quadVertices) {
-            if (!exists) {
-              allExist = false;
-              break;
-            }
-          }
+void mergeBlocks(
+    const std::vector<DualContouringBlock<ScalarType>>& blocks,
+    DualContouringResult<ScalarType>& result) {
+  // Offsets of the vertices and quads of each block in the merged buffers
+  std::vector<Index> vertexOffsets(blocks.size() + 1, 0);
+  std::vector<size_t> quadOffsets(blocks.size() + 1, 0);
+  for (size_t b = 0; b < blocks.size(); ++b) {
+    vertexOffsets[b + 1] = vertexOffsets[b] + static_cast<Index>(blocks[b].vertices.size());
+    quadOffsets[b + 1] = quadOffsets[b] + blocks[b].quads.size();
+  }
 
-          if (allExist) {
-            // Determine winding order based on which side is inside (negative)
-            // Default winding (0,1,2,3) produces normal pointing in +Y direction
-            if (val1 < val2) {
-              // val1 more negative (inside), val2 less negative (outside)
-              // Normal should point +Y (toward val2/outside) - use default winding
-              quads.emplace_back(
-                  quadVertices[0].second,
-                  quadVertices[1].second,
-                  quadVertices[2].second,
-                  quadVertices[3].second);
-            } else {
-              // val2 more negative (inside), val1 less negative (outside)
-              // Normal should point -Y (toward val1/outside) - flip winding
-              quads.emplace_back(
-                  quadVertices[0].second,
-                  quadVertices[3].second,
-                  quadVertices[2].second,
-                  quadVertices[1].second);
-            }
-          }
-        }
+  result.vertices.resize(vertexOffsets.back());
+  result.quads.resize(quadOffsets.back());
+  parallelForEach(0, static_cast<Size>(blocks.size()), [&](Size b) {
+    const auto& block = blocks[b];
+    std::copy(
+        block.vertices.begin(), block.vertices.end(), result.vertices.begin() + vertexOffsets[b]);
+
+    for (size_t q = 0; q < block.quads.size(); ++q) {
+      Eigen::Vector4i& quad = result.quads[quadOffsets[b] + q];
+      for (int c = 0; c < 4; ++c) {
+        const auto [cellBlock, vertex] = block.quads[q][c];
+        quad[c] = vertexOffsets[cellBlock] + vertex;
       }
     }
-  }
+  });
+
+  result.success = true;
+  result.processedCells = result.vertices.size();
+  result.generatedVertices = result.vertices.size();
 }
 
 /**
- * Generate quads for edges in the Z direction that cross the isosurface.
+ * Dual contour blocks in parallel: first the vertices of some blocks, then the quads of others.
  *
  * @param sdf The signed distance field
- * @param isovalue The isovalue to check against
- * @param cellToVertexIndex Map from cell indices to vertex indices
- * @param quads Output vector to append generated quads
+ * @param isovalue The isovalue to extract
+ * @param grid The block grid
+ * @param vertexBlocks Indices of the blocks whose vertices are created
+ * @param quadBlocks Indices of the blocks whose quads are generated; must include the blocks of
+ *   vertexBlocks and the blocks whose quads use their vertices
+ * @param blocks Mesh pieces of all blocks; those of the processed blocks are replaced
  */
 template <typename ScalarType>
-void generateQuadsForZEdges(
+void contourBlocks(
     const SignedDistanceField<ScalarType>& sdf,
     ScalarType isovalue,
-    const CellVertexMap& cellToVertexIndex,
-    std::vector<Eigen::Vector4i>& quads) {
-  const auto& resolution = sdf.resolution();
-  const auto& sdfData = sdf.data();
-
-  const auto linearIndex = [&](Index i, Index j, Index k) -> size_t {
-    return k * resolution.x() * resolution.y() + j * resolution.x() + i;
-  };
-
-  const auto hasVertex = [&](Index i, Index j, Index k) -> std::pair<bool, Index> {
-    if (i < 0 || j < 0 || k < 0 || i >= resolution.x() - 1 || j >= resolution.y() - 1 ||
-        k >= resolution.z() - 1) {
-      return {false, static_cast<Index>(-1)};
-    }
-    auto it = cellToVertexIndex.find(Eigen::Vector3<Index>(i, j, k));
-    if (it != cellToVertexIndex.end()) {
-      return {true, it->second};
-    }
-    return {false, static_cast<Index>(-1)};
-  };
-
-  // Z-direction edges: from grid point (i,j,k) to (i,j,k+1)
-  for (Index k = 0; k < resolution.z() - 1; ++k) {
-    for (Index j = 0; j < resolution.y(); ++j) {
-      for (Index i = 0; i < resolution.x(); ++i) {
-        // Check if this edge crosses the isosurface
-        const ScalarType val1 = sdfData[linearIndex(i, j, k)];
-        const ScalarType val2 = sdfData[linearIndex(i, j, k + 1)];
-
-        if (isInside(val1, isovalue) != isInside(val2, isovalue)) {
-          // This Z-edge crosses the isosurface
-          // Find the 4 cells that share this edge
-          const std::array<std::pair<bool, Index>, 4> quadVertices = {
-              {hasVertex(i - 1, j - 1, k), // Cell (i-1, j-1, k)
-               hasVertex(i, j - 1, k), // Cell (i, j-1, k)
-               hasVertex(i, j, k), // Cell (i, j, k)
-               hasVertex(i - 1, j, k)}}; // Cell (i-1, j, k)
-
-          // Check if all 4 vertices exist
-          bool allExist = true;
-          for (const auto& [exists, _] : quadVertices) {
-            if (!exists) {
-              allExist = false;
-              break;
-            }
-          }
-
-          if (allExist) {
-            // Determine winding order based on which side is inside (negative)
-            // Default winding (0,1,2,3) produces normal pointing in +Z direction
-            if (val1 < val2) {
-              // val1 more negative (inside), val2 less negative (outside)
-              // Normal should point +Z (toward val2/outside) - use default winding
-              quads.emplace_back(
-                  quadVertices[0].second,
-                  quadVertices[1].second,
-                  quadVertices[2].second,
-                  quadVertices[3].second);
-            } else {
-              // val2 more negative (inside), val1 less negative (outside)
-              // Normal should point -Z (toward val1/outside) - flip winding
-              quads.emplace_back(
-                  quadVertices[0].second,
-                  quadVertices[3].second,
-                  quadVertices[2].second,
-                  quadVertices[1].second);
-            }
-          }
-        }
-      }
-    }
+    const BlockGrid& grid,
+    const std::vector<Size>& vertexBlocks,
+    const std::vector<Size>& quadBlocks,
+    std::vector<DualContouringBlock<ScalarType>>& blocks) {
+  parallelForEach(0, static_cast<Size>(vertexBlocks.size()), [&](Size b) {
+    createBlockVertices(sdf, isovalue, grid, vertexBlocks[b], blocks[vertexBlocks[b]]);
+  });
+
+  // Quads look up the vertices of neighboring blocks, so they are generated once all vertices
+  // exist, into separate buffers since the lookups read every block.
+  std::vector<std::vector<std::array<std::pair<Index, Index>, 4>>> quads(quadBlocks.size());
+  parallelForEach(0, static_cast<Size>(quadBlocks.size()), [&](Size b) {
+    generateBlockQuads(sdf, isovalue, grid, blocks, quadBlocks[b], quads[b]);
+  });
+  for (size_t b = 0; b < quadBlocks.size(); ++b) {
+    blocks[quadBlocks[b]].quads = std::move(quads[b]);
   }
 }
 
@@ -439,29 +413,96 @@ DualContouringResult<ScalarType> dualContouring(
     ScalarType isovalue) {
   DualContouringResult<ScalarType> result;
 
-  // Step 1: Find all cells that intersect the isosurface and create vertices
-  auto [vertices, cellToVertexIndex] =
-      detail::findIntersectingCellsAndCreateVertices(sdf, isovalue);
+  const detail::BlockGrid grid(sdf.resolution());
+  std::vector<detail::DualContouringBlock<ScalarType>> blocks(grid.numBlocks());
+  std::vector<Size> blockIndices(blocks.size());
+  std::iota(blockIndices.begin(), blockIndices.end(), Size{0});
+
+  // Step 1: Find the cells intersecting the isosurface and their quads, block by block
+  detail::contourBlocks(sdf, isovalue, grid, blockIndices, blockIndices, blocks);
+
+  // Step 2: Merge the blocks into a single mesh
+  detail::mergeBlocks(blocks, result);
 
-  if (vertices.empty()) {
-    result.success = true;
-    return result;
+  return result;
+}
+
+template <typename ScalarType>
+IncrementalDualContouring<ScalarType>::IncrementalDualContouring(
+    const SignedDistanceField<ScalarType>& sdf,
+    ScalarType isovalue)
+    : isovalue_(isovalue), resolution_(sdf.resolution()) {
+  const detail::BlockGrid grid(resolution_);
+  blocks_.resize(grid.numBlocks());
+
+  std::vector<Size> blockIndices(blocks_.size());
+  std::iota(blockIndices.begin(), blockIndices.end(), Size{0});
+  detail::contourBlocks(sdf, isovalue_, grid, blockIndices, blockIndices, blocks_);
+  detail::mergeBlocks(blocks_, result_);
+}
+
+template <typename ScalarType>
+Size IncrementalDualContouring<ScalarType>::update(
+    const SignedDistanceField<ScalarType>& sdf,
+    const Eigen::Vector3<Index>& minVoxel,
+    const Eigen::Vector3<Index>& maxVoxel) {
+  assert(sdf.resolution() == resolution_);
+  const detail::BlockGrid grid(resolution_);
+  if (grid.numBlocks() == 0) {
+    return 0;
   }
 
-  // Step 2: Generate quads by processing edges in each direction
-  std::vector<Eigen::Vector4i> quads;
+  // Vertices sample the SDF around their cell, further along the axes with smaller voxels
+  const Eigen::Vector3<Index> margin = detail::updateMargin(sdf);
+  const Eigen::Vector3<Index> firstCell = (minVoxel - margin).array().max(0).matrix();
+  const Eigen::Vector3<Index> lastCell =
+      (maxVoxel + margin).array().min(grid.cellResolution.array() - 1).matrix();
+  if ((firstCell.array() > lastCell.array()).any()) {
+    return 0;
+  }
 
-  detail::generateQuadsForXEdges(sdf, isovalue, cellToVertexIndex, quads);
-  detail::generateQuadsForYEdges(sdf, isovalue, cellToVertexIndex, quads);
-  detail::generateQuadsForZEdges(sdf, isovalue, cellToVertexIndex, quads);
+  const Eigen::Vector3<Index> firstBlock = firstCell / detail::BlockGrid::kBlockSize;
+  const Eigen::Vector3<Index> lastBlock = lastCell / detail::BlockGrid::kBlockSize;
+  std::vector<Size> dirtyBlocks;
+  for (Index bk = firstBlock.z(); bk <= lastBlock.z(); ++bk) {
+    for (Index bj = firstBlock.y(); bj <= lastBlock.y(); ++bj) {
+      for (Index bi = firstBlock.x(); bi <= lastBlock.x(); ++bi) {
+        dirtyBlocks.push_back(grid.blockIndex({bi, bj, bk}));
+      }
+    }
+  }
 
-  result.vertices = std::move(vertices);
-  result.quads = std::move(quads);
-  result.success = true;
-  result.processedCells = cellToVertexIndex.size();
-  result.generatedVertices = result.vertices.size();
+  // Quads reference the vertices of the cells just before their edge, so the blocks right after
+  // the dirty ones need their quads regenerated too since the dirty vertices are renumbered.
+  const Eigen::Vector3<Index> lastQuadBlock =
+      (lastBlock.array() + 1).min(grid.blockResolution.array() - 1).matrix();
+  std::vector<Size> quadBlocks;
+  for (Index bk = firstBlock.z(); bk <= lastQuadBlock.z(); ++bk) {
+    for (Index bj = firstBlock.y(); bj <= lastQuadBlock.y(); ++bj) {
+      for (Index bi = firstBlock.x(); bi <= lastQuadBlock.x(); ++bi) {
+        quadBlocks.push_back(grid.blockIndex({bi, bj, bk}));
+      }
+    }
+  }
 
-  return result;
+  detail::contourBlocks(sdf, isovalue_, grid, dirtyBlocks, quadBlocks, blocks_);
+  detail::mergeBlocks(blocks_, result_);
+  return static_cast<Size>(dirtyBlocks.size());
+}
+
+template <typename ScalarType>
+const DualContouringResult<ScalarType>& IncrementalDualContouring<ScalarType>::result() const {
+  return result_;
+}
+
+template <typename ScalarType>
+const Eigen::Vector3<Index>& IncrementalDualContouring<ScalarType>::resolution() const {
+  return resolution_;
+}
+
+template <typename ScalarType>
+Size IncrementalDualContouring<ScalarType>::numBlocks() const {
+  return static_cast<Size>(blocks_.size());
 }
 
 std::vector<Eigen::Vector3i> triangulateQuads(const std::vector<Eigen::Vector4i>& quads) {
@@ -491,6 +532,9 @@ template DualContouringResult<double> dualContouring<double>(
     const SignedDistanceField<double>&,
     double);
 
+template class IncrementalDualContouring<float>;
+template class IncrementalDualContouring<double>;
+
 // Helper functions are automatically instantiated when dualContouring is instantiated
 
 } // namespace axel
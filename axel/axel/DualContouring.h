@@ -58,6 +58,9 @@ struct DualContouringResult {
  * 2. Placing one vertex at each intersecting cell, positioned on the surface using gradient descent
  * 3. Generating quads for each edge crossing that connects 4 adjacent cells
  *
+ * The grid is processed in blocks of cells in parallel, each block producing its own vertex and
+ * quad buffers that are merged at the end.
+ *
  * @param sdf The signed distance field to extract from
  * @param isovalue The isovalue to extract (typically 0.0 for zero level set)
  * @return Result containing extracted mesh
@@ -67,6 +70,96 @@ DualContouringResult<ScalarType> dualContouring(
     const SignedDistanceField<ScalarType>& sdf,
     ScalarType isovalue = ScalarType{0.0});
 
+namespace detail {
+
+/**
+ * Mesh pieces produced by dual contouring one block of cells. Cells are identified by the linear
+ * index of their minimum corner voxel, and quad corners by their block and their index among the
+ * vertices of that block, so the pieces of different blocks can be stitched together.
+ */
+template <typename S>
+struct DualContouringBlock {
+  /// Linear indices of the cells with a vertex, in increasing order
+  std::vector<Size> cells;
+
+  /// Vertex of each cell in cells
+  std::vector<Eigen::Vector3<S>> vertices;
+
+  /// Quads of the edges owned by the block, as (block index, vertex index within the block)
+  std::vector<std::array<std::pair<Index, Index>, 4>> quads;
+};
+
+} // namespace detail
+
+/**
+ * Dual contouring that keeps the mesh of each block of cells, so that the surface can be
+ * re-extracted after a local edit of the SDF by re-meshing only the blocks near the edit.
+ *
+ * The mesh produced after any sequence of updates is the same as running dualContouring() on the
+ * edited SDF, up to the order of vertices and quads.
+ */
+template <typename ScalarType>
+class IncrementalDualContouring {
+ public:
+  /// Number of cells along each side of a block
+  static constexpr Index kBlockSize = 16;
+
+  /**
+   * Extract the isosurface of the whole SDF.
+   *
+   * @param sdf The signed distance field to extract from
+   * @param isovalue The isovalue to extract (typically 0.0 for zero level set)
+   */
+  explicit IncrementalDualContouring(
+      const SignedDistanceField<ScalarType>& sdf,
+      ScalarType isovalue = ScalarType{0.0});
+
+  /**
+   * Re-mesh the blocks affected by a change of the voxels in the box [minVoxel, maxVoxel] and patch
+   * the mesh. Since vertices are placed by sampling the SDF around their cell, blocks within a few
+   * voxels of the box are re-meshed as well, more of them along the axes with smaller voxels.
+   *
+   * @param sdf The edited signed distance field; must have the resolution of the original one
+   * @param minVoxel Minimum grid index of the edited voxels (inclusive)
+   * @param maxVoxel Maximum grid index of the edited voxels (inclusive)
+   * @return Number of re-meshed blocks
+   */
+  Size update(
+      const SignedDistanceField<ScalarType>& sdf,
+      const Eigen::Vector3<Index>& minVoxel,
+      const Eigen::Vector3<Index>& maxVoxel);
+
+  /**
+   * Get the current mesh.
+   *
+   * @return Result containing the extracted mesh
+   */
+  [[nodiscard]] const DualContouringResult<ScalarType>& result() const;
+
+  /**
+   * Get the resolution of the SDF the mesh was extracted from.
+   *
+   * @return Grid resolution as (nx, ny, nz)
+   */
+  [[nodiscard]] const Eigen::Vector3<Index>& resolution() const;
+
+  /**
+   * Get the total number of blocks.
+   *
+   * @return Number of blocks covering the cells of the SDF
+   */
+  [[nodiscard]] Size numBlocks() const;
+
+ private:
+  ScalarType isovalue_;
+  Eigen::Vector3<Index> resolution_;
+  std::vector<detail::DualContouringBlock<ScalarType>> blocks_;
+  DualContouringResult<ScalarType> result_;
+};
+
+extern template class IncrementalDualContouring<float>;
+extern template class IncrementalDualContouring<double>;
+
 /**
  * Triangulate a quad mesh into triangles.
  * Each quad is split into two triangles using the diagonal (0,2).
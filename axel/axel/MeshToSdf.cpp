@@ -24,6 +24,7 @@
 #include "axel/Ray.h"
 #include "axel/TriBvh.h"
 #include "axel/common/Constants.h"
+#include "axel/common/Parallel.h"
 #include "axel/math/PointTriangleProjection.h"
 
 namespace axel {
@@ -123,14 +124,23 @@ SignedDistanceField<ScalarType> meshToSdf(
   detail::initializeNarrowBand(vertices, triangles, sdf, bandWidthWorld);
   std::cout << "Narrow band initialized" << std::endl;
 
-  // STEP 2: Fast marching propagation to fill entire grid
-  std::cout << "Step 2: Fast marching propagation..." << std::endl;
-  detail::fastMarchingPropagate(sdf);
-  std::cout << "Fast marching completed" << std::endl;
+  // STEP 2: Propagate distances from the narrow band to fill entire grid
+  switch (config.propagationMode) {
+    case PropagationMode::FastMarching:
+      std::cout << "Step 2: Fast marching propagation..." << std::endl;
+      detail::fastMarchingPropagate(sdf);
+      std::cout << "Fast marching completed" << std::endl;
+      break;
+    case PropagationMode::DistanceTransform:
+      std::cout << "Step 2: Distance transform propagation..." << std::endl;
+      detail::distanceTransformPropagate(sdf);
+      std::cout << "Distance transform completed" << std::endl;
+      break;
+  }
 
   // STEP 3: Apply signs based on inside/outside determination
   std::cout << "Step 3: Applying signs..." << std::endl;
-  detail::applySignsToDistanceField(sdf, vertices, triangles);
+  detail::applySignsToDistanceField(sdf, vertices, triangles, config.signMode);
   std::cout << "Signs applied" << std::endl;
 
   // Apply distance clamping if configured
@@ -407,6 +417,172 @@ ScalarType solveEikonal(
   return result;
 }
 
+/**
+ * Scratch space for transforming one grid line, reused across the lines of a plane.
+ */
+template <typename ScalarType>
+struct DistanceTransformLineBuffers {
+  explicit DistanceTransformLineBuffers(Index maxCount)
+      : sqrDist(maxCount), nearest(maxCount), parabolas(maxCount), boundaries(maxCount + 1) {}
+
+  std::vector<ScalarType> sqrDist;
+  std::vector<int64_t> nearest;
+  std::vector<Index> parabolas;
+  std::vector<ScalarType> boundaries;
+};
+
+/**
+ * One pass of the separable Euclidean distance transform along a grid line, using the lower
+ * envelope of parabolas from Felzenszwalb and Huttenlocher, "Distance Transforms of Sampled
+ * Functions". On input, sqrDist holds the squared distance from each sample to its nearest seed
+ * found by the previous passes (infinity if none) and nearest holds that seed; on output, both also
+ * account for the seeds of the other samples on the line. Linear in the number of samples.
+ */
+template <typename ScalarType>
+void distanceTransformLine(
+    ScalarType* sqrDist,
+    int64_t* nearest,
+    Index count,
+    size_t stride,
+    ScalarType spacing,
+    DistanceTransformLineBuffers<ScalarType>& buffers) {
+  constexpr ScalarType kInfinity = std::numeric_limits<ScalarType>::infinity();
+  const ScalarType sqrSpacing = spacing * spacing;
+
+  auto& f = buffers.sqrDist;
+  auto& v = buffers.parabolas;
+  auto& z = buffers.boundaries;
+  for (Index q = 0; q < count; ++q) {
+    f[q] = sqrDist[q * stride];
+    buffers.nearest[q] = nearest[q * stride];
+  }
+
+  // Build the lower envelope of the parabolas sqrSpacing * (x - p)^2 + f[p]; parabola v[k] is the
+  // lowest one between the boundaries z[k] and z[k + 1].
+  Index k = -1;
+  for (Index q = 0; q < count; ++q) {
+    if (f[q] == kInfinity) {
+      continue;
+    }
+
+    ScalarType s = 0;
+    while (k >= 0) {
+      const Index p = v[k];
+      s = ((f[q] + sqrSpacing * q * q) - (f[p] + sqrSpacing * p * p)) /
+          (ScalarType{2} * sqrSpacing * (q - p));
+      if (s > z[k]) {
+        break;
+      }
+      --k;
+    }
+    ++k;
+    v[k] = q;
+    z[k] = (k == 0) ? -kInfinity : s;
+  }
+
+  // No seed reaches this line yet.
+  if (k < 0) {
+    return;
+  }
+  z[k + 1] = kInfinity;
+
+  Index j = 0;
+  for (Index q = 0; q < count; ++q) {
+    while (z[j + 1] < static_cast<ScalarType>(q)) {
+      ++j;
+    }
+    const auto delta = static_cast<ScalarType>(q - v[j]);
+    sqrDist[q * stride] = sqrSpacing * delta * delta + f[v[j]];
+    nearest[q * stride] = buffers.nearest[v[j]];
+  }
+}
+
+/**
+ * Sets every voxel for which needsFill(linearIndex) is true to the distance of its nearest seed
+ * voxel, for which isSeed(linearIndex) is true, plus the Euclidean distance to that seed. The
+ * nearest seeds are found with an exact separable distance transform, one pass per axis with the
+ * grid lines of each pass processed in parallel. Voxels are left untouched if there are no seeds.
+ */
+template <typename ScalarType, typename IsSeed, typename NeedsFill>
+void fillFromNearestSeeds(
+    SignedDistanceField<ScalarType>& sdf,
+    IsSeed&& isSeed,
+    NeedsFill&& needsFill) {
+  const auto& resolution = sdf.resolution();
+  const auto voxelSize = sdf.voxelSize();
+  const size_t strideY = resolution.x();
+  const size_t strideZ = static_cast<size_t>(resolution.x()) * resolution.y();
+  const size_t totalVoxels = sdf.totalVoxels();
+
+  std::vector<ScalarType> sqrDist(totalVoxels, std::numeric_limits<ScalarType>::infinity());
+  std::vector<int64_t> nearest(totalVoxels, -1);
+  parallelForEach(0, resolution.z(), [&](Index k) {
+    for (size_t idx = k * strideZ; idx < (k + 1) * strideZ; ++idx) {
+      if (isSeed(idx)) {
+        sqrDist[idx] = ScalarType{0};
+        nearest[idx] = static_cast<int64_t>(idx);
+      }
+    }
+  });
+
+  const Index maxCount = resolution.maxCoeff();
+
+  // Pass along x, one z-plane per task.
+  parallelForEach(0, resolution.z(), [&](Index k) {
+    DistanceTransformLineBuffers<ScalarType> buffers(maxCount);
+    for (Index j = 0; j < resolution.y(); ++j) {
+      const size_t offset = k * strideZ + j * strideY;
+      distanceTransformLine(
+          sqrDist.data() + offset,
+          nearest.data() + offset,
+          resolution.x(),
+          1,
+          voxelSize.x(),
+          buffers);
+    }
+  });
+
+  // Pass along y, one z-plane per task.
+  parallelForEach(0, resolution.z(), [&](Index k) {
+    DistanceTransformLineBuffers<ScalarType> buffers(maxCount);
+    for (Index i = 0; i < resolution.x(); ++i) {
+      const size_t offset = k * strideZ + i;
+      distanceTransformLine(
+          sqrDist.data() + offset,
+          nearest.data() + offset,
+          resolution.y(),
+          strideY,
+          voxelSize.y(),
+          buffers);
+    }
+  });
+
+  // Pass along z, one y-plane per task.
+  parallelForEach(0, resolution.y(), [&](Index j) {
+    DistanceTransformLineBuffers<ScalarType> buffers(maxCount);
+    for (Index i = 0; i < resolution.x(); ++i) {
+      const size_t offset = j * strideY + i;
+      distanceTransformLine(
+          sqrDist.data() + offset,
+          nearest.data() + offset,
+          resolution.z(),
+          strideZ,
+          voxelSize.z(),
+          buffers);
+    }
+  });
+
+  // Seeds are never filled, so reading them while filling other voxels is safe.
+  auto& data = sdf.data();
+  parallelForEach(0, resolution.z(), [&](Index k) {
+    for (size_t idx = k * strideZ; idx < (k + 1) * strideZ; ++idx) {
+      if (nearest[idx] >= 0 && needsFill(idx)) {
+        data[idx] = data[nearest[idx]] + std::sqrt(sqrDist[idx]);
+      }
+    }
+  });
+}
+
 } // namespace
 
 template <typename ScalarType>
@@ -528,30 +704,32 @@ void fastMarchingPropagate(SignedDistanceField<ScalarType>& sdf) {
     }
   }
 
-  // Fill any remaining unknown voxels using simple distance propagation
-  for (Index i = 0; i < resolution.x(); ++i) {
-    for (Index j = 0; j < resolution.y(); ++j) {
-      for (Index k = 0; k < resolution.z(); ++k) {
-        const size_t linearIdx = i + j * resolution.x() + k * resolution.x() * resolution.y();
-        if (states[linearIdx] == VoxelState::UNKNOWN ||
-            sdf.at(i, j, k) >= std::numeric_limits<ScalarType>::max()) {
-          // Find the closest known voxel and use distance to it
-          ScalarType minDistance = std::numeric_limits<ScalarType>::max();
-
-          for (const auto& knownIdx : knownVoxels) {
-            const ScalarType knownDist = sdf.at(knownIdx.x(), knownIdx.y(), knownIdx.z());
-            const Vector3i deltaIdx = Vector3i(i, j, k) - knownIdx;
-            const auto deltaWorld = deltaIdx.cast<ScalarType>().cwiseProduct(sdf.voxelSize());
-            const ScalarType spatialDistance = deltaWorld.norm();
-
-            minDistance = std::min(minDistance, knownDist + spatialDistance);
-          }
-
-          sdf.set(i, j, k, minDistance);
-        }
-      }
-    }
+  // Fill any remaining unknown voxels from their nearest known voxel. Voxels are only left unknown
+  // if fast marching can't reach them, so this is usually a no-op.
+  const auto& data = sdf.data();
+  const auto isUnknown = [&states, &data](size_t idx) {
+    return states[idx] == VoxelState::UNKNOWN ||
+        data[idx] >= std::numeric_limits<ScalarType>::max();
+  };
+  bool hasUnknownVoxels = false;
+  for (size_t idx = 0; idx < totalVoxels && !hasUnknownVoxels; ++idx) {
+    hasUnknownVoxels = isUnknown(idx);
   }
+  if (hasUnknownVoxels) {
+    fillFromNearestSeeds(
+        sdf, [&states](size_t idx) { return states[idx] == VoxelState::KNOWN; }, isUnknown);
+  }
+}
+
+template <typename ScalarType>
+void distanceTransformPropagate(SignedDistanceField<ScalarType>& sdf) {
+  // The narrow band voxels are the only ones initialized to a finite distance.
+  const auto& data = sdf.data();
+  const auto isNarrowBand = [&data](size_t idx) {
+    return data[idx] < SignedDistanceField<ScalarType>::kVeryFarDistance;
+  };
+  fillFromNearestSeeds(
+      sdf, isNarrowBand, [&isNarrowBand](size_t idx) { return !isNarrowBand(idx); });
 }
 
 // ================================================================================================
@@ -602,14 +780,121 @@ bool isPointInsideByRayCasting(
   return insideCount > (directions.size() / 2);
 }
 
+/**
+ * Cast one ray along each selected grid row of each axis and report, for every voxel of the row,
+ * how many of the two rays leaving it along the axis cross the mesh an odd number of times. The
+ * ray starts outside the mesh, so the crossings on either side of a voxel are read off the row's
+ * sorted hits. Summed over the three axes, this gives the six votes of isPointInsideByRayCasting.
+ *
+ * @param grid Dense or sparse distance field whose grid is classified
+ * @param bvh Pre-built BVH of the mesh
+ * @param meshBounds Bounding box of the mesh vertices
+ * @param needsRow Called as needsRow(axis, voxel) with the first voxel of a row; rows for which it
+ *   returns false are skipped
+ * @param addOddCount Called as addOddCount(voxel, count) with count in [0, 2] for every voxel of
+ *   the selected rows; rows along the same axis run in parallel but never share voxels
+ */
+template <typename ScalarType, typename Grid, typename RowFilter, typename Callback>
+void castParityScanlines(
+    const Grid& grid,
+    const TriBvh<ScalarType>& bvh,
+    const BoundingBox<ScalarType>& meshBounds,
+    RowFilter&& needsRow,
+    Callback&& addOddCount) {
+  const auto& resolution = grid.resolution();
+
+  // Start the rays far enough back to be outside both the mesh and the grid.
+  BoundingBox<ScalarType> extent = meshBounds;
+  extent.extend(grid.bounds());
+  const ScalarType margin = (extent.max() - extent.min()).norm() + ScalarType{1};
+
+  for (int axis = 0; axis < 3; ++axis) {
+    const int axis1 = (axis + 1) % 3;
+    const int axis2 = (axis + 2) % 3;
+    const Eigen::Vector3<ScalarType> direction = Eigen::Vector3<ScalarType>::Unit(axis);
+    const Index nRows1 = resolution[axis1];
+
+    // Rows along the same axis cover disjoint voxels, so they can be processed in parallel.
+    parallelForEach(0, nRows1 * resolution[axis2], [&](Index row) {
+      Eigen::Vector3<Index> voxel = Eigen::Vector3<Index>::Zero();
+      voxel[axis1] = row % nRows1;
+      voxel[axis2] = row / nRows1;
+      if (!needsRow(axis, voxel)) {
+        return;
+      }
+
+      const Eigen::Vector3<ScalarType> rowStart =
+          grid.gridToWorld(Eigen::Vector3<ScalarType>(voxel.template cast<ScalarType>()));
+      const Eigen::Vector3<ScalarType> origin = rowStart - margin * direction;
+
+      std::vector<ScalarType> hitDistances;
+      for (const auto& hit : bvh.allHits(Ray3<ScalarType>(origin, direction))) {
+        hitDistances.push_back(hit.hitDistance);
+      }
+      std::sort(hitDistances.begin(), hitDistances.end());
+
+      // Merge hits that are closer than minDelta, as in isPointInsideByRayCasting, so that a ray
+      // through the edge shared by two triangles only counts one crossing.
+      const ScalarType minDelta = 0.01;
+      std::vector<ScalarType> crossings;
+      for (const ScalarType t : hitDistances) {
+        if (crossings.empty() || t > crossings.back() + minDelta) {
+          crossings.push_back(t);
+        }
+      }
+
+      size_t nBefore = 0;
+      for (voxel[axis] = 0; voxel[axis] < resolution[axis]; ++voxel[axis]) {
+        const ScalarType t = margin +
+            (grid.gridToWorld(Eigen::Vector3<ScalarType>(voxel.template cast<ScalarType>())) -
+             rowStart)
+                .dot(direction);
+        while (nBefore < crossings.size() && crossings[nBefore] < t) {
+          ++nBefore;
+        }
+        const size_t nAfter = crossings.size() - nBefore;
+        addOddCount(voxel, static_cast<uint8_t>((nBefore % 2) + (nAfter % 2)));
+      }
+    });
+  }
+}
+
+/**
+ * Count, for every voxel, how many of the six axis-aligned rays leaving it cross the mesh an odd
+ * number of times, using one ray per grid row and axis.
+ *
+ * @param sdf Distance field whose grid is classified
+ * @param bvh Pre-built BVH of the mesh
+ * @param meshBounds Bounding box of the mesh vertices
+ * @return Number of odd-parity rays (0 to 6) per voxel, in the linear order of the grid
+ */
 template <typename ScalarType>
-void applySignsToDistanceField(
-    SignedDistanceField<ScalarType>& sdf,
-    std::span<const Eigen::Vector3<ScalarType>> vertices,
-    std::span<const Eigen::Vector3i> triangles) {
+std::vector<uint8_t> countOddParityScanlines(
+    const SignedDistanceField<ScalarType>& sdf,
+    const TriBvh<ScalarType>& bvh,
+    const BoundingBox<ScalarType>& meshBounds) {
   const auto& resolution = sdf.resolution();
+  std::vector<uint8_t> oddCounts(sdf.totalVoxels(), 0);
+  castParityScanlines(
+      sdf,
+      bvh,
+      meshBounds,
+      [](int /*axis*/, const Eigen::Vector3<Index>& /*voxel*/) { return true; },
+      [&](const Eigen::Vector3<Index>& voxel, uint8_t count) {
+        const size_t index = static_cast<size_t>(voxel.z()) * resolution.x() * resolution.y() +
+            static_cast<size_t>(voxel.y()) * resolution.x() + voxel.x();
+        oddCounts[index] += count;
+      });
+  return oddCounts;
+}
 
-  // BUILD BVH ONCE for efficient ray casting
+/**
+ * Build a BVH over the mesh for ray casting and closest point queries.
+ */
+template <typename ScalarType>
+TriBvh<ScalarType> buildMeshBvh(
+    std::span<const Eigen::Vector3<ScalarType>> vertices,
+    std::span<const Eigen::Vector3i> triangles) {
   // Convert spans to matrices for TriBvh constructor
   Eigen::MatrixX3<ScalarType> vertexMatrix(vertices.size(), 3);
   for (size_t i = 0; i < vertices.size(); ++i) {
@@ -621,7 +906,33 @@ void applySignsToDistanceField(
     triangleMatrix.row(i) = triangles[i];
   }
 
-  const TriBvh<ScalarType> bvh(std::move(vertexMatrix), std::move(triangleMatrix));
+  return TriBvh<ScalarType>(std::move(vertexMatrix), std::move(triangleMatrix));
+}
+
+template <typename ScalarType>
+void applySignsToDistanceField(
+    SignedDistanceField<ScalarType>& sdf,
+    std::span<const Eigen::Vector3<ScalarType>> vertices,
+    std::span<const Eigen::Vector3i> triangles,
+    SignMode signMode) {
+  const auto& resolution = sdf.resolution();
+
+  // BUILD BVH ONCE for efficient ray casting
+  const TriBvh<ScalarType> bvh = buildMeshBvh(vertices, triangles);
+
+  if (signMode == SignMode::ScanlineParity) {
+    // Same majority vote as isPointInsideByRayCasting: inside if more than three of the six
+    // axis-aligned rays cross the mesh an odd number of times.
+    const std::vector<uint8_t> oddCounts =
+        countOddParityScanlines(sdf, bvh, computeMeshBounds(vertices));
+    auto& data = sdf.data();
+    for (size_t idx = 0; idx < data.size(); ++idx) {
+      if (oddCounts[idx] > 3) {
+        data[idx] = -std::abs(data[idx]);
+      }
+    }
+    return;
+  }
 
   // Process each voxel
   const auto processVoxel = [&](Index i, Index j, Index k) {
@@ -685,6 +996,199 @@ BoundingBox<ScalarType> computeMeshBounds(std::span<const Eigen::Vector3<ScalarT
 
 } // namespace detail
 
+// ================================================================================================
+// SPARSE NARROW BAND SDF
+// ================================================================================================
+
+template <typename ScalarType>
+SparseSignedDistanceField<ScalarType> meshToSparseSdf(
+    std::span<const Eigen::Vector3<ScalarType>> vertices,
+    std::span<const Eigen::Vector3i> triangles,
+    const BoundingBox<ScalarType>& bounds,
+    const Eigen::Vector3<Index>& resolution,
+    const MeshToSdfConfig<ScalarType>& config) {
+  using Vector3 = Eigen::Vector3<ScalarType>;
+  using SparseSdf = SparseSignedDistanceField<ScalarType>;
+  constexpr Index kBlockSize = SparseSdf::kBlockSize;
+  constexpr Index kBlockVoxels = SparseSdf::kBlockVoxels;
+
+  // Convert narrow band width from voxel units to world units
+  const Vector3 voxelSize =
+      (bounds.max() - bounds.min()).cwiseQuotient(resolution.template cast<ScalarType>());
+  const ScalarType bandWidth = config.narrowBandWidth * voxelSize.norm();
+  SparseSdf sdf(bounds, resolution, bandWidth);
+
+  // STEP 1: Allocate the blocks that may contain a voxel within the band of any triangle. Candidate
+  // blocks come from the band-expanded bounding box of the triangle, then are culled with the
+  // distance from the block center to the triangle, since large triangles have loose boxes.
+  const Eigen::Vector3<Index> maxVoxel = resolution.array() - 1;
+  for (const auto& triangle : triangles) {
+    const Vector3& v0 = vertices[triangle[0]];
+    const Vector3& v1 = vertices[triangle[1]];
+    const Vector3& v2 = vertices[triangle[2]];
+    const Vector3 lo = sdf.worldToGrid(Vector3(v0.cwiseMin(v1).cwiseMin(v2).array() - bandWidth));
+    const Vector3 hi = sdf.worldToGrid(Vector3(v0.cwiseMax(v1).cwiseMax(v2).array() + bandWidth));
+
+    Eigen::Vector3<Index> blockLo;
+    Eigen::Vector3<Index> blockHi;
+    bool overlaps = true;
+    for (int axis = 0; axis < 3; ++axis) {
+      const auto voxelLo = static_cast<Index>(std::max(std::ceil(lo[axis]), ScalarType{0}));
+      const auto voxelHi = static_cast<Index>(
+          std::min(std::floor(hi[axis]), static_cast<ScalarType>(maxVoxel[axis])));
+      overlaps = overlaps && voxelLo <= voxelHi;
+      blockLo[axis] = voxelLo / kBlockSize;
+      blockHi[axis] = voxelHi / kBlockSize;
+    }
+    if (!overlaps) {
+      continue;
+    }
+
+    for (Index bk = blockLo.z(); bk <= blockHi.z(); ++bk) {
+      for (Index bj = blockLo.y(); bj <= blockHi.y(); ++bj) {
+        for (Index bi = blockLo.x(); bi <= blockHi.x(); ++bi) {
+          const Eigen::Vector3<Index> first = Eigen::Vector3<Index>(bi, bj, bk) * kBlockSize;
+          const Eigen::Vector3<Index> last =
+              (first.array() + (kBlockSize - 1)).min(maxVoxel.array()).matrix();
+          const Vector3 firstPos = sdf.gridToWorld(Vector3(first.template cast<ScalarType>()));
+          const Vector3 lastPos = sdf.gridToWorld(Vector3(last.template cast<ScalarType>()));
+          const Vector3 center = ScalarType{0.5} * (firstPos + lastPos);
+
+          Vector3 closestPoint;
+          projectOnTriangle(center, v0, v1, v2, closestPoint);
+          if ((center - closestPoint).norm() <=
+              bandWidth + ScalarType{0.5} * (lastPos - firstPos).norm()) {
+            sdf.allocateBlock(bi, bj, bk);
+          }
+        }
+      }
+    }
+  }
+
+  const Eigen::Vector3<Index>& blockResolution = sdf.blockResolution();
+  const auto blockIndex = [&blockResolution](const Eigen::Vector3<Index>& block) {
+    return static_cast<size_t>(block.z()) * blockResolution.x() * blockResolution.y() +
+        static_cast<size_t>(block.y()) * blockResolution.x() + block.x();
+  };
+  const auto localIndex = [](const Eigen::Vector3<Index>& voxel) {
+    return static_cast<size_t>(voxel.z() % kBlockSize) * kBlockSize * kBlockSize +
+        static_cast<size_t>(voxel.y() % kBlockSize) * kBlockSize + voxel.x() % kBlockSize;
+  };
+
+  // Number the allocated blocks so that per-voxel state can be kept in flat arrays.
+  std::vector<Eigen::Vector3<Index>> allocated;
+  std::vector<int32_t> slots(
+      static_cast<size_t>(blockResolution.x()) * blockResolution.y() * blockResolution.z(), -1);
+  for (Index bk = 0; bk < blockResolution.z(); ++bk) {
+    for (Index bj = 0; bj < blockResolution.y(); ++bj) {
+      for (Index bi = 0; bi < blockResolution.x(); ++bi) {
+        if (sdf.isBlockAllocated(bi, bj, bk)) {
+          slots[blockIndex({bi, bj, bk})] = static_cast<int32_t>(allocated.size());
+          allocated.emplace_back(bi, bj, bk);
+        }
+      }
+    }
+  }
+
+  // STEP 2: Exact unsigned distances for the voxels of the allocated blocks
+  const TriBvh<ScalarType> bvh = detail::buildMeshBvh(vertices, triangles);
+  const auto forEachVoxelInBlock = [&](const Eigen::Vector3<Index>& block, auto&& func) {
+    const Eigen::Vector3<Index> begin = block * kBlockSize;
+    const Eigen::Vector3<Index> end = (begin.array() + kBlockSize).min(resolution.array());
+    for (Index k = begin.z(); k < end.z(); ++k) {
+      for (Index j = begin.y(); j < end.y(); ++j) {
+        for (Index i = begin.x(); i < end.x(); ++i) {
+          func(Eigen::Vector3<Index>(i, j, k));
+        }
+      }
+    }
+  };
+
+  std::cout << "Computing band distances..." << std::endl;
+  detail::parallelForEach(0, static_cast<Index>(allocated.size()), [&](Index slot) {
+    const Eigen::Vector3<Index>& block = allocated[slot];
+    ScalarType* data = sdf.blockData(block.x(), block.y(), block.z());
+    forEachVoxelInBlock(block, [&](const Eigen::Vector3<Index>& voxel) {
+      const Vector3 position = sdf.gridToWorld(Vector3(voxel.template cast<ScalarType>()));
+      const Vector3 closestPoint = bvh.closestSurfacePoint(position).point;
+      data[localIndex(voxel)] = std::min((position - closestPoint).norm(), bandWidth);
+    });
+  });
+
+  // STEP 3: Signs of the band voxels and of the tiles by scanline parity. Tiles are classified by
+  // their first voxel, so only rows through an allocated block or through a first voxel are cast.
+  std::cout << "Applying signs..." << std::endl;
+  std::vector<uint8_t> blockOddCounts(allocated.size() * kBlockVoxels, 0);
+  std::vector<uint8_t> tileOddCounts(slots.size(), 0);
+  detail::castParityScanlines(
+      sdf,
+      bvh,
+      detail::computeMeshBounds(vertices),
+      [&](int axis, const Eigen::Vector3<Index>& rowStart) {
+        const int axis1 = (axis + 1) % 3;
+        const int axis2 = (axis + 2) % 3;
+        if (rowStart[axis1] % kBlockSize == 0 && rowStart[axis2] % kBlockSize == 0) {
+          return true;
+        }
+        Eigen::Vector3<Index> block = rowStart / kBlockSize;
+        for (block[axis] = 0; block[axis] < blockResolution[axis]; ++block[axis]) {
+          if (slots[blockIndex(block)] >= 0) {
+            return true;
+          }
+        }
+        return false;
+      },
+      [&](const Eigen::Vector3<Index>& voxel, uint8_t count) {
+        const size_t block = blockIndex(voxel / kBlockSize);
+        if (slots[block] >= 0) {
+          blockOddCounts[static_cast<size_t>(slots[block]) * kBlockVoxels + localIndex(voxel)] +=
+              count;
+        } else if (localIndex(voxel) == 0) {
+          tileOddCounts[block] += count;
+        }
+      });
+
+  // Same majority vote as isPointInsideByRayCasting.
+  detail::parallelForEach(0, static_cast<Index>(allocated.size()), [&](Index slot) {
+    const Eigen::Vector3<Index>& block = allocated[slot];
+    ScalarType* data = sdf.blockData(block.x(), block.y(), block.z());
+    const uint8_t* oddCounts = blockOddCounts.data() + static_cast<size_t>(slot) * kBlockVoxels;
+    for (Index local = 0; local < kBlockVoxels; ++local) {
+      if (oddCounts[local] > 3) {
+        data[local] = -data[local];
+      }
+    }
+  });
+  for (Index bk = 0; bk < blockResolution.z(); ++bk) {
+    for (Index bj = 0; bj < blockResolution.y(); ++bj) {
+      for (Index bi = 0; bi < blockResolution.x(); ++bi) {
+        const size_t block = blockIndex({bi, bj, bk});
+        if (slots[block] < 0) {
+          sdf.setTile(bi, bj, bk, tileOddCounts[block] > 3);
+        }
+      }
+    }
+  }
+
+  return sdf;
+}
+
+template <typename ScalarType>
+SparseSignedDistanceField<ScalarType> meshToSparseSdf(
+    std::span<const Eigen::Vector3<ScalarType>> vertices,
+    std::span<const Eigen::Vector3i> triangles,
+    const Eigen::Vector3<Index>& resolution,
+    ScalarType padding,
+    const MeshToSdfConfig<ScalarType>& config) {
+  const auto bounds = detail::computeMeshBounds(vertices);
+  const auto extent = bounds.max() - bounds.min();
+  const auto paddingVec = extent * padding;
+
+  const BoundingBox<ScalarType> paddedBounds(bounds.min() - paddingVec, bounds.max() + paddingVec);
+
+  return meshToSparseSdf(vertices, triangles, paddedBounds, resolution, config);
+}
+
 // ================================================================================================
 // EXPLICIT INSTANTIATIONS
 // ================================================================================================
@@ -718,6 +1222,34 @@ template SignedDistanceField<double> meshToSdf<double>(
     double,
     const MeshToSdfConfig<double>&);
 
+template SparseSignedDistanceField<float> meshToSparseSdf<float>(
+    std::span<const Eigen::Vector3<float>>,
+    std::span<const Eigen::Vector3i>,
+    const BoundingBox<float>&,
+    const Eigen::Vector3<Index>&,
+    const MeshToSdfConfig<float>&);
+
+template SparseSignedDistanceField<double> meshToSparseSdf<double>(
+    std::span<const Eigen::Vector3<double>>,
+    std::span<const Eigen::Vector3i>,
+    const BoundingBox<double>&,
+    const Eigen::Vector3<Index>&,
+    const MeshToSdfConfig<double>&);
+
+template SparseSignedDistanceField<float> meshToSparseSdf<float>(
+    std::span<const Eigen::Vector3<float>>,
+    std::span<const Eigen::Vector3i>,
+    const Eigen::Vector3<Index>&,
+    float,
+    const MeshToSdfConfig<float>&);
+
+template SparseSignedDistanceField<double> meshToSparseSdf<double>(
+    std::span<const Eigen::Vector3<double>>,
+    std::span<const Eigen::Vector3i>,
+    const Eigen::Vector3<Index>&,
+    double,
+    const MeshToSdfConfig<double>&);
+
 // Detail namespace explicit instantiations
 namespace detail {
 
@@ -737,15 +1269,21 @@ template void fastMarchingPropagate<float>(SignedDistanceField<float>&);
 
 template void fastMarchingPropagate<double>(SignedDistanceField<double>&);
 
+template void distanceTransformPropagate<float>(SignedDistanceField<float>&);
+
+template void distanceTransformPropagate<double>(SignedDistanceField<double>&);
+
 template void applySignsToDistanceField<float>(
     SignedDistanceField<float>&,
     std::span<const Eigen::Vector3<float>>,
-    std::span<const Eigen::Vector3i>);
+    std::span<const Eigen::Vector3i>,
+    SignMode);
 
 template void applySignsToDistanceField<double>(
     SignedDistanceField<double>&,
     std::span<const Eigen::Vector3<double>>,
-    std::span<const Eigen::Vector3i>);
+    std::span<const Eigen::Vector3i>,
+    SignMode);
 
 template BoundingBox<float> computeMeshBounds<float>(std::span<const Eigen::Vector3<float>>);
 
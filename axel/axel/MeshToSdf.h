@@ -7,6 +7,7 @@
 
 #pragma once
 
+#include <cstdint>
 #include <limits>
 #include <queue>
 #include <vector>
@@ -16,10 +17,35 @@
 
 #include "axel/BoundingBox.h"
 #include "axel/SignedDistanceField.h"
+#include "axel/SparseSignedDistanceField.h"
 #include "axel/TriBvh.h"
 
 namespace axel {
 
+/**
+ * Method used to propagate distances from the narrow band to the rest of the grid.
+ */
+enum class PropagationMode : uint8_t {
+  /// Solve the Eikonal equation outward from the narrow band with fast marching. Single-threaded,
+  /// O(N log N) in the number of voxels.
+  FastMarching,
+  /// Exact Euclidean distance transform to the nearest narrow band voxel, plus that voxel's
+  /// distance. Separable, O(N) and parallel over grid lines; usually much faster on large grids.
+  DistanceTransform,
+};
+
+/**
+ * Method used to decide which voxels are inside the mesh.
+ */
+enum class SignMode : uint8_t {
+  /// Cast six axis-aligned rays from every voxel and take the majority of their parities.
+  RayCasting,
+  /// Cast one ray along every grid row in each axis, sort its intersections once and label all
+  /// voxels of the row from the parity before and after them. Same six-way majority vote as
+  /// RayCasting with three rays per row instead of six per voxel; parallel over rows.
+  ScanlineParity,
+};
+
 /**
  * Configuration parameters for mesh-to-SDF conversion.
  */
@@ -36,13 +62,19 @@ struct MeshToSdfConfig {
 
   /// Numerical tolerance for computations
   Scalar tolerance = std::numeric_limits<Scalar>::epsilon() * Scalar{1000};
+
+  /// Method used to propagate distances from the narrow band to the rest of the grid
+  PropagationMode propagationMode = PropagationMode::FastMarching;
+
+  /// Method used to decide which voxels are inside the mesh
+  SignMode signMode = SignMode::RayCasting;
 };
 
 /**
  * Convert a triangle mesh to a signed distance field using modern 3-step approach:
  * 1. Narrow band initialization with exact triangle distances
- * 2. Fast marching propagation using Eikonal equation
- * 3. Sign determination using ray casting
+ * 2. Propagation to the whole grid by fast marching or a distance transform
+ * 3. Sign determination using per-voxel ray casting or scanline parity
  *
  * @param vertices Vertex positions as span (works with std::vector, arrays, subranges)
  * @param triangles Triangle indices as span (indices must be valid within vertices)
@@ -77,6 +109,46 @@ SignedDistanceField<ScalarType> meshToSdf(
     ScalarType padding = ScalarType{0.1},
     const MeshToSdfConfig<ScalarType>& config = {});
 
+/**
+ * Convert a triangle mesh to a sparse signed distance field that only stores the blocks within
+ * config.narrowBandWidth voxels of the surface. Band voxels get exact distances from a BVH query;
+ * signs, including those of the inside/outside tiles, come from scanline parity. Memory and time
+ * grow with the surface area instead of the grid volume. config.propagationMode and
+ * config.signMode are ignored.
+ *
+ * @param vertices Vertex positions as span
+ * @param triangles Triangle indices as span (indices must be valid within vertices)
+ * @param bounds Spatial bounds for the SDF
+ * @param resolution Grid resolution (nx, ny, nz)
+ * @param config Configuration parameters
+ * @return Generated sparse signed distance field, clamped to the band width
+ */
+template <typename ScalarType>
+SparseSignedDistanceField<ScalarType> meshToSparseSdf(
+    std::span<const Eigen::Vector3<ScalarType>> vertices,
+    std::span<const Eigen::Vector3i> triangles,
+    const BoundingBox<ScalarType>& bounds,
+    const Eigen::Vector3<Index>& resolution,
+    const MeshToSdfConfig<ScalarType>& config = {});
+
+/**
+ * Convenience overload that computes bounds automatically from the mesh.
+ *
+ * @param vertices Vertex positions as span
+ * @param triangles Triangle indices as span
+ * @param resolution Grid resolution (nx, ny, nz)
+ * @param padding Extra space around mesh bounds (as fraction of bounding box size)
+ * @param config Configuration parameters
+ * @return Generated sparse signed distance field
+ */
+template <typename ScalarType>
+SparseSignedDistanceField<ScalarType> meshToSparseSdf(
+    std::span<const Eigen::Vector3<ScalarType>> vertices,
+    std::span<const Eigen::Vector3i> triangles,
+    const Eigen::Vector3<Index>& resolution,
+    ScalarType padding = ScalarType{0.1},
+    const MeshToSdfConfig<ScalarType>& config = {});
+
 namespace detail {
 
 // ================================================================================================
@@ -99,6 +171,13 @@ void initializeNarrowBand(
 template <typename ScalarType>
 void fastMarchingPropagate(SignedDistanceField<ScalarType>& sdf);
 
+/**
+ * Propagate distances from narrow band to entire grid using an exact Euclidean distance transform:
+ * each voxel gets the distance to its nearest narrow band voxel plus that voxel's distance.
+ */
+template <typename ScalarType>
+void distanceTransformPropagate(SignedDistanceField<ScalarType>& sdf);
+
 /**
  * Apply correct signs to distance field based on inside/outside classification.
  */
@@ -106,7 +185,8 @@ template <typename ScalarType>
 void applySignsToDistanceField(
     SignedDistanceField<ScalarType>& sdf,
     std::span<const Eigen::Vector3<ScalarType>> vertices,
-    std::span<const Eigen::Vector3i> triangles);
+    std::span<const Eigen::Vector3i> triangles,
+    SignMode signMode = SignMode::RayCasting);
 
 /**
  * Compute mesh bounding box from vertex spans.
@@ -0,0 +1,118 @@
+/*
+ * Copyright (c) Meta Platforms, Inc. and affiliates.
+ *
+ * This source code is licensed under the MIT license found in the
+ * LICENSE file in the root directory of this source tree.
+ */
+
+#pragma once
+
+#include <algorithm>
+#include <cmath>
+#include <utility>
+
+#include <Eigen/Core>
+
+#include "axel/common/Types.h"
+
+namespace axel::detail {
+
+/**
+ * Sample a voxel grid at a world-space position using trilinear interpolation, shared by the dense
+ * and sparse signed distance fields.
+ *
+ * Positions outside the grid are clamped to it and their distance to the clamped position is added
+ * to the interpolated value; their gradient then points away from the grid.
+ *
+ * @tparam ComputeGradient Whether to compute the analytic gradient; otherwise it is left zero
+ * @param field Grid providing at(i, j, k), resolution(), voxelSize(), worldToGrid() and
+ *   gridToWorld()
+ * @param position Query position in world space
+ * @return The interpolated value and its gradient in world space
+ */
+template <bool ComputeGradient, typename InputScalar, typename Field>
+std::pair<InputScalar, Eigen::Vector3<InputScalar>> sampleVoxelGrid(
+    const Field& field,
+    const Eigen::Vector3<InputScalar>& position) {
+  const auto& resolution = field.resolution();
+  const Eigen::Vector3<InputScalar> voxelSize = field.voxelSize().template cast<InputScalar>();
+  const Eigen::Vector3<InputScalar> gridPos = field.template worldToGrid<InputScalar>(position);
+
+  // Clamp to valid grid bounds
+  const Eigen::Vector3<InputScalar> clampedGridPos(
+      std::clamp(gridPos.x(), InputScalar{0}, static_cast<InputScalar>(resolution.x() - 1)),
+      std::clamp(gridPos.y(), InputScalar{0}, static_cast<InputScalar>(resolution.y() - 1)),
+      std::clamp(gridPos.z(), InputScalar{0}, static_cast<InputScalar>(resolution.z() - 1)));
+
+  // Get the integer grid coordinates of the lower corner
+  const auto i0 = static_cast<Index>(std::floor(clampedGridPos.x()));
+  const auto j0 = static_cast<Index>(std::floor(clampedGridPos.y()));
+  const auto k0 = static_cast<Index>(std::floor(clampedGridPos.z()));
+
+  // Get the integer grid coordinates of the upper corner
+  const Index i1 = std::min(i0 + 1, resolution.x() - 1);
+  const Index j1 = std::min(j0 + 1, resolution.y() - 1);
+  const Index k1 = std::min(k0 + 1, resolution.z() - 1);
+
+  // Calculate interpolation weights using InputScalar precision
+  const InputScalar fx = clampedGridPos.x() - static_cast<InputScalar>(i0);
+  const InputScalar fy = clampedGridPos.y() - static_cast<InputScalar>(j0);
+  const InputScalar fz = clampedGridPos.z() - static_cast<InputScalar>(k0);
+
+  // Get the 8 corner values and convert to InputScalar precision for interpolation
+  const auto c000 = static_cast<InputScalar>(field.at(i0, j0, k0));
+  const auto c001 = static_cast<InputScalar>(field.at(i0, j0, k1));
+  const auto c010 = static_cast<InputScalar>(field.at(i0, j1, k0));
+  const auto c011 = static_cast<InputScalar>(field.at(i0, j1, k1));
+  const auto c100 = static_cast<InputScalar>(field.at(i1, j0, k0));
+  const auto c101 = static_cast<InputScalar>(field.at(i1, j0, k1));
+  const auto c110 = static_cast<InputScalar>(field.at(i1, j1, k0));
+  const auto c111 = static_cast<InputScalar>(field.at(i1, j1, k1));
+
+  // Trilinear interpolation for value using InputScalar precision
+  const InputScalar c00 = c000 * (InputScalar{1} - fx) + c100 * fx;
+  const InputScalar c01 = c001 * (InputScalar{1} - fx) + c101 * fx;
+  const InputScalar c10 = c010 * (InputScalar{1} - fx) + c110 * fx;
+  const InputScalar c11 = c011 * (InputScalar{1} - fx) + c111 * fx;
+
+  const InputScalar c0 = c00 * (InputScalar{1} - fy) + c10 * fy;
+  const InputScalar c1 = c01 * (InputScalar{1} - fy) + c11 * fy;
+
+  const InputScalar value = c0 * (InputScalar{1} - fz) + c1 * fz;
+
+  // Calculate offset from original query point to clamped point
+  if (clampedGridPos != gridPos) {
+    const Eigen::Vector3<InputScalar> clampedWorldPos =
+        field.template gridToWorld<InputScalar>(clampedGridPos);
+    const Eigen::Vector3<InputScalar> offsetVector = position - clampedWorldPos;
+    const InputScalar offsetDistance = offsetVector.norm();
+
+    // If point was outside bounds, add offset distance and use offset gradient
+    if (offsetDistance > InputScalar{0}) {
+      return {value + offsetDistance, -(offsetVector / offsetDistance)};
+    }
+  }
+
+  if constexpr (!ComputeGradient) {
+    return {value, Eigen::Vector3<InputScalar>::Zero()};
+  } else {
+    // Standard analytical gradient computation for points inside the grid bounds
+    const InputScalar dfdx_term = (c100 - c000) * (InputScalar{1} - fy) * (InputScalar{1} - fz) +
+        (c101 - c001) * (InputScalar{1} - fy) * fz + (c110 - c010) * fy * (InputScalar{1} - fz) +
+        (c111 - c011) * fy * fz;
+
+    const InputScalar dfdy_term = (c010 - c000) * (InputScalar{1} - fx) * (InputScalar{1} - fz) +
+        (c011 - c001) * (InputScalar{1} - fx) * fz + (c110 - c100) * fx * (InputScalar{1} - fz) +
+        (c111 - c101) * fx * fz;
+
+    const InputScalar dfdz_term = (c001 - c000) * (InputScalar{1} - fx) * (InputScalar{1} - fy) +
+        (c011 - c010) * (InputScalar{1} - fx) * fy + (c101 - c100) * fx * (InputScalar{1} - fy) +
+        (c111 - c110) * fx * fy;
+
+    // Transform grid space gradients to world space
+    const Eigen::Vector3<InputScalar> gradient(dfdx_term, dfdy_term, dfdz_term);
+    return {value, gradient.cwiseQuotient(voxelSize)};
+  }
+}
+
+} // namespace axel::detail
@@ -223,16 +223,6 @@ class SignedDistanceField {
    */
   [[nodiscard]] Size linearIndex(Index i, Index j, Index k) const;
 
-  /**
-   * Clamp grid coordinates to valid bounds.
-   *
-   * @param gridPos Input grid coordinates
-   * @return Clamped grid coordinates
-   */
-  template <typename InputScalar = Scalar>
-  [[nodiscard]] Eigen::Vector3<InputScalar> clampToGrid(
-      const Eigen::Vector3<InputScalar>& gridPos) const;
-
   BoundingBoxType bounds_;
   Eigen::Vector3<Index> resolution_;
   Vector3 voxelSize_;
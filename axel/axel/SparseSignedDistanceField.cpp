@@ -0,0 +1,280 @@
+/*
+ * Copyright (c) Meta Platforms, Inc. and affiliates.
+ *
+ * This source code is licensed under the MIT license found in the
+ * LICENSE file in the root directory of this source tree.
+ */
+
+#include "axel/SparseSignedDistanceField.h"
+
+#include <algorithm>
+#include <cassert>
+#include <cmath>
+
+#include "axel/SdfSampling.h"
+
+namespace axel {
+
+template <typename ScalarType>
+SparseSignedDistanceField<ScalarType>::SparseSignedDistanceField(
+    const BoundingBoxType& bounds,
+    const Eigen::Vector3<Index>& resolution,
+    Scalar bandWidth)
+    : bounds_(bounds),
+      resolution_(resolution),
+      voxelSize_(
+          (bounds_.max() - bounds_.min()).cwiseQuotient(resolution_.template cast<Scalar>())),
+      bandWidth_(bandWidth),
+      blockResolution_(((resolution_.array() + (kBlockSize - 1)) / kBlockSize).matrix()),
+      blockTable_(
+          static_cast<Size>(blockResolution_.x()) * blockResolution_.y() * blockResolution_.z(),
+          kOutsideTile) {
+  assert(resolution_.x() > 0 && resolution_.y() > 0 && resolution_.z() > 0);
+  assert(bandWidth_ > Scalar{0});
+}
+
+template <typename ScalarType>
+SparseSignedDistanceField<ScalarType> SparseSignedDistanceField<ScalarType>::fromDense(
+    const SignedDistanceField<Scalar>& dense,
+    Scalar bandWidth) {
+  SparseSignedDistanceField result(dense.bounds(), dense.resolution(), bandWidth);
+  const auto& resolution = result.resolution_;
+
+  for (Index bk = 0; bk < result.blockResolution_.z(); ++bk) {
+    for (Index bj = 0; bj < result.blockResolution_.y(); ++bj) {
+      for (Index bi = 0; bi < result.blockResolution_.x(); ++bi) {
+        const Index iEnd = std::min((bi + 1) * kBlockSize, resolution.x());
+        const Index jEnd = std::min((bj + 1) * kBlockSize, resolution.y());
+        const Index kEnd = std::min((bk + 1) * kBlockSize, resolution.z());
+
+        bool inBand = false;
+        for (Index k = bk * kBlockSize; k < kEnd && !inBand; ++k) {
+          for (Index j = bj * kBlockSize; j < jEnd && !inBand; ++j) {
+            for (Index i = bi * kBlockSize; i < iEnd && !inBand; ++i) {
+              inBand = std::abs(dense.at(i, j, k)) < bandWidth;
+            }
+          }
+        }
+
+        if (!inBand) {
+          // No voxel of the block is near the surface, so they all share the sign of the first.
+          const Scalar first = dense.at(bi * kBlockSize, bj * kBlockSize, bk * kBlockSize);
+          result.setTile(bi, bj, bk, first < Scalar{0});
+          continue;
+        }
+
+        result.allocateBlock(bi, bj, bk);
+        for (Index k = bk * kBlockSize; k < kEnd; ++k) {
+          for (Index j = bj * kBlockSize; j < jEnd; ++j) {
+            for (Index i = bi * kBlockSize; i < iEnd; ++i) {
+              result.set(i, j, k, dense.at(i, j, k));
+            }
+          }
+        }
+      }
+    }
+  }
+
+  return result;
+}
+
+template <typename ScalarType>
+SignedDistanceField<ScalarType> SparseSignedDistanceField<ScalarType>::toDense() const {
+  SignedDistanceField<Scalar> dense(bounds_, resolution_);
+  for (Index k = 0; k < resolution_.z(); ++k) {
+    for (Index j = 0; j < resolution_.y(); ++j) {
+      for (Index i = 0; i < resolution_.x(); ++i) {
+        dense.set(i, j, k, at(i, j, k));
+      }
+    }
+  }
+  return dense;
+}
+
+template <typename ScalarType>
+ScalarType SparseSignedDistanceField<ScalarType>::at(Index i, Index j, Index k) const {
+  const int32_t block = blockTable_[blockIndex(i / kBlockSize, j / kBlockSize, k / kBlockSize)];
+  if (block < 0) {
+    return block == kInsideTile ? -bandWidth_ : bandWidth_;
+  }
+  const Size local =
+      (k % kBlockSize) * kBlockSize * kBlockSize + (j % kBlockSize) * kBlockSize + (i % kBlockSize);
+  return blocks_[static_cast<Size>(block) * kBlockVoxels + local];
+}
+
+template <typename ScalarType>
+void SparseSignedDistanceField<ScalarType>::set(Index i, Index j, Index k, Scalar value) {
+  const Index bi = i / kBlockSize;
+  const Index bj = j / kBlockSize;
+  const Index bk = k / kBlockSize;
+  allocateBlock(bi, bj, bk);
+  const Size local =
+      (k % kBlockSize) * kBlockSize * kBlockSize + (j % kBlockSize) * kBlockSize + (i % kBlockSize);
+  blockData(bi, bj, bk)[local] = std::clamp(value, -bandWidth_, bandWidth_);
+}
+
+template <typename ScalarType>
+template <typename InputScalar>
+InputScalar SparseSignedDistanceField<ScalarType>::sample(
+    const Eigen::Vector3<InputScalar>& position) const {
+  return detail::sampleVoxelGrid<false>(*this, position).first;
+}
+
+template <typename ScalarType>
+template <typename InputScalar>
+Eigen::Vector3<InputScalar> SparseSignedDistanceField<ScalarType>::gradient(
+    const Eigen::Vector3<InputScalar>& position) const {
+  return sampleWithGradient(position).second;
+}
+
+template <typename ScalarType>
+template <typename InputScalar>
+std::pair<InputScalar, Eigen::Vector3<InputScalar>>
+SparseSignedDistanceField<ScalarType>::sampleWithGradient(
+    const Eigen::Vector3<InputScalar>& position) const {
+  return detail::sampleVoxelGrid<true>(*this, position);
+}
+
+template <typename ScalarType>
+template <typename InputScalar>
+Eigen::Vector3<InputScalar> SparseSignedDistanceField<ScalarType>::worldToGrid(
+    const Eigen::Vector3<InputScalar>& position) const {
+  const auto localPos = position - bounds_.min().template cast<InputScalar>();
+  return localPos.cwiseQuotient(voxelSize_.template cast<InputScalar>());
+}
+
+template <typename ScalarType>
+template <typename InputScalar>
+Eigen::Vector3<InputScalar> SparseSignedDistanceField<ScalarType>::gridToWorld(
+    const Eigen::Vector3<InputScalar>& gridPos) const {
+  return bounds_.min().template cast<InputScalar>() +
+      gridPos.cwiseProduct(voxelSize_.template cast<InputScalar>());
+}
+
+template <typename ScalarType>
+const Eigen::Vector3<Index>& SparseSignedDistanceField<ScalarType>::resolution() const {
+  return resolution_;
+}
+
+template <typename ScalarType>
+const typename SparseSignedDistanceField<ScalarType>::BoundingBoxType&
+SparseSignedDistanceField<ScalarType>::bounds() const {
+  return bounds_;
+}
+
+template <typename ScalarType>
+typename SparseSignedDistanceField<ScalarType>::Vector3
+SparseSignedDistanceField<ScalarType>::voxelSize() const {
+  return voxelSize_;
+}
+
+template <typename ScalarType>
+ScalarType SparseSignedDistanceField<ScalarType>::bandWidth() const {
+  return bandWidth_;
+}
+
+template <typename ScalarType>
+Size SparseSignedDistanceField<ScalarType>::totalVoxels() const {
+  return static_cast<Size>(resolution_.x()) * resolution_.y() * resolution_.z();
+}
+
+template <typename ScalarType>
+const Eigen::Vector3<Index>& SparseSignedDistanceField<ScalarType>::blockResolution() const {
+  return blockResolution_;
+}
+
+template <typename ScalarType>
+Size SparseSignedDistanceField<ScalarType>::allocatedBlocks() const {
+  return static_cast<Size>(blocks_.size()) / kBlockVoxels;
+}
+
+template <typename ScalarType>
+bool SparseSignedDistanceField<ScalarType>::isBlockAllocated(Index bi, Index bj, Index bk) const {
+  return blockTable_[blockIndex(bi, bj, bk)] >= 0;
+}
+
+template <typename ScalarType>
+void SparseSignedDistanceField<ScalarType>::allocateBlock(Index bi, Index bj, Index bk) {
+  int32_t& block = blockTable_[blockIndex(bi, bj, bk)];
+  if (block >= 0) {
+    return;
+  }
+  const Scalar tileValue = block == kInsideTile ? -bandWidth_ : bandWidth_;
+  block = static_cast<int32_t>(allocatedBlocks());
+  blocks_.resize(blocks_.size() + kBlockVoxels, tileValue);
+}
+
+template <typename ScalarType>
+void SparseSignedDistanceField<ScalarType>::setTile(Index bi, Index bj, Index bk, bool inside) {
+  int32_t& block = blockTable_[blockIndex(bi, bj, bk)];
+  assert(block < 0);
+  block = inside ? kInsideTile : kOutsideTile;
+}
+
+template <typename ScalarType>
+ScalarType* SparseSignedDistanceField<ScalarType>::blockData(Index bi, Index bj, Index bk) {
+  const int32_t block = blockTable_[blockIndex(bi, bj, bk)];
+  assert(block >= 0);
+  return blocks_.data() + static_cast<Size>(block) * kBlockVoxels;
+}
+
+template <typename ScalarType>
+Size SparseSignedDistanceField<ScalarType>::memoryUsage() const {
+  return static_cast<Size>(blockTable_.size() * sizeof(int32_t) + blocks_.size() * sizeof(Scalar));
+}
+
+template <typename ScalarType>
+Size SparseSignedDistanceField<ScalarType>::blockIndex(Index bi, Index bj, Index bk) const {
+  return static_cast<Size>(bk) * blockResolution_.x() * blockResolution_.y() +
+      static_cast<Size>(bj) * blockResolution_.x() + static_cast<Size>(bi);
+}
+
+// Explicit instantiation for classes
+template class SparseSignedDistanceField<float>;
+template class SparseSignedDistanceField<double>;
+
+// Explicit instantiation for SparseSignedDistanceField templated methods
+template float SparseSignedDistanceField<float>::sample<float>(const Eigen::Vector3<float>&) const;
+template double SparseSignedDistanceField<float>::sample<double>(
+    const Eigen::Vector3<double>&) const;
+template float SparseSignedDistanceField<double>::sample<float>(const Eigen::Vector3<float>&) const;
+template double SparseSignedDistanceField<double>::sample<double>(
+    const Eigen::Vector3<double>&) const;
+
+template Eigen::Vector3<float> SparseSignedDistanceField<float>::gradient<float>(
+    const Eigen::Vector3<float>&) const;
+template Eigen::Vector3<double> SparseSignedDistanceField<float>::gradient<double>(
+    const Eigen::Vector3<double>&) const;
+template Eigen::Vector3<float> SparseSignedDistanceField<double>::gradient<float>(
+    const Eigen::Vector3<float>&) const;
+template Eigen::Vector3<double> SparseSignedDistanceField<double>::gradient<double>(
+    const Eigen::Vector3<double>&) const;
+
+template std::pair<float, Eigen::Vector3<float>>
+SparseSignedDistanceField<float>::sampleWithGradient<float>(const Eigen::Vector3<float>&) const;
+template std::pair<double, Eigen::Vector3<double>>
+SparseSignedDistanceField<float>::sampleWithGradient<double>(const Eigen::Vector3<double>&) const;
+template std::pair<float, Eigen::Vector3<float>>
+SparseSignedDistanceField<double>::sampleWithGradient<float>(const Eigen::Vector3<float>&) const;
+template std::pair<double, Eigen::Vector3<double>>
+SparseSignedDistanceField<double>::sampleWithGradient<double>(const Eigen::Vector3<double>&) const;
+
+template Eigen::Vector3<float> SparseSignedDistanceField<float>::worldToGrid<float>(
+    const Eigen::Vector3<float>&) const;
+template Eigen::Vector3<double> SparseSignedDistanceField<float>::worldToGrid<double>(
+    const Eigen::Vector3<double>&) const;
+template Eigen::Vector3<float> SparseSignedDistanceField<double>::worldToGrid<float>(
+    const Eigen::Vector3<float>&) const;
+template Eigen::Vector3<double> SparseSignedDistanceField<double>::worldToGrid<double>(
+    const Eigen::Vector3<double>&) const;
+
+template Eigen::Vector3<float> SparseSignedDistanceField<float>::gridToWorld<float>(
+    const Eigen::Vector3<float>&) const;
+template Eigen::Vector3<double> SparseSignedDistanceField<float>::gridToWorld<double>(
+    const Eigen::Vector3<double>&) const;
+template Eigen::Vector3<float> SparseSignedDistanceField<double>::gridToWorld<float>(
+    const Eigen::Vector3<float>&) const;
+template Eigen::Vector3<double> SparseSignedDistanceField<double>::gridToWorld<double>(
+    const Eigen::Vector3<double>&) const;
+
+} // namespace axel
@@ -0,0 +1,271 @@
+/*
+ * Copyright (c) Meta Platforms, Inc. and affiliates.
+ *
+ * This source code is licensed under the MIT license found in the
+ * LICENSE file in the root directory of this source tree.
+ */
+
+#pragma once
+
+#include <cstdint>
+#include <vector>
+
+#include <Eigen/Core>
+
+#include "axel/BoundingBox.h"
+#include "axel/SignedDistanceField.h"
+#include "axel/common/Types.h"
+
+namespace axel {
+
+/**
+ * A 3D signed distance field that only stores a narrow band around the surface.
+ *
+ * The grid is split into blocks of kBlockSize^3 voxels. Only blocks containing voxels within the
+ * band width of the surface store their distances; every other block is a tile that is either
+ * entirely inside or entirely outside, whose voxels all read as -bandWidth or +bandWidth. Stored
+ * distances are clamped to [-bandWidth, bandWidth] as well, so the field is a clamped SDF whose
+ * memory grows with the surface area rather than the volume.
+ *
+ * Provides the same trilinear sample()/gradient() API as SignedDistanceField.
+ */
+template <typename ScalarType>
+class SparseSignedDistanceField {
+ public:
+  using Scalar = ScalarType;
+  using Vector3 = Eigen::Vector3<Scalar>;
+  using BoundingBoxType = BoundingBox<Scalar>;
+
+  /// Number of voxels along each side of a block
+  static constexpr Index kBlockSize = 8;
+
+  /// Number of voxels in a block
+  static constexpr Index kBlockVoxels = kBlockSize * kBlockSize * kBlockSize;
+
+  /**
+   * Constructs an SDF with the given dimensions and bounds in which every block is an outside tile.
+   *
+   * @param bounds The 3D bounding box that defines the spatial extent of the SDF
+   * @param resolution Grid resolution in each dimension (nx, ny, nz)
+   * @param bandWidth Half-width of the stored band in world units; distances are clamped to it
+   */
+  SparseSignedDistanceField(
+      const BoundingBoxType& bounds,
+      const Eigen::Vector3<Index>& resolution,
+      Scalar bandWidth);
+
+  /**
+   * Converts a dense SDF, storing only the blocks with at least one voxel closer than bandWidth to
+   * the surface.
+   *
+   * @param dense Dense signed distance field
+   * @param bandWidth Half-width of the stored band in world units
+   * @return Sparse signed distance field
+   */
+  [[nodiscard]] static SparseSignedDistanceField fromDense(
+      const SignedDistanceField<Scalar>& dense,
+      Scalar bandWidth);
+
+  /**
+   * Converts to a dense SDF with the same bounds and resolution. Voxels outside the band get
+   * +/-bandWidth.
+   *
+   * @return Dense signed distance field
+   */
+  [[nodiscard]] SignedDistanceField<Scalar> toDense() const;
+
+  /**
+   * Access the SDF value at discrete grid coordinates.
+   *
+   * @param i Grid index in x dimension
+   * @param j Grid index in y dimension
+   * @param k Grid index in z dimension
+   * @return The stored distance, or +/-bandWidth if the voxel is in a tile
+   */
+  [[nodiscard]] Scalar at(Index i, Index j, Index k) const;
+
+  /**
+   * Set the SDF value at discrete grid coordinates, allocating the voxel's block if it is a tile.
+   * The value is clamped to [-bandWidth, bandWidth]. Not thread-safe when it allocates.
+   *
+   * @param i Grid index in x dimension
+   * @param j Grid index in y dimension
+   * @param k Grid index in z dimension
+   * @param value The distance value to set
+   */
+  void set(Index i, Index j, Index k, Scalar value);
+
+  /**
+   * Sample the SDF at a continuous 3D position using trilinear interpolation.
+   * Positions outside the band return values clamped to +/-bandWidth.
+   *
+   * @param position 3D world-space position to query
+   * @return Interpolated signed distance value
+   */
+  template <typename InputScalar = Scalar>
+  [[nodiscard]] InputScalar sample(const Eigen::Vector3<InputScalar>& position) const;
+
+  /**
+   * Sample the SDF gradient at a continuous 3D position. The gradient is zero inside tiles.
+   *
+   * @param position 3D world-space position to query
+   * @return Gradient vector at the given position
+   */
+  template <typename InputScalar = Scalar>
+  [[nodiscard]] Eigen::Vector3<InputScalar> gradient(
+      const Eigen::Vector3<InputScalar>& position) const;
+
+  /**
+   * Sample both the SDF value and gradient at a continuous 3D position using
+   * trilinear interpolation.
+   *
+   * @param position 3D world-space position to query
+   * @return Pair of (value, gradient) at the given position
+   */
+  template <typename InputScalar = Scalar>
+  [[nodiscard]] std::pair<InputScalar, Eigen::Vector3<InputScalar>> sampleWithGradient(
+      const Eigen::Vector3<InputScalar>& position) const;
+
+  /**
+   * Convert a 3D world-space position to continuous grid coordinates.
+   *
+   * @param position 3D world-space position
+   * @return Continuous grid coordinates (may be fractional)
+   */
+  template <typename InputScalar = Scalar>
+  [[nodiscard]] Eigen::Vector3<InputScalar> worldToGrid(
+      const Eigen::Vector3<InputScalar>& position) const;
+
+  /**
+   * Convert continuous grid coordinates to 3D world-space position.
+   *
+   * @param gridPos Continuous grid coordinates
+   * @return 3D world-space position
+   */
+  template <typename InputScalar = Scalar>
+  [[nodiscard]] Eigen::Vector3<InputScalar> gridToWorld(
+      const Eigen::Vector3<InputScalar>& gridPos) const;
+
+  /**
+   * Get the resolution of the SDF grid.
+   *
+   * @return Grid resolution as (nx, ny, nz)
+   */
+  [[nodiscard]] const Eigen::Vector3<Index>& resolution() const;
+
+  /**
+   * Get the bounding box of the SDF.
+   *
+   * @return The 3D bounding box
+   */
+  [[nodiscard]] const BoundingBoxType& bounds() const;
+
+  /**
+   * Get the voxel size in each dimension.
+   *
+   * @return Voxel size as (dx, dy, dz)
+   */
+  [[nodiscard]] Vector3 voxelSize() const;
+
+  /**
+   * Get the half-width of the stored band in world units.
+   *
+   * @return Band width
+   */
+  [[nodiscard]] Scalar bandWidth() const;
+
+  /**
+   * Get the total number of voxels in the SDF, stored or not.
+   *
+   * @return Total number of grid cells
+   */
+  [[nodiscard]] Size totalVoxels() const;
+
+  /**
+   * Get the number of blocks along each dimension.
+   *
+   * @return Block grid resolution
+   */
+  [[nodiscard]] const Eigen::Vector3<Index>& blockResolution() const;
+
+  /**
+   * Get the number of blocks that store their distances.
+   *
+   * @return Number of allocated blocks
+   */
+  [[nodiscard]] Size allocatedBlocks() const;
+
+  /**
+   * Check whether a block stores its distances.
+   *
+   * @param bi Block index in x dimension
+   * @param bj Block index in y dimension
+   * @param bk Block index in z dimension
+   * @return True if the block is allocated, false if it is a tile
+   */
+  [[nodiscard]] bool isBlockAllocated(Index bi, Index bj, Index bk) const;
+
+  /**
+   * Allocate a block, initializing its voxels to the value of its tile. Does nothing if the block
+   * is already allocated. Not thread-safe.
+   *
+   * @param bi Block index in x dimension
+   * @param bj Block index in y dimension
+   * @param bk Block index in z dimension
+   */
+  void allocateBlock(Index bi, Index bj, Index bk);
+
+  /**
+   * Mark a block that is not allocated as an inside or outside tile.
+   *
+   * @param bi Block index in x dimension
+   * @param bj Block index in y dimension
+   * @param bk Block index in z dimension
+   * @param inside True if the tile is inside the surface
+   */
+  void setTile(Index bi, Index bj, Index bk, bool inside);
+
+  /**
+   * Get mutable access to the voxels of an allocated block, stored as
+   * data[(k % kBlockSize) * kBlockSize^2 + (j % kBlockSize) * kBlockSize + (i % kBlockSize)].
+   * Different blocks can be written concurrently. Values should stay within the band.
+   *
+   * @param bi Block index in x dimension
+   * @param bj Block index in y dimension
+   * @param bk Block index in z dimension
+   * @return Pointer to the kBlockVoxels values of the block
+   */
+  [[nodiscard]] Scalar* blockData(Index bi, Index bj, Index bk);
+
+  /**
+   * Get the number of bytes used by the block table and the allocated blocks.
+   *
+   * @return Memory usage in bytes
+   */
+  [[nodiscard]] Size memoryUsage() const;
+
+ private:
+  /// Block table entries for blocks that are not allocated
+  static constexpr int32_t kOutsideTile = -1;
+  static constexpr int32_t kInsideTile = -2;
+
+  [[nodiscard]] Size blockIndex(Index bi, Index bj, Index bk) const;
+
+  BoundingBoxType bounds_;
+  Eigen::Vector3<Index> resolution_;
+  Vector3 voxelSize_;
+  Scalar bandWidth_;
+  Eigen::Vector3<Index> blockResolution_;
+
+  /// For every block, its offset in blocks_ in units of kBlockVoxels, or kOutsideTile/kInsideTile
+  std::vector<int32_t> blockTable_;
+  std::vector<Scalar> blocks_;
+};
+
+using SparseSignedDistanceFieldf = SparseSignedDistanceField<float>;
+using SparseSignedDistanceFieldd = SparseSignedDistanceField<double>;
+
+extern template class SparseSignedDistanceField<float>;
+extern template class SparseSignedDistanceField<double>;
+
+} // namespace axel
@@ -31,12 +31,11 @@ Eigen::Vector3<T> interpolatePosition(
       positions.row(triangleIndices[2]) * bary[2];
 }
 
-template <typename S, size_t LeafCapacity>
-Bvh<S, LeafCapacity> buildBvh(
+template <typename S>
+std::vector<BoundingBox<S>> computeTriangleBoundingBoxes(
     const Eigen::MatrixX3<S>& positions,
     const Eigen::MatrixX3i& triangles,
     const std::optional<S>& boundingBoxThickness) {
-  XR_PROFILE_EVENT("build_bvh");
   const Eigen::Index triangleCount{triangles.rows()};
   std::vector<BoundingBox<S>> boundingBoxes(triangleCount);
 
@@ -81,7 +80,17 @@ Bvh<S, LeafCapacity> buildBvh(
 #else
   dispenso::parallel_for(0, triangleCount, boundingBoxComputeLambda);
 #endif
-  return Bvh<S, LeafCapacity>{boundingBoxes};
+  return boundingBoxes;
+}
+
+template <typename S, size_t LeafCapacity>
+Bvh<S, LeafCapacity> buildBvh(
+    const Eigen::MatrixX3<S>& positions,
+    const Eigen::MatrixX3i& triangles,
+    const std::optional<S>& boundingBoxThickness) {
+  XR_PROFILE_EVENT("build_bvh");
+  return Bvh<S, LeafCapacity>{
+      computeTriangleBoundingBoxes<S>(positions, triangles, boundingBoxThickness)};
 }
 } // namespace
 
@@ -92,7 +101,54 @@ TriBvh<S, LeafCapacity>::TriBvh(
     const std::optional<S>& boundingBoxThickness)
     : positions_{std::move(positions)},
       triangles_{std::move(triangles)},
-      bvh_{buildBvh<S, LeafCapacity>(positions_, triangles_, boundingBoxThickness)} {}
+      boundingBoxThickness_{boundingBoxThickness},
+      bvh_{buildBvh<S, LeafCapacity>(positions_, triangles_, boundingBoxThickness)},
+      builtSurfaceAreaCost_{bvh_.computeSurfaceAreaCost()} {}
+
+template <typename S, size_t LeafCapacity>
+bool TriBvh<S, LeafCapacity>::refit(
+    Eigen::MatrixX3<S>&& positions,
+    const std::optional<S>& rebuildThreshold) {
+  XR_PROFILE_EVENT("refit_bvh");
+  XR_CHECK(
+      positions.rows() == positions_.rows(),
+      "Refit expects {} positions but got {}.",
+      positions_.rows(),
+      positions.rows());
+
+  std::vector<BoundingBox<S>> boundingBoxes =
+      computeTriangleBoundingBoxes<S>(positions, triangles_, boundingBoxThickness_);
+  positions_ = std::move(positions);
+
+  // The tree stores the primitives in build order, so look the new boxes up by triangle id.
+  auto& primitives = bvh_.getPrimitives();
+  const auto updatePrimitive = [&](const size_t i) {
+    primitives[i] = boundingBoxes[primitives[i].id];
+  };
+#ifdef AXEL_NO_DISPENSO
+  for (size_t i = 0; i < primitives.size(); ++i) {
+    updatePrimitive(i);
+  }
+#else
+  dispenso::parallel_for(size_t{0}, primitives.size(), updatePrimitive);
+#endif
+  bvh_.refit();
+
+  if (!rebuildThreshold.has_value() ||
+      bvh_.computeSurfaceAreaCost() <= rebuildThreshold.value() * builtSurfaceAreaCost_) {
+    return false;
+  }
+
+  XR_PROFILE_EVENT("rebuild_bvh");
+  bvh_.setBoundingBoxes(boundingBoxes);
+  builtSurfaceAreaCost_ = bvh_.computeSurfaceAreaCost();
+  return true;
+}
+
+template <typename S, size_t LeafCapacity>
+S TriBvh<S, LeafCapacity>::getSurfaceAreaCost() const {
+  return bvh_.computeSurfaceAreaCost();
+}
 
 template <typename S, size_t LeafCapacity>
 std::vector<uint32_t> TriBvh<S, LeafCapacity>::boxQuery(const BoundingBox<S>& box) const {
@@ -148,6 +204,51 @@ std::optional<IntersectionResult<S>> TriBvh<S, LeafCapacity>::closestHit(const R
       bary};
 }
 
+template <typename S, size_t LeafCapacity>
+std::vector<std::optional<IntersectionResult<S>>> TriBvh<S, LeafCapacity>::closestHits(
+    std::span<const Ray3<S>> rays) const {
+  std::vector<HitResult<S>> hits(rays.size());
+  std::vector<S> maxT(rays.size());
+  for (size_t i = 0; i < rays.size(); ++i) {
+    maxT[i] = rays[i].maxT;
+  }
+
+  bvh_.rayPacketQueryClosestHit(
+      rays, maxT, [this, &rays, &hits](const uint32_t primIdx, const uint32_t rayIdx, S& rayMaxT) {
+        const Eigen::Vector3i tri = triangles_.row(primIdx);
+        const Eigen::Vector3<S> p0 = positions_.row(tri[0]);
+        const Eigen::Vector3<S> p1 = positions_.row(tri[1]);
+        const Eigen::Vector3<S> p2 = positions_.row(tri[2]);
+
+        const Ray3<S>& ray = rays[rayIdx];
+        S u;
+        S v;
+        S tOut;
+        Eigen::Vector3<S> itsPoint;
+        if (rayTriangleIntersect(ray.origin, ray.direction, p0, p1, p2, itsPoint, tOut, u, v) &&
+            tOut >= ray.minT && tOut <= rayMaxT) {
+          hits[rayIdx] = {u, v, tOut, primIdx};
+          rayMaxT = tOut;
+        }
+      });
+
+  std::vector<std::optional<IntersectionResult<S>>> results(rays.size());
+  for (size_t i = 0; i < rays.size(); ++i) {
+    const HitResult<S>& hit = hits[i];
+    if (hit.triangleIdx == kInvalidTriangleIdx) {
+      continue;
+    }
+
+    const Eigen::Vector3<S> bary(static_cast<S>(1.0) - hit.bary0 - hit.bary1, hit.bary0, hit.bary1);
+    results[i] = IntersectionResult<S>{
+        static_cast<int32_t>(hit.triangleIdx),
+        hit.t,
+        interpolatePosition(triangles_.row(hit.triangleIdx), positions_, bary),
+        bary};
+  }
+  return results;
+}
+
 template <typename S, size_t LeafCapacity>
 std::vector<IntersectionResult<S>> TriBvh<S, LeafCapacity>::allHits(const Ray3<S>& ray) const {
   const auto results = bvh_.template rayQueryClosestHit<std::vector<HitResult<S>>>(
@@ -269,6 +370,11 @@ size_t TriBvh<S, LeafCapacity>::getPrimitiveCount() const {
   return bvh_.getPrimitiveCount();
 }
 
+template <typename S, size_t LeafCapacity>
+size_t TriBvh<S, LeafCapacity>::getVertexCount() const {
+  return positions_.rows();
+}
+
 template class TriBvh<float>;
 template class TriBvh<double>;
 template class TriBvh<float, kNativeLaneWidth<float>>;
@@ -8,6 +8,7 @@
 #pragma once
 
 #include <optional>
+#include <span>
 
 #ifndef AXEL_NO_DISPENSO
 #include <dispenso/parallel_for.h>
@@ -65,6 +66,14 @@ class TriBvh {
    */
   [[nodiscard]] std::optional<IntersectionResult<S>> closestHit(const Ray3<S>& ray) const;
 
+  /**
+   * @brief Returns the closest hit of each of the given rays, traversing the tree once for the
+   * whole packet. For coherent rays, e.g. the pixels of a small image tile, this is faster than
+   * calling closestHit() for each ray. Rays that hit nothing get a std::nullopt.
+   */
+  [[nodiscard]] std::vector<std::optional<IntersectionResult<S>>> closestHits(
+      std::span<const Ray3<S>> rays) const;
+
   /**
    * @brief Returns all hits with the given query ray.
    */
@@ -77,6 +86,24 @@ class TriBvh {
 
   [[nodiscard]] ClosestSurfacePointResult closestSurfacePoint(const Eigen::Vector3<S>& query) const;
 
+  /**
+   * @brief Replaces the vertex positions while keeping the triangles and the tree topology, and
+   * refits the node bounds to the new positions. This is much cheaper than a rebuild, but query
+   * performance degrades as the positions drift away from the ones the tree was built with.
+   *
+   * If rebuildThreshold is set, the tree is rebuilt instead once its surface area cost (see
+   * getSurfaceAreaCost()) exceeds rebuildThreshold times the cost right after the last build.
+   *
+   * @return True if the tree was rebuilt rather than refitted.
+   */
+  bool refit(Eigen::MatrixX3<S>&& positions, const std::optional<S>& rebuildThreshold = {});
+
+  /**
+   * @brief Returns the sum of the surface areas of all tree nodes relative to the root, which is
+   * proportional to the expected query cost. It grows as a refitted tree degrades.
+   */
+  [[nodiscard]] S getSurfaceAreaCost() const;
+
   /**
    * @brief Returns the total number of internal nodes in the tree.
    */
@@ -88,11 +115,19 @@ class TriBvh {
    */
   [[nodiscard]] size_t getPrimitiveCount() const;
 
+  /**
+   * @brief Returns the number of vertex positions the Bvh was constructed with.
+   */
+  [[nodiscard]] size_t getVertexCount() const;
+
  private:
   // This memory layout is required for gather operations in vectorized code.
   Eigen::Matrix<S, Eigen::Dynamic, 3, Eigen::RowMajor> positions_;
   Eigen::MatrixX3i triangles_;
+  std::optional<S> boundingBoxThickness_;
   Bvh<S, LeafCapacity> bvh_;
+  // Surface area cost of the tree right after it was last built.
+  S builtSurfaceAreaCost_{};
 };
 
 using TriBvhf = TriBvh<float>;
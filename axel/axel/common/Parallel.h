@@ -0,0 +1,33 @@
+/*
+ * Copyright (c) Meta Platforms, Inc. and affiliates.
+ *
+ * This source code is licensed under the MIT license found in the
+ * LICENSE file in the root directory of this source tree.
+ */
+
+#pragma once
+
+#include <type_traits>
+#include <utility>
+
+#ifndef AXEL_NO_DISPENSO
+#include <dispenso/parallel_for.h>
+#endif
+
+namespace axel::detail {
+
+/**
+ * Runs func(i) for each i in [begin, end), in parallel unless dispenso is disabled.
+ */
+template <typename IndexType, typename Func>
+void parallelForEach(std::type_identity_t<IndexType> begin, IndexType end, Func&& func) {
+#ifdef AXEL_NO_DISPENSO
+  for (IndexType i = begin; i < end; ++i) {
+    func(i);
+  }
+#else
+  dispenso::parallel_for(begin, end, std::forward<Func>(func));
+#endif
+}
+
+} // namespace axel::detail
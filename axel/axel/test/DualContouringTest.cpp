@@ -10,6 +10,7 @@
 #include <gtest/gtest.h>
 
 #include <cmath>
+#include <cstdint>
 #include <unordered_map>
 #include <unordered_set>
 
@@ -372,4 +373,106 @@ TEST_F(DualContouringTest, TriangulatedQuadsCorrectWinding) {
                                 << ", Total: " << triangles.size() << ", Ratio: " << correctRatio;
 }
 
+TEST_F(DualContouringTest, IncrementalMatchesFullExtraction) {
+  const BoundingBoxf bounds(
+      Eigen::Vector3f(-2.0f, -2.0f, -2.0f), Eigen::Vector3f(2.0f, 2.0f, 2.0f));
+  const Eigen::Vector3<Index> resolution(50, 41, 45);
+  auto sdf = createSphereSdf(1.0f, Eigen::Vector3f::Zero(), bounds, resolution);
+
+  IncrementalDualContouring<float> incremental(sdf, 0.0f);
+  EXPECT_EQ(incremental.numBlocks(), 4 * 3 * 3);
+
+  // Quads as the positions of their vertices, which identify them independently of the order.
+  const auto quadPositions = [](const DualContouringResult<float>& result) {
+    std::vector<std::array<float, 12>> quads;
+    for (const auto& quad : result.quads) {
+      std::array<float, 12>& positions = quads.emplace_back();
+      for (int c = 0; c < 4; ++c) {
+        for (int d = 0; d < 3; ++d) {
+          positions[3 * c + d] = result.vertices[quad[c]][d];
+        }
+      }
+    }
+    std::sort(quads.begin(), quads.end());
+    return quads;
+  };
+  EXPECT_EQ(quadPositions(incremental.result()), quadPositions(dualContouring(sdf, 0.0f)));
+
+  // Sculpt a bump into the sphere and re-mesh only around it.
+  const Eigen::Vector3<Index> minVoxel(34, 18, 20);
+  const Eigen::Vector3<Index> maxVoxel(44, 24, 26);
+  const Eigen::Vector3f bumpCenter(1.0f, 0.0f, 0.0f);
+  for (Index k = minVoxel.z(); k <= maxVoxel.z(); ++k) {
+    for (Index j = minVoxel.y(); j <= maxVoxel.y(); ++j) {
+      for (Index i = minVoxel.x(); i <= maxVoxel.x(); ++i) {
+        const Eigen::Vector3f position = sdf.gridToWorld(
+            Eigen::Vector3f(static_cast<float>(i), static_cast<float>(j), static_cast<float>(k)));
+        sdf.set(i, j, k, std::min(sdf.at(i, j, k), (position - bumpCenter).norm() - 0.3f));
+      }
+    }
+  }
+
+  const auto before = incremental.result().quads.size();
+  const Size updatedBlocks = incremental.update(sdf, minVoxel, maxVoxel);
+  EXPECT_GT(updatedBlocks, 0);
+  EXPECT_LT(updatedBlocks, incremental.numBlocks());
+  EXPECT_NE(incremental.result().quads.size(), before);
+
+  validateQuadMesh(incremental.result());
+  const auto full = dualContouring(sdf, 0.0f);
+  EXPECT_EQ(incremental.result().vertices.size(), full.vertices.size());
+  EXPECT_EQ(quadPositions(incremental.result()), quadPositions(full));
+}
+
+TEST_F(DualContouringTest, IncrementalMatchesFullExtractionAnisotropic) {
+  // Voxels 8 times longer along x than along y and z, so that a vertex can sample the SDF up to
+  // 16 voxels away from its cell along y and z.
+  const BoundingBoxf bounds(
+      Eigen::Vector3f(-2.0f, -2.0f, -2.0f), Eigen::Vector3f(2.0f, 2.0f, 2.0f));
+  const Eigen::Vector3<Index> resolution(4, 32, 32);
+  auto sdf = createSphereSdf(1.2f, Eigen::Vector3f::Zero(), bounds, resolution);
+  ASSERT_TRUE(sdf.voxelSize().isApprox(Eigen::Vector3f(1.0f, 0.125f, 0.125f)));
+
+  // Add hashed noise, whose irregular gradients send vertices far from their cells.
+  for (Index k = 0; k < resolution.z(); ++k) {
+    for (Index j = 0; j < resolution.y(); ++j) {
+      for (Index i = 0; i < resolution.x(); ++i) {
+        const uint32_t hash = (static_cast<uint32_t>(i) * 73856093u) ^
+            (static_cast<uint32_t>(j) * 19349663u) ^ (static_cast<uint32_t>(k) * 83492791u);
+        sdf.set(
+            i, j, k, sdf.at(i, j, k) + 0.5f * (static_cast<float>(hash % 1001u) / 500.0f - 1.0f));
+      }
+    }
+  }
+
+  IncrementalDualContouring<float> incremental(sdf, 0.0f);
+
+  const auto quadPositions = [](const DualContouringResult<float>& result) {
+    std::vector<std::array<float, 12>> quads;
+    for (const auto& quad : result.quads) {
+      std::array<float, 12>& positions = quads.emplace_back();
+      for (int c = 0; c < 4; ++c) {
+        for (int d = 0; d < 3; ++d) {
+          positions[3 * c + d] = result.vertices[quad[c]][d];
+        }
+      }
+    }
+    std::sort(quads.begin(), quads.end());
+    return quads;
+  };
+
+  // Edit single voxels one after the other and re-mesh only around each of them.
+  for (Index k = 0; k < resolution.z(); k += 4) {
+    for (Index j = 0; j < resolution.y(); j += 4) {
+      for (Index i = 0; i < resolution.x(); ++i) {
+        const Eigen::Vector3<Index> voxel(i, j, k);
+        sdf.set(i, j, k, sdf.at(i, j, k) + 0.3f);
+        incremental.update(sdf, voxel, voxel);
+      }
+      ASSERT_EQ(quadPositions(incremental.result()), quadPositions(dualContouring(sdf, 0.0f)))
+          << "After editing the voxels at j = " << j << ", k = " << k;
+    }
+  }
+}
+
 } // namespace axel
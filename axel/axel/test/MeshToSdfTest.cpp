@@ -356,6 +356,74 @@ TEST_F(MeshToSdfTest, Step2_FastMarchingPropagation_EikonalEquation) {
             << gradientTolerance << std::endl;
 }
 
+TEST_F(MeshToSdfTest, Step2_DistanceTransformPropagation_ExactDistances) {
+  // The distance transform should give close to exact distances everywhere in the grid, not just
+  // near the surface, since each voxel is only one straight segment away from the narrow band.
+  const BoundingBoxf bounds(
+      Eigen::Vector3f(-1.0f, -1.0f, -1.0f), Eigen::Vector3f(1.0f, 1.0f, 1.0f));
+  const Eigen::Vector3<Index> resolution(20, 24, 16);
+  SignedDistanceField<float> sdf(bounds, resolution);
+
+  const float bandWidth = 1.5f * sdf.voxelSize().norm();
+  const float maxError = 0.75f * sdf.voxelSize().maxCoeff();
+
+  detail::initializeNarrowBand(
+      std::span<const Eigen::Vector3f>(cubeVertices),
+      std::span<const Eigen::Vector3i>(cubeFaces),
+      sdf,
+      bandWidth);
+  detail::distanceTransformPropagate(sdf);
+
+  for (Index i = 0; i < resolution.x(); ++i) {
+    for (Index j = 0; j < resolution.y(); ++j) {
+      for (Index k = 0; k < resolution.z(); ++k) {
+        const Eigen::Vector3f worldPos = sdf.gridToWorld(
+            Eigen::Vector3f(static_cast<float>(i), static_cast<float>(j), static_cast<float>(k)));
+        const float exactDistance = bruteForceDistanceToMesh(
+            worldPos,
+            std::span<const Eigen::Vector3f>(cubeVertices),
+            std::span<const Eigen::Vector3i>(cubeFaces));
+
+        // The distance through the nearest band voxel can only overestimate the true distance.
+        EXPECT_GE(sdf.at(i, j, k), exactDistance - 1e-5f) << "At " << worldPos.transpose();
+        EXPECT_LE(sdf.at(i, j, k), exactDistance + maxError) << "At " << worldPos.transpose();
+      }
+    }
+  }
+}
+
+TEST_F(MeshToSdfTest, IntegratedTest_PropagationModesAgree) {
+  const BoundingBoxf bounds(
+      Eigen::Vector3f(-1.0f, -1.0f, -1.0f), Eigen::Vector3f(1.0f, 1.0f, 1.0f));
+  const Eigen::Vector3<Index> resolution(16, 16, 16);
+
+  MeshToSdfConfigf fastMarchingConfig;
+  fastMarchingConfig.propagationMode = PropagationMode::FastMarching;
+  MeshToSdfConfigf distanceTransformConfig;
+  distanceTransformConfig.propagationMode = PropagationMode::DistanceTransform;
+
+  const auto fastMarchingSdf = meshToSdf<float>(
+      std::span<const Eigen::Vector3f>(tetraVertices),
+      std::span<const Eigen::Vector3i>(tetraFaces),
+      bounds,
+      resolution,
+      fastMarchingConfig);
+  const auto distanceTransformSdf = meshToSdf<float>(
+      std::span<const Eigen::Vector3f>(tetraVertices),
+      std::span<const Eigen::Vector3i>(tetraFaces),
+      bounds,
+      resolution,
+      distanceTransformConfig);
+
+  const float voxelSize = fastMarchingSdf.voxelSize().maxCoeff();
+  for (size_t idx = 0; idx < fastMarchingSdf.totalVoxels(); ++idx) {
+    const float fastMarching = fastMarchingSdf.data()[idx];
+    const float distanceTransform = distanceTransformSdf.data()[idx];
+    EXPECT_EQ(fastMarching < 0.0f, distanceTransform < 0.0f) << "Voxel " << idx;
+    EXPECT_NEAR(fastMarching, distanceTransform, voxelSize) << "Voxel " << idx;
+  }
+}
+
 TEST_F(MeshToSdfTest, Step3_SignDetermination_InsideOutsideAccuracy) {
   // Test sign determination: inside cube should be negative, outside positive
   // Only test voxels that are clearly inside or outside (not on/near boundary)
@@ -495,6 +563,55 @@ TEST_F(MeshToSdfTest, Step3_SignDetermination_WindingNumbers) {
   EXPECT_GT(accuracy, 0.95f) << "Winding number sign determination should be very accurate";
 }
 
+TEST_F(MeshToSdfTest, Step3_ScanlineParity_MatchesRayCasting) {
+  const BoundingBoxf bounds(
+      Eigen::Vector3f(-1.0f, -1.0f, -1.0f), Eigen::Vector3f(1.0f, 1.0f, 1.0f));
+  const Eigen::Vector3<Index> resolution(17, 20, 15);
+
+  for (const auto& [vertices, faces] :
+       {std::pair(cubeVertices, cubeFaces), std::pair(tetraVertices, tetraFaces)}) {
+    SignedDistanceField<float> rayCastingSdf(bounds, resolution, 1.0f);
+    SignedDistanceField<float> scanlineSdf(bounds, resolution, 1.0f);
+    detail::applySignsToDistanceField(
+        rayCastingSdf,
+        std::span<const Eigen::Vector3f>(vertices),
+        std::span<const Eigen::Vector3i>(faces),
+        SignMode::RayCasting);
+    detail::applySignsToDistanceField(
+        scanlineSdf,
+        std::span<const Eigen::Vector3f>(vertices),
+        std::span<const Eigen::Vector3i>(faces),
+        SignMode::ScanlineParity);
+
+    int insideVoxels = 0;
+    for (Index i = 0; i < resolution.x(); ++i) {
+      for (Index j = 0; j < resolution.y(); ++j) {
+        for (Index k = 0; k < resolution.z(); ++k) {
+          const bool scanlineInside = scanlineSdf.at(i, j, k) < 0.0f;
+          insideVoxels += scanlineInside ? 1 : 0;
+          if (scanlineInside == (rayCastingSdf.at(i, j, k) < 0.0f)) {
+            continue;
+          }
+
+          // Per-voxel ray casting ignores hits closer than 0.01 to the voxel, so the two modes
+          // may only disagree right next to the surface.
+          const Eigen::Vector3f worldPos = scanlineSdf.gridToWorld(
+              Eigen::Vector3f(static_cast<float>(i), static_cast<float>(j), static_cast<float>(k)));
+          float surfaceDistance = std::numeric_limits<float>::max();
+          for (const auto& face : faces) {
+            Eigen::Vector3f closestPoint;
+            projectOnTriangle(
+                worldPos, vertices[face[0]], vertices[face[1]], vertices[face[2]], closestPoint);
+            surfaceDistance = std::min(surfaceDistance, (worldPos - closestPoint).norm());
+          }
+          EXPECT_LT(surfaceDistance, 0.01f) << "Voxel " << i << ", " << j << ", " << k;
+        }
+      }
+    }
+    EXPECT_GT(insideVoxels, 0);
+  }
+}
+
 TEST_F(MeshToSdfTest, IntegratedTest_CubeSDFProperties) {
   // Test the complete SDF has the expected mathematical properties
   const BoundingBoxf bounds(
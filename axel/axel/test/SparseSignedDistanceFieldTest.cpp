@@ -0,0 +1,170 @@
+/*
+ * Copyright (c) Meta Platforms, Inc. and affiliates.
+ *
+ * This source code is licensed under the MIT license found in the
+ * LICENSE file in the root directory of this source tree.
+ */
+
+#include "axel/SparseSignedDistanceField.h"
+
+#include <gtest/gtest.h>
+
+#include "axel/MeshToSdf.h"
+
+namespace axel {
+
+namespace {
+
+// Analytic SDF of a sphere of radius 0.5 centered at the origin, sampled on a dense grid.
+SignedDistanceFieldf createSphereSdf(const Eigen::Vector3<Index>& resolution) {
+  const BoundingBoxf bounds(
+      Eigen::Vector3f(-1.0f, -1.0f, -1.0f), Eigen::Vector3f(1.0f, 1.0f, 1.0f));
+  SignedDistanceFieldf sdf(bounds, resolution);
+  for (Index k = 0; k < resolution.z(); ++k) {
+    for (Index j = 0; j < resolution.y(); ++j) {
+      for (Index i = 0; i < resolution.x(); ++i) {
+        const Eigen::Vector3f position = sdf.gridToWorld(
+            Eigen::Vector3f(static_cast<float>(i), static_cast<float>(j), static_cast<float>(k)));
+        sdf.set(i, j, k, position.norm() - 0.5f);
+      }
+    }
+  }
+  return sdf;
+}
+
+} // namespace
+
+TEST(SparseSignedDistanceFieldTest, DefaultIsOutside) {
+  const BoundingBoxf bounds(Eigen::Vector3f(0.0f, 0.0f, 0.0f), Eigen::Vector3f(1.0f, 1.0f, 1.0f));
+  const SparseSignedDistanceFieldf sdf(bounds, Eigen::Vector3<Index>(10, 20, 3), 0.25f);
+
+  EXPECT_EQ(sdf.blockResolution(), Eigen::Vector3<Index>(2, 3, 1));
+  EXPECT_EQ(sdf.allocatedBlocks(), 0);
+  EXPECT_EQ(sdf.totalVoxels(), 600);
+  EXPECT_EQ(sdf.at(9, 19, 2), 0.25f);
+  EXPECT_FLOAT_EQ(sdf.sample(Eigen::Vector3f(0.5f, 0.5f, 0.5f)), 0.25f);
+  EXPECT_TRUE(sdf.gradient(Eigen::Vector3f(0.5f, 0.5f, 0.5f)).isZero());
+}
+
+TEST(SparseSignedDistanceFieldTest, SetAllocatesAndClamps) {
+  const BoundingBoxf bounds(Eigen::Vector3f(0.0f, 0.0f, 0.0f), Eigen::Vector3f(1.0f, 1.0f, 1.0f));
+  SparseSignedDistanceFieldf sdf(bounds, Eigen::Vector3<Index>(16, 16, 16), 0.25f);
+
+  sdf.setTile(1, 1, 1, true);
+  EXPECT_EQ(sdf.at(12, 12, 12), -0.25f);
+
+  sdf.set(9, 10, 11, 0.1f);
+  EXPECT_EQ(sdf.allocatedBlocks(), 1);
+  EXPECT_TRUE(sdf.isBlockAllocated(1, 1, 1));
+  EXPECT_EQ(sdf.at(9, 10, 11), 0.1f);
+  // The rest of the block keeps the value of the tile it replaced.
+  EXPECT_EQ(sdf.at(12, 12, 12), -0.25f);
+
+  sdf.set(0, 0, 0, -3.0f);
+  EXPECT_EQ(sdf.allocatedBlocks(), 2);
+  EXPECT_EQ(sdf.at(0, 0, 0), -0.25f);
+}
+
+TEST(SparseSignedDistanceFieldTest, DenseRoundTrip) {
+  const Eigen::Vector3<Index> resolution(40, 33, 27);
+  const SignedDistanceFieldf dense = createSphereSdf(resolution);
+  const float bandWidth = 0.2f;
+
+  const auto sparse = SparseSignedDistanceFieldf::fromDense(dense, bandWidth);
+  EXPECT_GT(sparse.allocatedBlocks(), 0);
+  EXPECT_LT(sparse.allocatedBlocks(), static_cast<Size>(sparse.blockResolution().prod()));
+  EXPECT_LT(sparse.memoryUsage(), static_cast<Size>(dense.totalVoxels() * sizeof(float)));
+
+  const SignedDistanceFieldf roundTrip = sparse.toDense();
+  EXPECT_EQ(roundTrip.resolution(), resolution);
+  for (Index k = 0; k < resolution.z(); ++k) {
+    for (Index j = 0; j < resolution.y(); ++j) {
+      for (Index i = 0; i < resolution.x(); ++i) {
+        const float expected = std::clamp(dense.at(i, j, k), -bandWidth, bandWidth);
+        EXPECT_EQ(sparse.at(i, j, k), expected);
+        EXPECT_EQ(roundTrip.at(i, j, k), expected);
+      }
+    }
+  }
+}
+
+TEST(SparseSignedDistanceFieldTest, SamplingMatchesDenseInsideBand) {
+  const SignedDistanceFieldf dense = createSphereSdf(Eigen::Vector3<Index>(32, 32, 32));
+  const auto sparse = SparseSignedDistanceFieldf::fromDense(dense, 0.3f);
+
+  // Near the surface every interpolated voxel is stored, so sparse and dense agree exactly.
+  for (const Eigen::Vector3f& position :
+       {Eigen::Vector3f(0.5f, 0.0f, 0.0f),
+        Eigen::Vector3f(0.1f, -0.42f, 0.2f),
+        Eigen::Vector3f(-0.3f, 0.3f, -0.3f)}) {
+    EXPECT_FLOAT_EQ(sparse.sample(position), dense.sample(position));
+    const auto [value, gradient] = sparse.sampleWithGradient(position);
+    EXPECT_FLOAT_EQ(value, dense.sample(position));
+    EXPECT_TRUE(gradient.isApprox(dense.gradient(position), 1e-5f));
+  }
+
+  // Far from the surface the sample is clamped to the band.
+  EXPECT_FLOAT_EQ(sparse.sample(Eigen::Vector3f(0.0f, 0.0f, 0.0f)), -0.3f);
+  EXPECT_FLOAT_EQ(sparse.sample(Eigen::Vector3f(0.9f, 0.9f, 0.9f)), 0.3f);
+  EXPECT_TRUE(sparse.gradient(Eigen::Vector3f(0.0f, 0.0f, 0.0f)).isZero());
+}
+
+TEST(SparseSignedDistanceFieldTest, MeshToSparseSdfMatchesDense) {
+  // Unit cube centered at the origin
+  const std::vector<Eigen::Vector3f> vertices = {
+      Eigen::Vector3f(-0.5f, -0.5f, -0.5f),
+      Eigen::Vector3f(0.5f, -0.5f, -0.5f),
+      Eigen::Vector3f(0.5f, 0.5f, -0.5f),
+      Eigen::Vector3f(-0.5f, 0.5f, -0.5f),
+      Eigen::Vector3f(-0.5f, -0.5f, 0.5f),
+      Eigen::Vector3f(0.5f, -0.5f, 0.5f),
+      Eigen::Vector3f(0.5f, 0.5f, 0.5f),
+      Eigen::Vector3f(-0.5f, 0.5f, 0.5f)};
+  const std::vector<Eigen::Vector3i> triangles = {
+      Eigen::Vector3i(0, 1, 2),
+      Eigen::Vector3i(0, 2, 3),
+      Eigen::Vector3i(4, 6, 5),
+      Eigen::Vector3i(4, 7, 6),
+      Eigen::Vector3i(0, 5, 1),
+      Eigen::Vector3i(0, 4, 5),
+      Eigen::Vector3i(2, 7, 3),
+      Eigen::Vector3i(2, 6, 7),
+      Eigen::Vector3i(0, 3, 7),
+      Eigen::Vector3i(0, 7, 4),
+      Eigen::Vector3i(1, 6, 2),
+      Eigen::Vector3i(1, 5, 6)};
+
+  const BoundingBoxf bounds(
+      Eigen::Vector3f(-1.0f, -1.0f, -1.0f), Eigen::Vector3f(1.0f, 1.0f, 1.0f));
+  const Eigen::Vector3<Index> resolution(41, 37, 45);
+  MeshToSdfConfig<float> config;
+  config.narrowBandWidth = 2.0f;
+  config.signMode = SignMode::ScanlineParity;
+
+  const auto sparse = meshToSparseSdf<float>(vertices, triangles, bounds, resolution, config);
+  const auto dense = meshToSdf<float>(vertices, triangles, bounds, resolution, config);
+
+  const float bandWidth = sparse.bandWidth();
+  EXPECT_FLOAT_EQ(bandWidth, 2.0f * sparse.voxelSize().norm());
+  EXPECT_LT(sparse.allocatedBlocks(), static_cast<Size>(sparse.blockResolution().prod()));
+
+  for (Index k = 0; k < resolution.z(); ++k) {
+    for (Index j = 0; j < resolution.y(); ++j) {
+      for (Index i = 0; i < resolution.x(); ++i) {
+        const Eigen::Vector3f position = sparse.gridToWorld(
+            Eigen::Vector3f(static_cast<float>(i), static_cast<float>(j), static_cast<float>(k)));
+        const Eigen::Vector3f outside = (position.cwiseAbs().array() - 0.5f).max(0.0f);
+        const float insideDistance = (0.5f - position.cwiseAbs().array()).minCoeff();
+        const float exact = outside.isZero() ? insideDistance : outside.norm();
+
+        // Every voxel within the band is stored with its exact distance.
+        EXPECT_NEAR(std::abs(sparse.at(i, j, k)), std::min(exact, bandWidth), 1e-5f)
+            << "Voxel " << i << ", " << j << ", " << k;
+        EXPECT_EQ(sparse.at(i, j, k) < 0.0f, dense.at(i, j, k) < 0.0f)
+            << "Voxel " << i << ", " << j << ", " << k;
+      }
+    }
+  }
+}
+
+} // namespace axel
@@ -108,6 +108,43 @@ TYPED_TEST(TriBvhTest, rayHitsClosest) {
       std::nullopt);
 }
 
+TYPED_TEST(TriBvhTest, rayHitsClosest_PacketMatchesSingleRays) {
+  using S = typename TestFixture::Type;
+
+  auto sphere = generateSphere(kSphereParams<S>);
+  const TriBvh<S> bvh{std::move(sphere.positions), std::move(sphere.triangles)};
+
+  // A pinhole-like 8x8 tile of rays from outside the sphere, with some rays missing it, some
+  // clipped by their maximum distance, and some starting inside it.
+  std::vector<Ray3<S>> rays;
+  for (int y = 0; y < 8; ++y) {
+    for (int x = 0; x < 8; ++x) {
+      const Eigen::Vector3<S> direction(S(x - 4) / 6, S(y - 4) / 6, 1);
+      rays.emplace_back(Eigen::Vector3<S>(0, 0, -10), direction);
+    }
+  }
+  rays[5].maxT = 6.0;
+  rays[17].origin = Eigen::Vector3<S>(0, 0, 1);
+
+  const auto hits = bvh.closestHits(rays);
+  ASSERT_THAT(hits, SizeIs(rays.size()));
+  size_t numHits = 0;
+  for (size_t i = 0; i < rays.size(); ++i) {
+    const auto expected = bvh.closestHit(rays[i]);
+    ASSERT_EQ(hits[i].has_value(), expected.has_value()) << "Failed for ray " << i;
+    if (expected.has_value()) {
+      ++numHits;
+      EXPECT_EQ(hits[i]->triangleId, expected->triangleId);
+      EXPECT_NEAR(hits[i]->hitDistance, expected->hitDistance, detail::eps<S>(1e-5, 1e-12));
+      EXPECT_EIGEN_MATRIX_NEAR(hits[i]->baryCoords, expected->baryCoords, detail::eps<S>());
+    }
+  }
+  EXPECT_GT(numHits, 0);
+  EXPECT_LT(numHits, rays.size());
+  EXPECT_FALSE(hits[5].has_value());
+  EXPECT_TRUE(hits[17].has_value());
+}
+
 TYPED_TEST(TriBvhTest, rayAllHits) {
   using S = typename TestFixture::Type;
 
@@ -245,6 +282,64 @@ TYPED_TEST(TriBvhTest, ClosestSurfacePoint_ExpectZeroDistFromMeshPoints) {
   }
 }
 
+TYPED_TEST(TriBvhTest, Refit_SameResultsAsRebuild) {
+  using S = typename TestFixture::Type;
+
+  const auto sphere = generateSphere(kSphereParams<S>);
+  auto bvh = makeBvh<S, kNativeLaneWidth<S>>(sphere);
+
+  // Squash and shift the sphere, as a stand-in for an animated mesh.
+  MeshData<S> deformed = sphere;
+  deformed.positions.col(0) *= 2.0;
+  deformed.positions.col(2) *= 0.5;
+  deformed.positions.col(1).array() += 1.0;
+
+  Eigen::MatrixX3<S> positions = deformed.positions;
+  EXPECT_FALSE(bvh.refit(std::move(positions)));
+  EXPECT_EQ(bvh.getVertexCount(), sphere.positions.rows());
+  const auto rebuilt = makeBvh<S, kNativeLaneWidth<S>>(deformed);
+
+  constexpr GridMeshParameters<S> kGridParams{10.0, 10.0, 1.0};
+  const Eigen::MatrixX<S> queryPoints =
+      generateGrid(kGridParams, Eigen::Vector3<S>(0, 0, 2)).positions;
+  for (uint32_t i = 0; i < queryPoints.rows(); ++i) {
+    const Eigen::Vector3<S> query = queryPoints.row(i);
+    EXPECT_NEAR(
+        (query - bvh.closestSurfacePoint(query).point).norm(),
+        (query - rebuilt.closestSurfacePoint(query).point).norm(),
+        detail::eps<S>(1e-5, 1e-12))
+        << "Failed for: " << query.transpose();
+  }
+}
+
+TYPED_TEST(TriBvhTest, Refit_RebuildsPastThreshold) {
+  using S = typename TestFixture::Type;
+
+  const auto sphere = generateSphere(kSphereParams<S>);
+  auto bvh = makeBvh<S, 1>(sphere);
+  const S builtCost = bvh.getSurfaceAreaCost();
+
+  // Refitting to the same positions keeps the cost unchanged.
+  Eigen::MatrixX3<S> positions = sphere.positions;
+  EXPECT_FALSE(bvh.refit(std::move(positions), S(1)));
+  EXPECT_NEAR(bvh.getSurfaceAreaCost(), builtCost, detail::eps<S>(1e-4, 1e-10));
+
+  // Shuffling the vertices scrambles the mesh, so the refitted nodes overlap heavily.
+  const Eigen::Index vertexCount = sphere.positions.rows();
+  positions.resize(vertexCount, 3);
+  for (Eigen::Index i = 0; i < vertexCount; ++i) {
+    positions.row(i) = sphere.positions.row((i * 7919) % vertexCount);
+  }
+  Eigen::MatrixX3<S> scrambled = positions;
+  EXPECT_TRUE(bvh.refit(std::move(positions), S(1.5)));
+
+  // Without a threshold the tree is never rebuilt, and ends up worse than the rebuilt one.
+  auto refitOnly = makeBvh<S, 1>(sphere);
+  EXPECT_FALSE(refitOnly.refit(std::move(scrambled)));
+  EXPECT_GT(refitOnly.getSurfaceAreaCost(), 1.5 * builtCost);
+  EXPECT_LT(bvh.getSurfaceAreaCost(), refitOnly.getSurfaceAreaCost());
+}
+
 TYPED_TEST(TriBvhTest, ClosestSurfacePoints_SameResultsAsIgl) {
   using S = typename TestFixture::Type;
 
@@ -16,12 +16,14 @@ common_public_headers = [
     "common/log.h",
     "common/memory.h",
     "common/profile.h",
+    "common/profiler.h",
     "common/progress_bar.h",
     "common/string.h",
 ]
 
 common_sources = [
     "common/log.cpp",
+    "common/profiler.cpp",
     "common/progress_bar.cpp",
     "common/string.cpp",
 ]
@@ -30,6 +32,7 @@ common_test_sources = [
     "test/common/aligned_allocator_test.cpp",
     "test/common/exception_test.cpp",
     "test/common/log_test.cpp",
+    "test/common/profiler_test.cpp",
     "test/common/progress_bar_test.cpp",
     "test/common/string_test.cpp",
 ]
@@ -184,6 +187,7 @@ character_sources = [
     "character/inverse_parameter_transform.cpp",
     "character/linear_skinning.cpp",
     "character/locator_state.cpp",
+    "character/marker.cpp",
     "character/mesh_state.cpp",
     "character/pose_shape.cpp",
     "character/skin_weights.cpp",
@@ -203,6 +207,7 @@ character_test_sources = [
     "test/character/linear_skinning_test.cpp",
     "test/character/locator_test.cpp",
     "test/character/locator_state_test.cpp",
+    "test/character/marker_test.cpp",
     "test/character/parameter_limits_test.cpp",
     "test/character/parameter_transform_test.cpp",
     "test/character/pose_shape_test.cpp",
@@ -520,6 +525,7 @@ io_marker_public_headers = [
     "io/marker/conversions.h",
     "io/marker/coordinate_system.h",
     "io/marker/marker_io.h",
+    "io/marker/marker_stream.h",
     "io/marker/trc_io.h",
 ]
 
@@ -527,6 +533,7 @@ io_marker_sources = [
     "io/marker/c3d_io.cpp",
     "io/marker/conversions.cpp",
     "io/marker/marker_io.cpp",
+    "io/marker/marker_stream.cpp",
     "io/marker/trc_io.cpp",
 ]
 
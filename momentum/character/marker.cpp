@@ -0,0 +1,88 @@
+/*
+ * Copyright (c) Meta Platforms, Inc. and affiliates.
+ *
+ * This source code is licensed under the MIT license found in the
+ * LICENSE file in the root directory of this source tree.
+ */
+
+#include "momentum/character/marker.h"
+
+#include "momentum/common/exception.h"
+
+namespace momentum {
+
+void ColumnarMarkerSequence::resize(const size_t numFrames) {
+  const auto nMarkers = static_cast<Eigen::Index>(markerNames.size());
+  const auto nFrames = static_cast<Eigen::Index>(numFrames);
+  if (positions.rows() != 3 * nMarkers || occluded.rows() != nMarkers) {
+    positions.setZero(3 * nMarkers, nFrames);
+    occluded.setOnes(nMarkers, nFrames);
+    return;
+  }
+
+  const Eigen::Index oldFrames = positions.cols();
+  positions.conservativeResize(Eigen::NoChange, nFrames);
+  occluded.conservativeResize(Eigen::NoChange, nFrames);
+  if (nFrames > oldFrames) {
+    positions.rightCols(nFrames - oldFrames).setZero();
+    occluded.rightCols(nFrames - oldFrames).setOnes();
+  }
+}
+
+std::vector<Marker> ColumnarMarkerSequence::frame(const size_t iFrame) const {
+  MT_THROW_IF(iFrame >= numFrames(), "Frame {} out of range [0, {})", iFrame, numFrames());
+
+  std::vector<Marker> markers(numMarkers());
+  for (size_t iMarker = 0; iMarker < markers.size(); ++iMarker) {
+    markers[iMarker].name = markerNames[iMarker];
+    markers[iMarker].pos = positions.col(iFrame).segment<3>(3 * iMarker).cast<double>();
+    markers[iMarker].occluded = occluded(iMarker, iFrame) != 0;
+  }
+  return markers;
+}
+
+ColumnarMarkerSequence toColumnarMarkerSequence(const MarkerSequence& sequence) {
+  ColumnarMarkerSequence result;
+  result.name = sequence.name;
+  result.fps = sequence.fps;
+  if (sequence.frames.empty()) {
+    return result;
+  }
+
+  const auto& firstFrame = sequence.frames.front();
+  result.markerNames.reserve(firstFrame.size());
+  for (const auto& marker : firstFrame) {
+    result.markerNames.push_back(marker.name);
+  }
+
+  const size_t numMarkers = result.markerNames.size();
+  result.resize(sequence.frames.size());
+  for (size_t iFrame = 0; iFrame < sequence.frames.size(); ++iFrame) {
+    const auto& frame = sequence.frames[iFrame];
+    MT_THROW_IF(
+        frame.size() != numMarkers,
+        "Frame {} of marker sequence '{}' has {} markers, but the first frame has {}",
+        iFrame,
+        sequence.name,
+        frame.size(),
+        numMarkers);
+    for (size_t iMarker = 0; iMarker < numMarkers; ++iMarker) {
+      result.positions.col(iFrame).segment<3>(3 * iMarker) = frame[iMarker].pos.cast<float>();
+      result.occluded(iMarker, iFrame) = frame[iMarker].occluded ? 1 : 0;
+    }
+  }
+  return result;
+}
+
+MarkerSequence toMarkerSequence(const ColumnarMarkerSequence& sequence) {
+  MarkerSequence result;
+  result.name = sequence.name;
+  result.fps = sequence.fps;
+  result.frames.reserve(sequence.numFrames());
+  for (size_t iFrame = 0; iFrame < sequence.numFrames(); ++iFrame) {
+    result.frames.push_back(sequence.frame(iFrame));
+  }
+  return result;
+}
+
+} // namespace momentum
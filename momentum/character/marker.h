@@ -9,6 +9,7 @@
 
 #include <momentum/math/types.h>
 
+#include <cstdint>
 #include <string>
 #include <vector>
 
@@ -45,4 +46,52 @@ struct MarkerSequence {
   float fps = 30.0f;
 };
 
+/// ColumnarMarkerSequence stores the same data as a MarkerSequence in columnar form.
+///
+/// Instead of a Marker with its own name string for every marker in every frame, the marker names
+/// are stored once and the positions and occlusion flags of all frames are stored in two dense
+/// arrays. Marker i of every frame is the marker named markerNames[i].
+struct ColumnarMarkerSequence {
+  /// Name of the actor sequence (typically a unique subject name or ID)
+  std::string name;
+
+  /// The names of the markers. Size: [numMarkers]
+  std::vector<std::string> markerNames;
+
+  /// The marker positions in centimeters. Column f holds the positions of all the markers in frame
+  /// f, so the data is laid out as [numFrames][numMarkers][3]. Size: [3 * numMarkers, numFrames]
+  Eigen::MatrixXf positions;
+
+  /// The occlusion status of the markers, 1 if occluded and 0 otherwise. The data is laid out as
+  /// [numFrames][numMarkers]. Size: [numMarkers, numFrames]
+  Eigen::Matrix<uint8_t, Eigen::Dynamic, Eigen::Dynamic> occluded;
+
+  /// The frame rate of the motion capture sequence in frames per second (default is 30.0)
+  float fps = 30.0f;
+
+  /// Resizes the sequence to numFrames frames of the current markers; new frames are occluded with
+  /// zero positions.
+  void resize(size_t numFrames);
+
+  [[nodiscard]] size_t numFrames() const {
+    return positions.cols();
+  }
+
+  [[nodiscard]] size_t numMarkers() const {
+    return markerNames.size();
+  }
+
+  /// Returns the markers of a single frame.
+  [[nodiscard]] std::vector<Marker> frame(size_t iFrame) const;
+};
+
+/// Converts a MarkerSequence to columnar form. The marker names are taken from the first frame.
+/// Positions are converted to single precision.
+///
+/// @throw std::runtime_error if the frames don't all have the same number of markers.
+[[nodiscard]] ColumnarMarkerSequence toColumnarMarkerSequence(const MarkerSequence& sequence);
+
+/// Converts a ColumnarMarkerSequence back to a MarkerSequence with one Marker per marker and frame.
+[[nodiscard]] MarkerSequence toMarkerSequence(const ColumnarMarkerSequence& sequence);
+
 } // namespace momentum
@@ -62,15 +62,27 @@
 
 #else
 
-#define MT_PROFILE_FUNCTION()
-#define MT_PROFILE_FUNCTION_CATEGORY(CATEGORY)
-#define MT_PROFILE_EVENT(NAME)
-#define MT_PROFILE_EVENT_DYNAMIC(NAME)
-#define MT_PROFILE_CATEGORY(NAME, CATEGORY)
-#define MT_PROFILE_PREPARE_PUSH_POP()
-#define MT_PROFILE_PUSH(NAME)
-#define MT_PROFILE_POP()
-#define MT_PROFILE_THREAD(THREAD_NAME)
+// Built-in backend; zones are only recorded while momentum::profiler::Profiler is enabled.
+#include <momentum/common/profiler.h>
+
+#define _MT_PROFILE_CONCATENATE_DETAIL(x, y) x##y
+#define _MT_PROFILE_CONCATENATE(x, y) _MT_PROFILE_CONCATENATE_DETAIL(x, y)
+#define _MT_PROFILE_MAKE_UNIQUE(x) _MT_PROFILE_CONCATENATE(x, __LINE__)
+
+#define MT_PROFILE_FUNCTION() \
+  ::momentum::profiler::ScopedZone _MT_PROFILE_MAKE_UNIQUE(_mtProfileZone)(__func__)
+#define MT_PROFILE_FUNCTION_CATEGORY(CATEGORY) MT_PROFILE_FUNCTION()
+#define MT_PROFILE_EVENT(NAME) \
+  ::momentum::profiler::ScopedZone _MT_PROFILE_MAKE_UNIQUE(_mtProfileZone)(NAME)
+#define MT_PROFILE_EVENT_DYNAMIC(NAME)                                      \
+  ::momentum::profiler::ScopedZone _MT_PROFILE_MAKE_UNIQUE(_mtProfileZone)( \
+      NAME, ::momentum::profiler::ScopedZone::Dynamic{})
+#define MT_PROFILE_CATEGORY(NAME, CATEGORY) MT_PROFILE_EVENT(NAME)
+#define MT_PROFILE_PREPARE_PUSH_POP() ::momentum::profiler::ZoneStack _mtProfileZoneStack
+#define MT_PROFILE_PUSH(NAME) _mtProfileZoneStack.push(NAME)
+#define MT_PROFILE_POP() _mtProfileZoneStack.pop()
+#define MT_PROFILE_THREAD(THREAD_NAME) \
+  ::momentum::profiler::Profiler::instance().setThreadName(THREAD_NAME)
 #define MT_PROFILE_UPDATE()
 #define MT_PROFILE_BEGIN_FRAME()
 #define MT_PROFILE_END_FRAME()
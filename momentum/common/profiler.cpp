@@ -0,0 +1,312 @@
+/*
+ * Copyright (c) Meta Platforms, Inc. and affiliates.
+ *
+ * This source code is licensed under the MIT license found in the
+ * LICENSE file in the root directory of this source tree.
+ */
+
+#include "momentum/common/profiler.h"
+
+#include "momentum/common/exception.h"
+
+#include <fmt/format.h>
+
+#include <algorithm>
+#include <chrono>
+#include <fstream>
+#include <map>
+#include <mutex>
+#include <thread>
+#include <unordered_map>
+#include <unordered_set>
+
+namespace momentum::profiler {
+
+namespace {
+
+constexpr size_t kDefaultBufferCapacity = 16384;
+
+std::atomic<Profiler*> gInstance{nullptr};
+
+Profiler& defaultProfiler() {
+  static Profiler profiler;
+  return profiler;
+}
+
+// Appends a string as a JSON string literal.
+void appendJsonString(std::string& out, std::string_view str) {
+  out += '"';
+  for (const char c : str) {
+    switch (c) {
+      case '"':
+        out += "\\\"";
+        break;
+      case '\\':
+        out += "\\\\";
+        break;
+      case '\n':
+        out += "\\n";
+        break;
+      case '\t':
+        out += "\\t";
+        break;
+      default:
+        if (static_cast<unsigned char>(c) < 0x20) {
+          out += fmt::format("\\u{:04x}", static_cast<int>(c));
+        } else {
+          out += c;
+        }
+    }
+  }
+  out += '"';
+}
+
+} // namespace
+
+struct Profiler::ThreadBuffer {
+  std::mutex mutex;
+  // Ring buffer of the most recent zones; grows up to the capacity.
+  std::vector<ZoneEvent> events;
+  size_t next = 0;
+  size_t dropped = 0;
+  uint32_t threadId = 0;
+};
+
+struct Profiler::Impl {
+  mutable std::mutex mutex;
+  std::atomic<size_t> capacity{kDefaultBufferCapacity};
+  std::unordered_map<std::thread::id, std::shared_ptr<ThreadBuffer>> buffers;
+  std::unordered_map<std::thread::id, uint32_t> threadIds;
+  std::map<uint32_t, std::string> threadNames;
+  // Node-based, so that the names stay at the same address
+  std::unordered_set<std::string> names;
+
+  // Requires mutex to be held.
+  uint32_t threadId(const std::thread::id id) {
+    return threadIds.try_emplace(id, static_cast<uint32_t>(threadIds.size())).first->second;
+  }
+};
+
+Profiler::Profiler() : impl_(std::make_shared<Impl>()) {}
+
+Profiler::~Profiler() = default;
+
+Profiler& Profiler::instance() {
+  Profiler* profiler = gInstance.load(std::memory_order_acquire);
+  return profiler != nullptr ? *profiler : defaultProfiler();
+}
+
+void Profiler::setInstance(Profiler* profiler) {
+  gInstance.store(profiler, std::memory_order_release);
+}
+
+void Profiler::setEnabled(const bool enabled) {
+  enabled_.store(enabled, std::memory_order_relaxed);
+}
+
+size_t Profiler::bufferCapacity() const {
+  return impl_->capacity.load(std::memory_order_relaxed);
+}
+
+void Profiler::setBufferCapacity(const size_t capacity) {
+  MT_THROW_IF(capacity == 0, "The profiler buffer capacity must be positive.");
+  impl_->capacity.store(capacity, std::memory_order_relaxed);
+  clear();
+}
+
+void Profiler::clear() {
+  std::lock_guard<std::mutex> lock(impl_->mutex);
+  for (auto it = impl_->buffers.begin(); it != impl_->buffers.end();) {
+    // Only the profiler references the buffers of threads that exited
+    if (it->second.use_count() == 1) {
+      it = impl_->buffers.erase(it);
+      continue;
+    }
+    auto& buffer = *it->second;
+    std::lock_guard<std::mutex> bufferLock(buffer.mutex);
+    buffer.events.clear();
+    buffer.events.shrink_to_fit();
+    buffer.next = 0;
+    buffer.dropped = 0;
+    ++it;
+  }
+}
+
+Profiler::ThreadBuffer& Profiler::threadBuffer() {
+  // Comparing the owners of the weak and shared pointers is cheap, and exact even if the profiler
+  // was destroyed, since the weak pointer keeps its control block alive.
+  struct Cache {
+    std::weak_ptr<Impl> owner;
+    std::shared_ptr<ThreadBuffer> buffer;
+  };
+  thread_local Cache cache;
+  if (cache.buffer != nullptr && !cache.owner.owner_before(impl_) &&
+      !impl_.owner_before(cache.owner)) {
+    return *cache.buffer;
+  }
+
+  const auto id = std::this_thread::get_id();
+  std::lock_guard<std::mutex> lock(impl_->mutex);
+  auto& buffer = impl_->buffers[id];
+  if (buffer == nullptr) {
+    buffer = std::make_shared<ThreadBuffer>();
+    buffer->threadId = impl_->threadId(id);
+  }
+  cache.owner = impl_;
+  cache.buffer = buffer;
+  return *buffer;
+}
+
+void Profiler::record(const char* name, const uint64_t beginNs, const uint64_t endNs) {
+  const size_t capacity = impl_->capacity.load(std::memory_order_relaxed);
+  ThreadBuffer& buffer = threadBuffer();
+  std::lock_guard<std::mutex> lock(buffer.mutex);
+  const ZoneEvent event{name, beginNs, endNs - beginNs, buffer.threadId};
+  if (buffer.events.size() < capacity) {
+    buffer.events.push_back(event);
+  } else {
+    buffer.events[buffer.next] = event;
+    ++buffer.dropped;
+  }
+  buffer.next = (buffer.next + 1) % capacity;
+}
+
+const char* Profiler::intern(std::string_view name) {
+  std::lock_guard<std::mutex> lock(impl_->mutex);
+  return impl_->names.emplace(name).first->c_str();
+}
+
+void Profiler::setThreadName(std::string_view name) {
+  const auto id = std::this_thread::get_id();
+  std::lock_guard<std::mutex> lock(impl_->mutex);
+  impl_->threadNames[impl_->threadId(id)] = std::string(name);
+}
+
+uint64_t Profiler::now() {
+  // The steady clock has the same epoch in every copy of this library in the process
+  return std::chrono::duration_cast<std::chrono::nanoseconds>(
+             std::chrono::steady_clock::now().time_since_epoch())
+      .count();
+}
+
+std::vector<ZoneEvent> Profiler::events() const {
+  std::vector<ZoneEvent> result;
+  {
+    std::lock_guard<std::mutex> lock(impl_->mutex);
+    for (const auto& [id, buffer] : impl_->buffers) {
+      std::lock_guard<std::mutex> bufferLock(buffer->mutex);
+      result.insert(result.end(), buffer->events.begin(), buffer->events.end());
+    }
+  }
+  std::sort(result.begin(), result.end(), [](const ZoneEvent& a, const ZoneEvent& b) {
+    // Enclosing zones come before the zones nested in them
+    return a.beginNs != b.beginNs ? a.beginNs < b.beginNs : a.durationNs > b.durationNs;
+  });
+  return result;
+}
+
+size_t Profiler::droppedEvents() const {
+  std::lock_guard<std::mutex> lock(impl_->mutex);
+  size_t result = 0;
+  for (const auto& [id, buffer] : impl_->buffers) {
+    std::lock_guard<std::mutex> bufferLock(buffer->mutex);
+    result += buffer->dropped;
+  }
+  return result;
+}
+
+std::vector<ZoneStats> Profiler::zoneStats() const {
+  const std::vector<ZoneEvent> allEvents = events();
+
+  // Time spent in the zones directly nested in each zone
+  std::vector<uint64_t> childNs(allEvents.size(), 0);
+  std::unordered_map<uint32_t, std::vector<size_t>> openZones;
+  for (size_t i = 0; i < allEvents.size(); ++i) {
+    const ZoneEvent& event = allEvents[i];
+    auto& stack = openZones[event.threadId];
+    while (!stack.empty()) {
+      const ZoneEvent& parent = allEvents[stack.back()];
+      if (parent.beginNs + parent.durationNs > event.beginNs) {
+        break;
+      }
+      stack.pop_back();
+    }
+    if (!stack.empty()) {
+      childNs[stack.back()] += event.durationNs;
+    }
+    stack.push_back(i);
+  }
+
+  constexpr double kNsToMs = 1e-6;
+  std::unordered_map<std::string_view, ZoneStats> statsByName;
+  for (size_t i = 0; i < allEvents.size(); ++i) {
+    const ZoneEvent& event = allEvents[i];
+    const double durationMs = event.durationNs * kNsToMs;
+    auto [it, inserted] = statsByName.try_emplace(event.name);
+    ZoneStats& stats = it->second;
+    if (inserted) {
+      stats.name = event.name;
+      stats.minMs = durationMs;
+      stats.maxMs = durationMs;
+    }
+    ++stats.count;
+    stats.totalMs += durationMs;
+    stats.selfMs += (event.durationNs - std::min(childNs[i], event.durationNs)) * kNsToMs;
+    stats.minMs = std::min(stats.minMs, durationMs);
+    stats.maxMs = std::max(stats.maxMs, durationMs);
+  }
+
+  std::vector<ZoneStats> result;
+  result.reserve(statsByName.size());
+  for (auto& [name, stats] : statsByName) {
+    result.push_back(std::move(stats));
+  }
+  std::sort(result.begin(), result.end(), [](const ZoneStats& a, const ZoneStats& b) {
+    return a.totalMs > b.totalMs;
+  });
+  return result;
+}
+
+std::string Profiler::chromeTrace() const {
+  const std::vector<ZoneEvent> allEvents = events();
+  std::map<uint32_t, std::string> threadNames;
+  {
+    std::lock_guard<std::mutex> lock(impl_->mutex);
+    threadNames = impl_->threadNames;
+  }
+
+  // Timestamps are in microseconds, relative to the first zone
+  const uint64_t originNs = allEvents.empty() ? 0 : allEvents.front().beginNs;
+  std::string out = R"({"displayTimeUnit":"ms","traceEvents":[)";
+  bool first = true;
+  for (const auto& event : allEvents) {
+    out += first ? "\n" : ",\n";
+    first = false;
+    out += R"({"name":)";
+    appendJsonString(out, event.name);
+    out += fmt::format(
+        R"(,"cat":"momentum","ph":"X","pid":0,"tid":{},"ts":{:.3f},"dur":{:.3f}}})",
+        event.threadId,
+        (event.beginNs - originNs) * 1e-3,
+        event.durationNs * 1e-3);
+  }
+  for (const auto& [threadId, name] : threadNames) {
+    out += first ? "\n" : ",\n";
+    first = false;
+    out += fmt::format(
+        R"({{"name":"thread_name","ph":"M","pid":0,"tid":{},"args":{{"name":)", threadId);
+    appendJsonString(out, name);
+    out += "}}";
+  }
+  out += "\n]}\n";
+  return out;
+}
+
+void Profiler::saveChromeTrace(const filesystem::path& filename) const {
+  std::ofstream file(filename, std::ios::out | std::ios::binary);
+  MT_THROW_IF(!file.is_open(), "Unable to open {} for writing", filename.string());
+  file << chromeTrace();
+  MT_THROW_IF(!file.good(), "Unable to write the trace to {}", filename.string());
+}
+
+} // namespace momentum::profiler
@@ -0,0 +1,193 @@
+/*
+ * Copyright (c) Meta Platforms, Inc. and affiliates.
+ *
+ * This source code is licensed under the MIT license found in the
+ * LICENSE file in the root directory of this source tree.
+ */
+
+#pragma once
+
+#include <momentum/common/filesystem.h>
+
+#include <atomic>
+#include <cstddef>
+#include <cstdint>
+#include <memory>
+#include <string>
+#include <string_view>
+#include <vector>
+
+namespace momentum::profiler {
+
+/// A completed profiling zone.
+struct ZoneEvent {
+  /// Name of the zone; points to storage that lives as long as the profiler.
+  const char* name = nullptr;
+
+  /// Start time in nanoseconds, relative to an arbitrary process-wide epoch.
+  uint64_t beginNs = 0;
+
+  /// Duration in nanoseconds.
+  uint64_t durationNs = 0;
+
+  /// Small integer identifying the thread the zone ran on.
+  uint32_t threadId = 0;
+};
+
+/// Timings of all the recorded zones with the same name.
+struct ZoneStats {
+  std::string name;
+
+  /// Number of recorded zones.
+  size_t count = 0;
+
+  /// Total time spent in the zones, in milliseconds.
+  double totalMs = 0.0;
+
+  /// Total time spent in the zones excluding the zones nested in them on the same thread, in
+  /// milliseconds.
+  double selfMs = 0.0;
+
+  double minMs = 0.0;
+  double maxMs = 0.0;
+};
+
+/// Records the zones of the MT_PROFILE macros when the built-in profiling backend is used.
+///
+/// Zones are only recorded while the profiler is enabled, which is off by default. Each thread
+/// records into its own ring buffer, which keeps the most recent bufferCapacity() zones of that
+/// thread.
+///
+/// A process normally has a single Profiler, returned by instance(). When momentum is linked
+/// statically into several shared libraries, each library has its own instance; calling
+/// setInstance() in all but one of them makes them record into the same profiler.
+class Profiler {
+ public:
+  Profiler();
+  ~Profiler();
+
+  Profiler(const Profiler&) = delete;
+  Profiler& operator=(const Profiler&) = delete;
+
+  /// The profiler the MT_PROFILE macros record into.
+  [[nodiscard]] static Profiler& instance();
+
+  /// Makes instance() return the given profiler, or the default one if nullptr.
+  static void setInstance(Profiler* profiler);
+
+  [[nodiscard]] bool isEnabled() const {
+    return enabled_.load(std::memory_order_relaxed);
+  }
+
+  void setEnabled(bool enabled);
+
+  /// Maximum number of zones kept per thread.
+  [[nodiscard]] size_t bufferCapacity() const;
+
+  /// Sets the maximum number of zones kept per thread; discards the recorded zones.
+  void setBufferCapacity(size_t capacity);
+
+  /// Discards the recorded zones.
+  void clear();
+
+  /// The recorded zones of all threads, sorted by start time.
+  [[nodiscard]] std::vector<ZoneEvent> events() const;
+
+  /// Number of zones overwritten because a thread's buffer was full since the last clear().
+  [[nodiscard]] size_t droppedEvents() const;
+
+  /// Aggregated timings of the recorded zones, sorted by decreasing total time.
+  [[nodiscard]] std::vector<ZoneStats> zoneStats() const;
+
+  /// The recorded zones in the Chrome trace event format, viewable in chrome://tracing or
+  /// Perfetto.
+  [[nodiscard]] std::string chromeTrace() const;
+
+  /// Writes chromeTrace() to a file.
+  ///
+  /// @throws std::runtime_error if the file cannot be written.
+  void saveChromeTrace(const filesystem::path& filename) const;
+
+  /// Records a zone of the calling thread.
+  ///
+  /// @param[in] name Name of the zone, which must outlive the profiler (e.g. a string literal).
+  void record(const char* name, uint64_t beginNs, uint64_t endNs);
+
+  /// Returns a copy of the name that lives as long as the profiler, for zones with dynamic names.
+  [[nodiscard]] const char* intern(std::string_view name);
+
+  /// Names the calling thread in the Chrome trace.
+  void setThreadName(std::string_view name);
+
+  /// Current time in nanoseconds, relative to the epoch of ZoneEvent::beginNs.
+  [[nodiscard]] static uint64_t now();
+
+ private:
+  struct Impl;
+  struct ThreadBuffer;
+
+  ThreadBuffer& threadBuffer();
+
+  std::atomic<bool> enabled_{false};
+  std::shared_ptr<Impl> impl_;
+};
+
+/// A profiling zone that lasts until the end of the enclosing scope.
+class ScopedZone {
+ public:
+  /// @param[in] name Name of the zone, which must outlive the profiler (e.g. a string literal).
+  explicit ScopedZone(const char* name) {
+    Profiler& profiler = Profiler::instance();
+    if (profiler.isEnabled()) {
+      start(profiler, name);
+    }
+  }
+
+  /// Zone with a name that does not outlive the zone.
+  struct Dynamic {};
+  ScopedZone(std::string_view name, Dynamic /*unused*/) {
+    Profiler& profiler = Profiler::instance();
+    if (profiler.isEnabled()) {
+      start(profiler, profiler.intern(name));
+    }
+  }
+
+  ~ScopedZone() {
+    if (profiler_ != nullptr) {
+      profiler_->record(name_, beginNs_, Profiler::now());
+    }
+  }
+
+  ScopedZone(const ScopedZone&) = delete;
+  ScopedZone& operator=(const ScopedZone&) = delete;
+
+ private:
+  void start(Profiler& profiler, const char* name) {
+    profiler_ = &profiler;
+    name_ = name;
+    beginNs_ = Profiler::now();
+  }
+
+  Profiler* profiler_ = nullptr;
+  const char* name_ = nullptr;
+  uint64_t beginNs_ = 0;
+};
+
+/// Zones opened and closed explicitly, for MT_PROFILE_PUSH and MT_PROFILE_POP.
+class ZoneStack {
+ public:
+  void push(const char* name) {
+    zones_.push_back(std::make_unique<ScopedZone>(name));
+  }
+
+  void pop() {
+    if (!zones_.empty()) {
+      zones_.pop_back();
+    }
+  }
+
+ private:
+  std::vector<std::unique_ptr<ScopedZone>> zones_;
+};
+
+} // namespace momentum::profiler
@@ -8,11 +8,19 @@
 #include "momentum/io/marker/c3d_io.h"
 
 #include "momentum/character/marker.h"
+#include "momentum/common/exception.h"
 #include "momentum/common/log.h"
 #include "momentum/io/marker/conversions.h"
 
 #include <ezc3d/ezc3d_all.h>
 
+#include <array>
+#include <bit>
+#include <cmath>
+#include <cstring>
+#include <fstream>
+#include <map>
+#include <optional>
 #include <set>
 #include <unordered_map>
 
@@ -67,11 +75,482 @@ bool isMarkerValid(const std::string_view label, std::span<const std::string> va
   return true;
 }
 
-} // namespace
+// Checks that the point unit is supported, and warns if it is not millimeters.
+bool checkUnit(const std::string& unitStr) {
+  if (unitStr != "mm" && unitStr != "m" && unitStr != "cm" && unitStr != "dm") {
+    MT_LOGE("{}: Unknown unit string '{}' found in the file.", __func__, unitStr);
+    return false;
+  }
+  MT_LOGW_IF(
+      unitStr != "mm",
+      "{}: Unit '{}' is not mm. Translating a C3D file that contains 3D point data stored in any units other than millimeters is extremely complex and any mistakes will render the file invalid.",
+      __func__,
+      unitStr);
+  return true;
+}
 
-std::vector<MarkerSequence>
-loadC3d(const std::string& filename, UpVector up, std::span<const std::string> validMarkerNames) {
-  std::vector<MarkerSequence> resultAnim;
+// Collects the labels of the first numPoints points. getLabels(name) returns the values of the
+// POINT parameter with the given name.
+template <typename GetLabels>
+std::optional<std::vector<std::string>> collectPointLabels(
+    const size_t numPoints,
+    GetLabels&& getLabels) {
+  constexpr auto kLabelStr = "LABELS";
+
+  // Point:Labels section can store max 255 labels. For the other labels, find them in section
+  // LABEL2, LABEL3.. Each additional section can contain max 255 labels. The file may contain
+  // more labels than numPoints since some points may be invalid.
+  constexpr auto kNumLabelsPerSection = 255;
+  auto pointLabels = getLabels(kLabelStr);
+  if (!pointLabels) {
+    MT_LOGE("{}: Invalid c3d file: no point labels found!", __func__);
+    return {};
+  }
+  size_t numOfExtraSections = numPoints / kNumLabelsPerSection;
+
+  constexpr size_t kAdditionSectionStartIndex = 2;
+  pointLabels->reserve(numPoints);
+  for (size_t sectionId = kAdditionSectionStartIndex;
+       sectionId < kAdditionSectionStartIndex + numOfExtraSections;
+       sectionId++) {
+    const auto labelStr = kLabelStr + std::to_string(sectionId);
+    const auto additionalPointLabels = getLabels(labelStr);
+    if (additionalPointLabels) {
+      pointLabels->insert(
+          pointLabels->end(), additionalPointLabels->begin(), additionalPointLabels->end());
+    }
+  }
+
+  if (pointLabels->size() < numPoints) {
+    MT_LOGE("{}: Number of point labels loaded isn't consistent with the header! ", __func__);
+    return {};
+  }
+  // Only the first numPoints points need to be loaded
+  pointLabels->resize(numPoints);
+  return pointLabels;
+}
+
+// Groups the points into subjects by their labels. Returns one sequence without frames per subject,
+// and sets markerMap to the (subject, marker) index of every point, or {-1, -1} for the points
+// that are not loaded.
+std::vector<ColumnarMarkerSequence> groupPointsBySubject(
+    std::span<const std::string> pointLabels,
+    std::span<const std::string> validMarkerNames,
+    const float fps,
+    std::vector<std::pair<int, int>>& markerMap) {
+  const size_t numPoints = pointLabels.size();
+
+  // Go through the labels to find all the subjects and their markers.
+  // A Subject is a collection of points that should be grouped together to represent an object.
+  std::unordered_map<std::string, std::vector<int>> subjectNameMap;
+  subjectNameMap.reserve(numPoints);
+  for (size_t iLabel = 0; iLabel < numPoints; ++iLabel) {
+    const std::string& name = pointLabels[iLabel];
+    const std::string subjectName = findSubjectName(name);
+    subjectNameMap[subjectName].push_back(iLabel);
+  }
+
+  markerMap.assign(numPoints, {-1, -1});
+  std::vector<ColumnarMarkerSequence> subjects(subjectNameMap.size());
+  auto actorId = 0;
+  for (const auto& namePointsPair : subjectNameMap) {
+    const auto& subjectName = namePointsPair.first;
+    auto markerCount = 0;
+    auto& actorSequence = subjects[actorId];
+    actorSequence.fps = fps;
+    actorSequence.name = subjectName;
+    for (const auto kPointIdx : namePointsPair.second) {
+      auto pointLabel = pointLabels[kPointIdx];
+      if (!subjectName.empty()) {
+        pointLabel = pointLabel.substr(subjectName.size() + 1);
+      }
+
+      if (isMarkerValid(pointLabel, validMarkerNames)) {
+        markerMap[kPointIdx] = std::make_pair(actorId, markerCount);
+        actorSequence.markerNames.push_back(pointLabel);
+        markerCount++;
+      }
+    }
+    actorId++;
+  }
+  return subjects;
+}
+
+// The processor types of the C3D format, which define the byte order of integers and the float
+// representation
+enum class C3dProcessor { Intel = 84, Dec = 85, Mips = 86 };
+
+int16_t decodeInt16(const char* bytes, const C3dProcessor processor) {
+  const auto b0 = static_cast<uint8_t>(bytes[0]);
+  const auto b1 = static_cast<uint8_t>(bytes[1]);
+  if (processor == C3dProcessor::Mips) {
+    return static_cast<int16_t>((b0 << 8) | b1);
+  }
+  return static_cast<int16_t>((b1 << 8) | b0);
+}
+
+float decodeFloat(const char* bytes, const C3dProcessor processor) {
+  std::array<uint8_t, 4> b{};
+  std::memcpy(b.data(), bytes, 4);
+  if (processor == C3dProcessor::Mips) {
+    std::reverse(b.begin(), b.end());
+  } else if (processor == C3dProcessor::Dec) {
+    // DEC floats have their 16-bit words swapped and an exponent that is larger by 2
+    b = {b[2], b[3], b[0], static_cast<uint8_t>(b[1] != 0 ? b[1] - 1 : 0)};
+  }
+  const uint32_t bits = static_cast<uint32_t>(b[0]) | (static_cast<uint32_t>(b[1]) << 8) |
+      (static_cast<uint32_t>(b[2]) << 16) | (static_cast<uint32_t>(b[3]) << 24);
+  return std::bit_cast<float>(bits);
+}
+
+// A parameter of the C3D parameter section
+struct C3dParameter {
+  // -1 for char, 1 for byte, 2 for int16 and 4 for float
+  int8_t type = 0;
+  std::vector<uint8_t> dimensions;
+  std::vector<char> data;
+};
+
+// The layout of a C3D file, parsed from its header and parameter section
+struct C3dLayout {
+  C3dProcessor processor = C3dProcessor::Intel;
+  std::map<std::string, C3dParameter> parameters; // keyed by "GROUP:PARAMETER"
+  size_t numPoints = 0;
+  size_t numAnalogValues = 0; // per frame
+  size_t numFrames = 0;
+  bool isFloat = false;
+  float scaleFactor = 1.0f;
+  float fps = 0.0f;
+  std::streamoff dataOffset = 0;
+  std::streamoff frameBytes = 0;
+
+  [[nodiscard]] const C3dParameter* parameter(const std::string& name) const {
+    const auto it = parameters.find(name);
+    return it != parameters.end() ? &it->second : nullptr;
+  }
+
+  [[nodiscard]] std::optional<std::vector<std::string>> strings(const std::string& name) const {
+    const auto* param = parameter(name);
+    if (param == nullptr || param->type != -1) {
+      return {};
+    }
+    const size_t length = param->dimensions.empty() ? param->data.size() : param->dimensions[0];
+    std::vector<std::string> result;
+    for (size_t begin = 0; length > 0 && begin + length <= param->data.size(); begin += length) {
+      std::string value(param->data.data() + begin, length);
+      value.erase(value.find_last_not_of(std::string(" \0", 2)) + 1);
+      result.push_back(std::move(value));
+    }
+    return result;
+  }
+
+  // Returns the integer values of a parameter, read as unsigned 16-bit words
+  [[nodiscard]] std::vector<uint32_t> words(const std::string& name) const {
+    const auto* param = parameter(name);
+    std::vector<uint32_t> result;
+    if (param != nullptr && param->type == 2) {
+      for (size_t i = 0; i + 2 <= param->data.size(); i += 2) {
+        result.push_back(static_cast<uint16_t>(decodeInt16(param->data.data() + i, processor)));
+      }
+    }
+    return result;
+  }
+};
+
+std::string toUpper(std::string str) {
+  std::transform(str.begin(), str.end(), str.begin(), ::toupper);
+  return str;
+}
+
+// Parses the parameter section, which is a list of group and parameter records
+void parseC3dParameters(const std::vector<char>& section, C3dLayout& layout) {
+  std::map<int, std::string> groupNames;
+  std::vector<std::pair<int, std::pair<std::string, C3dParameter>>> groupParameters;
+
+  size_t pos = 4;
+  while (pos + 2 <= section.size()) {
+    const size_t nameLength = std::abs(static_cast<int8_t>(section[pos]));
+    if (nameLength == 0) {
+      break;
+    }
+    const int id = static_cast<int8_t>(section[pos + 1]);
+    const size_t offsetPos = pos + 2 + nameLength;
+    MT_THROW_IF(offsetPos + 2 > section.size(), "Truncated C3D parameter section");
+    std::string name = toUpper(std::string(section.data() + pos + 2, nameLength));
+    const auto offset =
+        static_cast<uint16_t>(decodeInt16(section.data() + offsetPos, layout.processor));
+
+    if (id < 0) {
+      groupNames[-id] = std::move(name);
+    } else {
+      size_t cur = offsetPos + 2;
+      MT_THROW_IF(cur + 2 > section.size(), "Truncated C3D parameter section");
+      C3dParameter param;
+      param.type = static_cast<int8_t>(section[cur]);
+      const size_t numDimensions = static_cast<uint8_t>(section[cur + 1]);
+      cur += 2;
+      MT_THROW_IF(cur + numDimensions > section.size(), "Truncated C3D parameter section");
+      param.dimensions.assign(section.begin() + cur, section.begin() + cur + numDimensions);
+      cur += numDimensions;
+      size_t numBytes = std::abs(param.type);
+      for (const auto dim : param.dimensions) {
+        numBytes *= dim;
+      }
+      MT_THROW_IF(cur + numBytes > section.size(), "Truncated C3D parameter section");
+      param.data.assign(section.begin() + cur, section.begin() + cur + numBytes);
+      groupParameters.emplace_back(id, std::make_pair(std::move(name), std::move(param)));
+    }
+
+    if (offset == 0) {
+      break;
+    }
+    pos = offsetPos + offset;
+  }
+
+  for (auto& [groupId, nameParam] : groupParameters) {
+    const auto group = groupNames.find(groupId);
+    if (group != groupNames.end()) {
+      layout.parameters[group->second + ":" + nameParam.first] = std::move(nameParam.second);
+    }
+  }
+}
+
+// Reads the header and parameter section of a C3D file.
+C3dLayout readC3dLayout(std::ifstream& file) {
+  C3dLayout layout;
+  constexpr std::streamoff kBlockSize = 512;
+
+  std::array<char, kBlockSize> header{};
+  file.read(header.data(), kBlockSize);
+  MT_THROW_IF(!file || static_cast<uint8_t>(header[1]) != 0x50, "Invalid C3D header");
+  const std::streamoff parameterOffset = (static_cast<uint8_t>(header[0]) - 1) * kBlockSize;
+
+  std::array<char, 4> sectionHeader{};
+  file.seekg(parameterOffset);
+  file.read(sectionHeader.data(), 4);
+  MT_THROW_IF(!file, "Invalid C3D parameter section");
+  const auto processor = static_cast<uint8_t>(sectionHeader[3]);
+  MT_THROW_IF(
+      processor < static_cast<uint8_t>(C3dProcessor::Intel) ||
+          processor > static_cast<uint8_t>(C3dProcessor::Mips),
+      "Unknown C3D processor type {}",
+      processor);
+  layout.processor = static_cast<C3dProcessor>(processor);
+
+  std::vector<char> section(static_cast<uint8_t>(sectionHeader[2]) * kBlockSize);
+  file.seekg(parameterOffset);
+  file.read(section.data(), section.size());
+  section.resize(file.gcount());
+  file.clear();
+  parseC3dParameters(section, layout);
+
+  const auto word = [&](size_t iWord) -> uint16_t {
+    return decodeInt16(header.data() + 2 * (iWord - 1), layout.processor);
+  };
+  layout.numPoints = word(2);
+  layout.numAnalogValues = word(3);
+  const size_t firstFrame = word(4);
+  const size_t lastFrame = word(5);
+  layout.scaleFactor = decodeFloat(header.data() + 12, layout.processor);
+  layout.dataOffset = (static_cast<std::streamoff>(word(9)) - 1) * kBlockSize;
+  layout.fps = decodeFloat(header.data() + 20, layout.processor);
+  layout.isFloat = layout.scaleFactor < 0.0f;
+  layout.scaleFactor = std::abs(layout.scaleFactor);
+
+  // The header can only count up to 65535 frames; longer captures store the frame range in
+  // TRIAL:ACTUAL_START_FIELD and TRIAL:ACTUAL_END_FIELD as two 16-bit words each.
+  layout.numFrames = lastFrame >= firstFrame ? lastFrame - firstFrame + 1 : 0;
+  const auto startField = layout.words("TRIAL:ACTUAL_START_FIELD");
+  const auto endField = layout.words("TRIAL:ACTUAL_END_FIELD");
+  if (startField.size() >= 2 && endField.size() >= 2) {
+    const size_t start = startField[0] | (startField[1] << 16);
+    const size_t end = endField[0] | (endField[1] << 16);
+    if (end >= start) {
+      layout.numFrames = std::max(layout.numFrames, end - start + 1);
+    }
+  }
+  const auto pointFrames = layout.words("POINT:FRAMES");
+  if (!pointFrames.empty()) {
+    layout.numFrames = std::max<size_t>(layout.numFrames, pointFrames[0]);
+  }
+
+  // Every frame holds 4 values (x, y, z and residual) per point followed by the analog values
+  const std::streamoff valueSize = layout.isFloat ? 4 : 2;
+  layout.frameBytes = valueSize * (4 * layout.numPoints + layout.numAnalogValues);
+  file.seekg(0, std::ios::end);
+  const std::streamoff fileSize = file.tellg();
+  if (layout.frameBytes > 0) {
+    const std::streamoff availableFrames =
+        std::max<std::streamoff>(fileSize - layout.dataOffset, 0) / layout.frameBytes;
+    layout.numFrames = std::min<size_t>(layout.numFrames, availableFrames);
+  }
+  return layout;
+}
+
+class C3dStreamReader : public MarkerStreamReader {
+ public:
+  C3dStreamReader(
+      std::ifstream&& file,
+      C3dLayout&& layout,
+      std::vector<ColumnarMarkerSequence>&& subjects,
+      std::vector<std::pair<int, int>>&& markerMap,
+      std::string unit,
+      UpVector up)
+      : MarkerStreamReader(std::move(subjects), layout.numFrames),
+        file_(std::move(file)),
+        layout_(std::move(layout)),
+        markerMap_(std::move(markerMap)),
+        unit_(std::move(unit)),
+        up_(up) {
+    for (const auto& subject : this->subjects()) {
+      lastPositions_.emplace_back(Eigen::VectorXf::Zero(3 * subject.numMarkers()));
+    }
+  }
+
+ protected:
+  size_t readFrames(const size_t firstFrame, std::span<ColumnarMarkerSequence> chunk) override {
+    const size_t numFrames = chunk.empty() ? 0 : chunk.front().numFrames();
+    if (numFrames == 0 || layout_.frameBytes == 0) {
+      return numFrames;
+    }
+
+    if (firstFrame != nextFrame_) {
+      findLastPositions(firstFrame);
+    }
+    const size_t numFramesRead = decodeFrames(firstFrame, chunk);
+
+    // Occluded markers keep their position from the previous frame, as in loadC3dColumnar
+    for (size_t actorId = 0; actorId < chunk.size(); ++actorId) {
+      auto& actorSequence = chunk[actorId];
+      auto& lastPositions = lastPositions_[actorId];
+      for (size_t iFrame = 0; iFrame < numFramesRead; ++iFrame) {
+        for (size_t markerId = 0; markerId < actorSequence.numMarkers(); ++markerId) {
+          auto pos = actorSequence.positions.col(iFrame).segment<3>(3 * markerId);
+          if (actorSequence.occluded(markerId, iFrame) != 0) {
+            pos = lastPositions.segment<3>(3 * markerId);
+          } else {
+            lastPositions.segment<3>(3 * markerId) = pos;
+          }
+        }
+      }
+    }
+    nextFrame_ = firstFrame + numFramesRead;
+    return numFramesRead;
+  }
+
+ private:
+  // Number of frames read at once when looking for the last visible positions before a frame
+  static constexpr size_t kLookBackFrames = 256;
+
+  // Sets lastPositions_ to the positions the markers had when they were last visible before the
+  // given frame, reading the file backwards until every marker is found or the start is reached.
+  void findLastPositions(const size_t frame) {
+    std::vector<ColumnarMarkerSequence> block = subjects();
+    std::vector<std::vector<bool>> found(block.size());
+    size_t numMissing = 0;
+    for (size_t actorId = 0; actorId < block.size(); ++actorId) {
+      lastPositions_[actorId].setZero();
+      found[actorId].assign(block[actorId].numMarkers(), false);
+      numMissing += block[actorId].numMarkers();
+    }
+
+    size_t end = frame;
+    while (end > 0 && numMissing > 0) {
+      const size_t begin = end - std::min(end, kLookBackFrames);
+      for (auto& actorSequence : block) {
+        actorSequence.resize(0);
+        actorSequence.resize(end - begin);
+      }
+      const size_t numFramesRead = decodeFrames(begin, block);
+      for (size_t iFrame = numFramesRead; iFrame-- > 0;) {
+        for (size_t actorId = 0; actorId < block.size(); ++actorId) {
+          const auto& actorSequence = block[actorId];
+          for (size_t markerId = 0; markerId < actorSequence.numMarkers(); ++markerId) {
+            if (!found[actorId][markerId] && actorSequence.occluded(markerId, iFrame) == 0) {
+              lastPositions_[actorId].segment<3>(3 * markerId) =
+                  actorSequence.positions.col(iFrame).segment<3>(3 * markerId);
+              found[actorId][markerId] = true;
+              --numMissing;
+            }
+          }
+        }
+      }
+      end = begin;
+    }
+  }
+
+  // Reads the frames [firstFrame, firstFrame + chunk[i].numFrames()) and stores the positions of
+  // the visible markers in the chunk. Returns the number of frames read.
+  size_t decodeFrames(const size_t firstFrame, std::span<ColumnarMarkerSequence> chunk) {
+    const size_t numFrames = chunk.empty() ? 0 : chunk.front().numFrames();
+    buffer_.resize(numFrames * layout_.frameBytes);
+    file_.clear();
+    file_.seekg(layout_.dataOffset + static_cast<std::streamoff>(firstFrame) * layout_.frameBytes);
+    file_.read(buffer_.data(), buffer_.size());
+    const size_t numFramesRead = file_.gcount() / layout_.frameBytes;
+
+    const size_t valueSize = layout_.isFloat ? 4 : 2;
+    for (size_t iFrame = 0; iFrame < numFramesRead; ++iFrame) {
+      const char* frameData = buffer_.data() + iFrame * layout_.frameBytes;
+      for (size_t pointId = 0; pointId < layout_.numPoints; ++pointId) {
+        const auto [kActorId, kMarkerId] = markerMap_[pointId];
+        // not a marker of interest
+        if ((kActorId == -1) || (kMarkerId == -1)) {
+          continue;
+        }
+
+        const char* pointData = frameData + 4 * valueSize * pointId;
+        Vector3d pos;
+        double residual = 0.0;
+        if (layout_.isFloat) {
+          for (size_t k = 0; k < 3; ++k) {
+            pos[k] = decodeFloat(pointData + 4 * k, layout_.processor);
+          }
+          residual = decodeFloat(pointData + 12, layout_.processor);
+        } else {
+          for (size_t k = 0; k < 3; ++k) {
+            pos[k] = decodeInt16(pointData + 2 * k, layout_.processor) * layout_.scaleFactor;
+          }
+          residual = decodeInt16(pointData + 6, layout_.processor);
+        }
+
+        // residual < 0 indicates that the data is invalid
+        if (std::isnan(pos[0]) || std::isnan(pos[1]) || std::isnan(pos[2]) ||
+            pos == Eigen::Vector3d::Zero() || residual < 0) {
+          continue;
+        }
+        pos = toMomentumVector3(pos, up_, unit_);
+
+        auto& actorSequence = chunk[kActorId];
+        actorSequence.occluded(kMarkerId, iFrame) = 0;
+        actorSequence.positions.col(iFrame).segment<3>(3 * kMarkerId) = pos.cast<float>();
+      }
+    }
+    return numFramesRead;
+  }
+
+  std::ifstream file_;
+  const C3dLayout layout_;
+  const std::vector<std::pair<int, int>> markerMap_;
+  const std::string unit_;
+  const UpVector up_;
+  std::vector<char> buffer_;
+  // The positions of the markers of every subject in the frame before nextFrame_
+  std::vector<Eigen::VectorXf> lastPositions_;
+  size_t nextFrame_ = 0;
+};
+
+// Reads the points of a C3D file with ezc3d. The points are grouped into subjects, which are passed
+// to onSubjects(subjects, numFrames) before any frame is read; then onPoint(actorId, markerId,
+// frameId, pos) is called for every visible point of interest. Returns false if the file can't be
+// read or has no visible points.
+template <typename OnSubjects, typename OnPoint>
+bool readC3dPoints(
+    const std::string& filename,
+    UpVector up,
+    std::span<const std::string> validMarkerNames,
+    OnSubjects&& onSubjects,
+    OnPoint&& onPoint) {
   float fps = 0.0f;
 
   bool hasAnim = false;
@@ -88,7 +567,6 @@ loadC3d(const std::string& filename, UpVector up, std::span<const std::string> v
 
     // Load Point Labels from Parameter Section
     constexpr auto kPointGroupStr = "POINT";
-    constexpr auto kLabelStr = "LABELS";
     const auto& parameters = c3dFile.parameters();
     const auto& pointGroup = parameters.group(kPointGroupStr);
 
@@ -97,96 +575,29 @@ loadC3d(const std::string& filename, UpVector up, std::span<const std::string> v
     const auto& unit = pointGroup.parameter(kUnitStr).valuesAsString();
     if (unit.size() != 1) {
       MT_LOGE("{}: Invalid c3d file: no unit information found!", __func__);
-      return {};
+      return false;
     }
 
     const auto& unitStr = unit[0];
-    if (unitStr != "mm" && unitStr != "m" && unitStr != "cm" && unitStr != "dm") {
-      MT_LOGE("{}: Unknown unit string '{}' found in the file.", __func__, unitStr);
-      return {};
-    }
-    MT_LOGW_IF(
-        unitStr != "mm",
-        "{}: Unit '{}' is not mm. Translating a C3D file that contains 3D point data stored in any units other than millimeters is extremely complex and any mistakes will render the file invalid.",
-        __func__,
-        unitStr);
-
-    // Point:Labels section can store max 255 labels. For the other labels, find them in section
-    // LABEL2, LABEL3.. Each additional section can contain max 255 labels. The file may contain
-    // more labels than kPointsPerFrame since some points may be invalid.
-    constexpr auto kNumLabelsPerSection = 255;
-    auto pointLabels = pointGroup.parameter(kLabelStr).valuesAsString();
-    size_t numOfExtraSections = kPointsPerFrame / kNumLabelsPerSection;
-
-    constexpr size_t kAdditionSectionStartIndex = 2;
-    pointLabels.reserve(kPointsPerFrame);
-    for (size_t sectionId = kAdditionSectionStartIndex;
-         sectionId < kAdditionSectionStartIndex + numOfExtraSections;
-         sectionId++) {
-      const auto labelStr = kLabelStr + std::to_string(sectionId);
-      const auto& additionalPointLabels = pointGroup.parameter(labelStr).valuesAsString();
-      pointLabels.insert(
-          pointLabels.end(), additionalPointLabels.begin(), additionalPointLabels.end());
-    }
-
-    if (pointLabels.size() < kPointsPerFrame) {
-      MT_LOGE("{}: Number of point labels loaded isn't consistent with the header! ", __func__);
-      return {};
+    if (!checkUnit(unitStr)) {
+      return false;
     }
-    // Only the first kPointsPerFrame points need to be loaded
-    pointLabels.resize(kPointsPerFrame);
 
-    // Go through the labels to find all the subjects and their markers.
-    // A Subject is a collection of points that should be grouped together to represent an object.
-    std::unordered_map<std::string, std::vector<int>> subjectNameMap;
-    subjectNameMap.reserve(kPointsPerFrame);
-    for (size_t iLabel = 0; iLabel < kPointsPerFrame; ++iLabel) {
-      const std::string& name = pointLabels[iLabel];
-      const std::string subjectName = findSubjectName(name);
-      subjectNameMap[subjectName].push_back(iLabel);
+    const auto pointLabels = collectPointLabels(
+        kPointsPerFrame, [&](const std::string& name) -> std::optional<std::vector<std::string>> {
+          return pointGroup.parameter(name).valuesAsString();
+        });
+    if (!pointLabels) {
+      return false;
     }
 
     // Set up a look up table for each point on which actor it belongs to
-    const auto kNumOfSubjects = subjectNameMap.size();
-    std::vector<std::pair<int, int>> markerMap(kPointsPerFrame, {-1, -1});
-    resultAnim = std::vector<MarkerSequence>(kNumOfSubjects);
-    auto templateActors = std::vector<std::vector<Marker>>(kNumOfSubjects);
-    auto actorId = 0;
-    for (const auto& namePointsPair : subjectNameMap) {
-      const auto& subjectName = namePointsPair.first;
-      auto markerCount = 0;
-      auto& actorSequence = resultAnim[actorId];
-      actorSequence.fps = fps;
-      auto& templateActor = templateActors[actorId];
-      actorSequence.name = subjectName;
-      for (const auto kPointIdx : namePointsPair.second) {
-        auto pointLabel = pointLabels[kPointIdx];
-        if (!subjectName.empty()) {
-          pointLabel = pointLabel.substr(subjectName.size() + 1);
-        }
-
-        if (isMarkerValid(pointLabel, validMarkerNames)) {
-          markerMap[kPointIdx] = std::make_pair(actorId, markerCount);
-
-          Marker marker;
-          marker.name = pointLabel;
-          marker.occluded = true;
-          templateActor.push_back(marker);
-          markerCount++;
-        }
-      }
-      actorId++;
-    }
+    std::vector<std::pair<int, int>> markerMap;
+    onSubjects(groupPointsBySubject(*pointLabels, validMarkerNames, fps, markerMap), kFrameCount);
 
     // Go through each frame to save the data
     const auto& frames = c3dFile.data().frames();
     for (int frameId = 0; frameId < kFrameCount; frameId++) {
-      // Set all markers to be occluded
-      for (auto& templateActor : templateActors) {
-        for (auto& marker : templateActor) {
-          marker.occluded = true;
-        }
-      }
       const auto& frameData = frames[frameId];
       const auto& framePoints = frameData.points().points();
       for (int pointId = 0; pointId < kPointsPerFrame; ++pointId) {
@@ -198,7 +609,6 @@ loadC3d(const std::string& filename, UpVector up, std::span<const std::string> v
           continue;
         }
 
-        auto& marker = templateActors[kActorId][kMarkerId];
         const auto& pointData = framePoints[pointId];
         Vector3d pos{pointData.x(), pointData.y(), pointData.z()};
         if (std::isnan(pos[0]) || std::isnan(pos[1]) || std::isnan(pos[2])) {
@@ -214,28 +624,135 @@ loadC3d(const std::string& filename, UpVector up, std::span<const std::string> v
         // residual == 0 indicates that the data is generated. Can see if the want to keep the =
         // here or not
         if (residual >= 0) {
-          marker.occluded = false;
-          marker.pos = pos;
+          onPoint(kActorId, kMarkerId, frameId, pos);
           hasAnim = true;
         }
       }
-      for (actorId = 0; actorId < templateActors.size(); actorId++) {
-        resultAnim[actorId].frames.push_back(templateActors[actorId]);
-      }
     }
   } catch (std::exception& e) {
     MT_LOGE("{}: Exception: {}", e.what(), __func__);
-    return {};
+    return false;
   } catch (...) {
     MT_LOGE("{}: Unknown c3d reading error", __func__);
+    return false;
+  }
+
+  return hasAnim;
+}
+
+} // namespace
+
+std::vector<ColumnarMarkerSequence> loadC3dColumnar(
+    const std::string& filename,
+    UpVector up,
+    std::span<const std::string> validMarkerNames) {
+  std::vector<ColumnarMarkerSequence> resultAnim;
+  const bool hasAnim = readC3dPoints(
+      filename,
+      up,
+      validMarkerNames,
+      [&](std::vector<ColumnarMarkerSequence>&& subjects, const size_t numFrames) {
+        resultAnim = std::move(subjects);
+        for (auto& actorSequence : resultAnim) {
+          // All markers start out occluded
+          actorSequence.resize(numFrames);
+        }
+      },
+      [&](const int actorId, const int markerId, const size_t frameId, const Vector3d& pos) {
+        auto& actorSequence = resultAnim[actorId];
+        actorSequence.occluded(markerId, frameId) = 0;
+        actorSequence.positions.col(frameId).segment<3>(3 * markerId) = pos.cast<float>();
+      });
+  if (!hasAnim) {
     return {};
   }
 
+  // Occluded markers keep their position from the previous frame
+  for (auto& actorSequence : resultAnim) {
+    for (Eigen::Index frameId = 1; frameId < actorSequence.occluded.cols(); ++frameId) {
+      for (Eigen::Index markerId = 0; markerId < actorSequence.occluded.rows(); ++markerId) {
+        if (actorSequence.occluded(markerId, frameId) != 0) {
+          actorSequence.positions.col(frameId).segment<3>(3 * markerId) =
+              actorSequence.positions.col(frameId - 1).segment<3>(3 * markerId);
+        }
+      }
+    }
+  }
+  return resultAnim;
+}
+
+std::vector<MarkerSequence>
+loadC3d(const std::string& filename, UpVector up, std::span<const std::string> validMarkerNames) {
+  // Read straight into double-precision markers instead of going through the float columnar
+  // storage, so that the positions are not rounded.
+  std::vector<MarkerSequence> resultAnim;
+  const bool hasAnim = readC3dPoints(
+      filename,
+      up,
+      validMarkerNames,
+      [&](std::vector<ColumnarMarkerSequence>&& subjects, const size_t numFrames) {
+        resultAnim.resize(subjects.size());
+        for (size_t actorId = 0; actorId < subjects.size(); ++actorId) {
+          auto& actorSequence = resultAnim[actorId];
+          actorSequence.name = subjects[actorId].name;
+          actorSequence.fps = subjects[actorId].fps;
+          std::vector<Marker> templateActor(subjects[actorId].markerNames.size());
+          for (size_t markerId = 0; markerId < templateActor.size(); ++markerId) {
+            templateActor[markerId].name = subjects[actorId].markerNames[markerId];
+            templateActor[markerId].occluded = true;
+          }
+          actorSequence.frames.assign(numFrames, templateActor);
+        }
+      },
+      [&](const int actorId, const int markerId, const size_t frameId, const Vector3d& pos) {
+        auto& marker = resultAnim[actorId].frames[frameId][markerId];
+        marker.occluded = false;
+        marker.pos = pos;
+      });
   if (!hasAnim) {
-    resultAnim.clear();
+    return {};
   }
 
+  // Occluded markers keep their position from the previous frame
+  for (auto& actorSequence : resultAnim) {
+    for (size_t frameId = 1; frameId < actorSequence.frames.size(); ++frameId) {
+      auto& frame = actorSequence.frames[frameId];
+      for (size_t markerId = 0; markerId < frame.size(); ++markerId) {
+        if (frame[markerId].occluded) {
+          frame[markerId].pos = actorSequence.frames[frameId - 1][markerId].pos;
+        }
+      }
+    }
+  }
   return resultAnim;
 }
 
+std::unique_ptr<MarkerStreamReader> openC3dStream(
+    const std::string& filename,
+    UpVector up,
+    std::span<const std::string> validMarkerNames) {
+  std::ifstream file(filename, std::ios::binary);
+  MT_THROW_IF(!file.is_open(), "Unable to open C3D file '{}'", filename);
+  C3dLayout layout = readC3dLayout(file);
+
+  const auto unit = layout.strings("POINT:UNITS");
+  MT_THROW_IF(
+      !unit || unit->size() != 1, "Invalid c3d file '{}': no unit information found", filename);
+  MT_THROW_IF(!checkUnit(unit->front()), "Unknown unit '{}' in '{}'", unit->front(), filename);
+
+  const auto pointLabels = collectPointLabels(
+      layout.numPoints, [&](const std::string& name) { return layout.strings("POINT:" + name); });
+  MT_THROW_IF(!pointLabels, "Invalid point labels in '{}'", filename);
+
+  std::vector<std::pair<int, int>> markerMap;
+  auto subjects = groupPointsBySubject(*pointLabels, validMarkerNames, layout.fps, markerMap);
+  return std::make_unique<C3dStreamReader>(
+      std::move(file),
+      std::move(layout),
+      std::move(subjects),
+      std::move(markerMap),
+      unit->front(),
+      up);
+}
+
 } // namespace momentum
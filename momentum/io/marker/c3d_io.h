@@ -9,6 +9,10 @@
 
 #include <momentum/character/marker.h>
 #include <momentum/io/marker/coordinate_system.h>
+#include <momentum/io/marker/marker_stream.h>
+
+#include <memory>
+#include <span>
 
 namespace momentum {
 
@@ -27,4 +31,39 @@ namespace momentum {
     UpVector up = UpVector::Y,
     std::span<const std::string> validMarkerNames = {});
 
+/// Loads all the subjects from a C3D file into a vector of ColumnarMarkerSequences.
+///
+/// Same as loadC3d, but the marker data is stored in columnar form without creating a Marker per
+/// marker and frame. Occluded markers keep the position they had in the previous frame, or zero.
+/// The positions are stored in single precision; use loadC3d for double-precision positions.
+///
+/// @param[in] filename The C3D file to load marker data from.
+/// @param[in] up (Optional) The up-vector convention of the input marker file (default:
+/// UpVector::Y).
+/// @return std::vector<ColumnarMarkerSequence> A vector containing the marker sequences from the
+/// C3D file.
+[[nodiscard]] std::vector<ColumnarMarkerSequence> loadC3dColumnar(
+    const std::string& filename,
+    UpVector up = UpVector::Y,
+    std::span<const std::string> validMarkerNames = {});
+
+/// Opens a C3D file for reading its frames in chunks.
+///
+/// Only the header and parameter section are read up front. The point data of a chunk is read
+/// directly from its offset in the file, so seeking is constant time and memory use is bounded by
+/// the chunk size. As in loadC3dColumnar, occluded markers keep the position they had in the
+/// previous frame, or zero. After a seek, the frames before the new position are read backwards
+/// until the last visible position of every marker is found.
+///
+/// @param[in] filename The C3D file to read marker data from.
+/// @param[in] up (Optional) The up-vector convention of the input marker file (default:
+/// UpVector::Y).
+/// @param[in] validMarkerNames (Optional) If not empty, only these markers are read.
+/// @return A MarkerStreamReader with the subjects of the file.
+/// @throws std::runtime_error if the file cannot be opened or is not a valid C3D file.
+[[nodiscard]] std::unique_ptr<MarkerStreamReader> openC3dStream(
+    const std::string& filename,
+    UpVector up = UpVector::Y,
+    std::span<const std::string> validMarkerNames = {});
+
 } // namespace momentum
@@ -8,6 +8,7 @@
 #include "momentum/io/marker/marker_io.h"
 
 #include "momentum/character/marker.h"
+#include "momentum/common/exception.h"
 #include "momentum/common/filesystem.h"
 #include "momentum/common/log.h"
 #include "momentum/io/fbx/fbx_io.h"
@@ -27,6 +28,52 @@ size_t markerCount(const std::vector<std::vector<Marker>>& frames) {
   }
   return maxCountMarkers;
 }
+
+size_t markerCount(const ColumnarMarkerSequence& sequence) {
+  size_t maxCountMarkers = 0;
+  for (Eigen::Index iFrame = 0; iFrame < sequence.occluded.cols(); ++iFrame) {
+    const auto markerCount =
+        static_cast<size_t>((sequence.occluded.col(iFrame).array() == 0).count());
+    maxCountMarkers = std::max(markerCount, maxCountMarkers);
+  }
+  return maxCountMarkers;
+}
+
+// Returns the index of the main subject given the name and the max number of visible markers of
+// every actor.
+int mainSubjectIndex(std::span<const std::string> names, std::span<const size_t> maxMarkers) {
+  const size_t numActors = names.size();
+  if (numActors == 0) {
+    return -1;
+  }
+
+  // Special case when there's only one actor.
+  // Return the actor even if it has no markers (empty sequence is valid).
+  if (numActors == 1) {
+    return 0;
+  }
+
+  // find the max marker count with a name
+  size_t maxCount = 0;
+  size_t actorID = 0; // default to be the first actor
+  for (size_t iActor = 0; iActor < numActors; ++iActor) {
+    const size_t count = maxMarkers[iActor];
+    auto actorName = names[iActor];
+    std::transform(actorName.begin(), actorName.end(), actorName.begin(), [](unsigned char c) {
+      return std::tolower(c);
+    });
+    if (count > maxCount && !actorName.empty() && actorName != "unlabeled") {
+      maxCount = count;
+      actorID = iActor;
+    }
+  }
+
+  if (maxCount > 0) {
+    return actorID;
+  } else {
+    return -1;
+  }
+}
 } // namespace
 
 std::vector<MarkerSequence> loadMarkers(
@@ -53,6 +100,30 @@ std::vector<MarkerSequence> loadMarkers(
   }
 }
 
+std::vector<ColumnarMarkerSequence> loadMarkersColumnar(
+    const std::string& filename,
+    UpVector up,
+    std::span<const std::string> validMarkerNames) {
+  const std::string ext = filesystem::path(filename).extension().string();
+  try {
+    if (ext == ".c3d") {
+      return loadC3dColumnar(filename, up, validMarkerNames);
+    } else if (ext == ".trc") {
+      return {loadTrcColumnar(filename, up)};
+    } else if (ext == ".glb") {
+      return {toColumnarMarkerSequence(loadMarkerSequence(filename))};
+    } else if (ext == ".fbx") {
+      return {toColumnarMarkerSequence(loadFbxMarkerSequence(filename))};
+    } else {
+      MT_LOGE("{} Unknown marker file type {}", __func__, filename);
+      return {};
+    }
+  } catch (...) {
+    MT_LOGE("{}: Unknown error in {}", __func__, filename);
+    return {};
+  }
+}
+
 std::optional<MarkerSequence> loadMarkersForMainSubject(
     const std::string& filename,
     UpVector up,
@@ -66,11 +137,34 @@ std::optional<MarkerSequence> loadMarkersForMainSubject(
   }
 }
 
-int findMainSubjectIndex(std::span<const MarkerSequence> markerSequences) {
-  if (markerSequences.empty()) {
-    return -1;
+std::optional<ColumnarMarkerSequence> loadMarkersForMainSubjectColumnar(
+    const std::string& filename,
+    UpVector up,
+    std::span<const std::string> validMarkerNames) {
+  std::vector<ColumnarMarkerSequence> markerSequences =
+      loadMarkersColumnar(filename, up, validMarkerNames);
+  const int subjectID = findMainSubjectIndex(markerSequences);
+  if (subjectID < 0) {
+    return {};
+  } else {
+    return {std::move(markerSequences.at(subjectID))};
+  }
+}
+
+std::unique_ptr<MarkerStreamReader> openMarkerStream(
+    const std::string& filename,
+    UpVector up,
+    std::span<const std::string> validMarkerNames) {
+  const std::string ext = filesystem::path(filename).extension().string();
+  if (ext == ".c3d") {
+    return openC3dStream(filename, up, validMarkerNames);
+  } else if (ext == ".trc") {
+    return openTrcStream(filename, up);
   }
+  MT_THROW("{}: Unsupported marker file type for streaming {}", __func__, filename);
+}
 
+int findMainSubjectIndex(std::span<const MarkerSequence> markerSequences) {
   // We define the main subject as one with the most markers. Ideally, the main subject is the one
   // with a proper name, because unlabeled markers are usually the largest number, except when there
   // is only one actor.
@@ -80,37 +174,24 @@ int findMainSubjectIndex(std::span<const MarkerSequence> markerSequences) {
   // We will go through the sequence to find the max number of visible markers. This is quite slow
   // but more robust.
   const size_t numActors = markerSequences.size();
-  std::vector<int> maxMarkers(numActors, 0);
+  std::vector<std::string> names(numActors);
+  std::vector<size_t> maxMarkers(numActors, 0);
   // count markers for each actor
   for (size_t iActor = 0; iActor < numActors; ++iActor) {
+    names.at(iActor) = markerSequences[iActor].name;
     maxMarkers.at(iActor) = markerCount(markerSequences[iActor].frames);
   }
+  return mainSubjectIndex(names, maxMarkers);
+}
 
-  // Special case when there's only one actor.
-  // Return the actor even if it has no markers (empty sequence is valid).
-  if (numActors == 1) {
-    return 0;
-  }
-
-  // find the max marker count with a name
-  size_t maxCount = 0;
-  size_t actorID = 0; // default to be the first actor
+int findMainSubjectIndex(std::span<const ColumnarMarkerSequence> markerSequences) {
+  const size_t numActors = markerSequences.size();
+  std::vector<std::string> names(numActors);
+  std::vector<size_t> maxMarkers(numActors, 0);
   for (size_t iActor = 0; iActor < numActors; ++iActor) {
-    const size_t count = maxMarkers.at(iActor);
-    auto actorName = markerSequences[iActor].name;
-    std::transform(actorName.begin(), actorName.end(), actorName.begin(), [](unsigned char c) {
-      return std::tolower(c);
-    });
-    if (count > maxCount && !actorName.empty() && actorName != "unlabeled") {
-      maxCount = count;
-      actorID = iActor;
-    }
-  }
-
-  if (maxCount > 0) {
-    return actorID;
-  } else {
-    return -1;
+    names.at(iActor) = markerSequences[iActor].name;
+    maxMarkers.at(iActor) = markerCount(markerSequences[iActor]);
   }
+  return mainSubjectIndex(names, maxMarkers);
 }
 } // namespace momentum
@@ -9,6 +9,9 @@
 
 #include <momentum/character/marker.h>
 #include <momentum/io/marker/coordinate_system.h>
+#include <momentum/io/marker/marker_stream.h>
+
+#include <memory>
 
 #include <optional>
 #include <vector>
@@ -44,6 +47,49 @@ namespace momentum {
     UpVector up = UpVector::Y,
     std::span<const std::string> validMarkerNames = {});
 
+/// Loads all actor sequences from a marker file (c3d, trc, glb, fbx) in columnar form. Otherwise
+/// the same as loadMarkers.
+///
+/// c3d and trc files are read directly into the columnar layout; the other formats are converted
+/// with toColumnarMarkerSequence.
+///
+/// @param[in] filename The marker file to load data from.
+/// @param[in] up (Optional) The up-vector convention of the input marker file (default:
+/// UpVector::Y).
+/// @return std::vector<ColumnarMarkerSequence> A vector of ColumnarMarkerSequences containing the
+/// marker data from the file.
+[[nodiscard]] std::vector<ColumnarMarkerSequence> loadMarkersColumnar(
+    const std::string& filename,
+    UpVector up = UpVector::Y,
+    std::span<const std::string> validMarkerNames = {});
+
+/// Loads the main subject's marker data from a marker file in columnar form. Otherwise the same as
+/// loadMarkersForMainSubject.
+///
+/// @param[in] filename The marker file to load data from.
+/// @param[in] up (Optional) The up-vector convention of the input marker file (default:
+/// UpVector::Y).
+/// @return std::optional<ColumnarMarkerSequence> A ColumnarMarkerSequence containing the main
+/// subject's marker data, or an empty optional if no main subject is found.
+[[nodiscard]] std::optional<ColumnarMarkerSequence> loadMarkersForMainSubjectColumnar(
+    const std::string& filename,
+    UpVector up = UpVector::Y,
+    std::span<const std::string> validMarkerNames = {});
+
+/// Opens a marker file (c3d, trc) for reading its frames in chunks with bounded memory. The
+/// positions are converted to the target coordinate system as in loadMarkers.
+///
+/// @param[in] filename The marker file to read data from.
+/// @param[in] up (Optional) The up-vector convention of the input marker file (default:
+/// UpVector::Y).
+/// @return std::unique_ptr<MarkerStreamReader> A reader for the frames of all the subjects in the
+/// file.
+/// @throws std::runtime_error if the file type is not supported or the file cannot be read.
+[[nodiscard]] std::unique_ptr<MarkerStreamReader> openMarkerStream(
+    const std::string& filename,
+    UpVector up = UpVector::Y,
+    std::span<const std::string> validMarkerNames = {});
+
 /// Finds the "main subject" from a vector of MarkerSequences. The main subject is currently defined
 /// as a named actor with the maximum number of visible markers in the sequence.
 ///
@@ -53,4 +99,12 @@ namespace momentum {
 /// @note This function is exposed mainly for unit tests.
 [[nodiscard]] int findMainSubjectIndex(std::span<const MarkerSequence> markerSequences);
 
+/// Finds the "main subject" from a vector of ColumnarMarkerSequences, using the same rules as for
+/// MarkerSequences.
+///
+/// @param[in] markerSequences A vector of ColumnarMarkerSequences to search for the main subject.
+/// @return int The main subject's index in the input vector. If no main subject found, -1 is
+/// returned.
+[[nodiscard]] int findMainSubjectIndex(std::span<const ColumnarMarkerSequence> markerSequences);
+
 } // namespace momentum
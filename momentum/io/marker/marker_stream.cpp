@@ -0,0 +1,52 @@
+/*
+ * Copyright (c) Meta Platforms, Inc. and affiliates.
+ *
+ * This source code is licensed under the MIT license found in the
+ * LICENSE file in the root directory of this source tree.
+ */
+
+#include "momentum/io/marker/marker_stream.h"
+
+#include "momentum/common/exception.h"
+
+#include <algorithm>
+
+namespace momentum {
+
+MarkerStreamReader::MarkerStreamReader(
+    std::vector<ColumnarMarkerSequence> subjects,
+    size_t numFrames)
+    : subjects_(std::move(subjects)), numFrames_(numFrames) {
+  for (auto& subject : subjects_) {
+    subject.resize(0);
+  }
+}
+
+void MarkerStreamReader::seek(const size_t frame) {
+  MT_THROW_IF(frame > numFrames_, "Cannot seek to frame {} of {}", frame, numFrames_);
+  currentFrame_ = frame;
+}
+
+std::vector<ColumnarMarkerSequence> MarkerStreamReader::read(const size_t maxFrames) {
+  const size_t numRequested = std::min(maxFrames, numFrames_ - currentFrame_);
+  std::vector<ColumnarMarkerSequence> chunk = subjects_;
+  for (auto& sequence : chunk) {
+    sequence.resize(numRequested);
+  }
+  if (numRequested == 0) {
+    return chunk;
+  }
+
+  const size_t numRead = readFrames(currentFrame_, chunk);
+  if (numRead < numRequested) {
+    // The file has fewer frames than its header claims
+    for (auto& sequence : chunk) {
+      sequence.resize(numRead);
+    }
+    numFrames_ = currentFrame_ + numRead;
+  }
+  currentFrame_ += numRead;
+  return chunk;
+}
+
+} // namespace momentum
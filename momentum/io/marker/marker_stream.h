@@ -0,0 +1,74 @@
+/*
+ * Copyright (c) Meta Platforms, Inc. and affiliates.
+ *
+ * This source code is licensed under the MIT license found in the
+ * LICENSE file in the root directory of this source tree.
+ */
+
+#pragma once
+
+#include <momentum/character/marker.h>
+
+#include <span>
+#include <vector>
+
+namespace momentum {
+
+/// Reads the frames of a marker file in chunks, so that long captures can be processed with
+/// bounded memory.
+///
+/// The reader keeps track of the next frame to read; read() returns the following frames of every
+/// subject in the file and advances past them, and seek() moves to any frame. Only the frames of
+/// the current chunk are held in memory.
+class MarkerStreamReader {
+ public:
+  virtual ~MarkerStreamReader() = default;
+
+  MarkerStreamReader(const MarkerStreamReader&) = delete;
+  MarkerStreamReader& operator=(const MarkerStreamReader&) = delete;
+
+  /// The subjects (motion capture actors) in the file. Each sequence has the name, marker names and
+  /// frame rate of a subject, but no frames.
+  [[nodiscard]] const std::vector<ColumnarMarkerSequence>& subjects() const {
+    return subjects_;
+  }
+
+  /// The number of frames in the file.
+  [[nodiscard]] size_t numFrames() const {
+    return numFrames_;
+  }
+
+  /// The index of the next frame to read.
+  [[nodiscard]] size_t currentFrame() const {
+    return currentFrame_;
+  }
+
+  /// Moves to a frame, so that the next read() starts from it.
+  ///
+  /// @param[in] frame The frame index, in [0, numFrames()]; numFrames() moves to the end.
+  void seek(size_t frame);
+
+  /// Reads the next frames of all the subjects and advances past them.
+  ///
+  /// @param[in] maxFrames The maximum number of frames to read.
+  /// @return One sequence per subject, in the order of subjects(), each with the same
+  /// min(maxFrames, numFrames() - currentFrame()) frames. The sequences have no frames once the end
+  /// of the file is reached.
+  [[nodiscard]] std::vector<ColumnarMarkerSequence> read(size_t maxFrames);
+
+ protected:
+  MarkerStreamReader(std::vector<ColumnarMarkerSequence> subjects, size_t numFrames);
+
+  /// Reads frames [firstFrame, firstFrame + chunk[i].numFrames()) into the chunk of every subject.
+  /// The chunk frames are initialized as occluded with zero positions.
+  ///
+  /// @return The number of frames read, which is less than requested if the file ends early.
+  virtual size_t readFrames(size_t firstFrame, std::span<ColumnarMarkerSequence> chunk) = 0;
+
+ private:
+  std::vector<ColumnarMarkerSequence> subjects_;
+  size_t numFrames_;
+  size_t currentFrame_ = 0;
+};
+
+} // namespace momentum
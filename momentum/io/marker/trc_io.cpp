@@ -12,90 +12,264 @@
 #include "momentum/io/common/stream_utils.h"
 #include "momentum/io/marker/conversions.h"
 
+#include <algorithm>
+#include <charconv>
+#include <cstdlib>
 #include <fstream>
+#include <optional>
 
 namespace momentum {
 
-MarkerSequence loadTrc(const std::string& filename, UpVector up) {
-  MarkerSequence res;
-  res.fps = 0.f;
+namespace {
 
-  std::ifstream infile(filename);
-  if (!infile.is_open()) {
-    return res;
+struct TrcHeader {
+  float fps = 0.0f;
+  // The frame count of the header, or std::nullopt if it is missing or malformed
+  std::optional<size_t> numFrames;
+  std::string unit;
+  std::vector<std::string> markerNames;
+};
+
+// Parses a non-negative integer, or returns std::nullopt if str is not one.
+std::optional<size_t> parseCount(const std::string& str) {
+  size_t value = 0;
+  const auto [end, error] = std::from_chars(str.data(), str.data() + str.size(), value);
+  if (error != std::errc() || end != str.data() + str.size()) {
+    return std::nullopt;
   }
+  return value;
+}
 
+// Parses the header of a TRC file and leaves the stream at the first frame line.
+bool readTrcHeader(std::istream& infile, TrcHeader& header) {
   std::string line;
 
-  // parse header
   GetLineCrossPlatform(infile, line);
   if (line.find("PathFileType\t4\t(X/Y/Z)") == std::string::npos) {
-    return res;
+    return false;
   }
 
   GetLineCrossPlatform(infile, line);
   if (line.find(
           "DataRate\tCameraRate\tNumFrames\tNumMarkers\tUnits\tOrigDataRate\tOrigDataStartFrame\tOrigNumFrames") ==
       std::string::npos) {
-    return res;
+    return false;
   }
 
   GetLineCrossPlatform(infile, line);
   auto tokens = tokenize(line, " \t\r\n");
   if (tokens.size() != 8) {
-    return res;
+    return false;
   }
-  const double frameRate = std::stod(tokens[0]);
+  header.fps = static_cast<float>(std::stod(tokens[0]));
+  header.numFrames = parseCount(tokens[2]);
   const size_t numMarkers = std::stoi(tokens[3]);
-  res.fps = static_cast<float>(frameRate);
+  header.unit = tokens[4];
 
   // get line with marker names and parse it
   GetLineCrossPlatform(infile, line);
   tokens = tokenize(line, " \t\r\n");
   if (tokens.size() != numMarkers + 2) {
-    res.fps = 0.0f;
-    return res;
-  }
-  std::vector<std::string> markerNames;
-  for (size_t i = 2; i < tokens.size(); i++) {
-    markerNames.push_back(tokens[i]);
+    return false;
   }
+  header.markerNames.assign(tokens.begin() + 2, tokens.end());
 
   // ignore next line
   GetLineCrossPlatform(infile, line);
+  return true;
+}
+
+class TrcStreamReader : public MarkerStreamReader {
+ public:
+  TrcStreamReader(std::ifstream&& infile, TrcHeader&& header, UpVector up)
+      : MarkerStreamReader(makeSubjects(header), header.numFrames.value_or(0)),
+        infile_(std::move(infile)),
+        numMarkers_(header.markerNames.size()),
+        unit_(std::move(header.unit)),
+        up_(up),
+        frameIndex_{infile_.tellg()} {}
 
-  while (GetLineCrossPlatform(infile, line)) {
-    tokens = tokenize(line, "\t", false);
-    // check for right size
-    if (tokens.size() != numMarkers * 3 + 2) {
-      continue;
+  // Reads all the remaining frames, regardless of the frame count in the header.
+  ColumnarMarkerSequence readAll() {
+    ColumnarMarkerSequence result = subjects().front();
+    result.resize(numFrames());
+    size_t numFramesRead = 0;
+    while (nextFrameLine()) {
+      if (numFramesRead == result.numFrames()) {
+        result.resize(std::max<size_t>(2 * numFramesRead, 1));
+      }
+      parseFrame(result, numFramesRead++);
     }
+    result.resize(numFramesRead);
+    return result;
+  }
 
-    // create actor structure for every frame
-    std::vector<Marker> markers(numMarkers);
+  // Reads all the remaining frames into double-precision markers.
+  MarkerSequence readAllMarkers() {
+    const auto& subject = subjects().front();
+    MarkerSequence result;
+    result.fps = subject.fps;
+    result.frames.reserve(numFrames());
+    while (nextFrameLine()) {
+      std::vector<Marker> markers(numMarkers_);
+      parseFrame([&](const size_t i, const Vector3d* p) {
+        markers[i].name = subject.markerNames[i];
+        markers[i].occluded = p == nullptr;
+        if (p != nullptr) {
+          markers[i].pos = *p;
+        }
+      });
+      result.frames.push_back(std::move(markers));
+    }
+    return result;
+  }
+
+ protected:
+  size_t readFrames(const size_t firstFrame, std::span<ColumnarMarkerSequence> chunk) override {
+    auto& sequence = chunk.front();
+    if (!seekToFrame(firstFrame)) {
+      return 0;
+    }
+    for (size_t iFrame = 0; iFrame < sequence.numFrames(); ++iFrame) {
+      if (!nextFrameLine()) {
+        return iFrame;
+      }
+      parseFrame(sequence, iFrame);
+    }
+    return sequence.numFrames();
+  }
+
+ private:
+  // Every kIndexStride-th frame's offset in the file is remembered for seeking
+  static constexpr size_t kIndexStride = 1024;
+
+  static std::vector<ColumnarMarkerSequence> makeSubjects(const TrcHeader& header) {
+    std::vector<ColumnarMarkerSequence> subjects(1);
+    subjects[0].fps = header.fps;
+    subjects[0].markerNames = header.markerNames;
+    return subjects;
+  }
+
+  // Reads the next frame line into line_, skipping lines without the right number of values.
+  bool nextFrameLine() {
+    while (true) {
+      const bool isIndexed = nextFrame_ == frameIndex_.size() * kIndexStride;
+      const std::streampos lineStart = isIndexed ? infile_.tellg() : std::streampos();
+      if (!GetLineCrossPlatform(infile_, line_) && line_.empty()) {
+        return false;
+      }
+      if (line_.empty() ||
+          static_cast<size_t>(std::count(line_.begin(), line_.end(), '\t')) !=
+              numMarkers_ * 3 + 1) {
+        continue;
+      }
+      if (isIndexed) {
+        frameIndex_.push_back(lineStart);
+      }
+      ++nextFrame_;
+      return true;
+    }
+  }
+
+  // Moves the stream to the line of the given frame, using the closest known frame offset.
+  bool seekToFrame(const size_t frame) {
+    const size_t iIndex = std::min(frame / kIndexStride, frameIndex_.size() - 1);
+    if (frame < nextFrame_ || iIndex * kIndexStride > nextFrame_) {
+      infile_.clear();
+      infile_.seekg(frameIndex_[iIndex]);
+      nextFrame_ = iIndex * kIndexStride;
+    }
+    while (nextFrame_ < frame) {
+      if (!nextFrameLine()) {
+        return false;
+      }
+    }
+    return true;
+  }
+
+  // Parses line_ into the given frame of the sequence.
+  void parseFrame(ColumnarMarkerSequence& sequence, const size_t iFrame) const {
+    parseFrame([&](const size_t i, const Vector3d* p) {
+      sequence.occluded(i, iFrame) = p == nullptr ? 1 : 0;
+      if (p != nullptr) {
+        sequence.positions.col(iFrame).segment<3>(3 * i) = p->cast<float>();
+      }
+    });
+  }
+
+  // Parses line_ and calls onMarker(i, p) for every marker i, where p points to the position of
+  // the marker or is nullptr if the marker is occluded.
+  template <typename OnMarker>
+  void parseFrame(OnMarker&& onMarker) const {
+    const auto tokens = tokenize(std::string_view(line_), "\t", false);
+    MT_THROW_IF(tokens.size() != numMarkers_ * 3 + 2, "Invalid TRC frame '{}'", line_);
 
     // go over all markers
-    for (size_t i = 0; i < numMarkers; i++) {
+    for (size_t i = 0; i < numMarkers_; i++) {
       const size_t pos = i * 3 + 2;
-      MT_THROW_IF(
-          i >= markerNames.size() || pos + 2 >= tokens.size(), "Marker index {} out of bounds", i);
-      markers[i].name = markerNames[i];
       if (tokens[pos + 0].empty() || tokens[pos + 1].empty() || tokens[pos + 2].empty()) {
-        markers[i].occluded = true;
+        onMarker(i, nullptr);
       } else {
-        markers[i].occluded = false;
-        Vector3d p{
-            std::stod(tokens[pos + 0]), std::stod(tokens[pos + 1]), std::stod(tokens[pos + 2])};
-        p = toMomentumVector3(p, up, tokens[4]);
-        markers[i].pos = p;
+        Vector3d p;
+        for (size_t k = 0; k < 3; ++k) {
+          // The tokens are views into line_, so strtod stops at the following tab
+          const char* begin = tokens[pos + k].data();
+          char* end = nullptr;
+          p[k] = std::strtod(begin, &end);
+          MT_THROW_IF(end == begin, "Invalid TRC value '{}'", tokens[pos + k]);
+        }
+        p = toMomentumVector3(p, up_, unit_);
+        onMarker(i, &p);
       }
     }
+  }
+
+  std::ifstream infile_;
+  const size_t numMarkers_;
+  const std::string unit_;
+  const UpVector up_;
+  std::vector<std::streampos> frameIndex_;
+  size_t nextFrame_ = 0;
+  std::string line_;
+};
+
+} // namespace
 
-    // store frame
-    res.frames.push_back(markers);
+ColumnarMarkerSequence loadTrcColumnar(const std::string& filename, UpVector up) {
+  ColumnarMarkerSequence res;
+  res.fps = 0.f;
+
+  std::ifstream infile(filename, std::ios::binary);
+  TrcHeader header;
+  if (!infile.is_open() || !readTrcHeader(infile, header)) {
+    return res;
+  }
+
+  return TrcStreamReader(std::move(infile), std::move(header), up).readAll();
+}
+
+MarkerSequence loadTrc(const std::string& filename, UpVector up) {
+  MarkerSequence res;
+  res.fps = 0.f;
+
+  std::ifstream infile(filename, std::ios::binary);
+  TrcHeader header;
+  if (!infile.is_open() || !readTrcHeader(infile, header)) {
+    return res;
   }
 
-  return res;
+  // Read straight into double-precision markers instead of going through the float columnar
+  // storage, so that the positions are not rounded.
+  return TrcStreamReader(std::move(infile), std::move(header), up).readAllMarkers();
+}
+
+std::unique_ptr<MarkerStreamReader> openTrcStream(const std::string& filename, UpVector up) {
+  std::ifstream infile(filename, std::ios::binary);
+  MT_THROW_IF(!infile.is_open(), "Unable to open TRC file '{}'", filename);
+  TrcHeader header;
+  MT_THROW_IF(!readTrcHeader(infile, header), "Invalid TRC header in '{}'", filename);
+  MT_THROW_IF(!header.numFrames, "Missing TRC frame count in '{}'", filename);
+  return std::make_unique<TrcStreamReader>(std::move(infile), std::move(header), up);
 }
 
 } // namespace momentum
@@ -9,6 +9,9 @@
 
 #include <momentum/character/marker.h>
 #include <momentum/io/marker/coordinate_system.h>
+#include <momentum/io/marker/marker_stream.h>
+
+#include <memory>
 
 namespace momentum {
 
@@ -24,4 +27,35 @@ namespace momentum {
 /// @return MarkerSequence A MarkerSequence containing the marker data from the TRC file.
 [[nodiscard]] MarkerSequence loadTrc(const std::string& filename, UpVector up = UpVector::Y);
 
+/// Loads marker data from a TRC file into a ColumnarMarkerSequence.
+///
+/// Same as loadTrc, but the marker data is stored in columnar form without creating a Marker per
+/// marker and frame. Occluded markers have zero positions. The positions are stored in single
+/// precision; use loadTrc for double-precision positions.
+///
+/// @param[in] filename The TRC file to load marker data from.
+/// @param[in] up (Optional) The up-vector convention of the input marker file (default:
+/// UpVector::Y).
+/// @return ColumnarMarkerSequence A ColumnarMarkerSequence containing the marker data from the TRC
+/// file.
+[[nodiscard]] ColumnarMarkerSequence loadTrcColumnar(
+    const std::string& filename,
+    UpVector up = UpVector::Y);
+
+/// Opens a TRC file for reading its frames in chunks.
+///
+/// Frames are read from the file on demand, so memory use is bounded by the chunk size. Seeking
+/// scans the file forward from the closest frame read before. The number of frames is the one given
+/// in the header. Occluded markers have zero positions.
+///
+/// @param[in] filename The TRC file to read marker data from.
+/// @param[in] up (Optional) The up-vector convention of the input marker file (default:
+/// UpVector::Y).
+/// @return A MarkerStreamReader with a single subject.
+/// @throws std::runtime_error if the file cannot be opened or has an invalid header or no frame
+/// count.
+[[nodiscard]] std::unique_ptr<MarkerStreamReader> openTrcStream(
+    const std::string& filename,
+    UpVector up = UpVector::Y);
+
 } // namespace momentum
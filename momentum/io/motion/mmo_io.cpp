@@ -8,9 +8,25 @@
 #include "momentum/io/motion/mmo_io.h"
 
 #include "momentum/character/character.h"
+#include "momentum/common/exception.h"
 #include "momentum/common/log.h"
 
+#include <algorithm>
+#include <cstring>
 #include <fstream>
+#include <tuple>
+
+#if defined(_WIN32)
+#ifndef WIN32_LEAN_AND_MEAN
+#define WIN32_LEAN_AND_MEAN
+#endif
+#include <windows.h>
+#else
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#endif
 
 namespace momentum {
 
@@ -302,4 +318,151 @@ std::tuple<MatrixXf, VectorXf, std::vector<std::string>, std::vector<std::string
   return result;
 }
 
+namespace {
+
+// Maps a whole file read-only and returns the mapping and its size. Returns a null mapping for
+// empty files, which cannot be mapped.
+std::pair<std::byte*, size_t> mapFile(const std::string& filename) {
+#if defined(_WIN32)
+  HANDLE file = CreateFileA(
+      filename.c_str(),
+      GENERIC_READ,
+      FILE_SHARE_READ,
+      nullptr,
+      OPEN_EXISTING,
+      FILE_ATTRIBUTE_NORMAL,
+      nullptr);
+  MT_THROW_IF(file == INVALID_HANDLE_VALUE, "Failed to open file {}", filename);
+  LARGE_INTEGER size;
+  if (!GetFileSizeEx(file, &size)) {
+    CloseHandle(file);
+    MT_THROW("Failed to get the size of file {}", filename);
+  }
+  if (size.QuadPart == 0) {
+    CloseHandle(file);
+    return {nullptr, 0};
+  }
+  HANDLE mapping = CreateFileMappingA(file, nullptr, PAGE_READONLY, 0, 0, nullptr);
+  CloseHandle(file);
+  MT_THROW_IF(mapping == nullptr, "Failed to map file {}", filename);
+  void* data = MapViewOfFile(mapping, FILE_MAP_READ, 0, 0, 0);
+  // The view keeps the mapping alive
+  CloseHandle(mapping);
+  MT_THROW_IF(data == nullptr, "Failed to map file {}", filename);
+  return {static_cast<std::byte*>(data), static_cast<size_t>(size.QuadPart)};
+#else
+  const int fd = open(filename.c_str(), O_RDONLY);
+  MT_THROW_IF(fd < 0, "Failed to open file {}", filename);
+  struct stat st{};
+  if (fstat(fd, &st) != 0) {
+    close(fd);
+    MT_THROW("Failed to get the size of file {}", filename);
+  }
+  const auto size = static_cast<size_t>(st.st_size);
+  if (size == 0) {
+    close(fd);
+    return {nullptr, 0};
+  }
+  void* data = mmap(nullptr, size, PROT_READ, MAP_PRIVATE, fd, 0);
+  // The mapping stays valid after the file is closed
+  close(fd);
+  MT_THROW_IF(data == MAP_FAILED, "Failed to map file {}", filename);
+  return {static_cast<std::byte*>(data), size};
+#endif
+}
+
+void unmapFile(std::byte* data, [[maybe_unused]] size_t size) {
+  if (data == nullptr) {
+    return;
+  }
+#if defined(_WIN32)
+  UnmapViewOfFile(data);
+#else
+  munmap(data, size);
+#endif
+}
+
+} // namespace
+
+MappedMmo::MappedMmo(const std::string& filename) {
+  std::tie(mapping_, mappingSize_) = mapFile(filename);
+
+  // The header is parsed with bounds checks so that truncated files throw instead of reading past
+  // the end of the mapping.
+  size_t offset = 0;
+  auto checkedRead = [&](void* dst, size_t count) {
+    MT_THROW_IF(
+        count > mappingSize_ - offset,
+        "Invalid mmo file {}: expected at least {} bytes, got {}",
+        filename,
+        offset + count,
+        mappingSize_);
+    if (count > 0) {
+      std::memcpy(dst, mapping_ + offset, count);
+    }
+    offset += count;
+  };
+  auto readNames = [&](size_t count, std::vector<std::string>& names) {
+    names.reserve(std::min(count, mappingSize_ / sizeof(size_t)));
+    for (size_t i = 0; i < count; i++) {
+      size_t length = 0;
+      checkedRead(&length, sizeof(size_t));
+      MT_THROW_IF(length > mappingSize_ - offset, "Invalid name length in mmo file {}", filename);
+      names.emplace_back(reinterpret_cast<const char*>(mapping_ + offset), length);
+      offset += length;
+    }
+  };
+
+  try {
+    size_t nParams = 0;
+    size_t nJoints = 0;
+    checkedRead(&nParams, sizeof(size_t));
+    checkedRead(&nJoints, sizeof(size_t));
+    checkedRead(&numFrames_, sizeof(size_t));
+
+    readNames(nParams, parameterNames_);
+    readNames(nJoints, jointNames_);
+
+    MT_THROW_IF(
+        nJoints > (mappingSize_ - offset) / (kParametersPerJoint * sizeof(float)),
+        "Invalid joint count {} in mmo file {}",
+        nJoints,
+        filename);
+    scale_.resize(gsl::narrow<Eigen::Index>(nJoints * kParametersPerJoint));
+    checkedRead(scale_.data(), scale_.size() * sizeof(float));
+
+    const size_t frameBytes = nParams * sizeof(float);
+    MT_THROW_IF(
+        frameBytes > 0 && numFrames_ > (mappingSize_ - offset) / frameBytes,
+        "Invalid mmo file {}: {} frames of {} parameters exceed the file size",
+        filename,
+        numFrames_,
+        nParams);
+
+    poses_ = mapping_ + offset;
+  } catch (...) {
+    unmapFile(mapping_, mappingSize_);
+    throw;
+  }
+}
+
+MatrixXf MappedMmo::frames(const size_t start, const size_t count) const {
+  MT_THROW_IF(
+      start > numFrames_ || count > numFrames_ - start,
+      "Frames [{}, {}) are out of range for a motion with {} frames",
+      start,
+      start + count,
+      numFrames_);
+  MatrixXf result(gsl::narrow<Eigen::Index>(numParameters()), gsl::narrow<Eigen::Index>(count));
+  if (result.size() > 0) {
+    const size_t frameBytes = numParameters() * sizeof(float);
+    std::memcpy(result.data(), poses_ + start * frameBytes, count * frameBytes);
+  }
+  return result;
+}
+
+MappedMmo::~MappedMmo() {
+  unmapFile(mapping_, mappingSize_);
+}
+
 } // namespace momentum
@@ -10,6 +10,10 @@
 #include <momentum/character/fwd.h>
 #include <momentum/math/types.h>
 
+#include <cstddef>
+#include <string>
+#include <vector>
+
 namespace momentum {
 
 /// Save motion data using character parameter mapping
@@ -68,6 +72,72 @@ std::tuple<MatrixXf, VectorXf, std::vector<std::string>, std::vector<std::string
 /// @return Tuple of (mapped poses, mapped scale)
 std::tuple<MatrixXf, VectorXf> loadMmo(const std::string& filename, const Character& character);
 
+/// A .mmo file mapped read-only into memory, so that frames are only read from disk when they are
+/// accessed.
+///
+/// This avoids reading whole files when only a few frames of many motions are needed.
+class MappedMmo {
+ public:
+  /// Map a motion file into memory
+  ///
+  /// @param filename Input file path
+  /// @throws std::runtime_error if the file cannot be mapped or is not a valid .mmo file
+  explicit MappedMmo(const std::string& filename);
+
+  ~MappedMmo();
+
+  MappedMmo(const MappedMmo&) = delete;
+  MappedMmo& operator=(const MappedMmo&) = delete;
+
+  /// Names of the motion parameters
+  [[nodiscard]] const std::vector<std::string>& parameterNames() const {
+    return parameterNames_;
+  }
+
+  /// Names of the skeleton joints
+  [[nodiscard]] const std::vector<std::string>& jointNames() const {
+    return jointNames_;
+  }
+
+  /// Joint scale parameters
+  [[nodiscard]] const VectorXf& scale() const {
+    return scale_;
+  }
+
+  [[nodiscard]] size_t numParameters() const {
+    return parameterNames_.size();
+  }
+
+  [[nodiscard]] size_t numFrames() const {
+    return numFrames_;
+  }
+
+  /// Copy a range of frames out of the mapped file
+  ///
+  /// @param start First frame to copy
+  /// @param count Number of frames to copy
+  /// @return Motion poses matrix (parameters x count)
+  /// @throws std::runtime_error if the range exceeds the number of frames
+  [[nodiscard]] MatrixXf frames(size_t start, size_t count) const;
+
+  /// The mapped poses: numFrames() frames of numParameters() floats each, frame after frame
+  ///
+  /// The data is not necessarily aligned for float access, since the header before it has
+  /// variable length.
+  [[nodiscard]] const std::byte* data() const {
+    return poses_;
+  }
+
+ private:
+  std::byte* mapping_ = nullptr;
+  size_t mappingSize_ = 0;
+  std::vector<std::string> parameterNames_;
+  std::vector<std::string> jointNames_;
+  VectorXf scale_;
+  size_t numFrames_ = 0;
+  const std::byte* poses_ = nullptr;
+};
+
 /// Extract auxiliary data from motion parameters
 ///
 /// Auxiliary parameters are identified by names wrapped with double underscores (e.g., "__param__")
@@ -25,6 +25,7 @@
 #include <utility>
 
 #include <momentum/common/exception.h>
+#include <momentum/common/profile.h>
 
 namespace momentum::rasterizer {
 
@@ -741,6 +742,7 @@ void rasterizeMeshImp(
     float nearClip,
     float depthOffset,
     Eigen::Vector2f imageOffset) {
+  MT_PROFILE_FUNCTION();
   MT_THROW_IF(nearClip <= 0.0f, "Near clip must be positive");
 
   if (triangles.size() == 0) {
@@ -1036,6 +1038,7 @@ void rasterizeLinesImp(
     Span3f rgbBuffer,
     float depthOffset,
     const Eigen::Vector2f& imageOffset) {
+  MT_PROFILE_FUNCTION();
   MT_THROW_IF(nearClip <= 0.0f, "Near clip must be positive");
 
   if (positions_world.size() == 0) {
@@ -1118,6 +1121,7 @@ void rasterizeCirclesImp(
     Span3f rgbBuffer,
     float depthOffset,
     const Eigen::Vector2f& imageOffset) {
+  MT_PROFILE_FUNCTION();
   if (positions_world.size() == 0) {
     return;
   }
@@ -1208,6 +1212,7 @@ void rasterizeSplatsImp(
     float nearClip,
     float depthOffset,
     Eigen::Vector2f imageOffset) {
+  MT_PROFILE_FUNCTION();
   MT_THROW_IF(nearClip <= 0.0f, "Near clip must be positive");
   MT_THROW_IF(radius <= 0.0f, "radius must be positive");
 
@@ -1400,6 +1405,7 @@ void rasterizeWireframeImp(
     bool backfaceCulling,
     float depthOffset,
     const Eigen::Vector2f& imageOffset) {
+  MT_PROFILE_FUNCTION();
   const SimdCamera cameraSimd(camera, modelMatrix, imageOffset);
   MT_THROW_IF(nearClip <= 0, "near_clip must be greater than 0.");
   MT_THROW_IF(thickness <= 0, "thickness must be greater than 0.");
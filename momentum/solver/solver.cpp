@@ -85,6 +85,7 @@ double SolverT<T>::solve(Eigen::VectorX<T>& params) {
 
   initializeSolver();
 
+  converged_ = false;
   iteration_ = 0;
   for (; iteration_ < maxIterations_; iteration_++) {
     // do actual iteration (iterations should update the error value)
@@ -111,6 +112,11 @@ double SolverT<T>::solve(Eigen::VectorX<T>& params) {
     }
 
     if (iteration_ >= minIterations_ && converged) {
+      converged_ = true;
+      break;
+    }
+
+    if (iterationCallback_ && !iterationCallback_(iteration_, error_)) {
       break;
     }
 
@@ -127,6 +133,11 @@ double SolverT<T>::solve(Eigen::VectorX<T>& params) {
   return error_;
 }
 
+template <typename T>
+void SolverT<T>::setIterationCallback(IterationCallback callback) {
+  iterationCallback_ = std::move(callback);
+}
+
 template <typename T>
 const ParameterSet& SolverT<T>::getActiveParameters() const {
   return activeParameters_;
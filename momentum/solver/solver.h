@@ -10,6 +10,7 @@
 #include <momentum/math/types.h>
 #include <momentum/solver/fwd.h>
 
+#include <functional>
 #include <string>
 #include <unordered_map>
 
@@ -91,6 +92,20 @@ class SolverT {
     return errorHistory_;
   }
 
+  /// Called after every iteration with the iteration index and the current error
+  ///
+  /// Returning false stops the solve after the current iteration, e.g. to enforce an external
+  /// time or iteration budget.
+  using IterationCallback = std::function<bool(size_t iteration, double error)>;
+
+  /// Sets a callback that is invoked after every iteration; pass an empty function to remove it
+  void setIterationCallback(IterationCallback callback);
+
+  /// Returns whether the last solve() stopped because the convergence criterion was met
+  [[nodiscard]] bool hasConverged() const {
+    return converged_;
+  }
+
  protected:
   /// Initializes solver state before optimization begins
   virtual void initializeSolver() = 0;
@@ -150,6 +165,12 @@ class SolverT {
 
   /// Relative error change threshold for convergence
   float threshold_{};
+
+  /// Optional per-iteration callback that can stop the solve early
+  IterationCallback iterationCallback_;
+
+  /// Whether the last solve converged
+  bool converged_ = false;
 };
 
 } // namespace momentum
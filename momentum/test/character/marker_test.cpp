@@ -0,0 +1,128 @@
+/*
+ * Copyright (c) Meta Platforms, Inc. and affiliates.
+ *
+ * This source code is licensed under the MIT license found in the
+ * LICENSE file in the root directory of this source tree.
+ */
+
+#include <gtest/gtest.h>
+
+#include "momentum/character/marker.h"
+
+namespace momentum {
+
+namespace {
+
+MarkerSequence createTestSequence(size_t numFrames, size_t numMarkers) {
+  MarkerSequence sequence;
+  sequence.name = "subject";
+  sequence.fps = 120.0f;
+  for (size_t iFrame = 0; iFrame < numFrames; ++iFrame) {
+    std::vector<Marker> frame(numMarkers);
+    for (size_t iMarker = 0; iMarker < numMarkers; ++iMarker) {
+      frame[iMarker].name = "marker" + std::to_string(iMarker);
+      frame[iMarker].occluded = (iFrame + iMarker) % 3 == 0;
+      if (!frame[iMarker].occluded) {
+        frame[iMarker].pos = Vector3d(iFrame, iMarker, 0.5 * iFrame + iMarker);
+      }
+    }
+    sequence.frames.push_back(std::move(frame));
+  }
+  return sequence;
+}
+
+} // namespace
+
+TEST(ColumnarMarkerSequenceTest, DefaultConstructor) {
+  const ColumnarMarkerSequence sequence;
+  EXPECT_TRUE(sequence.name.empty());
+  EXPECT_EQ(sequence.numFrames(), 0);
+  EXPECT_EQ(sequence.numMarkers(), 0);
+  EXPECT_FLOAT_EQ(sequence.fps, 30.0f);
+}
+
+TEST(ColumnarMarkerSequenceTest, RoundTrip) {
+  const MarkerSequence sequence = createTestSequence(5, 4);
+  const ColumnarMarkerSequence columnar = toColumnarMarkerSequence(sequence);
+
+  EXPECT_EQ(columnar.name, sequence.name);
+  EXPECT_FLOAT_EQ(columnar.fps, sequence.fps);
+  ASSERT_EQ(columnar.numFrames(), 5);
+  ASSERT_EQ(columnar.numMarkers(), 4);
+  EXPECT_EQ(columnar.positions.rows(), 12);
+  EXPECT_EQ(columnar.occluded.rows(), 4);
+  EXPECT_EQ(columnar.markerNames[2], "marker2");
+
+  // The positions of a frame are contiguous
+  EXPECT_FLOAT_EQ(columnar.positions.data()[3 * 4 * 2 + 3 * 2 + 2], 3.0f);
+
+  const MarkerSequence result = toMarkerSequence(columnar);
+  EXPECT_EQ(result.name, sequence.name);
+  EXPECT_FLOAT_EQ(result.fps, sequence.fps);
+  ASSERT_EQ(result.frames.size(), sequence.frames.size());
+  for (size_t iFrame = 0; iFrame < result.frames.size(); ++iFrame) {
+    ASSERT_EQ(result.frames[iFrame].size(), sequence.frames[iFrame].size());
+    for (size_t iMarker = 0; iMarker < result.frames[iFrame].size(); ++iMarker) {
+      const auto& expected = sequence.frames[iFrame][iMarker];
+      const auto& actual = result.frames[iFrame][iMarker];
+      EXPECT_EQ(actual.name, expected.name);
+      EXPECT_EQ(actual.occluded, expected.occluded);
+      EXPECT_TRUE(actual.pos.isApprox(expected.pos, 1e-6));
+    }
+  }
+}
+
+TEST(ColumnarMarkerSequenceTest, EmptySequence) {
+  MarkerSequence sequence;
+  sequence.name = "empty";
+  const ColumnarMarkerSequence columnar = toColumnarMarkerSequence(sequence);
+  EXPECT_EQ(columnar.name, "empty");
+  EXPECT_EQ(columnar.numFrames(), 0);
+  EXPECT_EQ(columnar.numMarkers(), 0);
+  EXPECT_TRUE(toMarkerSequence(columnar).frames.empty());
+}
+
+TEST(ColumnarMarkerSequenceTest, MismatchedFrameSizeThrows) {
+  MarkerSequence sequence = createTestSequence(3, 4);
+  sequence.frames[1].pop_back();
+  EXPECT_THROW((void)toColumnarMarkerSequence(sequence), std::runtime_error);
+}
+
+TEST(ColumnarMarkerSequenceTest, Frame) {
+  const ColumnarMarkerSequence columnar = toColumnarMarkerSequence(createTestSequence(3, 2));
+  const std::vector<Marker> frame = columnar.frame(2);
+  ASSERT_EQ(frame.size(), 2);
+  EXPECT_EQ(frame[1].name, "marker1");
+  EXPECT_TRUE(frame[1].occluded);
+  EXPECT_FALSE(frame[0].occluded);
+  EXPECT_TRUE(frame[0].pos.isApprox(Vector3d(2.0, 0.0, 1.0)));
+
+  EXPECT_THROW((void)columnar.frame(3), std::runtime_error);
+}
+
+TEST(ColumnarMarkerSequenceTest, Resize) {
+  ColumnarMarkerSequence columnar = toColumnarMarkerSequence(createTestSequence(3, 2));
+  const Eigen::MatrixXf positions = columnar.positions;
+
+  // Growing keeps the existing frames and adds occluded frames
+  columnar.resize(5);
+  EXPECT_EQ(columnar.numFrames(), 5);
+  EXPECT_TRUE(columnar.positions.leftCols(3).isApprox(positions));
+  EXPECT_TRUE(columnar.positions.rightCols(2).isZero());
+  EXPECT_TRUE((columnar.occluded.rightCols(2).array() == 1).all());
+
+  // Shrinking keeps the first frames
+  columnar.resize(2);
+  EXPECT_EQ(columnar.numFrames(), 2);
+  EXPECT_TRUE(columnar.positions.isApprox(positions.leftCols(2)));
+
+  // Changing the markers resets all frames
+  columnar.markerNames.emplace_back("marker2");
+  columnar.resize(4);
+  EXPECT_EQ(columnar.positions.rows(), 9);
+  EXPECT_EQ(columnar.numFrames(), 4);
+  EXPECT_TRUE(columnar.positions.isZero());
+  EXPECT_TRUE((columnar.occluded.array() == 1).all());
+}
+
+} // namespace momentum
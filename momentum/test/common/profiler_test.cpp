@@ -0,0 +1,209 @@
+/*
+ * Copyright (c) Meta Platforms, Inc. and affiliates.
+ *
+ * This source code is licensed under the MIT license found in the
+ * LICENSE file in the root directory of this source tree.
+ */
+
+#include "momentum/common/profiler.h"
+
+#include <gtest/gtest.h>
+
+#include <algorithm>
+#include <string>
+#include <thread>
+#include <vector>
+
+using namespace momentum::profiler;
+
+namespace {
+
+const ZoneStats* findStats(const std::vector<ZoneStats>& stats, const std::string& name) {
+  const auto it =
+      std::find_if(stats.begin(), stats.end(), [&](const ZoneStats& s) { return s.name == name; });
+  return it != stats.end() ? &*it : nullptr;
+}
+
+// Makes the ScopedZones record into a fresh profiler for the duration of a test.
+class ProfilerTest : public testing::Test {
+ protected:
+  void SetUp() override {
+    Profiler::setInstance(&profiler_);
+    profiler_.setEnabled(true);
+  }
+
+  void TearDown() override {
+    Profiler::setInstance(nullptr);
+  }
+
+  Profiler profiler_;
+};
+
+} // namespace
+
+TEST_F(ProfilerTest, DisabledRecordsNothing) {
+  profiler_.setEnabled(false);
+  {
+    ScopedZone zone("disabled");
+  }
+  EXPECT_TRUE(profiler_.events().empty());
+
+  profiler_.setEnabled(true);
+  {
+    ScopedZone zone("enabled");
+  }
+  const auto events = profiler_.events();
+  ASSERT_EQ(events.size(), 1);
+  EXPECT_STREQ(events[0].name, "enabled");
+
+  profiler_.clear();
+  EXPECT_TRUE(profiler_.events().empty());
+}
+
+TEST_F(ProfilerTest, NestedZones) {
+  // Explicit timestamps, so that the self times are exact
+  profiler_.record("inner", 20, 30);
+  profiler_.record("outer", 10, 50);
+  profiler_.record("inner", 35, 45);
+  profiler_.record("outer", 100, 110);
+
+  const auto events = profiler_.events();
+  ASSERT_EQ(events.size(), 4);
+  EXPECT_STREQ(events[0].name, "outer");
+  EXPECT_EQ(events[0].beginNs, 10);
+  EXPECT_EQ(events[0].durationNs, 40);
+
+  const auto stats = profiler_.zoneStats();
+  ASSERT_EQ(stats.size(), 2);
+  EXPECT_EQ(stats[0].name, "outer");
+  EXPECT_EQ(stats[0].count, 2);
+  EXPECT_DOUBLE_EQ(stats[0].totalMs, 50e-6);
+  EXPECT_DOUBLE_EQ(stats[0].selfMs, 30e-6);
+  EXPECT_DOUBLE_EQ(stats[0].minMs, 10e-6);
+  EXPECT_DOUBLE_EQ(stats[0].maxMs, 40e-6);
+
+  const ZoneStats* inner = findStats(stats, "inner");
+  ASSERT_NE(inner, nullptr);
+  EXPECT_EQ(inner->count, 2);
+  EXPECT_DOUBLE_EQ(inner->totalMs, 20e-6);
+  EXPECT_DOUBLE_EQ(inner->selfMs, 20e-6);
+}
+
+TEST_F(ProfilerTest, ScopedZonesNest) {
+  {
+    ScopedZone outer("outer");
+    ZoneStack stack;
+    stack.push("pushed");
+    {
+      ScopedZone inner("inner");
+    }
+    stack.pop();
+  }
+
+  const auto events = profiler_.events();
+  ASSERT_EQ(events.size(), 3);
+  EXPECT_STREQ(events[0].name, "outer");
+  for (const auto& event : events) {
+    EXPECT_GE(event.beginNs, events[0].beginNs);
+    EXPECT_LE(event.beginNs + event.durationNs, events[0].beginNs + events[0].durationNs);
+  }
+  EXPECT_NE(findStats(profiler_.zoneStats(), "pushed"), nullptr);
+}
+
+TEST_F(ProfilerTest, RingBufferKeepsLatestZones) {
+  profiler_.setBufferCapacity(3);
+  EXPECT_EQ(profiler_.bufferCapacity(), 3);
+  for (uint64_t i = 0; i < 5; ++i) {
+    profiler_.record("zone", 10 * i, 10 * i + 1);
+  }
+
+  const auto events = profiler_.events();
+  ASSERT_EQ(events.size(), 3);
+  EXPECT_EQ(events[0].beginNs, 20);
+  EXPECT_EQ(events[2].beginNs, 40);
+  EXPECT_EQ(profiler_.droppedEvents(), 2);
+
+  profiler_.clear();
+  EXPECT_EQ(profiler_.droppedEvents(), 0);
+
+  EXPECT_THROW(profiler_.setBufferCapacity(0), std::runtime_error);
+}
+
+TEST_F(ProfilerTest, DynamicNames) {
+  for (int i = 0; i < 2; ++i) {
+    std::string name = "frame_" + std::to_string(i);
+    ScopedZone zone(name, ScopedZone::Dynamic{});
+    name.assign("overwritten");
+  }
+
+  const auto stats = profiler_.zoneStats();
+  ASSERT_EQ(stats.size(), 2);
+  EXPECT_NE(findStats(stats, "frame_0"), nullptr);
+  EXPECT_NE(findStats(stats, "frame_1"), nullptr);
+  EXPECT_EQ(profiler_.intern("frame_0"), profiler_.intern(std::string("frame_0")));
+}
+
+TEST_F(ProfilerTest, ChromeTrace) {
+  profiler_.setThreadName("main \"thread\"");
+  profiler_.record("zone", 1000, 3500);
+  profiler_.record("zone", 5000, 6000);
+
+  const std::string trace = profiler_.chromeTrace();
+  EXPECT_NE(trace.find(R"("traceEvents":[)"), std::string::npos);
+  EXPECT_NE(
+      trace.find(
+          R"({"name":"zone","cat":"momentum","ph":"X","pid":0,"tid":0,"ts":0.000,"dur":2.500})"),
+      std::string::npos);
+  EXPECT_NE(trace.find(R"("ts":4.000,"dur":1.000)"), std::string::npos);
+  EXPECT_NE(trace.find(R"("args":{"name":"main \"thread\""})"), std::string::npos);
+
+  profiler_.clear();
+  EXPECT_NE(profiler_.chromeTrace().find(R"("traceEvents":[)"), std::string::npos);
+}
+
+TEST_F(ProfilerTest, MultipleThreads) {
+  constexpr int kThreads = 4;
+  constexpr int kZones = 100;
+  std::vector<std::thread> threads;
+  threads.reserve(kThreads);
+  for (int i = 0; i < kThreads; ++i) {
+    threads.emplace_back([] {
+      for (int j = 0; j < kZones; ++j) {
+        ScopedZone zone("worker");
+      }
+    });
+  }
+  for (auto& thread : threads) {
+    thread.join();
+  }
+
+  const auto events = profiler_.events();
+  ASSERT_EQ(events.size(), kThreads * kZones);
+  std::vector<uint32_t> threadIds;
+  for (const auto& event : events) {
+    threadIds.push_back(event.threadId);
+  }
+  std::sort(threadIds.begin(), threadIds.end());
+  threadIds.erase(std::unique(threadIds.begin(), threadIds.end()), threadIds.end());
+  EXPECT_EQ(threadIds.size(), kThreads);
+
+  const auto stats = profiler_.zoneStats();
+  ASSERT_EQ(stats.size(), 1);
+  EXPECT_EQ(stats[0].count, kThreads * kZones);
+
+  // The buffers of the exited threads are released.
+  profiler_.clear();
+  EXPECT_TRUE(profiler_.events().empty());
+}
+
+TEST_F(ProfilerTest, SetInstance) {
+  EXPECT_EQ(&Profiler::instance(), &profiler_);
+  Profiler::setInstance(nullptr);
+  EXPECT_NE(&Profiler::instance(), &profiler_);
+
+  // The default profiler is disabled, so the zone is not recorded anywhere.
+  {
+    ScopedZone zone("default");
+  }
+  EXPECT_TRUE(profiler_.events().empty());
+}
@@ -7,10 +7,12 @@
 
 #include "momentum/common/filesystem.h"
 #include "momentum/io/marker/marker_io.h"
+#include "momentum/io/marker/trc_io.h"
 #include "momentum/test/io/io_helpers.h"
 
 #include <gtest/gtest.h>
 
+#include <fstream>
 #include <string>
 #include <vector>
 
@@ -69,6 +71,35 @@ TEST(MarkerIOTest, testFindMainSubject) {
 
   const int mainSubjectID = findMainSubjectIndex(actorSequences);
   EXPECT_EQ(mainSubjectID, 1);
+
+  std::vector<ColumnarMarkerSequence> columnarSequences;
+  for (const auto& sequence : actorSequences) {
+    columnarSequences.push_back(toColumnarMarkerSequence(sequence));
+  }
+  EXPECT_EQ(findMainSubjectIndex(columnarSequences), 1);
+}
+
+TEST(MarkerIOTest, testLoadMarkersColumnar) {
+  const std::string markerFile = getMarkerFile();
+  const std::vector<MarkerSequence> actorSequences = loadMarkers(markerFile);
+  const std::vector<ColumnarMarkerSequence> columnarSequences = loadMarkersColumnar(markerFile);
+  ASSERT_EQ(columnarSequences.size(), actorSequences.size());
+  ASSERT_EQ(columnarSequences[0].numFrames(), 89);
+  ASSERT_EQ(columnarSequences[0].numMarkers(), 36);
+
+  for (size_t iFrame = 0; iFrame < columnarSequences[0].numFrames(); ++iFrame) {
+    const std::vector<Marker> frame = columnarSequences[0].frame(iFrame);
+    const std::vector<Marker>& expected = actorSequences[0].frames[iFrame];
+    for (size_t iMarker = 0; iMarker < frame.size(); ++iMarker) {
+      EXPECT_EQ(frame[iMarker].name, expected[iMarker].name);
+      EXPECT_EQ(frame[iMarker].occluded, expected[iMarker].occluded);
+      EXPECT_TRUE(frame[iMarker].pos.isApprox(expected[iMarker].pos, 1e-5));
+    }
+  }
+
+  const auto mainSubjectSequence = loadMarkersForMainSubjectColumnar(markerFile);
+  ASSERT_TRUE(mainSubjectSequence.has_value());
+  EXPECT_EQ(mainSubjectSequence->numFrames(), 89);
 }
 
 TEST(MarkerIOTest, testLoadMarkersForMainSubject) {
@@ -80,6 +111,194 @@ TEST(MarkerIOTest, testLoadMarkersForMainSubject) {
   EXPECT_EQ(mainSubjectSequence->frames[0].size(), 36);
 }
 
+TEST(MarkerIOTest, testStreamC3d) {
+  const std::string markerFile = getMarkerFile();
+  const std::vector<ColumnarMarkerSequence> expected = loadMarkersColumnar(markerFile);
+  ASSERT_EQ(expected.size(), 1);
+
+  // The file has occluded markers, whose positions are carried forward
+  ASSERT_GT(expected[0].occluded.cast<int>().sum(), 0);
+
+  const auto reader = openMarkerStream(markerFile);
+  ASSERT_EQ(reader->numFrames(), 89);
+  ASSERT_EQ(reader->subjects().size(), 1);
+  EXPECT_EQ(reader->subjects()[0].markerNames, expected[0].markerNames);
+  EXPECT_EQ(reader->subjects()[0].numFrames(), 0);
+
+  const auto checkChunk = [&](const ColumnarMarkerSequence& chunk, size_t firstFrame) {
+    const auto& occluded = expected[0].occluded.middleCols(firstFrame, chunk.numFrames());
+    EXPECT_EQ(chunk.occluded, occluded);
+    for (size_t iFrame = 0; iFrame < chunk.numFrames(); ++iFrame) {
+      // Occluded markers keep their previous position, as in the loader
+      for (size_t iMarker = 0; iMarker < chunk.numMarkers(); ++iMarker) {
+        const Eigen::Vector3f actual = chunk.positions.col(iFrame).segment<3>(3 * iMarker);
+        const Eigen::Vector3f reference =
+            expected[0].positions.col(firstFrame + iFrame).segment<3>(3 * iMarker);
+        EXPECT_TRUE(actual.isApprox(reference, 1e-5f));
+      }
+    }
+  };
+
+  size_t numFramesRead = 0;
+  while (true) {
+    const auto chunk = reader->read(32);
+    ASSERT_EQ(chunk.size(), 1);
+    if (chunk[0].numFrames() == 0) {
+      break;
+    }
+    EXPECT_LE(chunk[0].numFrames(), 32);
+    checkChunk(chunk[0], numFramesRead);
+    numFramesRead += chunk[0].numFrames();
+  }
+  EXPECT_EQ(numFramesRead, 89);
+  EXPECT_EQ(reader->currentFrame(), 89);
+
+  reader->seek(40);
+  const auto chunk = reader->read(10);
+  ASSERT_EQ(chunk[0].numFrames(), 10);
+  checkChunk(chunk[0], 40);
+  EXPECT_EQ(reader->currentFrame(), 50);
+
+  EXPECT_THROW(reader->seek(90), std::runtime_error);
+}
+
+TEST(MarkerIOTest, testStreamTrc) {
+  auto tempFile = temporaryFile("markers", ".trc");
+  {
+    std::ofstream ofs(tempFile.path(), std::ios::binary);
+    ofs << "PathFileType\t4\t(X/Y/Z)\tmarkers.trc\n"
+        << "DataRate\tCameraRate\tNumFrames\tNumMarkers\tUnits\tOrigDataRate\t"
+        << "OrigDataStartFrame\tOrigNumFrames\n"
+        << "100\t100\t5\t2\tmm\t100\t1\t5\n"
+        << "Frame#\tTime\tA\t\t\tB\n"
+        << "\t\tX1\tY1\tZ1\tX2\tY2\tZ2\n";
+    for (int iFrame = 0; iFrame < 5; ++iFrame) {
+      ofs << iFrame + 1 << "\t" << iFrame * 0.01 << "\t" << 10 * iFrame << "\t20\t30\t";
+      if (iFrame == 2) {
+        ofs << "\t\t\n";
+      } else {
+        ofs << "40\t50\t" << 60 + iFrame << "\n";
+      }
+    }
+  }
+
+  const ColumnarMarkerSequence expected = loadTrcColumnar(tempFile.path().string());
+  ASSERT_EQ(expected.numFrames(), 5);
+  EXPECT_FLOAT_EQ(expected.fps, 100.0f);
+  EXPECT_EQ(expected.markerNames, (std::vector<std::string>{"A", "B"}));
+  EXPECT_EQ(expected.occluded(1, 2), 1);
+  // Millimeters are converted to centimeters
+  EXPECT_TRUE(expected.positions.col(3).segment<3>(0).isApprox(Eigen::Vector3f(3.0f, 3.0f, -2.0f)));
+
+  const auto reader = openMarkerStream(tempFile.path().string());
+  ASSERT_EQ(reader->numFrames(), 5);
+  ASSERT_EQ(reader->subjects().size(), 1);
+  EXPECT_EQ(reader->subjects()[0].markerNames, expected.markerNames);
+
+  auto chunk = reader->read(2);
+  ASSERT_EQ(chunk[0].numFrames(), 2);
+  EXPECT_TRUE(chunk[0].positions.isApprox(expected.positions.leftCols(2)));
+
+  reader->seek(4);
+  chunk = reader->read(2);
+  ASSERT_EQ(chunk[0].numFrames(), 1);
+  EXPECT_TRUE(chunk[0].positions.isApprox(expected.positions.rightCols(1)));
+
+  // Seeking backwards
+  reader->seek(1);
+  chunk = reader->read(3);
+  ASSERT_EQ(chunk[0].numFrames(), 3);
+  EXPECT_TRUE(chunk[0].positions.isApprox(expected.positions.middleCols(1, 3)));
+  EXPECT_EQ(chunk[0].occluded, expected.occluded.middleCols(1, 3));
+}
+
+TEST(MarkerIOTest, testLoadC3dDoublePrecision) {
+  const std::vector<MarkerSequence> actorSequences = loadMarkers(getMarkerFile());
+  ASSERT_EQ(actorSequences.size(), 1);
+
+  // The positions are converted from mm to cm in double precision, so they are not all exactly
+  // representable as floats
+  bool hasDoublePrecision = false;
+  for (const auto& frame : actorSequences[0].frames) {
+    for (const auto& marker : frame) {
+      hasDoublePrecision |=
+          !marker.occluded && marker.pos != marker.pos.cast<float>().cast<double>();
+    }
+  }
+  EXPECT_TRUE(hasDoublePrecision);
+}
+
+TEST(MarkerIOTest, testLoadTrcDoublePrecision) {
+  auto tempFile = temporaryFile("markers", ".trc");
+  {
+    std::ofstream ofs(tempFile.path(), std::ios::binary);
+    ofs << "PathFileType\t4\t(X/Y/Z)\tmarkers.trc\n"
+        << "DataRate\tCameraRate\tNumFrames\tNumMarkers\tUnits\tOrigDataRate\t"
+        << "OrigDataStartFrame\tOrigNumFrames\n"
+        << "100\t100\t2\t1\tcm\t100\t1\t2\n"
+        << "Frame#\tTime\tA\n"
+        << "\t\tX1\tY1\tZ1\n"
+        << "1\t0\t1.0000000001\t2\t3\n"
+        << "2\t0.01\t\t\t\n";
+  }
+
+  const MarkerSequence sequence = loadTrc(tempFile.path().string());
+  ASSERT_EQ(sequence.frames.size(), 2);
+  ASSERT_EQ(sequence.frames[0].size(), 1);
+  EXPECT_EQ(sequence.frames[0][0].name, "A");
+  EXPECT_FALSE(sequence.frames[0][0].occluded);
+  EXPECT_EQ(sequence.frames[0][0].pos, Eigen::Vector3d(1.0000000001, 3.0, -2.0));
+  EXPECT_TRUE(sequence.frames[1][0].occluded);
+}
+
+TEST(MarkerIOTest, testLoadTrcUnit) {
+  for (const auto& [unit, scale] :
+       std::vector<std::pair<std::string, double>>{{"mm", 0.1}, {"cm", 1.0}, {"m", 100.0}}) {
+    auto tempFile = temporaryFile("markers", ".trc");
+    {
+      std::ofstream ofs(tempFile.path(), std::ios::binary);
+      ofs << "PathFileType\t4\t(X/Y/Z)\tmarkers.trc\n"
+          << "DataRate\tCameraRate\tNumFrames\tNumMarkers\tUnits\tOrigDataRate\t"
+          << "OrigDataStartFrame\tOrigNumFrames\n"
+          << "100\t100\t1\t1\t" << unit << "\t100\t1\t1\n"
+          << "Frame#\tTime\tA\n"
+          << "\t\tX1\tY1\tZ1\n"
+          << "1\t0\t10\t20\t30\n";
+    }
+
+    // The positions are converted from the unit of the header to centimeters
+    const MarkerSequence sequence = loadTrc(tempFile.path().string());
+    ASSERT_EQ(sequence.frames.size(), 1);
+    EXPECT_TRUE(sequence.frames[0][0].pos.isApprox(scale * Eigen::Vector3d(10.0, 30.0, -20.0)))
+        << unit;
+  }
+}
+
+TEST(MarkerIOTest, testLoadTrcMalformedFrameCount) {
+  auto tempFile = temporaryFile("markers", ".trc");
+  {
+    std::ofstream ofs(tempFile.path(), std::ios::binary);
+    ofs << "PathFileType\t4\t(X/Y/Z)\tmarkers.trc\n"
+        << "DataRate\tCameraRate\tNumFrames\tNumMarkers\tUnits\tOrigDataRate\t"
+        << "OrigDataStartFrame\tOrigNumFrames\n"
+        << "100\t100\tunknown\t1\tcm\t100\t1\tunknown\n"
+        << "Frame#\tTime\tA\n"
+        << "\t\tX1\tY1\tZ1\n";
+    for (int iFrame = 0; iFrame < 3; ++iFrame) {
+      ofs << iFrame + 1 << "\t" << iFrame * 0.01 << "\t1\t2\t3\n";
+    }
+  }
+
+  // The header frame count is only a hint for the loaders
+  EXPECT_EQ(loadTrc(tempFile.path().string()).frames.size(), 3);
+  EXPECT_EQ(loadTrcColumnar(tempFile.path().string()).numFrames(), 3);
+  EXPECT_THROW((void)openMarkerStream(tempFile.path().string()), std::runtime_error);
+}
+
+TEST(MarkerIOTest, testStreamUnsupported) {
+  EXPECT_THROW((void)openMarkerStream("markers.glb"), std::runtime_error);
+}
+
 TEST(MarkerIOTest, testLoadMarkersEmpty) {
   const auto actorSequences = loadMarkers("");
   EXPECT_EQ(actorSequences.size(), 0);
@@ -13,6 +13,8 @@
 
 #include <gtest/gtest.h>
 
+#include <cstring>
+#include <filesystem>
 #include <fstream>
 
 using namespace momentum;
@@ -199,3 +201,52 @@ TEST_F(MmoIOTest, ErrorConditions) {
   EXPECT_EQ(poses.rows(), 0);
   EXPECT_TRUE(paramNames.empty());
 }
+
+TEST_F(MmoIOTest, MappedMatchesLoad) {
+  auto tempFile = temporaryFile("mmo_test", ".mmo");
+
+  // The name lengths leave the poses at an offset that is not a multiple of sizeof(float)
+  const std::vector<std::string> parameterNames = {"a", "bb", "ccc"};
+  const std::vector<std::string> jointNames = {"root"};
+  const VectorXf scale = VectorXf::Random(kParametersPerJoint);
+  const MatrixXf poses = MatrixXf::Random(3, 10);
+  saveMmo(tempFile.path().string(), poses, scale, parameterNames, jointNames);
+
+  const MappedMmo mapped(tempFile.path().string());
+  EXPECT_EQ(mapped.numFrames(), 10);
+  EXPECT_EQ(mapped.numParameters(), parameterNames.size());
+  EXPECT_EQ(mapped.parameterNames(), parameterNames);
+  EXPECT_EQ(mapped.jointNames(), jointNames);
+  EXPECT_TRUE(mapped.scale().isApprox(scale));
+
+  EXPECT_TRUE(mapped.frames(0, 10).isApprox(poses));
+  EXPECT_TRUE(mapped.frames(3, 4).isApprox(poses.middleCols(3, 4)));
+  EXPECT_EQ(mapped.frames(10, 0).cols(), 0);
+  EXPECT_THROW((void)mapped.frames(8, 3), std::runtime_error);
+  EXPECT_THROW((void)mapped.frames(11, 0), std::runtime_error);
+
+  // The raw data holds the frames one after the other
+  float value = 0;
+  std::memcpy(&value, mapped.data() + (2 * poses.rows() + 1) * sizeof(float), sizeof(float));
+  EXPECT_FLOAT_EQ(value, poses(1, 2));
+}
+
+TEST_F(MmoIOTest, MappedErrorConditions) {
+  EXPECT_THROW(MappedMmo("nonexistent.mmo"), std::runtime_error);
+
+  auto tempFile = temporaryFile("mmo_test", ".mmo");
+  saveMmo(tempFile.path().string(), poses_, scale_, parameterNames_, jointNames_);
+  const auto size = std::filesystem::file_size(tempFile.path());
+
+  // Truncated poses
+  std::filesystem::resize_file(tempFile.path(), size - 1);
+  EXPECT_THROW(MappedMmo(tempFile.path().string()), std::runtime_error);
+
+  // Truncated header
+  std::filesystem::resize_file(tempFile.path(), 12);
+  EXPECT_THROW(MappedMmo(tempFile.path().string()), std::runtime_error);
+
+  // Empty file
+  std::filesystem::resize_file(tempFile.path(), 0);
+  EXPECT_THROW(MappedMmo(tempFile.path().string()), std::runtime_error);
+}
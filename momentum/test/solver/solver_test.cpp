@@ -13,6 +13,7 @@
 #include <gtest/gtest.h>
 
 #include <cstddef>
+#include <vector>
 
 namespace {
 
@@ -343,6 +344,58 @@ TYPED_TEST(SolverTest, Convergence) {
   EXPECT_GT(iterCountIter->second(0, 0), 1.0f);
 }
 
+// Test stopping the solve early from the iteration callback
+TYPED_TEST(SolverTest, IterationCallback) {
+  using T = typename TestFixture::Type;
+
+  const size_t numParameters = 10;
+
+  auto function = std::make_unique<MockSolverFunction<T>>(numParameters);
+
+  SolverOptions options;
+  options.minIterations = 1;
+  options.maxIterations = 10;
+
+  // Error keeps changing by a large relative amount, so the solve never converges on its own
+  class NonConvergingMockSolver : public MockSolver<T> {
+   public:
+    NonConvergingMockSolver(const SolverOptions& options, SolverFunctionT<T>* solver)
+        : MockSolver<T>(options, solver) {}
+
+    void doIteration() override {
+      this->error_ = 1.0 / static_cast<double>(this->iteration_ + 1);
+    }
+  };
+
+  NonConvergingMockSolver solver(options, function.get());
+  Eigen::VectorX<T> parameters = Eigen::VectorX<T>::Ones(numParameters);
+
+  solver.solve(parameters);
+  EXPECT_EQ(solver.getErrorHistory().size(), 10);
+  EXPECT_FALSE(solver.hasConverged());
+
+  std::vector<size_t> iterations;
+  solver.setIterationCallback([&](size_t iteration, double error) {
+    EXPECT_DOUBLE_EQ(error, 1.0 / static_cast<double>(iteration + 1));
+    iterations.push_back(iteration);
+    return iteration < 2;
+  });
+  solver.solve(parameters);
+  EXPECT_EQ(solver.getErrorHistory().size(), 3);
+  EXPECT_EQ(iterations, (std::vector<size_t>{0, 1, 2}));
+  EXPECT_FALSE(solver.hasConverged());
+
+  // Removing the callback restores the default behavior.
+  solver.setIterationCallback({});
+  solver.solve(parameters);
+  EXPECT_EQ(solver.getErrorHistory().size(), 10);
+
+  // The default mock converges after its second iteration.
+  MockSolver<T> convergingSolver(options, function.get());
+  convergingSolver.solve(parameters);
+  EXPECT_TRUE(convergingSolver.hasConverged());
+}
+
 // Test with invalid parameters size
 TYPED_TEST(SolverTest, InvalidParametersSize) {
   using T = typename TestFixture::Type;
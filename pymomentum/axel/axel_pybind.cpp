@@ -9,10 +9,12 @@
 #include <axel/DualContouring.h>
 #include <axel/MeshToSdf.h>
 #include <axel/SignedDistanceField.h>
+#include <axel/SparseSignedDistanceField.h>
 #include <axel/common/Types.h>
 #include <axel/math/MeshHoleFilling.h>
 #include <momentum/common/exception.h>
 #include <pymomentum/axel/axel_utility.h>
+#include <pymomentum/axel/sdf_sample.h>
 #include <pymomentum/axel/tri_bvh_pybind.h>
 
 #include <fmt/format.h>
@@ -21,6 +23,8 @@
 #include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
+#include <torch/csrc/utils/pybind.h>
+#include <torch/python.h>
 #include <Eigen/Core>
 
 #include <gsl/span>
@@ -114,12 +118,43 @@ py::array_t<float> smoothMeshLaplacianBinding(
   return eigenVectorsToArray<float, 3>(smoothedVertices);
 }
 
+// Converts a dual contouring result to the (vertices, normals, faces) tuple returned to Python,
+// with normals computed from the SDF gradients at the vertices.
+py::tuple dualContouringResultToTuple(
+    const axel::SignedDistanceField<float>& sdf,
+    const axel::DualContouringResult<float>& result,
+    bool triangulate) {
+  if (!result.success) {
+    throw std::runtime_error("Dual contouring failed");
+  }
+
+  // Convert vertices to numpy array using helper
+  auto vertices = pymomentum::eigenVectorsToArray<float, 3>(result.vertices);
+
+  // Compute normals at vertices by sampling SDF gradients
+  std::vector<Eigen::Vector3f> normals;
+  normals.reserve(result.vertices.size());
+  for (const auto& vertex : result.vertices) {
+    normals.push_back(sdf.gradient(vertex));
+  }
+  auto normalsArray = pymomentum::eigenVectorsToArray<float, 3>(normals);
+
+  // Convert quads to numpy array using helper
+  auto faces = triangulate
+      ? pymomentum::eigenVectorsToArray<int, 3>(axel::triangulateQuads(result.quads))
+      : pymomentum::eigenVectorsToArray<int, 4>(result.quads);
+
+  return py::make_tuple(vertices, normalsArray, faces);
+}
+
 } // namespace
 
 PYBIND11_MODULE(axel, m) {
   m.attr("__name__") = "pymomentum.axel";
   m.doc() = "Python bindings for Axel library classes including SignedDistanceField.";
 
+  pybind11::module_::import("torch"); // @dep=//caffe2:torch
+
   // Bind BoundingBox
   py::class_<axel::BoundingBox<float>>(m, "BoundingBox")
       .def(
@@ -347,6 +382,164 @@ More efficient than calling sample() and gradient() separately.
             maxPt.z());
       });
 
+  // Bind SparseSignedDistanceField
+  py::class_<axel::SparseSignedDistanceField<float>>(m, "SparseSignedDistanceField")
+      .def(
+          py::init<const axel::BoundingBox<float>&, const Eigen::Vector3<axel::Index>&, float>(),
+          R"(Create an empty narrow-band signed distance field in which every voxel is outside.
+
+The grid is split into blocks of 8x8x8 voxels. Only blocks near the surface store their
+distances; all other blocks read as +band_width (outside) or -band_width (inside).
+
+:param bounds: 3D bounding box defining the spatial extent of the SDF.
+:param resolution: Grid resolution in each dimension (nx, ny, nz).
+:param band_width: Half-width of the stored band in world units; distances are clamped to it.)",
+          py::arg("bounds"),
+          py::arg("resolution"),
+          py::arg("band_width"))
+      .def_static(
+          "from_dense",
+          &axel::SparseSignedDistanceField<float>::fromDense,
+          R"(Convert a dense :class:`SignedDistanceField`, keeping only the blocks within the band.
+
+:param dense: The dense signed distance field.
+:param band_width: Half-width of the stored band in world units.
+:return: The sparse signed distance field.)",
+          py::arg("dense"),
+          py::arg("band_width"))
+      .def(
+          "to_dense",
+          &axel::SparseSignedDistanceField<float>::toDense,
+          R"(Convert to a dense :class:`SignedDistanceField` with the same bounds and resolution.
+
+Voxels outside the band get +/-band_width.)")
+      .def_property_readonly(
+          "bounds",
+          &axel::SparseSignedDistanceField<float>::bounds,
+          "Get the bounding box of the SDF.")
+      .def_property_readonly(
+          "resolution",
+          &axel::SparseSignedDistanceField<float>::resolution,
+          "Get the grid resolution as (nx, ny, nz).")
+      .def_property_readonly(
+          "voxel_size",
+          &axel::SparseSignedDistanceField<float>::voxelSize,
+          "Get the voxel size in each dimension as (dx, dy, dz).")
+      .def_property_readonly(
+          "band_width",
+          &axel::SparseSignedDistanceField<float>::bandWidth,
+          "Get the half-width of the stored band in world units.")
+      .def_property_readonly(
+          "total_voxels",
+          &axel::SparseSignedDistanceField<float>::totalVoxels,
+          "Get the total number of voxels in the SDF, stored or not.")
+      .def_property_readonly(
+          "allocated_blocks",
+          &axel::SparseSignedDistanceField<float>::allocatedBlocks,
+          "Get the number of 8x8x8 blocks that store their distances.")
+      .def_property_readonly(
+          "memory_usage",
+          &axel::SparseSignedDistanceField<float>::memoryUsage,
+          "Get the number of bytes used by the block table and the allocated blocks.")
+      .def(
+          "sample",
+          [](const axel::SparseSignedDistanceField<float>& self,
+             const py::array_t<float>& positions) {
+            return applyBatchedScalarOperation(
+                self,
+                positions,
+                [](const axel::SparseSignedDistanceField<float>& sdf, const Eigen::Vector3f& pos) {
+                  return sdf.sample(pos);
+                });
+          },
+          R"(Sample the SDF at continuous 3D positions using trilinear interpolation.
+
+Positions away from the surface return values clamped to +/-band_width.
+
+:param positions: Position(s) to query. Either (3,) for single position or (N, 3) for batch of positions.
+:return: Interpolated signed distance value(s). Scalar for single position, 1D array for batch.)",
+          py::arg("positions"))
+      .def(
+          "gradient",
+          [](const axel::SparseSignedDistanceField<float>& self,
+             const py::array_t<float>& positions) {
+            return applyBatchedVectorOperation(
+                self,
+                positions,
+                [](const axel::SparseSignedDistanceField<float>& sdf, const Eigen::Vector3f& pos) {
+                  return sdf.gradient(pos);
+                });
+          },
+          R"(Sample the SDF gradient at continuous 3D positions. The gradient is zero away from the band.
+
+:param positions: Position(s) to query. Either (3,) for single position or (N, 3) for batch of positions.
+:return: Gradient vector(s) at the given position(s). Shape (3,) for single position, (N, 3) for batch.)",
+          py::arg("positions"))
+      .def(
+          "sample_with_gradient",
+          [](const axel::SparseSignedDistanceField<float>& self,
+             const py::array_t<float>& positions) {
+            return applyBatchedSampleGradientOperation(
+                self,
+                positions,
+                [](const axel::SparseSignedDistanceField<float>& sdf, const Eigen::Vector3f& pos) {
+                  return sdf.sampleWithGradient(pos);
+                });
+          },
+          R"(Sample both the SDF value and gradient at continuous 3D positions.
+
+:param positions: Position(s) to query. Either (3,) for single position or (N, 3) for batch of positions.
+:return: Tuple of (value(s), gradient(s)) at the given position(s).)",
+          py::arg("positions"))
+      .def(
+          "world_to_grid",
+          &axel::SparseSignedDistanceField<float>::worldToGrid<float>,
+          R"(Convert a 3D world-space position to continuous grid coordinates.
+
+:param position: 3D world-space position (x, y, z).
+:return: Continuous grid coordinates (may be fractional).)",
+          py::arg("position"))
+      .def(
+          "grid_to_world",
+          &axel::SparseSignedDistanceField<float>::gridToWorld<float>,
+          R"(Convert continuous grid coordinates to 3D world-space position.
+
+:param grid_pos: Continuous grid coordinates.
+:return: 3D world-space position (x, y, z).)",
+          py::arg("grid_pos"))
+      .def("__repr__", [](const axel::SparseSignedDistanceField<float>& self) {
+        const auto& res = self.resolution();
+        return fmt::format(
+            "SparseSignedDistanceField(resolution=[{}, {}, {}], band_width={:.3f}, allocated_blocks={})",
+            res.x(),
+            res.y(),
+            res.z(),
+            self.bandWidth(),
+            self.allocatedBlocks());
+      });
+
+  // Bind PropagationMode
+  py::enum_<axel::PropagationMode>(m, "PropagationMode")
+      .value(
+          "FastMarching",
+          axel::PropagationMode::FastMarching,
+          "Solve the Eikonal equation outward from the narrow band with fast marching.")
+      .value(
+          "DistanceTransform",
+          axel::PropagationMode::DistanceTransform,
+          "Exact Euclidean distance transform to the nearest narrow band voxel; linear time and multi-threaded.");
+
+  // Bind SignMode
+  py::enum_<axel::SignMode>(m, "SignMode")
+      .value(
+          "RayCasting",
+          axel::SignMode::RayCasting,
+          "Cast six axis-aligned rays from every voxel and take the majority of their parities.")
+      .value(
+          "ScanlineParity",
+          axel::SignMode::ScanlineParity,
+          "Cast one ray per grid row along each axis and label the whole row from its sorted hits; same majority vote, much faster and multi-threaded.");
+
   // Bind MeshToSdfConfig
   py::class_<axel::MeshToSdfConfig<float>>(m, "MeshToSdfConfig")
       .def(py::init<>(), "Create MeshToSdfConfig with default parameters.")
@@ -362,12 +555,23 @@ More efficient than calling sample() and gradient() separately.
           "tolerance",
           &axel::MeshToSdfConfig<float>::tolerance,
           R"(Numerical tolerance for computations. Default: machine epsilon * 1000)")
+      .def_readwrite(
+          "propagation_mode",
+          &axel::MeshToSdfConfig<float>::propagationMode,
+          R"(How distances are propagated from the narrow band to the rest of the grid, as a :class:`PropagationMode`. Default: FastMarching)")
+      .def_readwrite(
+          "sign_mode",
+          &axel::MeshToSdfConfig<float>::signMode,
+          R"(How voxels are classified as inside or outside the mesh, as a :class:`SignMode`. Default: RayCasting)")
       .def("__repr__", [](const axel::MeshToSdfConfig<float>& self) {
         return fmt::format(
-            "MeshToSdfConfig(narrow_band_width={:.3f}, max_distance={:.3f}, tolerance={:.6e})",
+            "MeshToSdfConfig(narrow_band_width={:.3f}, max_distance={:.3f}, tolerance={:.6e}, propagation_mode={}, sign_mode={})",
             self.narrowBandWidth,
             self.maxDistance,
-            self.tolerance);
+            self.tolerance,
+            self.propagationMode == axel::PropagationMode::FastMarching ? "FastMarching"
+                                                                        : "DistanceTransform",
+            self.signMode == axel::SignMode::RayCasting ? "RayCasting" : "ScanlineParity");
       });
 
   // Bind mesh_to_sdf function
@@ -562,6 +766,129 @@ Example usage::
       py::arg("padding") = 0.1f,
       py::arg("config") = axel::MeshToSdfConfig<float>{});
 
+  // Bind mesh_to_sparse_sdf function
+  m.def(
+      "mesh_to_sparse_sdf",
+      [](const py::array_t<float>& vertices,
+         const py::array_t<int>& triangles,
+         const axel::BoundingBox<float>& bounds,
+         const py::array_t<axel::Index>& resolution,
+         const axel::MeshToSdfConfig<float>& config) {
+        validatePositionArray(vertices, "vertices");
+        validateTriangleIndexArray(triangles, "triangles", vertices.shape(0));
+
+        if (resolution.ndim() != 1 || resolution.shape(0) != 3) {
+          throw std::runtime_error(
+              fmt::format(
+                  "Invalid shape for resolution: expected (3,), got {}",
+                  getArrayDimStr(resolution)));
+        }
+
+        const auto verticesData = vertices.unchecked<2>();
+        const auto trianglesData = triangles.unchecked<2>();
+        const auto resolutionData = resolution.unchecked<1>();
+
+        std::vector<Eigen::Vector3f> vertexVector;
+        vertexVector.reserve(verticesData.shape(0));
+        for (py::ssize_t i = 0; i < verticesData.shape(0); ++i) {
+          vertexVector.emplace_back(verticesData(i, 0), verticesData(i, 1), verticesData(i, 2));
+        }
+
+        std::vector<Eigen::Vector3i> triangleVector;
+        triangleVector.reserve(trianglesData.shape(0));
+        for (py::ssize_t i = 0; i < trianglesData.shape(0); ++i) {
+          triangleVector.emplace_back(
+              trianglesData(i, 0), trianglesData(i, 1), trianglesData(i, 2));
+        }
+
+        const Eigen::Vector3<axel::Index> resolutionVector(
+            resolutionData(0), resolutionData(1), resolutionData(2));
+
+        return axel::meshToSparseSdf<float>(
+            std::span<const Eigen::Vector3f>(vertexVector),
+            std::span<const Eigen::Vector3i>(triangleVector),
+            bounds,
+            resolutionVector,
+            config);
+      },
+      R"(Convert a triangle mesh to a narrow-band :class:`SparseSignedDistanceField`.
+
+Only the 8x8x8 blocks within config.narrow_band_width voxels of the mesh store exact distances;
+all other blocks are classified as inside or outside by scanline parity. This takes time and memory
+proportional to the surface area instead of the grid volume. config.propagation_mode and
+config.sign_mode are ignored.
+
+:param vertices: Vertex positions as 2D array of shape (N, 3) where N is number of vertices.
+:param triangles: Triangle indices as 2D array of shape (M, 3) where M is number of triangles.
+:param bounds: Spatial bounds for the SDF as a :class:`BoundingBox`.
+:param resolution: Grid resolution as 1D array of shape (3,) containing (nx, ny, nz).
+:param config: Configuration parameters as :class:`MeshToSdfConfig` (optional).
+:return: Generated :class:`SparseSignedDistanceField`.)",
+      py::arg("vertices"),
+      py::arg("triangles"),
+      py::arg("bounds"),
+      py::arg("resolution"),
+      py::arg("config") = axel::MeshToSdfConfig<float>{});
+
+  // Bind convenience overload with automatic bounds computation
+  m.def(
+      "mesh_to_sparse_sdf",
+      [](const py::array_t<float>& vertices,
+         const py::array_t<int>& triangles,
+         const py::array_t<axel::Index>& resolution,
+         float padding,
+         const axel::MeshToSdfConfig<float>& config) {
+        validatePositionArray(vertices, "vertices");
+        validateTriangleIndexArray(triangles, "triangles", vertices.shape(0));
+
+        if (resolution.ndim() != 1 || resolution.shape(0) != 3) {
+          throw std::runtime_error(
+              fmt::format(
+                  "Invalid shape for resolution: expected (3,), got {}",
+                  getArrayDimStr(resolution)));
+        }
+
+        const auto verticesData = vertices.unchecked<2>();
+        const auto trianglesData = triangles.unchecked<2>();
+        const auto resolutionData = resolution.unchecked<1>();
+
+        std::vector<Eigen::Vector3f> vertexVector;
+        vertexVector.reserve(verticesData.shape(0));
+        for (py::ssize_t i = 0; i < verticesData.shape(0); ++i) {
+          vertexVector.emplace_back(verticesData(i, 0), verticesData(i, 1), verticesData(i, 2));
+        }
+
+        std::vector<Eigen::Vector3i> triangleVector;
+        triangleVector.reserve(trianglesData.shape(0));
+        for (py::ssize_t i = 0; i < trianglesData.shape(0); ++i) {
+          triangleVector.emplace_back(
+              trianglesData(i, 0), trianglesData(i, 1), trianglesData(i, 2));
+        }
+
+        const Eigen::Vector3<axel::Index> resolutionVector(
+            resolutionData(0), resolutionData(1), resolutionData(2));
+
+        return axel::meshToSparseSdf<float>(
+            std::span<const Eigen::Vector3f>(vertexVector),
+            std::span<const Eigen::Vector3i>(triangleVector),
+            resolutionVector,
+            padding,
+            config);
+      },
+      R"(Convert a triangle mesh to a narrow-band :class:`SparseSignedDistanceField` with automatic bounds.
+
+:param vertices: Vertex positions as 2D array of shape (N, 3) where N is number of vertices.
+:param triangles: Triangle indices as 2D array of shape (M, 3) where M is number of triangles.
+:param resolution: Grid resolution as 1D array of shape (3,) containing (nx, ny, nz).
+:param padding: Extra space around mesh bounds as fraction of bounding box size (default: 0.1).
+:param config: Configuration parameters as :class:`MeshToSdfConfig` (optional).
+:return: Generated :class:`SparseSignedDistanceField`.)",
+      py::arg("vertices"),
+      py::arg("triangles"),
+      py::arg("resolution"),
+      py::arg("padding") = 0.1f,
+      py::arg("config") = axel::MeshToSdfConfig<float>{});
+
   // Bind fill_holes function
   m.def(
       "fill_holes",
@@ -673,28 +1000,7 @@ Example usage::
       [](const axel::SignedDistanceField<float>& sdf, float isovalue, bool triangulate) {
         // Call the dual contouring function
         const auto result = axel::dualContouring<float>(sdf, isovalue);
-
-        if (!result.success) {
-          throw std::runtime_error("Dual contouring failed");
-        }
-
-        // Convert vertices to numpy array using helper
-        auto vertices = pymomentum::eigenVectorsToArray<float, 3>(result.vertices);
-
-        // Compute normals at vertices by sampling SDF gradients
-        std::vector<Eigen::Vector3f> normals;
-        normals.reserve(result.vertices.size());
-        for (const auto& vertex : result.vertices) {
-          normals.push_back(sdf.gradient(vertex));
-        }
-        auto normalsArray = pymomentum::eigenVectorsToArray<float, 3>(normals);
-
-        // Convert quads to numpy array using helper
-        auto faces = triangulate
-            ? pymomentum::eigenVectorsToArray<int, 3>(axel::triangulateQuads(result.quads))
-            : pymomentum::eigenVectorsToArray<int, 4>(result.quads);
-
-        return py::make_tuple(vertices, normalsArray, faces);
+        return dualContouringResultToTuple(sdf, result, triangulate);
       },
       R"(Extract an isosurface from a signed distance field using dual contouring.
 
@@ -746,6 +1052,71 @@ Example usage::
       py::arg("isovalue") = 0.0f,
       py::arg("triangulate") = false);
 
+  // Bind IncrementalDualContouring
+  py::class_<axel::IncrementalDualContouring<float>>(m, "IncrementalDualContouring")
+      .def(
+          py::init<const axel::SignedDistanceField<float>&, float>(),
+          R"(Extract an isosurface with dual contouring, keeping the mesh of each block of cells.
+
+After a local edit of the SDF, :meth:`update` re-meshes only the blocks near the edited voxels
+and patches the mesh, which gives the same surface as calling :func:`dual_contouring` again.
+
+:param sdf: The :class:`SignedDistanceField` to extract the isosurface from.
+:param isovalue: The isovalue to extract (typically 0.0 for zero level set). Default: 0.0)",
+          py::arg("sdf"),
+          py::arg("isovalue") = 0.0f,
+          py::call_guard<py::gil_scoped_release>())
+      .def(
+          "update",
+          [](axel::IncrementalDualContouring<float>& self,
+             const axel::SignedDistanceField<float>& sdf,
+             const Eigen::Vector3<axel::Index>& minVoxel,
+             const Eigen::Vector3<axel::Index>& maxVoxel) {
+            MT_THROW_IF_T(
+                sdf.resolution() != self.resolution(),
+                py::value_error,
+                "SDF resolution ({}, {}, {}) does not match the extracted one ({}, {}, {})",
+                sdf.resolution().x(),
+                sdf.resolution().y(),
+                sdf.resolution().z(),
+                self.resolution().x(),
+                self.resolution().y(),
+                self.resolution().z());
+            return self.update(sdf, minVoxel, maxVoxel);
+          },
+          R"(Re-mesh after the voxels in the box [min_voxel, max_voxel] of the SDF were edited.
+
+:param sdf: The edited :class:`SignedDistanceField`, with the resolution of the original one.
+:param min_voxel: Minimum grid index (i, j, k) of the edited voxels (inclusive).
+:param max_voxel: Maximum grid index (i, j, k) of the edited voxels (inclusive).
+:return: Number of re-meshed blocks.)",
+          py::arg("sdf"),
+          py::arg("min_voxel"),
+          py::arg("max_voxel"),
+          py::call_guard<py::gil_scoped_release>())
+      .def(
+          "mesh",
+          [](const axel::IncrementalDualContouring<float>& self,
+             const axel::SignedDistanceField<float>& sdf,
+             bool triangulate) {
+            return dualContouringResultToTuple(sdf, self.result(), triangulate);
+          },
+          R"(Get the current mesh, in the format returned by :func:`dual_contouring`.
+
+:param sdf: The :class:`SignedDistanceField` used to compute the vertex normals.
+:param triangulate: Whether to triangulate the quads (default: False).
+:return: Tuple of (vertices, normals, quads).)",
+          py::arg("sdf"),
+          py::arg("triangulate") = false)
+      .def_property_readonly(
+          "num_blocks",
+          &axel::IncrementalDualContouring<float>::numBlocks,
+          "Get the total number of blocks of cells.")
+      .def_readonly_static(
+          "block_size",
+          &axel::IncrementalDualContouring<float>::kBlockSize,
+          "Number of cells along each side of a block.");
+
   // Bind triangulate_quads function
   m.def(
       "triangulate_quads",
@@ -880,6 +1251,52 @@ Example usage::
       py::arg("iterations") = 1,
       py::arg("step") = 0.5f);
 
+  // Bind sdf_sample functions
+  m.def(
+      "sdf_sample",
+      [](at::Tensor points, const axel::SignedDistanceField<float>* sdf) {
+        return sdfSample(points, {sdf});
+      },
+      py::call_guard<py::gil_scoped_release>(),
+      R"(Sample a signed distance field at a tensor of points using trilinear interpolation.
+
+The grid is read in place and the points are processed in parallel. The result is
+differentiable with respect to the points: backpropagation uses the analytic gradient of
+the interpolation, which is only computed when ``points`` requires grad.
+
+:param points: Tensor of shape (N, 3) or (B, N, 3) with the positions to sample.
+:param sdf: The signed distance field to sample.
+:return: Tensor of shape (N,) or (B, N) with the interpolated signed distances.)",
+      py::arg("points"),
+      py::arg("sdf"));
+
+  m.def(
+      "sdf_sample",
+      [](at::Tensor points, const std::vector<const axel::SignedDistanceField<float>*>& sdfs) {
+        return sdfSample(points, sdfs);
+      },
+      py::call_guard<py::gil_scoped_release>(),
+      R"(Sample a batch of signed distance fields, possibly with different bounds and resolutions,
+at a batch of points in a single call.
+
+Example usage::
+
+    import torch
+    import pymomentum.axel as axel
+
+    # Penetration loss of each pose's vertices against its own collision SDF
+    vertices = skinned_vertices.requires_grad_()  # (B, N, 3)
+    distances = axel.sdf_sample(vertices, sdfs)  # len(sdfs) == B
+    loss = torch.relu(-distances).square().sum()
+    loss.backward()
+
+:param points: Tensor of shape (B, N, 3) with the positions to sample.
+:param sdfs: List of B signed distance fields; the points of batch entry ``b`` are sampled
+    in ``sdfs[b]``. A list with a single SDF is used for all batch entries.
+:return: Tensor of shape (B, N) with the interpolated signed distances.)",
+      py::arg("points"),
+      py::arg("sdfs"));
+
   // Register TriBvh bindings
   registerTriBvhBindings(m);
 }
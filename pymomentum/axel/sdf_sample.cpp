@@ -0,0 +1,170 @@
+/*
+ * Copyright (c) Meta Platforms, Inc. and affiliates.
+ *
+ * This source code is licensed under the MIT license found in the
+ * LICENSE file in the root directory of this source tree.
+ */
+
+#include "pymomentum/axel/sdf_sample.h"
+
+#include "pymomentum/tensor_utility/autograd_utility.h"
+#include "pymomentum/tensor_utility/tensor_utility.h"
+
+#include <momentum/common/exception.h>
+
+#include <dispenso/parallel_for.h>
+#include <Eigen/Core>
+
+#include <algorithm>
+
+namespace pymomentum {
+
+namespace {
+
+using SdfList = std::vector<const axel::SignedDistanceField<float>*>;
+
+// Points are split into chunks of this size so that a few large batches still spread over all
+// threads, without paying the scheduling overhead per point.
+constexpr int64_t kPointsPerTask = 4096;
+
+// Validates the points against the SDFs and returns them as a contiguous
+// [nBatch x nPoints x 3] CPU tensor of type T.
+template <typename T>
+at::Tensor validatePoints(at::Tensor points, const SdfList& sdfs, bool& squeeze) {
+  MT_THROW_IF(sdfs.empty(), "sdf_sample: expected at least one SDF.");
+  for (const auto* sdf : sdfs) {
+    MT_THROW_IF(sdf == nullptr, "sdf_sample: expected a SignedDistanceField, got None.");
+  }
+
+  TensorChecker checker("sdf_sample");
+  points = checker.validateAndFixTensor(
+      points, "points", {-1, 3}, {"nPoints", "xyz"}, toScalarType<T>(), true, false, &squeeze);
+
+  const int64_t nBatch = checker.getBatchSize();
+  MT_THROW_IF(
+      sdfs.size() != 1 && static_cast<int64_t>(sdfs.size()) != nBatch,
+      "sdf_sample: expected a single SDF or one SDF per batch entry ({}), got {}.",
+      nBatch,
+      sdfs.size());
+  return points;
+}
+
+// Samples the SDFs at [nBatch x nPoints x 3] points. If gradients is defined, it receives the
+// [nBatch x nPoints x 3] spatial gradients of the distances.
+template <typename T>
+at::Tensor sampleDistances(const at::Tensor& points, const SdfList& sdfs, at::Tensor* gradients) {
+  const int64_t nBatch = points.size(0);
+  const int64_t nPoints = points.size(1);
+
+  at::Tensor distances = at::empty({nBatch, nPoints}, at::CPU(toScalarType<T>()));
+  if (gradients != nullptr) {
+    *gradients = at::empty({nBatch, nPoints, 3}, at::CPU(toScalarType<T>()));
+  }
+
+  const T* pointsData = points.data_ptr<T>();
+  T* distancesData = distances.data_ptr<T>();
+  T* gradientsData = gradients != nullptr ? gradients->data_ptr<T>() : nullptr;
+
+  const int64_t nTasksPerBatch = (nPoints + kPointsPerTask - 1) / kPointsPerTask;
+  dispenso::parallel_for(0, nBatch * nTasksPerBatch, [&](int64_t iTask) {
+    const int64_t iBatch = iTask / nTasksPerBatch;
+    const int64_t begin = (iTask % nTasksPerBatch) * kPointsPerTask;
+    const int64_t end = std::min(begin + kPointsPerTask, nPoints);
+    const auto& sdf = *sdfs[sdfs.size() == 1 ? 0 : iBatch];
+
+    for (int64_t iPoint = iBatch * nPoints + begin; iPoint < iBatch * nPoints + end; ++iPoint) {
+      const Eigen::Vector3<T> position =
+          Eigen::Map<const Eigen::Vector3<T>>(pointsData + 3 * iPoint);
+      if (gradientsData != nullptr) {
+        const auto [distance, gradient] = sdf.template sampleWithGradient<T>(position);
+        distancesData[iPoint] = distance;
+        Eigen::Map<Eigen::Vector3<T>>(gradientsData + 3 * iPoint) = gradient;
+      } else {
+        distancesData[iPoint] = sdf.template sample<T>(position);
+      }
+    }
+  });
+
+  return distances;
+}
+
+#ifndef PYMOMENTUM_LIMITED_TORCH_API
+using torch::autograd::AutogradContext;
+using torch::autograd::variable_list;
+
+template <typename T>
+struct SdfSampleFunction : public torch::autograd::Function<SdfSampleFunction<T>> {
+ public:
+  static variable_list forward(AutogradContext* ctx, at::Tensor points, const SdfList* sdfs);
+
+  static variable_list backward(AutogradContext* ctx, variable_list grad_outputs);
+};
+
+template <typename T>
+variable_list
+SdfSampleFunction<T>::forward(AutogradContext* ctx, at::Tensor points, const SdfList* sdfs) {
+  const auto device = points.device();
+
+  bool squeeze = false;
+  points = validatePoints<T>(points, *sdfs, squeeze);
+
+  // The gradient of the trilinear interpolation is computed alongside the distance, since both
+  // read the same eight voxels; backward then only needs to scale it.
+  at::Tensor gradients;
+  at::Tensor distances = sampleDistances<T>(points, *sdfs, &gradients);
+  if (squeeze) {
+    distances = distances.squeeze(0);
+    gradients = gradients.squeeze(0);
+  }
+
+  ctx->save_for_backward({gradients});
+  return {distances.to(device)};
+}
+
+template <typename T>
+variable_list SdfSampleFunction<T>::backward(AutogradContext* ctx, variable_list grad_outputs) {
+  MT_THROW_IF(grad_outputs.size() != 1, "Invalid grad_outputs in SdfSampleFunction::backward");
+
+  const auto saved = ctx->get_saved_variables();
+  MT_THROW_IF(saved.empty(), "Missing saved variable");
+  const at::Tensor& gradients = saved[0];
+
+  const auto device = grad_outputs[0].device();
+  const at::Tensor dLoss_dDistances = grad_outputs[0].to(at::DeviceType::CPU, toScalarType<T>());
+  const at::Tensor dLoss_dPoints = dLoss_dDistances.unsqueeze(-1) * gradients;
+
+  return {dLoss_dPoints.to(device), at::Tensor()};
+}
+#endif // PYMOMENTUM_LIMITED_TORCH_API
+
+template <typename T>
+at::Tensor sdfSampleNoGrad(at::Tensor points, const SdfList& sdfs) {
+  const auto device = points.device();
+
+  bool squeeze = false;
+  points = validatePoints<T>(points, sdfs, squeeze);
+
+  at::Tensor distances = sampleDistances<T>(points, sdfs, nullptr);
+  if (squeeze) {
+    distances = distances.squeeze(0);
+  }
+  return distances.to(device);
+}
+
+} // namespace
+
+at::Tensor sdfSample(at::Tensor points, const SdfList& sdfs) {
+  // Skip computing the gradients when nothing is going to be backpropagated.
+  if (!points.requires_grad() || !at::GradMode::is_enabled()) {
+    return hasFloat64(points) ? sdfSampleNoGrad<double>(points, sdfs)
+                              : sdfSampleNoGrad<float>(points, sdfs);
+  }
+
+#ifndef PYMOMENTUM_LIMITED_TORCH_API
+  return applyTemplatedAutogradFunction<SdfSampleFunction>(points, &sdfs)[0];
+#else
+  MT_THROW("sdf_sample with gradients is not supported in limited PyTorch API mode");
+#endif
+}
+
+} // namespace pymomentum
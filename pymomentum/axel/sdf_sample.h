@@ -0,0 +1,29 @@
+/*
+ * Copyright (c) Meta Platforms, Inc. and affiliates.
+ *
+ * This source code is licensed under the MIT license found in the
+ * LICENSE file in the root directory of this source tree.
+ */
+
+#pragma once
+
+#include <axel/SignedDistanceField.h>
+
+#include <ATen/ATen.h>
+
+#include <vector>
+
+namespace pymomentum {
+
+// Samples signed distance fields at the given points with trilinear interpolation, reading the
+// grids in place and processing the points in parallel. The result is differentiable with respect
+// to the points, using the analytic gradient of the interpolation.
+//
+// points: [nBatch x nPoints x 3] or [nPoints x 3] tensor of world-space positions.
+// sdfs: either a single SDF, used for every batch entry, or one SDF per batch entry.
+// Returns the [nBatch x nPoints] (or [nPoints]) signed distances.
+at::Tensor sdfSample(
+    at::Tensor points,
+    const std::vector<const axel::SignedDistanceField<float>*>& sdfs);
+
+} // namespace pymomentum
@@ -600,6 +600,36 @@ Returns numpy arrays for efficient downstream processing.
          - triangle_indices: uint32 array of shape (N,) with triangle indices (kInvalidTriangleIdx if invalid)
          - bary_coords: float array of shape (N, 3) with barycentric coordinates)",
           py::arg("queries"))
+      .def(
+          "refit",
+          [](axel::TriBvh<float>& self,
+             const py::array_t<float>& vertices,
+             std::optional<float> rebuild_threshold) {
+            if (vertices.ndim() == 2 &&
+                static_cast<size_t>(vertices.shape(0)) != self.getVertexCount()) {
+              throw std::runtime_error(
+                  fmt::format(
+                      "refit expects {} vertices but got {}",
+                      self.getVertexCount(),
+                      vertices.shape(0)));
+            }
+            Eigen::MatrixX3f positions = createPositionsMatrix<float>(vertices, "vertices");
+            pybind11::gil_scoped_release release;
+            return self.refit(std::move(positions), rebuild_threshold);
+          },
+          R"(Update the vertex positions while keeping the triangles and the tree structure.
+
+Only the bounds of the tree nodes are recomputed, bottom-up and in parallel, which is much cheaper than building a new :class:`TriBvh`.  This suits animated meshes such as the skinned mesh of each frame of a sequence.  The tree gets less efficient to query as the mesh deforms away from the pose it was built in; pass rebuild_threshold to rebuild the tree automatically once :attr:`surface_area_cost` grows past rebuild_threshold times its value after the last build.
+
+:param vertices: New vertex positions as 2D array of shape (N, 3), with the same N as the vertices the tree was built with.
+:param rebuild_threshold: Optional ratio (e.g. 1.5) of the surface area cost above which the tree is rebuilt instead of refitted.
+:return: True if the tree was rebuilt, False if it was refitted.)",
+          py::arg("vertices"),
+          py::arg("rebuild_threshold") = std::nullopt)
+      .def_property_readonly(
+          "surface_area_cost",
+          &axel::TriBvh<float>::getSurfaceAreaCost,
+          "Sum of the surface areas of all tree nodes relative to the root; proportional to the expected query cost, and grows as a refitted tree degrades.")
       .def_property_readonly(
           "node_count",
           &axel::TriBvh<float>::getNodeCount,
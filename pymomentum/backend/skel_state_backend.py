@@ -22,6 +22,7 @@ exact performance difference may vary depending on the specific use case.
 
 Key Functions:
 - global_skel_state_from_local_skel_state: Forward kinematics from local to global joint states
+- global_skel_state_from_local_skel_state_functional: torch.compile-friendly forward kinematics
 - skin_points_from_skel_state: Linear blend skinning using skeleton states
 - local_skel_state_from_joint_params: Convert joint parameters to local states
 
@@ -31,15 +32,49 @@ Related Modules:
 - quaternion: Quaternion math operations used by this backend
 """
 
-from typing import List, Tuple
+import threading
+from typing import Any, Callable, Dict, List, Tuple
 
 import torch as th
 
-from pymomentum import quaternion, skel_state, trs
-from pymomentum.backend.trs_backend import unpose_from_global_joint_state
+from pymomentum import fused_kernels, quaternion, skel_state, trs
+from pymomentum.backend.trs_backend import (
+    skinning_from_joint_matrices_sparse,
+    unpose_from_global_joint_state,
+)
+
+
+# Several functions below come in three parts: a Python implementation ``_name``, its
+# TorchScript compilation ``_name_jit``, and the public ``name`` that picks one. Python
+# calls run the implementation while :mod:`pymomentum.fused_kernels` are enabled, so that
+# its ops dispatch to fused kernels, and the compiled version otherwise. TorchScript
+# callers skip the ``is_scripting()`` branch and always call the compiled version.
+def _call_impl(
+    impl: Callable[..., Any], impl_jit: Callable[..., Any], *args: Any
+) -> Any:
+    return (impl if fused_kernels.should_dispatch() else impl_jit)(*args)
+
+
+def _local_skel_state_from_joint_params(
+    joint_params: th.Tensor,
+    joint_offset: th.Tensor,
+    joint_quat_rotation: th.Tensor,
+) -> th.Tensor:
+    t = joint_offset[None, :] + joint_params[:, :, :3]
+    q = quaternion.multiply(
+        joint_quat_rotation[None],
+        quaternion.euler_xyz_to_quaternion(joint_params[:, :, 3:6]),
+    )
+    s = th.exp2(joint_params[:, :, 6:])
+
+    return th.cat([t, q, s], dim=-1)
+
+
+_local_skel_state_from_joint_params_jit = th.jit.script(
+    _local_skel_state_from_joint_params
+)
 
 
-@th.jit.script
 def local_skel_state_from_joint_params(
     joint_params: th.Tensor,
     joint_offset: th.Tensor,
@@ -73,22 +108,182 @@ def local_skel_state_from_joint_params(
         The quaternion format follows [qx, qy, qz, qw] convention (vector-first).
         Scale values are exponentiated from log2 space to linear space.
     """
-    t = joint_offset[None, :] + joint_params[:, :, :3]
-    q = quaternion.multiply(
-        joint_quat_rotation[None],
-        quaternion.euler_xyz_to_quaternion(joint_params[:, :, 3:6]),
+    if not th.jit.is_scripting():
+        return _call_impl(
+            _local_skel_state_from_joint_params,
+            _local_skel_state_from_joint_params_jit,
+            joint_params,
+            joint_offset,
+            joint_quat_rotation,
+        )
+
+    return _local_skel_state_from_joint_params_jit(
+        joint_params,
+        joint_offset,
+        joint_quat_rotation,
     )
-    s = th.exp2(joint_params[:, :, 6:])
 
-    return th.cat([t, q, s], dim=-1)
+
+# Precision policies for forward kinematics, see fk_precision_flags.
+FK_PRECISIONS: Tuple[str, ...] = ("float64", "float32", "compensated_float32")
+
+
+def fk_precision_flags(precision: str) -> Tuple[bool, bool]:
+    """
+    Map a forward kinematics precision policy to backend flags.
+
+    - ``"float64"``: the kinematic chain is accumulated in float64 and the result is
+      converted back to the input dtype. This is the most accurate, but doubles the
+      memory traffic for float32 inputs.
+    - ``"float32"``: everything runs in the input dtype.
+    - ``"compensated_float32"``: runs in the input dtype, but carries the rounding
+      error of the translation sums along the chain (compensated summation) and
+      renormalizes the quaternions after every level.
+
+    Args:
+        precision: One of :data:`FK_PRECISIONS`.
+
+    Returns:
+        Tuple of (use_double_precision, compensated).
+    """
+    if precision not in FK_PRECISIONS:
+        raise ValueError(
+            f"Unknown FK precision {precision!r}, expected one of {FK_PRECISIONS}"
+        )
+    return precision == "float64", precision == "compensated_float32"
+
+
+def _multiply_compensated(
+    state1: th.Tensor,
+    state1_t_lo: th.Tensor,
+    state2: th.Tensor,
+    state2_t_lo: th.Tensor,
+) -> Tuple[th.Tensor, th.Tensor]:
+    t1, q1, s1 = skel_state.split(state1)
+    t2, q2, s2 = skel_state.split(state2)
+    q1 = quaternion.normalize(q1)
+    q2 = quaternion.normalize(q2)
+
+    # Rotation is linear, so the two parts of the child translation are rotated
+    # separately to keep the low-order part from being absorbed.
+    offset = (
+        s1
+        * (
+            quaternion.rotate_vector_assume_normalized(q1, t2)
+            + quaternion.rotate_vector_assume_normalized(q1, state2_t_lo)
+        )
+        + state1_t_lo
+    )
+    t = t1 + offset
+    # TwoSum: (t1 + offset) - t exactly.
+    offset_rounded = t - t1
+    t_lo = (t1 - (t - offset_rounded)) + (offset - offset_rounded)
+
+    q = quaternion.normalize(quaternion.multiply_assume_normalized(q1, q2))
+    return th.cat([t, q, s1 * s2], dim=-1), t_lo
+
+
+_multiply_compensated_jit = th.jit.script(_multiply_compensated)
+
+
+def multiply_compensated(
+    state1: th.Tensor,
+    state1_t_lo: th.Tensor,
+    state2: th.Tensor,
+    state2_t_lo: th.Tensor,
+) -> Tuple[th.Tensor, th.Tensor]:
+    """
+    Multiply two skeleton states whose translations carry a low-order error term.
+
+    The translation of each state is represented as the unevaluated sum ``t + t_lo``.
+    The result translation is computed with an error-free transformation (TwoSum), so
+    the rounding error of adding the parent translation is not lost but returned as
+    the new low-order term. The result quaternion is renormalized.
+
+    Args:
+        state1: Parent skeleton states, shape (..., 8).
+        state1_t_lo: Low-order part of the parent translations, shape (..., 3).
+        state2: Child skeleton states, shape (..., 8).
+        state2_t_lo: Low-order part of the child translations, shape (..., 3).
+
+    Returns:
+        Tuple of (state1 * state2, low-order part of its translation).
+    """
+    if not th.jit.is_scripting():
+        return _call_impl(
+            _multiply_compensated,
+            _multiply_compensated_jit,
+            state1,
+            state1_t_lo,
+            state2,
+            state2_t_lo,
+        )
+
+    return _multiply_compensated_jit(
+        state1,
+        state1_t_lo,
+        state2,
+        state2_t_lo,
+    )
+
+
+def _global_skel_state_from_local_skel_state_impl(
+    local_skel_state: th.Tensor,
+    prefix_mul_indices: List[th.Tensor],
+    save_intermediate_results: bool = True,
+    use_double_precision: bool = True,
+    compensated: bool = False,
+) -> Tuple[th.Tensor, List[th.Tensor]]:
+    dtype = local_skel_state.dtype
+    intermediate_results: List[th.Tensor] = []
+    if use_double_precision:
+        global_skel_state = local_skel_state.clone().double()
+    else:
+        global_skel_state = local_skel_state.clone()
+    # Low-order part of the translations, only used when compensated.
+    t_lo = th.zeros_like(global_skel_state[..., :3]) if compensated else th.empty(0)
+    for prefix_mul_index in prefix_mul_indices:
+        source = prefix_mul_index[0]
+        target = prefix_mul_index[1]
+
+        state1 = global_skel_state.index_select(-2, target)
+        state2 = global_skel_state.index_select(-2, source)
+
+        if save_intermediate_results:
+            intermediate_results.append(state2.clone())
+
+        if compensated:
+            state, t_lo_source = multiply_compensated(
+                state1,
+                t_lo.index_select(-2, target),
+                state2,
+                t_lo.index_select(-2, source),
+            )
+            t_lo.index_copy_(-2, source, t_lo_source)
+            global_skel_state.index_copy_(-2, source, state)
+        else:
+            global_skel_state.index_copy_(
+                -2, source, skel_state.multiply(state1, state2)
+            )
+
+    if compensated:
+        global_skel_state = th.cat(
+            [global_skel_state[..., :3] + t_lo, global_skel_state[..., 3:]], dim=-1
+        )
+    return (global_skel_state.to(dtype), intermediate_results)
+
+
+_global_skel_state_from_local_skel_state_impl_jit = th.jit.script(
+    _global_skel_state_from_local_skel_state_impl
+)
 
 
-@th.jit.script
 def global_skel_state_from_local_skel_state_impl(
     local_skel_state: th.Tensor,
     prefix_mul_indices: List[th.Tensor],
     save_intermediate_results: bool = True,
     use_double_precision: bool = True,
+    compensated: bool = False,
 ) -> Tuple[th.Tensor, List[th.Tensor]]:
     """
     Compute global skeleton state from local joint transformations using forward kinematics.
@@ -123,6 +318,8 @@ def global_skel_state_from_local_skel_state_impl(
         use_double_precision: If True, performs computations in float64 for improved
             numerical stability. Recommended for deep kinematic chains to minimize
             accumulated floating-point errors.
+        compensated: If True, uses :func:`multiply_compensated` to carry the rounding
+            error of the translations along the chain; see :func:`fk_precision_flags`.
 
     Returns:
         global_skel_state: Global joint transformations, shape (batch_size, num_joints, 8).
@@ -139,25 +336,24 @@ def global_skel_state_from_local_skel_state_impl(
         :func:`global_skel_state_from_local_skel_state`: User-facing wrapper function
         :func:`local_skel_state_from_joint_params`: Convert joint parameters to local states
     """
-    dtype = local_skel_state.dtype
-    intermediate_results: List[th.Tensor] = []
-    if use_double_precision:
-        global_skel_state = local_skel_state.clone().double()
-    else:
-        global_skel_state = local_skel_state.clone()
-    for prefix_mul_index in prefix_mul_indices:
-        source = prefix_mul_index[0]
-        target = prefix_mul_index[1]
-
-        state1 = global_skel_state.index_select(-2, target)
-        state2 = global_skel_state.index_select(-2, source)
-
-        if save_intermediate_results:
-            intermediate_results.append(state2.clone())
-
-        global_skel_state.index_copy_(-2, source, skel_state.multiply(state1, state2))
+    if not th.jit.is_scripting():
+        return _call_impl(
+            _global_skel_state_from_local_skel_state_impl,
+            _global_skel_state_from_local_skel_state_impl_jit,
+            local_skel_state,
+            prefix_mul_indices,
+            save_intermediate_results,
+            use_double_precision,
+            compensated,
+        )
 
-    return (global_skel_state.to(dtype), intermediate_results)
+    return _global_skel_state_from_local_skel_state_impl_jit(
+        local_skel_state,
+        prefix_mul_indices,
+        save_intermediate_results,
+        use_double_precision,
+        compensated,
+    )
 
 
 def global_skel_state_from_local_skel_state_no_grad(
@@ -165,6 +361,7 @@ def global_skel_state_from_local_skel_state_no_grad(
     prefix_mul_indices: List[th.Tensor],
     save_intermediate_results: bool = True,
     use_double_precision: bool = True,
+    compensated: bool = False,
 ) -> Tuple[th.Tensor, List[th.Tensor]]:
     """
     Compute global skeleton state without gradient tracking.
@@ -178,6 +375,7 @@ def global_skel_state_from_local_skel_state_no_grad(
         prefix_mul_indices: List of [child_index, parent_index] tensor pairs
         save_intermediate_results: Whether to save intermediate states for backprop
         use_double_precision: Whether to use float64 for numerical stability
+        compensated: Whether to use compensated translation sums, see :func:`fk_precision_flags`
 
     Returns:
         global_skel_state: Global joint transformations, shape (batch_size, num_joints, 8)
@@ -192,10 +390,63 @@ def global_skel_state_from_local_skel_state_no_grad(
             prefix_mul_indices,
             save_intermediate_results=save_intermediate_results,
             use_double_precision=use_double_precision,
+            compensated=compensated,
         )
     return outputs
 
 
+def global_skel_state_from_local_skel_state_checkpointed_no_grad(
+    local_skel_state: th.Tensor,
+    prefix_mul_indices: List[th.Tensor],
+    checkpoint_every: int,
+    use_double_precision: bool = True,
+    compensated: bool = False,
+) -> Tuple[th.Tensor, List[th.Tensor]]:
+    """
+    Compute global skeleton state while keeping only level-boundary checkpoints.
+
+    Instead of saving a copy of the child states for every prefix level (as
+    :func:`global_skel_state_from_local_skel_state_impl` does), this keeps the full
+    working state only after every ``checkpoint_every`` levels. The per-level
+    intermediates are rebuilt from these checkpoints during the backward pass by
+    :func:`global_skel_state_from_local_skel_state_backprop_checkpointed`.
+
+    Args:
+        local_skel_state: Local joint transformations, shape (batch_size, num_joints, 8)
+        prefix_mul_indices: List of [child_index, parent_index] tensor pairs
+        checkpoint_every: Number of prefix levels between checkpoints. Must be >= 1.
+            A value >= len(prefix_mul_indices) stores no checkpoints at all and the
+            backward pass recomputes everything from the input.
+        use_double_precision: Whether to use float64 for numerical stability
+        compensated: Whether to use compensated translation sums, see
+            :func:`fk_precision_flags`. The compensation restarts at every checkpoint.
+
+    Returns:
+        global_skel_state: Global joint transformations, shape (batch_size, num_joints, 8)
+        checkpoints: Working-precision states at the start of every segment but the first.
+    """
+    if checkpoint_every < 1:
+        raise ValueError(f"checkpoint_every must be >= 1, got {checkpoint_every}")
+
+    dtype = local_skel_state.dtype
+    checkpoints: List[th.Tensor] = []
+    with th.no_grad():
+        state = local_skel_state.double() if use_double_precision else local_skel_state
+        for start in range(0, len(prefix_mul_indices), checkpoint_every):
+            if start > 0:
+                checkpoints.append(state)
+            # The impl clones its input, so every segment output is a fresh tensor and
+            # the previously stored checkpoint is left untouched.
+            state, _ = global_skel_state_from_local_skel_state_impl(
+                state,
+                prefix_mul_indices[start : start + checkpoint_every],
+                save_intermediate_results=False,
+                use_double_precision=use_double_precision,
+                compensated=compensated,
+            )
+    return state.to(dtype), checkpoints
+
+
 # @th.jit.script
 def global_skel_state_from_local_skel_state_backprop(
     global_skel_state: th.Tensor,
@@ -289,6 +540,72 @@ def global_skel_state_from_local_skel_state_backprop(
     return grad_local_skel_state.to(dtype)
 
 
+def global_skel_state_from_local_skel_state_backprop_checkpointed(
+    local_skel_state: th.Tensor,
+    grad_global_skel_state: th.Tensor,
+    prefix_mul_indices: List[th.Tensor],
+    checkpoints: List[th.Tensor],
+    checkpoint_every: int,
+    use_double_precision: bool = True,
+    compensated: bool = False,
+) -> th.Tensor:
+    """
+    Backward pass of :func:`global_skel_state_from_local_skel_state_checkpointed_no_grad`.
+
+    The prefix levels are processed in segments of ``checkpoint_every`` levels, last
+    segment first. For each segment the forward pass is replayed from its checkpoint
+    (or from the input for the first segment) to rebuild the intermediate results,
+    which are then consumed by :func:`global_skel_state_from_local_skel_state_backprop`.
+    At most one segment worth of intermediates is alive at any time.
+
+    Args:
+        local_skel_state: Local joint transformations passed to the forward pass,
+            shape (batch_size, num_joints, 8).
+        grad_global_skel_state: Gradients w.r.t. global joint states, shape (batch_size, num_joints, 8).
+        prefix_mul_indices: List of [child_index, parent_index] tensor pairs
+        checkpoints: Checkpoints returned by the forward pass.
+        checkpoint_every: Number of prefix levels between checkpoints, as used in the forward pass.
+        use_double_precision: Whether to use float64 for numerical stability
+        compensated: Whether the forward pass used compensated translation sums
+
+    Returns:
+        grad_local_skel_state: Gradients w.r.t. local joint states, shape (batch_size, num_joints, 8).
+    """
+    dtype = grad_global_skel_state.dtype
+    working_dtype = th.float64 if use_double_precision else local_skel_state.dtype
+    grad_local_skel_state = grad_global_skel_state.to(working_dtype)
+
+    starts = list(range(0, len(prefix_mul_indices), checkpoint_every))
+    for segment in reversed(range(len(starts))):
+        levels = prefix_mul_indices[
+            starts[segment] : starts[segment] + checkpoint_every
+        ]
+        segment_input = (
+            local_skel_state.detach().to(working_dtype)
+            if segment == 0
+            else checkpoints[segment - 1]
+        )
+        with th.no_grad():
+            segment_output, intermediate_results = (
+                global_skel_state_from_local_skel_state_impl(
+                    segment_input,
+                    levels,
+                    save_intermediate_results=True,
+                    use_double_precision=use_double_precision,
+                    compensated=compensated,
+                )
+            )
+        grad_local_skel_state = global_skel_state_from_local_skel_state_backprop(
+            segment_output,
+            grad_local_skel_state,
+            levels,
+            intermediate_results,
+            use_double_precision=use_double_precision,
+        )
+
+    return grad_local_skel_state.to(dtype)
+
+
 class GlobalSkelStateFromLocalSkelStateJIT(th.autograd.Function):
     """
     PyTorch autograd function for differentiable forward kinematics using skeleton states.
@@ -298,6 +615,10 @@ class GlobalSkelStateFromLocalSkelStateJIT(th.autograd.Function):
     The forward pass computes global states efficiently while saving intermediate results
     for the backward pass.
 
+    When ``checkpoint_every`` is set, only level-boundary checkpoints are kept and the
+    intermediate results are recomputed during the backward pass, trading compute for
+    memory.
+
     Note:
         This class is used internally by global_skel_state_from_local_skel_state when
         not in JIT mode. It provides gradient computation capabilities that are not
@@ -309,6 +630,9 @@ class GlobalSkelStateFromLocalSkelStateJIT(th.autograd.Function):
     def forward(
         local_skel_state: th.Tensor,
         prefix_mul_indices: List[th.Tensor],
+        checkpoint_every: int | None = None,
+        use_double_precision: bool = True,
+        compensated: bool = False,
     ) -> Tuple[th.Tensor, List[th.Tensor]]:
         """
         Compute forward pass for differentiable forward kinematics.
@@ -316,13 +640,27 @@ class GlobalSkelStateFromLocalSkelStateJIT(th.autograd.Function):
         Args:
             local_skel_state: Local joint transformations, shape (batch_size, num_joints, 8)
             prefix_mul_indices: List of [child_index, parent_index] tensor pairs
+            checkpoint_every: If None, save all intermediate results. Otherwise the
+                number of prefix levels between recomputation checkpoints.
+            use_double_precision: Whether to use float64 for numerical stability
+            compensated: Whether to use compensated translation sums
 
         Returns:
-            Tuple of (global_skel_state, intermediate_results)
+            Tuple of (global_skel_state, intermediate_results or checkpoints)
         """
-        return global_skel_state_from_local_skel_state_no_grad(
+        if checkpoint_every is None:
+            return global_skel_state_from_local_skel_state_no_grad(
+                local_skel_state,
+                prefix_mul_indices,
+                use_double_precision=use_double_precision,
+                compensated=compensated,
+            )
+        return global_skel_state_from_local_skel_state_checkpointed_no_grad(
             local_skel_state,
             prefix_mul_indices,
+            checkpoint_every,
+            use_double_precision=use_double_precision,
+            compensated=compensated,
         )
 
     @staticmethod
@@ -334,21 +672,33 @@ class GlobalSkelStateFromLocalSkelStateJIT(th.autograd.Function):
 
         Args:
             ctx: Context object for saving tensors and data
-            inputs: Tuple of (local_skel_state, prefix_mul_indices)
-            outputs: Tuple of (global_skel_state, intermediate_results)
+            inputs: Tuple of (local_skel_state, prefix_mul_indices, checkpoint_every,
+                use_double_precision, compensated)
+            outputs: Tuple of (global_skel_state, intermediate_results or checkpoints)
         """
         (
-            _,
+            local_skel_state,
             prefix_mul_indices,
+            checkpoint_every,
+            use_double_precision,
+            compensated,
         ) = inputs
         (
             global_skel_state,
             intermediate_results,
         ) = outputs
-        # need to clone as it's modified in-place
-        ctx.save_for_backward(global_skel_state.clone())
-        ctx.intermediate_results = intermediate_results
         ctx.prefix_mul_indices = prefix_mul_indices
+        ctx.checkpoint_every = checkpoint_every
+        ctx.use_double_precision = use_double_precision
+        ctx.compensated = compensated
+        if checkpoint_every is None:
+            # need to clone as it's modified in-place
+            ctx.save_for_backward(global_skel_state.clone())
+            ctx.intermediate_results = intermediate_results
+        else:
+            # The input is kept alive by autograd anyway, so saving it is free.
+            ctx.save_for_backward(local_skel_state)
+            ctx.checkpoints = intermediate_results
 
     @staticmethod
     # pyre-ignore[14]
@@ -357,24 +707,39 @@ class GlobalSkelStateFromLocalSkelStateJIT(th.autograd.Function):
         ctx,
         grad_global_skel_state: th.Tensor,
         _0,
-    ) -> Tuple[th.Tensor, None]:
-        (global_skel_state,) = ctx.saved_tensors
-
-        intermediate_results = ctx.intermediate_results
+    ) -> Tuple[th.Tensor, None, None, None, None]:
         prefix_mul_indices = ctx.prefix_mul_indices
 
-        grad_local_state = global_skel_state_from_local_skel_state_backprop(
-            global_skel_state,
-            grad_global_skel_state,
-            prefix_mul_indices,
-            intermediate_results,
-        )
-        return grad_local_state, None
+        if ctx.checkpoint_every is None:
+            (global_skel_state,) = ctx.saved_tensors
+            grad_local_state = global_skel_state_from_local_skel_state_backprop(
+                global_skel_state,
+                grad_global_skel_state,
+                prefix_mul_indices,
+                ctx.intermediate_results,
+                use_double_precision=ctx.use_double_precision,
+            )
+        else:
+            (local_skel_state,) = ctx.saved_tensors
+            grad_local_state = (
+                global_skel_state_from_local_skel_state_backprop_checkpointed(
+                    local_skel_state,
+                    grad_global_skel_state,
+                    prefix_mul_indices,
+                    ctx.checkpoints,
+                    ctx.checkpoint_every,
+                    use_double_precision=ctx.use_double_precision,
+                    compensated=ctx.compensated,
+                )
+            )
+        return grad_local_state, None, None, None, None
 
 
 def global_skel_state_from_local_skel_state(
     local_skel_state: th.Tensor,
     prefix_mul_indices: List[th.Tensor],
+    checkpoint_every: int | None = None,
+    precision: str = "float64",
 ) -> th.Tensor:
     """
     Compute global skeleton state from local joint transformations (user-facing wrapper).
@@ -387,6 +752,15 @@ def global_skel_state_from_local_skel_state(
                          Each joint contains [tx, ty, tz, qx, qy, qz, qw, s] parameters.
         prefix_mul_indices: List of [child_index, parent_index] tensor pairs defining
                            the kinematic hierarchy traversal order.
+        checkpoint_every: Memory/compute trade-off for the backward pass. If None (default),
+                         a copy of the child states is saved for every prefix level. If set,
+                         only the state after every ``checkpoint_every`` levels is saved and the
+                         intermediates are recomputed in the backward pass. Use 1 to save every
+                         level boundary, or a value >= len(prefix_mul_indices) to save nothing
+                         but the input.
+        precision: Precision policy, one of :data:`FK_PRECISIONS`; see
+                  :func:`fk_precision_flags`. The backward pass runs in float64 for
+                  "float64" and in the input dtype otherwise.
 
     Returns:
         global_skel_state: Global joint transformations, shape (batch_size, num_joints, 8).
@@ -402,20 +776,350 @@ def global_skel_state_from_local_skel_state(
         :func:`local_skel_state_from_joint_params`: Convert joint parameters to local states
     """
 
+    use_double_precision, compensated = fk_precision_flags(precision)
     if th.jit.is_tracing() or th.jit.is_scripting():
         global_skel_state, _ = global_skel_state_from_local_skel_state_impl(
-            local_skel_state, prefix_mul_indices
+            local_skel_state,
+            prefix_mul_indices,
+            use_double_precision=use_double_precision,
+            compensated=compensated,
         )
         return global_skel_state
     else:
         global_skel_state, _ = GlobalSkelStateFromLocalSkelStateJIT.apply(
             local_skel_state,
             prefix_mul_indices,
+            checkpoint_every,
+            use_double_precision,
+            compensated,
         )
         return global_skel_state
 
 
-@th.jit.script
+def global_skel_state_from_local_skel_state_functional(
+    local_skel_state: th.Tensor,
+    prefix_mul_indices: List[th.Tensor],
+    use_double_precision: bool = True,
+    compensated: bool = False,
+) -> th.Tensor:
+    """
+    Compute global skeleton state using only out-of-place, differentiable tensor ops.
+
+    This computes the same result as :func:`global_skel_state_from_local_skel_state`, but
+    without a custom autograd function or in-place updates: autograd differentiates
+    the ops directly. This makes it traceable by ``torch.compile`` as part of a larger
+    graph (e.g. FK, skinning and a loss in one training step) without graph breaks.
+    In eager mode the hand-written backward of
+    :func:`global_skel_state_from_local_skel_state` is faster and saves less memory.
+
+    Args:
+        local_skel_state: Local joint transformations, shape (batch_size, num_joints, 8).
+        prefix_mul_indices: List of [child_index, parent_index] tensor pairs defining
+            the kinematic hierarchy traversal order. The number of levels must not
+            change between calls, as ``torch.compile`` unrolls the loop over them.
+        use_double_precision: Whether to use float64 for numerical stability.
+        compensated: Whether to use compensated translation sums, see
+            :func:`fk_precision_flags`.
+
+    Returns:
+        global_skel_state: Global joint transformations, shape (batch_size, num_joints, 8).
+    """
+    dtype = local_skel_state.dtype
+    global_skel_state = (
+        local_skel_state.double() if use_double_precision else local_skel_state
+    )
+    t_lo = th.zeros_like(global_skel_state[..., :3])
+    for prefix_mul_index in prefix_mul_indices:
+        source = prefix_mul_index[0]
+        target = prefix_mul_index[1]
+        state1 = global_skel_state.index_select(-2, target)
+        state2 = global_skel_state.index_select(-2, source)
+        if compensated:
+            state, t_lo_source = multiply_compensated(
+                state1,
+                t_lo.index_select(-2, target),
+                state2,
+                t_lo.index_select(-2, source),
+            )
+            t_lo = t_lo.index_copy(-2, source, t_lo_source)
+        else:
+            state = skel_state.multiply(state1, state2)
+        global_skel_state = global_skel_state.index_copy(-2, source, state)
+    if compensated:
+        global_skel_state = th.cat(
+            [global_skel_state[..., :3] + t_lo, global_skel_state[..., 3:]], dim=-1
+        )
+    return global_skel_state.to(dtype)
+
+
+def _cross_planar_into(a: th.Tensor, b: th.Tensor, out: th.Tensor) -> None:
+    """Cross product of component-major vectors of shape (3, ...), written to ``out``."""
+    th.mul(a[1], b[2], out=out[0])
+    out[0].addcmul_(a[2], b[1], value=-1.0)
+    th.mul(a[2], b[0], out=out[1])
+    out[1].addcmul_(a[0], b[2], value=-1.0)
+    th.mul(a[0], b[1], out=out[2])
+    out[2].addcmul_(a[1], b[0], value=-1.0)
+
+
+def _normalize_planar_(q: th.Tensor, scalar: th.Tensor) -> None:
+    """Normalize component-major quaternions of shape (4, ...) in place."""
+    th.mul(q[0], q[0], out=scalar[0])
+    for i in range(1, 4):
+        scalar[0].addcmul_(q[i], q[i])
+    q.div_(scalar.sqrt_().clamp_min_(1e-12))
+
+
+def _skel_state_multiply_planar_into(
+    state1: th.Tensor,
+    state2: th.Tensor,
+    out: th.Tensor,
+    vec_a: th.Tensor,
+    vec_b: th.Tensor,
+    scalar: th.Tensor,
+) -> None:
+    """
+    In-place equivalent of :func:`pymomentum.skel_state.multiply` on component-major states.
+
+    The states are stored with the 8 skeleton state components along the leading
+    dimension, i.e. shape (8, n, ...), so that every component is a dense plane and
+    the cross products reduce to plane-wise multiply-adds (``torch.cross`` on the
+    trailing dimension is several times slower than an elementwise multiply on CPU).
+    The quaternions of ``state1`` and ``state2`` are normalized in place.
+
+    :parameter state1: Parent states, shape (8, n, ...).
+    :parameter state2: Child states, shape (8, n, ...).
+    :parameter out: Output states, shape (8, n, ...).
+    :parameter vec_a: Scratch buffer, shape (3, n, ...).
+    :parameter vec_b: Scratch buffer, shape (3, n, ...).
+    :parameter scalar: Scratch buffer, shape (1, n, ...).
+    """
+    t1, q1, s1 = state1[0:3], state1[3:7], state1[7:8]
+    t2, q2, s2 = state2[0:3], state2[3:7], state2[7:8]
+
+    # Normalize the quaternions (matches torch.nn.functional.normalize).
+    _normalize_planar_(q1, scalar)
+    _normalize_planar_(q2, scalar)
+
+    v1, w1 = q1[0:3], q1[3:4]
+    v2, w2 = q2[0:3], q2[3:4]
+
+    # t = t1 + s1 * rotate(q1, t2), using v + 2 * (w * (a x v) + a x (a x v)).
+    _cross_planar_into(v1, t2, vec_a)
+    _cross_planar_into(v1, vec_a, vec_b)
+    vec_a.mul_(w1).add_(vec_b).mul_(2.0).add_(t2)
+    th.addcmul(t1, s1, vec_a, out=out[0:3])
+
+    # q = q1 * q2, using (w1 v2 + w2 v1 + v1 x v2, w1 w2 - v1 . v2).
+    q_out = out[3:7]
+    _cross_planar_into(v1, v2, q_out[0:3])
+    q_out[0:3].addcmul_(w1, v2).addcmul_(w2, v1)
+    th.mul(v1, v2, out=vec_b)
+    th.sum(vec_b, dim=0, keepdim=True, out=scalar)
+    th.mul(w1, w2, out=q_out[3:4])
+    q_out[3:4].sub_(scalar)
+
+    # s = s1 * s2
+    th.mul(s1, s2, out=out[7:8])
+
+
+class _SkelStateFKWorkspace:
+    """Preallocated buffers for one (batch shape, dtype, device) combination."""
+
+    def __init__(
+        self,
+        prefix_mul_indices: List[th.Tensor],
+        shape: Tuple[int, ...],
+        dtype: th.dtype,
+        device: th.device,
+    ) -> None:
+        batch_shape = shape[:-2]
+
+        def alloc(k: int, n: int) -> th.Tensor:
+            return th.empty((k, n) + batch_shape, dtype=dtype, device=device)
+
+        self.global_skel_state: th.Tensor = alloc(8, shape[-2])
+        self.sources: List[th.Tensor] = []
+        self.targets: List[th.Tensor] = []
+        # (state1, state2, out, vec_a, vec_b, scalar) per level.
+        self.level_buffers: List[Tuple[th.Tensor, ...]] = []
+        for prefix_mul_index in prefix_mul_indices:
+            prefix_mul_index = prefix_mul_index.to(device=device, dtype=th.long)
+            self.sources.append(prefix_mul_index[0].contiguous())
+            self.targets.append(prefix_mul_index[1].contiguous())
+            n = prefix_mul_index.shape[1]
+            self.level_buffers.append(
+                (
+                    alloc(8, n),
+                    alloc(8, n),
+                    alloc(8, n),
+                    alloc(3, n),
+                    alloc(3, n),
+                    alloc(1, n),
+                )
+            )
+
+
+class SkelStateForwardKinematics:
+    """
+    Reusable forward kinematics engine for the skeleton state representation.
+
+    This computes the same result as :func:`global_skel_state_from_local_skel_state_impl`
+    but is meant to be built once per skeleton and called many times. All per-level
+    gather/scatter buffers are allocated on the first call for a given batch shape,
+    dtype and device and are reused by subsequent calls, and the per-level
+    :func:`pymomentum.skel_state.multiply` is evaluated in place into those buffers.
+    In steady state the only allocation is the returned tensor.
+
+    Internally the states are kept component-major with the joints ahead of the
+    batch dimensions, shape (8, num_joints, ...), so the per-level gathers copy
+    contiguous rows and the per-level math runs on dense planes rather than strided
+    slices.
+
+    The engine does not track gradients; use :func:`global_skel_state_from_local_skel_state`
+    when backpropagation is required.
+
+    The engine can be shared between threads: each thread gets its own work buffers,
+    so the buffers are allocated once per thread that calls it.
+
+    Example::
+
+        fk = SkelStateForwardKinematics(prefix_mul_indices)
+        for local_skel_state in batches:
+            global_skel_state = fk(local_skel_state)
+    """
+
+    def __init__(
+        self,
+        prefix_mul_indices: List[th.Tensor],
+        use_double_precision: bool = True,
+    ) -> None:
+        """
+        :parameter prefix_mul_indices: List of [child_index, parent_index] tensor pairs
+            defining the kinematic hierarchy traversal order, as returned by
+            :func:`pymomentum.backend.utils.calc_fk_prefix_multiplication_indices`.
+        :parameter use_double_precision: If True, the kinematic chain is accumulated in
+            float64 and the result is converted back to the input dtype.
+        """
+        self.prefix_mul_indices: List[th.Tensor] = [
+            idx.detach().long() for idx in prefix_mul_indices
+        ]
+        self.use_double_precision: bool = use_double_precision
+        # Per-thread (key, workspace), so that concurrent calls do not share buffers.
+        self._local: threading.local = threading.local()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The work buffers are not copied; they are reallocated on first use.
+        state = self.__dict__.copy()
+        del state["_local"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    def _get_workspace(self, local_skel_state: th.Tensor) -> _SkelStateFKWorkspace:
+        dtype = th.float64 if self.use_double_precision else local_skel_state.dtype
+        key = (tuple(local_skel_state.shape), dtype, local_skel_state.device)
+        workspace = getattr(self._local, "workspace", None)
+        if workspace is None or self._local.key != key:
+            workspace = _SkelStateFKWorkspace(
+                self.prefix_mul_indices, key[0], dtype, key[2]
+            )
+            self._local.workspace = workspace
+            self._local.key = key
+        return workspace
+
+    def release(self) -> None:
+        """Free the cached work buffers of the calling thread."""
+        self._local.workspace = None
+        self._local.key = None
+
+    def forward(
+        self,
+        local_skel_state: th.Tensor,
+        save_intermediate_results: bool = False,
+    ) -> Tuple[th.Tensor, List[th.Tensor]]:
+        """
+        Compute global skeleton states from local skeleton states.
+
+        :parameter local_skel_state: Local joint transformations, shape (..., num_joints, 8).
+        :parameter save_intermediate_results: If True, also return the per-level child
+            states in the same format as :func:`global_skel_state_from_local_skel_state_impl`.
+            This allocates one tensor per level.
+        :return: Tuple of (global_skel_state, intermediate_results).
+        """
+        skel_state.check(local_skel_state)
+        intermediate_results: List[th.Tensor] = []
+        with th.no_grad():
+            workspace = self._get_workspace(local_skel_state)
+            global_skel_state = workspace.global_skel_state
+            global_skel_state.copy_(local_skel_state.movedim(-1, 0).movedim(-1, 1))
+            for source, target, buffers in zip(
+                workspace.sources, workspace.targets, workspace.level_buffers
+            ):
+                state1, state2, out, vec_a, vec_b, scalar = buffers
+                th.index_select(global_skel_state, 1, target, out=state1)
+                th.index_select(global_skel_state, 1, source, out=state2)
+                if save_intermediate_results:
+                    intermediate_results.append(
+                        state2.movedim(0, -1).movedim(0, -2).contiguous()
+                    )
+                _skel_state_multiply_planar_into(
+                    state1, state2, out, vec_a, vec_b, scalar
+                )
+                global_skel_state.index_copy_(1, source, out)
+
+            # The work buffer is reused by the next call, so always hand out a copy.
+            result = th.empty(
+                local_skel_state.shape,
+                dtype=local_skel_state.dtype,
+                device=local_skel_state.device,
+            )
+            result.copy_(global_skel_state.movedim(0, -1).movedim(0, -2))
+        return result, intermediate_results
+
+    def __call__(self, local_skel_state: th.Tensor) -> th.Tensor:
+        return self.forward(local_skel_state)[0]
+
+
+def _skin_points_from_skel_state(
+    template: th.Tensor,
+    global_skel_state: th.Tensor,
+    binded_skel_state_inv: th.Tensor,
+    skin_indices_flattened: th.Tensor,
+    skin_weights_flattened: th.Tensor,
+    vert_indices_flattened: th.Tensor,
+) -> th.Tensor:
+    assert template.shape[-1] == 3
+    while template.ndim < global_skel_state.ndim:
+        template = template.unsqueeze(0)
+
+    template = template.expand(
+        list(global_skel_state.shape[:-2]) + list(template.shape[-2:])
+    )
+
+    joint_state = skel_state.multiply(
+        global_skel_state,
+        binded_skel_state_inv,
+    )
+
+    skinned = th.zeros_like(template)
+    skinned = skinned.index_add(
+        -2,
+        vert_indices_flattened,
+        skel_state.transform_points(
+            th.index_select(joint_state, -2, skin_indices_flattened),
+            th.index_select(template, -2, vert_indices_flattened),
+        )
+        * skin_weights_flattened[None, :, None],
+    )
+    return skinned
+
+
+_skin_points_from_skel_state_jit = th.jit.script(_skin_points_from_skel_state)
+
+
 def skin_points_from_skel_state(
     template: th.Tensor,
     global_skel_state: th.Tensor,
@@ -470,9 +1174,41 @@ def skin_points_from_skel_state(
         :func:`skin_oriented_points_from_skel_state`: Skinning for oriented points (gaussians)
         :func:`global_skel_state_from_local_skel_state`: Forward kinematics for joint states
     """
+    if not th.jit.is_scripting():
+        return _call_impl(
+            _skin_points_from_skel_state,
+            _skin_points_from_skel_state_jit,
+            template,
+            global_skel_state,
+            binded_skel_state_inv,
+            skin_indices_flattened,
+            skin_weights_flattened,
+            vert_indices_flattened,
+        )
+
+    return _skin_points_from_skel_state_jit(
+        template,
+        global_skel_state,
+        binded_skel_state_inv,
+        skin_indices_flattened,
+        skin_weights_flattened,
+        vert_indices_flattened,
+    )
+
+
+def _skin_points_from_skel_state_dual_quaternion(
+    template: th.Tensor,
+    global_skel_state: th.Tensor,
+    binded_skel_state_inv: th.Tensor,
+    skin_indices_flattened: th.Tensor,
+    skin_weights_flattened: th.Tensor,
+    vert_indices_flattened: th.Tensor,
+) -> th.Tensor:
     assert template.shape[-1] == 3
     while template.ndim < global_skel_state.ndim:
         template = template.unsqueeze(0)
+    while binded_skel_state_inv.ndim < global_skel_state.ndim:
+        binded_skel_state_inv = binded_skel_state_inv.unsqueeze(0)
 
     template = template.expand(
         list(global_skel_state.shape[:-2]) + list(template.shape[-2:])
@@ -482,72 +1218,186 @@ def skin_points_from_skel_state(
         global_skel_state,
         binded_skel_state_inv,
     )
-
-    skinned = th.zeros_like(template)
-    skinned = skinned.index_add(
-        -2,
+    t, q, s = skel_state.split(joint_state)
+    d = 0.5 * quaternion.multiply_assume_normalized(
+        th.cat([t, th.zeros_like(s)], dim=-1), q
+    )
+    # (..., num_influences, 9): real part, dual part and scale of each influence.
+    influence = th.index_select(th.cat([q, d, s], dim=-1), -2, skin_indices_flattened)
+
+    # Align every influence with the first influence of its vertex.
+    num_vertices = template.shape[-2]
+    num_influences = vert_indices_flattened.shape[0]
+    first_influence = th.full(
+        [num_vertices],
+        num_influences - 1,
+        dtype=vert_indices_flattened.dtype,
+        device=vert_indices_flattened.device,
+    ).scatter_reduce(
+        0,
         vert_indices_flattened,
-        skel_state.transform_points(
-            th.index_select(joint_state, -2, skin_indices_flattened),
-            th.index_select(template, -2, vert_indices_flattened),
-        )
-        * skin_weights_flattened[None, :, None],
+        th.arange(
+            num_influences,
+            dtype=vert_indices_flattened.dtype,
+            device=vert_indices_flattened.device,
+        ),
+        reduce="amin",
+    )
+    pivot = th.index_select(
+        influence[..., 0:4], -2, first_influence.index_select(0, vert_indices_flattened)
+    )
+    flip = (influence[..., 0:4] * pivot).sum(-1, keepdim=True) < 0
+    sign = 1.0 - 2.0 * flip.to(influence.dtype)
+    weights = skin_weights_flattened[:, None].to(influence.dtype)
+    influence = th.cat(
+        [influence[..., 0:8] * (sign * weights), influence[..., 8:9] * weights], dim=-1
     )
-    return skinned
 
+    blended = th.zeros(
+        list(influence.shape[:-2]) + [num_vertices, 9],
+        dtype=influence.dtype,
+        device=influence.device,
+    ).index_add(-2, vert_indices_flattened, influence)
+
+    real = blended[..., 0:4]
+    norm = th.linalg.vector_norm(real, dim=-1, keepdim=True).clamp(min=1e-12)
+    real = real / norm
+    dual = blended[..., 4:8] / norm
+    translation = 2.0 * quaternion.multiply_assume_normalized(
+        dual, quaternion.conjugate(real)
+    )
+    return (
+        quaternion.rotate_vector_assume_normalized(real, blended[..., 8:9] * template)
+        + translation[..., 0:3]
+    )
 
-@th.jit.script
-def skin_oriented_points_from_skel_state(
-    means: th.Tensor,
-    quaternions: th.Tensor,
+
+_skin_points_from_skel_state_dual_quaternion_jit = th.jit.script(
+    _skin_points_from_skel_state_dual_quaternion
+)
+
+
+def skin_points_from_skel_state_dual_quaternion(
+    template: th.Tensor,
     global_skel_state: th.Tensor,
     binded_skel_state_inv: th.Tensor,
     skin_indices_flattened: th.Tensor,
     skin_weights_flattened: th.Tensor,
     vert_indices_flattened: th.Tensor,
-) -> tuple[th.Tensor, th.Tensor]:
+) -> th.Tensor:
     """
-    Apply linear blend skinning to oriented points (Gaussian splatting) using skeleton states.
+    Apply dual quaternion skinning (DQS) to points using skeleton state transformations.
 
-    This function extends standard LBS to handle oriented points, which have both position
-    and orientation. Each oriented point is influenced by multiple joints, with both its
-    position and orientation blended according to skinning weights.
+    Drop-in alternative to :func:`skin_points_from_skel_state` that takes the same
+    flattened skinning layout. Instead of averaging the transformed positions, the
+    rigid part of each joint transform is blended as a unit dual quaternion, which
+    avoids the volume loss ("candy-wrapper" artifact) of linear blending on twisting
+    joints.
 
-    For orientations, rotation matrices are linearly interpolated (LERP) and then converted
-    back to quaternions. This is different from spherical linear interpolation (SLERP) but
-    provides smoother blending for skinning applications.
+    Dual Quaternion Skinning Formula:
+    For each joint j with skinning transform T_j * T_bind_j^(-1) = (t_j, q_j, s_j):
+        d_j = 0.5 * (t_j, 0) * q_j
+        q_i = Σ_j w_ij * σ_ij * q_j,  d_i = Σ_j w_ij * σ_ij * d_j,  s_i = Σ_j w_ij * s_j
+        skinned_p_i = R(q_i / |q_i|) (s_i * p_i) + 2 * (d_i / |q_i|) * conj(q_i / |q_i|)
+
+    where σ_ij = ±1 flips q_j into the hemisphere of the first influence of vertex i,
+    so that q and -q blend to the same rotation. Scale is not part of the dual
+    quaternion and is blended linearly; the result is exact for rigid influences and
+    equal to linear blending when all influences share the same transform.
 
     Args:
-        means: Point positions, shape (batch_size, num_points, 3).
-            Center positions of the oriented points (e.g., Gaussian means).
-        quaternions: Point orientations, shape (batch_size, num_points, 4).
-            Orientations as quaternions in [qx, qy, qz, qw] format.
+        template: Template vertex positions, shape (batch_size, num_vertices, 3).
         global_skel_state: Global joint transformations, shape (batch_size, num_joints, 8).
-            Each joint contains [tx, ty, tz, qx, qy, qz, qw, s] parameters.
         binded_skel_state_inv: Inverse bind pose transformations, shape (num_joints, 8).
-            Static transformations representing the joint configuration during binding.
         skin_indices_flattened: Joint indices for skinning, shape (num_influences,).
-            Flattened list of joint indices that influence points.
         skin_weights_flattened: Skinning weights, shape (num_influences,).
-            Corresponding weights for each joint influence (normalized per point).
-        vert_indices_flattened: Point indices for skinning, shape (num_influences,).
-            Flattened list of point indices corresponding to joint influences.
+        vert_indices_flattened: Vertex indices for skinning, shape (num_influences,).
 
     Returns:
-        skinned_means: Deformed point positions, shape (batch_size, num_points, 3).
-            Transformed positions according to current joint poses and skinning weights.
-        skinned_quaternions: Blended point orientations, shape (batch_size, num_points, 4).
-            Orientations blended using rotation matrix interpolation and converted back to quaternions.
-
-    Note:
-        This function is commonly used for Gaussian splatting applications where each
-        Gaussian has both a mean position and orientation that need to be skinned.
-        The rotation blending uses linear interpolation in matrix space for stability.
+        skinned_points: Deformed vertex positions, shape (batch_size, num_vertices, 3).
 
     See Also:
-        :func:`skin_points_from_skel_state`: Standard LBS for points without orientation
-        :func:`global_skel_state_from_local_skel_state`: Forward kinematics for joint states
+        :func:`skin_points_from_skel_state`: Linear blend skinning
     """
+    if not th.jit.is_scripting():
+        return _call_impl(
+            _skin_points_from_skel_state_dual_quaternion,
+            _skin_points_from_skel_state_dual_quaternion_jit,
+            template,
+            global_skel_state,
+            binded_skel_state_inv,
+            skin_indices_flattened,
+            skin_weights_flattened,
+            vert_indices_flattened,
+        )
+
+    return _skin_points_from_skel_state_dual_quaternion_jit(
+        template,
+        global_skel_state,
+        binded_skel_state_inv,
+        skin_indices_flattened,
+        skin_weights_flattened,
+        vert_indices_flattened,
+    )
+
+
+def skin_points_from_skel_state_sparse(
+    template: th.Tensor,
+    global_skel_state: th.Tensor,
+    binded_skel_state_inv: th.Tensor,
+    weights_csr: th.Tensor,
+    weights_csr_t: th.Tensor,
+) -> th.Tensor:
+    """
+    Sparse-weight variant of :func:`skin_points_from_skel_state`.
+
+    Each joint's skinning transform T_j * T_bind_j^(-1) is converted to a 3x4 matrix,
+    the matrices are blended per vertex with one sparse-dense matmul against the
+    (V, J) CSR weight matrix, and the blended matrices are applied to the template.
+    This avoids the per-influence gather/scatter of the dense path and is usually
+    faster for large meshes and batches. The backward pass multiplies by the
+    precomputed CSR transpose.
+
+    Args:
+        template: Template vertex positions, shape (..., num_vertices, 3).
+        global_skel_state: Global joint transformations, shape (..., num_joints, 8).
+        binded_skel_state_inv: Inverse bind pose transformations, shape (num_joints, 8).
+        weights_csr: (num_vertices, num_joints) CSR skinning weights, see
+            :func:`pymomentum.backend.utils.calc_skinning_weights_csr`.
+        weights_csr_t: (num_joints, num_vertices) CSR transpose of ``weights_csr``.
+
+    Returns:
+        skinned_points: Deformed vertex positions, shape (..., num_vertices, 3).
+    """
+    assert template.shape[-1] == 3
+    batch_shape = global_skel_state.shape[:-2]
+    while binded_skel_state_inv.ndim < global_skel_state.ndim:
+        binded_skel_state_inv = binded_skel_state_inv.unsqueeze(0)
+    joint_state = skel_state.multiply(global_skel_state, binded_skel_state_inv)
+    joint_matrices = skel_state.to_matrix(joint_state)[..., :3, :4]
+    joint_matrices = joint_matrices.reshape((-1,) + tuple(joint_matrices.shape[-3:]))
+
+    while template.ndim < global_skel_state.ndim:
+        template = template.unsqueeze(0)
+    template = template.expand(batch_shape + template.shape[-2:]).reshape(
+        (-1,) + tuple(template.shape[-2:])
+    )
+
+    skinned = skinning_from_joint_matrices_sparse(
+        template, joint_matrices, weights_csr, weights_csr_t
+    )
+    return skinned.reshape(batch_shape + skinned.shape[-2:])
+
+
+def _skin_oriented_points_from_skel_state(
+    means: th.Tensor,
+    quaternions: th.Tensor,
+    global_skel_state: th.Tensor,
+    binded_skel_state_inv: th.Tensor,
+    skin_indices_flattened: th.Tensor,
+    skin_weights_flattened: th.Tensor,
+    vert_indices_flattened: th.Tensor,
+) -> tuple[th.Tensor, th.Tensor]:
     assert means.shape[-1] == 3
     assert quaternions.shape[-1] == 4
     while means.ndim < global_skel_state.ndim:
@@ -592,6 +1442,86 @@ def skin_oriented_points_from_skel_state(
     return skinned_means, skinned_quaternions
 
 
+_skin_oriented_points_from_skel_state_jit = th.jit.script(
+    _skin_oriented_points_from_skel_state
+)
+
+
+def skin_oriented_points_from_skel_state(
+    means: th.Tensor,
+    quaternions: th.Tensor,
+    global_skel_state: th.Tensor,
+    binded_skel_state_inv: th.Tensor,
+    skin_indices_flattened: th.Tensor,
+    skin_weights_flattened: th.Tensor,
+    vert_indices_flattened: th.Tensor,
+) -> tuple[th.Tensor, th.Tensor]:
+    """
+    Apply linear blend skinning to oriented points (Gaussian splatting) using skeleton states.
+
+    This function extends standard LBS to handle oriented points, which have both position
+    and orientation. Each oriented point is influenced by multiple joints, with both its
+    position and orientation blended according to skinning weights.
+
+    For orientations, rotation matrices are linearly interpolated (LERP) and then converted
+    back to quaternions. This is different from spherical linear interpolation (SLERP) but
+    provides smoother blending for skinning applications.
+
+    Args:
+        means: Point positions, shape (batch_size, num_points, 3).
+            Center positions of the oriented points (e.g., Gaussian means).
+        quaternions: Point orientations, shape (batch_size, num_points, 4).
+            Orientations as quaternions in [qx, qy, qz, qw] format.
+        global_skel_state: Global joint transformations, shape (batch_size, num_joints, 8).
+            Each joint contains [tx, ty, tz, qx, qy, qz, qw, s] parameters.
+        binded_skel_state_inv: Inverse bind pose transformations, shape (num_joints, 8).
+            Static transformations representing the joint configuration during binding.
+        skin_indices_flattened: Joint indices for skinning, shape (num_influences,).
+            Flattened list of joint indices that influence points.
+        skin_weights_flattened: Skinning weights, shape (num_influences,).
+            Corresponding weights for each joint influence (normalized per point).
+        vert_indices_flattened: Point indices for skinning, shape (num_influences,).
+            Flattened list of point indices corresponding to joint influences.
+
+    Returns:
+        skinned_means: Deformed point positions, shape (batch_size, num_points, 3).
+            Transformed positions according to current joint poses and skinning weights.
+        skinned_quaternions: Blended point orientations, shape (batch_size, num_points, 4).
+            Orientations blended using rotation matrix interpolation and converted back to quaternions.
+
+    Note:
+        This function is commonly used for Gaussian splatting applications where each
+        Gaussian has both a mean position and orientation that need to be skinned.
+        The rotation blending uses linear interpolation in matrix space for stability.
+
+    See Also:
+        :func:`skin_points_from_skel_state`: Standard LBS for points without orientation
+        :func:`global_skel_state_from_local_skel_state`: Forward kinematics for joint states
+    """
+    if not th.jit.is_scripting():
+        return _call_impl(
+            _skin_oriented_points_from_skel_state,
+            _skin_oriented_points_from_skel_state_jit,
+            means,
+            quaternions,
+            global_skel_state,
+            binded_skel_state_inv,
+            skin_indices_flattened,
+            skin_weights_flattened,
+            vert_indices_flattened,
+        )
+
+    return _skin_oriented_points_from_skel_state_jit(
+        means,
+        quaternions,
+        global_skel_state,
+        binded_skel_state_inv,
+        skin_indices_flattened,
+        skin_weights_flattened,
+        vert_indices_flattened,
+    )
+
+
 def unpose_from_momentum_global_joint_state(
     verts: th.Tensor,
     global_joint_state: th.Tensor,
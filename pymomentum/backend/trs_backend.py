@@ -381,6 +381,7 @@ class ForwardKinematicsFromLocalTransformationJIT(th.autograd.Function):
         local_state_r: th.Tensor,
         local_state_s: th.Tensor,
         prefix_mul_indices: List[th.Tensor],
+        use_double_precision: bool = True,
     ) -> Tuple[
         th.Tensor, th.Tensor, th.Tensor, List[Tuple[th.Tensor, th.Tensor, th.Tensor]]
     ]:
@@ -392,6 +393,7 @@ class ForwardKinematicsFromLocalTransformationJIT(th.autograd.Function):
             local_state_r: Local joint rotations, shape (batch_size, num_joints, 3, 3)
             local_state_s: Local joint scales, shape (batch_size, num_joints, 1)
             prefix_mul_indices: List of [child_index, parent_index] tensor pairs
+            use_double_precision: Whether to use float64 for numerical stability
 
         Returns:
             Tuple of (global_state_t, global_state_r, global_state_s, intermediate_results)
@@ -401,6 +403,7 @@ class ForwardKinematicsFromLocalTransformationJIT(th.autograd.Function):
             local_state_r,
             local_state_s,
             prefix_mul_indices,
+            use_double_precision=use_double_precision,
         )
 
     @staticmethod
@@ -412,7 +415,8 @@ class ForwardKinematicsFromLocalTransformationJIT(th.autograd.Function):
 
         Args:
             ctx: Context object for saving tensors and data
-            inputs: Tuple of (local_state_t, local_state_r, local_state_s, prefix_mul_indices)
+            inputs: Tuple of (local_state_t, local_state_r, local_state_s, prefix_mul_indices,
+                use_double_precision)
             outputs: Tuple of (joint_state_t, joint_state_r, joint_state_s, intermediate_results)
         """
         (
@@ -420,6 +424,7 @@ class ForwardKinematicsFromLocalTransformationJIT(th.autograd.Function):
             _,
             _,
             prefix_mul_indices,
+            use_double_precision,
         ) = inputs
         (
             joint_state_t,
@@ -435,6 +440,7 @@ class ForwardKinematicsFromLocalTransformationJIT(th.autograd.Function):
         )
         ctx.intermediate_results = intermediate_results
         ctx.prefix_mul_indices = prefix_mul_indices
+        ctx.use_double_precision = use_double_precision
 
     @staticmethod
     # pyre-ignore[14]
@@ -445,7 +451,7 @@ class ForwardKinematicsFromLocalTransformationJIT(th.autograd.Function):
         grad_joint_state_r: th.Tensor,
         grad_joint_state_s: th.Tensor,
         _0,
-    ) -> Tuple[th.Tensor, th.Tensor, th.Tensor, None]:
+    ) -> Tuple[th.Tensor, th.Tensor, th.Tensor, None, None]:
         (
             joint_state_t,
             joint_state_r,
@@ -468,8 +474,9 @@ class ForwardKinematicsFromLocalTransformationJIT(th.autograd.Function):
             grad_joint_state_s,
             prefix_mul_indices,
             intermediate_results,
+            use_double_precision=ctx.use_double_precision,
         )
-        return (grad_local_state_t, grad_local_state_r, grad_local_state_s, None)
+        return (grad_local_state_t, grad_local_state_r, grad_local_state_s, None, None)
 
 
 def global_trs_state_from_local_trs_state(
@@ -477,6 +484,7 @@ def global_trs_state_from_local_trs_state(
     local_state_r: th.Tensor,
     local_state_s: th.Tensor,
     prefix_mul_indices: List[th.Tensor],
+    use_double_precision: bool = True,
 ) -> Tuple[th.Tensor, th.Tensor, th.Tensor]:
     """
     Compute global TRS state from local joint transformations (user-facing wrapper).
@@ -489,6 +497,7 @@ def global_trs_state_from_local_trs_state(
         local_state_r: Local joint rotations, shape (batch_size, num_joints, 3, 3).
         local_state_s: Local joint scales, shape (batch_size, num_joints, 1).
         prefix_mul_indices: List of [child_index, parent_index] tensor pairs defining the kinematic hierarchy traversal order.
+        use_double_precision: If True (default), the forward and backward passes run in float64.
 
     Returns:
         global_state_t: Global joint translations, shape (batch_size, num_joints, 3).
@@ -515,6 +524,7 @@ def global_trs_state_from_local_trs_state(
             local_state_r,
             local_state_s,
             prefix_mul_indices,
+            use_double_precision=use_double_precision,
         )
     else:
         (
@@ -527,6 +537,7 @@ def global_trs_state_from_local_trs_state(
             local_state_r,
             local_state_s,
             prefix_mul_indices,
+            use_double_precision,
         )
     return (
         joint_state_t,
@@ -724,6 +735,144 @@ def multi_topology_skinning(
     return skinned.view(template.shape[0], template.shape[1], template.shape[2])
 
 
+class SparseSkinningBlend(th.autograd.Function):
+    """
+    Blend per-joint features into per-vertex features with a sparse weight matrix.
+
+    Computes ``weights @ joint_features`` where ``weights`` is the (V, J) CSR skinning
+    weight matrix. The backward pass multiplies by the precomputed (J, V) transpose,
+    so neither direction materializes a per-influence tensor.
+    """
+
+    @staticmethod
+    # pyre-ignore[14]
+    def forward(
+        weights_csr: th.Tensor,
+        weights_csr_t: th.Tensor,
+        joint_features: th.Tensor,
+    ) -> th.Tensor:
+        """
+        Args:
+            weights_csr: (V, J) sparse CSR skinning weights.
+            weights_csr_t: (J, V) sparse CSR transpose of ``weights_csr``.
+            joint_features: (J, F) dense per-joint features.
+
+        Returns:
+            (V, F) dense per-vertex features.
+        """
+        if weights_csr.dtype != joint_features.dtype:
+            weights_csr = weights_csr.to(joint_features.dtype)
+        return th.sparse.mm(weights_csr, joint_features)
+
+    @staticmethod
+    # pyre-ignore[14]
+    # pyre-ignore[2]
+    def setup_context(ctx, inputs, outputs) -> None:
+        _, weights_csr_t, _ = inputs
+        ctx.weights_csr_t = weights_csr_t
+
+    @staticmethod
+    # pyre-ignore[14]
+    def backward(
+        # pyre-ignore[2]
+        ctx,
+        grad_vertex_features: th.Tensor,
+    ) -> Tuple[None, None, th.Tensor]:
+        weights_csr_t = ctx.weights_csr_t
+        if weights_csr_t.dtype != grad_vertex_features.dtype:
+            weights_csr_t = weights_csr_t.to(grad_vertex_features.dtype)
+        return None, None, th.sparse.mm(weights_csr_t, grad_vertex_features)
+
+
+def skinning_from_joint_matrices_sparse(
+    template: th.Tensor,
+    joint_matrices: th.Tensor,
+    weights_csr: th.Tensor,
+    weights_csr_t: th.Tensor,
+) -> th.Tensor:
+    r"""
+    LBS skinning with a sparse weight matrix over flattened 3x4 joint matrices.
+
+    Instead of gathering a transform per (vertex, influence) pair, the skinning
+    matrices are blended per vertex first with a single sparse-dense matmul,
+    M_i = \sum_j w_ij [A_j | b_j], and then applied to the template,
+    y_i = M_i[:, :3] x_i + M_i[:, 3].
+    The largest intermediate is (B, V, 12) rather than (B, N, 3, 3) with N the
+    number of influences.
+
+    Args:
+        template: (B, V, 3) or (V, 3) LBS template
+        joint_matrices: (B, J, 3, 4) skinning matrices, i.e. the joint transforms
+            already composed with the inverse bind pose.
+        weights_csr: (V, J) CSR skinning weights, see
+            :func:`pymomentum.backend.utils.calc_skinning_weights_csr`.
+        weights_csr_t: (J, V) CSR transpose of ``weights_csr``.
+
+    Returns:
+        skinned: (B, V, 3) Skinned mesh
+    """
+    batch_size, nr_joints = joint_matrices.shape[0], joint_matrices.shape[1]
+    if template.ndim == 2 or template.shape[0] != batch_size:
+        template = template.reshape(-1, template.shape[-2], 3).expand(
+            batch_size, -1, -1
+        )
+
+    # (B, J, 3, 4) -> (J, B * 12) so the whole batch is blended in one matmul.
+    joint_features = joint_matrices.reshape(batch_size, nr_joints, 12)
+    joint_features = joint_features.permute(1, 0, 2).reshape(nr_joints, -1)
+    vertex_matrices = SparseSkinningBlend.apply(
+        weights_csr, weights_csr_t, joint_features
+    )
+    vertex_matrices = vertex_matrices.reshape(-1, batch_size, 3, 4).permute(1, 0, 2, 3)
+
+    return (vertex_matrices[..., :3] * template[:, :, None, :]).sum(
+        dim=-1
+    ) + vertex_matrices[..., 3]
+
+
+def skinning_sparse(
+    template: th.Tensor,
+    t: th.Tensor,
+    r: th.Tensor,
+    s: th.Tensor,
+    t0: th.Tensor,
+    r0: th.Tensor,
+    weights_csr: th.Tensor,
+    weights_csr_t: th.Tensor,
+) -> th.Tensor:
+    r"""
+    Sparse-weight variant of :func:`skinning`.
+
+    Computes the same
+    y_i = \sum_j w_ij (s_j * r_j * (r0_j * x_i + t0_j) + t_j)
+    but blends the per-joint 3x4 matrices with a sparse-dense matmul instead of
+    gathering per-influence rotations, see :func:`skinning_from_joint_matrices_sparse`.
+
+    Args:
+        template: (B, V, 3) LBS template
+        t: (B, J, 3) Translation of the joints
+        r: (B, J, 3, 3) Rotation of the joints
+        s: (B, J, 1) Scale of the joints
+        t0: (J, 3) Translation of inverse bind pose
+        r0: (J, 3, 3) Rotation of inverse bind pose
+        weights_csr: (V, J) CSR skinning weights, see
+            :func:`pymomentum.backend.utils.calc_skinning_weights_csr`.
+        weights_csr_t: (J, V) CSR transpose of ``weights_csr``.
+
+    Returns:
+        skinned: (B, V, 3) Skinned mesh
+    """
+    sr = s[:, :, :, None] * r
+    A = trs.rotmat_multiply(sr, r0[None])
+    b = trs.rotmat_rotate_vector(sr, t0[None]) + t
+    return skinning_from_joint_matrices_sparse(
+        template,
+        th.cat([A, b[..., None]], dim=-1),
+        weights_csr,
+        weights_csr_t,
+    )
+
+
 def unpose_from_global_joint_state(
     verts: th.Tensor,
     t: th.Tensor,
@@ -14,6 +14,8 @@ within pymomentum for the backend porting effort.
 
 # pyre-strict
 
+import copy
+import functools
 from typing import List, Tuple
 
 import numpy as np
@@ -23,6 +25,70 @@ import pymomentum.geometry as pym_geometry
 import torch
 
 
+def _calc_fk_prefix_multiplication_schedule(
+    joint_parents: np.ndarray,
+) -> Tuple[np.ndarray, ...]:
+    """
+    Vectorized construction of the prefix multiplication schedule.
+
+    Joint depths and a binary-lifting ancestor table are computed by pointer
+    jumping, which needs O(log(depth)) vectorized passes over the joints instead of
+    walking every kinematic chain in Python.
+
+    :parameter joint_parents: (J,) int64 array of parent indices, -1 for roots.
+    :return: Tuple with one (2, n) int64 array of [source, target] indices per level.
+    """
+    nr_joints = len(joint_parents)
+    if nr_joints == 0:
+        return ()
+    has_parent = joint_parents >= 0
+    if np.any(joint_parents >= nr_joints):
+        raise ValueError("Joint parent index out of range.")
+
+    # ancestors[k][j] is the 2^k-th ancestor of joint j (or -1), and depth[j] is
+    # the number of ancestors of j; both are built by pointer jumping.
+    depth = has_parent.astype(np.int64)
+    jump = joint_parents.astype(np.int64)
+    ancestors = [jump]
+    while True:
+        valid = jump >= 0
+        if not valid.any():
+            break
+        safe_jump = np.where(valid, jump, 0)
+        depth = depth + np.where(valid, depth[safe_jump], 0)
+        jump = np.where(valid, jump[safe_jump], -1)
+        ancestors.append(jump)
+        if len(ancestors) > nr_joints.bit_length() + 1:
+            raise ValueError("Joint parents contain a cycle.")
+
+    all_joints = np.arange(nr_joints, dtype=np.int64)
+    schedule = []
+    max_depth = int(depth.max())
+    for level in range(max_depth.bit_length()):
+        source = all_joints[((depth >> level) & 1).astype(bool)]
+        # Target is the ancestor at depth ((d >> level) << level) - 1, i.e. the last
+        # element of the previous block in the joint's kinematic chain.
+        steps = depth[source] - (((depth[source] >> level) << level) - 1)
+        target = source.copy()
+        for k, ancestor in enumerate(ancestors):
+            take = ((steps >> k) & 1).astype(bool)
+            target[take] = ancestor[target[take]]
+        schedule.append(np.stack([source, target]))
+    return tuple(schedule)
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_fk_prefix_multiplication_schedule(
+    joint_parents_bytes: bytes,
+) -> Tuple[np.ndarray, ...]:
+    schedule = _calc_fk_prefix_multiplication_schedule(
+        np.frombuffer(joint_parents_bytes, dtype=np.int64)
+    )
+    for level in schedule:
+        level.flags.writeable = False
+    return schedule
+
+
 def calc_fk_prefix_multiplication_indices(
     joint_parents: torch.Tensor,
 ) -> List[torch.Tensor]:
@@ -33,6 +99,10 @@ def calc_fk_prefix_multiplication_indices(
     during forward kinematics computation. The algorithm builds kinematic chains
     for each joint and determines the multiplication order for parallel processing.
 
+    The schedule only depends on the skeleton topology, so it is cached per process
+    keyed on the contents of ``joint_parents``: characters sharing a topology build
+    it once. The returned tensors are fresh copies and may be modified freely.
+
     :parameter joint_parents: Parent joint index for each joint. For root joint, its parent is -1.
     :type joint_parents: torch.Tensor
     :return: List of prefix multiplication indices per level. For each level,
@@ -40,36 +110,11 @@ def calc_fk_prefix_multiplication_indices(
     :rtype: List[torch.Tensor]
     """
     device = joint_parents.device
-    nr_joints = len(joint_parents)
-    # get the kinematic chain per joint
-    kc_joints = []
-    for idx_joint in range(nr_joints):
-        kc = [idx_joint]
-        while joint_parents[idx_joint] >= 0:
-            idx_joint = int(joint_parents[idx_joint])
-            kc.append(idx_joint)
-        kc_joints.append(kc[::-1])
-
-    # get the multiplication target per joint per level
-    prefix_mul_indices = []
-    while True:
-        level = len(prefix_mul_indices)
-        source = []
-        target = []
-        for kc in kc_joints:
-            idx = len(kc) - 1
-            current_bit = (idx >> level) & 1
-            if current_bit:
-                source.append(kc[idx])
-                target.append(kc[((idx >> level) << level) - 1])
-        if source:
-            prefix_mul_indices.append(
-                torch.from_numpy(np.array([source, target])).long().to(device)
-            )
-        else:
-            break
-
-    return prefix_mul_indices
+    joint_parents_np = np.ascontiguousarray(
+        joint_parents.detach().cpu().numpy(), dtype=np.int64
+    )
+    schedule = _cached_fk_prefix_multiplication_schedule(joint_parents_np.tobytes())
+    return [torch.tensor(level, dtype=torch.long, device=device) for level in schedule]
 
 
 def flatten_skinning_weights_and_indices(
@@ -106,6 +151,44 @@ def flatten_skinning_weights_and_indices(
     return skin_indices_flattened, skin_weights_flattened, vert_indices_flattened
 
 
+def calc_skinning_weights_csr(
+    skin_indices_flattened: torch.Tensor,
+    skin_weights_flattened: torch.Tensor,
+    vert_indices_flattened: torch.Tensor,
+    nr_vertices: int,
+    nr_joints: int,
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Build sparse CSR skinning weight matrices from flattened skinning data.
+
+    The (V, J) matrix holds the weight of joint j on vertex v; it is what the sparse
+    skinning path multiplies against the per-joint transforms. Its (J, V) transpose
+    is returned as well so that the backward pass does not have to transpose a
+    sparse matrix on every call. Duplicate (vertex, joint) entries are summed.
+
+    :parameter skin_indices_flattened: (N,) joint indices, as returned by
+        :func:`flatten_skinning_weights_and_indices`.
+    :type skin_indices_flattened: torch.Tensor
+    :parameter skin_weights_flattened: (N,) skinning weights.
+    :type skin_weights_flattened: torch.Tensor
+    :parameter vert_indices_flattened: (N,) vertex indices.
+    :type vert_indices_flattened: torch.Tensor
+    :parameter nr_vertices: Number of vertices V.
+    :type nr_vertices: int
+    :parameter nr_joints: Number of joints J.
+    :type nr_joints: int
+    :return: Tuple of the (V, J) CSR weight matrix and its (J, V) CSR transpose.
+    :rtype: Tuple[torch.Tensor, torch.Tensor]
+    """
+    indices = torch.stack(
+        [vert_indices_flattened.long(), skin_indices_flattened.long()], dim=0
+    )
+    weights = torch.sparse_coo_tensor(
+        indices, skin_weights_flattened, (nr_vertices, nr_joints)
+    ).coalesce()
+    return weights.to_sparse_csr(), weights.t().coalesce().to_sparse_csr()
+
+
 class LBSAdapter:
     """Adapter class to make pymomentum Character compatible with LBS interface.
 
@@ -193,10 +276,25 @@ class LBSAdapter:
         :param device: Target device to move tensors to
         :return: New LBSAdapter instance on the target device
         """
+        device = torch.device(device)
         if device == self._device:
             return self
 
-        new_adapter = LBSAdapter(self.character, str(device))
+        # Move the existing tensors rather than re-extracting everything from the
+        # character. The bind pose tensors are always kept on the CPU.
+        new_adapter = copy.copy(self)
+        new_adapter._device = device
+        for name in (
+            "joint_parents",
+            "joint_offset",
+            "joint_rotation",
+            "param_transform",
+            "param_transform_offsets",
+            "mesh_vertices",
+            "skin_weights",
+            "skin_indices",
+        ):
+            setattr(new_adapter, name, getattr(self, name).to(device))
         return new_adapter
 
     def assemble_pose_and_scale_(
@@ -0,0 +1,212 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+# pyre-strict
+"""
+Benchmark a forward kinematics + skinning + loss training step of
+:class:`pymomentum.torch.character.Character` in eager mode, as a TorchScript
+trace, and under ``torch.compile``, and report the accuracy of the forward
+kinematics precision policies as a function of joint depth.
+
+Usage::
+
+    python pymomentum/benchmarks/benchmark_character.py --num-joints 100 --batch-size 32
+    python pymomentum/benchmarks/benchmark_character.py --precision-report
+"""
+
+import argparse
+import time
+from typing import Callable
+
+import pymomentum.geometry as pym_geometry
+import torch
+from pymomentum.backend import skel_state_backend
+from pymomentum.torch.character import Character
+
+
+def _steps_per_second(
+    step: Callable[[torch.Tensor], torch.Tensor],
+    model_parameters: torch.Tensor,
+    num_warmup: int,
+    num_steps: int,
+) -> float:
+    def run() -> None:
+        model_parameters.grad = None
+        step(model_parameters).backward()
+
+    for _ in range(num_warmup):
+        run()
+    start = time.perf_counter()
+    for _ in range(num_steps):
+        run()
+    return num_steps / (time.perf_counter() - start)
+
+
+def benchmark_character_step(
+    character: pym_geometry.Character,
+    batch_size: int,
+    *,
+    num_warmup: int = 3,
+    num_steps: int = 20,
+    use_sparse_weights: bool = False,
+) -> dict[str, float]:
+    """
+    Measure training steps per second of model parameters -> skeleton state ->
+    skinned vertices -> loss, including the backward pass.
+
+    :param character: The character to benchmark.
+    :param batch_size: Number of poses per step.
+    :param num_warmup: Untimed steps run first; these include tracing and
+        compilation.
+    :param num_steps: Number of timed steps.
+    :param use_sparse_weights: Use the sparse skinning path in eager mode and
+        TorchScript; ``torch.compile`` always uses the dense path.
+    :return: Steps per second for "eager", "torchscript" and "compile".
+    """
+    module = Character(character)
+    module.linear_blend_skinning.use_sparse_weights = use_sparse_weights
+    num_model_parameters = module.parameter_transform.parameter_transform.shape[1]
+
+    torch.manual_seed(0)
+    model_parameters = torch.randn(batch_size, num_model_parameters, requires_grad=True)
+    target = module.skin_points(
+        module.model_parameters_to_skeleton_state(torch.zeros_like(model_parameters))
+    ).detach()
+
+    def step(model_parameters: torch.Tensor) -> torch.Tensor:
+        skel_state = module.model_parameters_to_skeleton_state(model_parameters)
+        vertices = module.skin_points(skel_state)
+        return (vertices - target).square().sum()
+
+    traced = torch.jit.trace(step, (model_parameters,), check_trace=False)
+    compiled = torch.compile(step, fullgraph=True)
+
+    steps = [("eager", step), ("torchscript", traced), ("compile", compiled)]
+    return {
+        name: _steps_per_second(fn, model_parameters, num_warmup, num_steps)
+        for name, fn in steps
+    }
+
+
+def _joint_depths(joint_parents: list[int]) -> list[int]:
+    depths = []
+    for parent in joint_parents:
+        # Parents always precede their children.
+        depths.append(0 if parent < 0 else depths[parent] + 1)
+    return depths
+
+
+def fk_precision_report(
+    character: pym_geometry.Character,
+    batch_size: int = 256,
+    *,
+    root_translation_std: float = 1000.0,
+) -> list[dict[str, float | int | str]]:
+    """
+    Measure the forward kinematics error of each precision policy on float32 inputs
+    against a float64 reference, grouped by joint depth.
+
+    The float32 inputs are the float64 reference inputs rounded to float32, so the
+    "float32_input" row, which runs float64 forward kinematics on the rounded inputs,
+    shows how much of the error of the policies comes from the input rounding alone.
+
+    :param character: The character to evaluate.
+    :param batch_size: Number of random poses.
+    :param root_translation_std: Standard deviation of the root translation; the
+        float32 error grows with the distance from the origin.
+    :return: One row per (precision, depth) with the maximum and mean position error
+        and the maximum quaternion error over all joints at that depth.
+    """
+    torch.manual_seed(0)
+    num_joints = character.skeleton.size
+    joint_parameters = torch.normal(
+        0, 0.5, size=(batch_size, num_joints, 7), dtype=torch.float64
+    )
+    joint_parameters[..., 6] = 0
+    joint_parameters[:, 0, :3] = torch.normal(
+        0, root_translation_std, size=(batch_size, 3), dtype=torch.float64
+    )
+    joint_parameters_float32 = joint_parameters.float()
+
+    reference_character = Character(
+        character, dtype=torch.float64, fk_precision="float64"
+    )
+    reference = reference_character.joint_parameters_to_skeleton_state(joint_parameters)
+    skel_states = {
+        "float32_input": reference_character.joint_parameters_to_skeleton_state(
+            joint_parameters_float32.double()
+        )
+    }
+    for precision in skel_state_backend.FK_PRECISIONS:
+        skel_states[precision] = (
+            Character(character, fk_precision=precision)
+            .joint_parameters_to_skeleton_state(joint_parameters_float32)
+            .double()
+        )
+    depths = torch.tensor(_joint_depths(character.skeleton.joint_parents))
+
+    rows = []
+    for precision, skel_state in skel_states.items():
+        position_error = (skel_state[..., :3] - reference[..., :3]).norm(dim=-1)
+        rotation_error = (skel_state[..., 3:7] - reference[..., 3:7]).norm(dim=-1)
+        for depth in range(int(depths.max()) + 1):
+            joints = depths == depth
+            rows.append(
+                {
+                    "precision": precision,
+                    "depth": depth,
+                    "max_position_error": float(position_error[:, joints].max()),
+                    "mean_position_error": float(position_error[:, joints].mean()),
+                    "max_rotation_error": float(rotation_error[:, joints].max()),
+                }
+            )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-joints", type=int, default=100)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--num-steps", type=int, default=20)
+    parser.add_argument("--num-threads", type=int, default=None)
+    parser.add_argument("--sparse", action="store_true")
+    parser.add_argument(
+        "--precision-report",
+        action="store_true",
+        help="Report the FK error of each precision policy by joint depth instead.",
+    )
+    args = parser.parse_args()
+
+    if args.num_threads is not None:
+        torch.set_num_threads(args.num_threads)
+
+    if args.precision_report:
+        rows = fk_precision_report(
+            pym_geometry.create_test_character(num_joints=args.num_joints)
+        )
+        print(
+            f"{'precision':>20} {'depth':>5} "
+            f"{'max pos':>10} {'mean pos':>10} {'max rot':>10}"
+        )
+        for row in rows:
+            print(
+                f"{row['precision']:>20} {row['depth']:>5} "
+                f"{row['max_position_error']:10.3e} {row['mean_position_error']:10.3e} "
+                f"{row['max_rotation_error']:10.3e}"
+            )
+        return
+
+    results = benchmark_character_step(
+        pym_geometry.create_test_character(num_joints=args.num_joints),
+        args.batch_size,
+        num_steps=args.num_steps,
+        use_sparse_weights=args.sparse,
+    )
+    for name, steps_per_second in results.items():
+        print(f"{name:>12}: {steps_per_second:10.2f} steps/s")
+
+
+if __name__ == "__main__":
+    main()
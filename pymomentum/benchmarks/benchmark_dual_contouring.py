@@ -0,0 +1,153 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+# pyre-strict
+"""
+Benchmark :func:`pymomentum.axel.dual_contouring` on a sphere SDF at several
+grid resolutions, against re-meshing a small local edit with
+:class:`pymomentum.axel.IncrementalDualContouring`.
+
+Usage::
+
+    python pymomentum/benchmarks/benchmark_dual_contouring.py
+    python pymomentum/benchmarks/benchmark_dual_contouring.py --resolutions 128 --edit-radius 8
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pymomentum.axel as axel
+
+
+def sphere_sdf(resolution: int, radius: float = 1.0) -> axel.SignedDistanceField:
+    """
+    Create the SDF of a sphere centered in a cubic grid.
+
+    :param resolution: Number of voxels along each axis.
+    :param radius: Radius of the sphere; the grid spans [-1.5 radius, 1.5 radius].
+    :return: The signed distance field.
+    """
+    extent = 1.5 * radius
+    bounds = axel.BoundingBox(
+        np.full(3, -extent, dtype=np.float32), np.full(3, extent, dtype=np.float32)
+    )
+    sdf = axel.SignedDistanceField(bounds, np.array([resolution] * 3))
+    voxel_size = 2 * extent / resolution
+    axis = -extent + voxel_size * np.arange(resolution, dtype=np.float32)
+    # For a cubic grid the buffer is indexed as [k, j, i].
+    z, y, x = np.meshgrid(axis, axis, axis, indexing="ij")
+    np.asarray(sdf)[...] = np.sqrt(x**2 + y**2 + z**2) - radius
+    return sdf
+
+
+def add_bump(
+    sdf: axel.SignedDistanceField, center: np.ndarray, radius: float, margin: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Union a small sphere into the SDF, editing only the voxels around it.
+
+    :param sdf: Cubic signed distance field to edit in place.
+    :param center: World-space center of the bump.
+    :param radius: Radius of the bump.
+    :param margin: Number of voxels edited beyond the bump radius.
+    :return: The (min_voxel, max_voxel) box of the edited voxels.
+    """
+    resolution = int(sdf.resolution[0])
+    voxel_size = float(sdf.voxel_size[0])
+    center_voxel = np.round(sdf.world_to_grid(center.astype(np.float32))).astype(int)
+    half = int(np.ceil(radius / voxel_size)) + margin
+    min_voxel = np.clip(center_voxel - half, 0, resolution - 1)
+    max_voxel = np.clip(center_voxel + half, 0, resolution - 1)
+
+    axes = [
+        sdf.bounds.min[d] + voxel_size * np.arange(min_voxel[d], max_voxel[d] + 1)
+        for d in range(3)
+    ]
+    z, y, x = np.meshgrid(axes[2], axes[1], axes[0], indexing="ij")
+    bump = np.sqrt((x - center[0]) ** 2 + (y - center[1]) ** 2 + (z - center[2]) ** 2)
+    region = np.asarray(sdf)[
+        min_voxel[2] : max_voxel[2] + 1,
+        min_voxel[1] : max_voxel[1] + 1,
+        min_voxel[0] : max_voxel[0] + 1,
+    ]
+    np.minimum(region, bump - radius, out=region)
+    return min_voxel, max_voxel
+
+
+def benchmark_dual_contouring(
+    resolution: int, *, edit_radius: int = 4, num_repeats: int = 1
+) -> dict[str, float]:
+    """
+    Time a full extraction and an incremental update after a local edit.
+
+    :param resolution: Number of voxels along each axis.
+    :param edit_radius: Radius of the sculpted bump in voxels.
+    :param num_repeats: Number of timed runs per measurement; the fastest is kept.
+    :return: Times in milliseconds of the full extraction "full_ms", of building
+        the incremental extractor "incremental_init_ms" and of updating it after
+        the edit "update_ms", with the number of re-meshed blocks
+        "updated_blocks" out of "num_blocks" and the number of output quads
+        "num_quads".
+    """
+    sdf = sphere_sdf(resolution)
+
+    def best_time(func) -> float:
+        best = float("inf")
+        for _ in range(num_repeats):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        return 1000 * best
+
+    results = {}
+    results["full_ms"] = best_time(lambda: axel.dual_contouring(sdf))
+    results["incremental_init_ms"] = best_time(
+        lambda: axel.IncrementalDualContouring(sdf)
+    )
+
+    incremental = axel.IncrementalDualContouring(sdf)
+    voxel_size = float(sdf.voxel_size[0])
+    min_voxel, max_voxel = add_bump(
+        sdf, np.array([1.0, 0.0, 0.0]), edit_radius * voxel_size, margin=2
+    )
+    updated_blocks = 0
+
+    def update() -> None:
+        nonlocal updated_blocks
+        updated_blocks = incremental.update(sdf, min_voxel, max_voxel)
+
+    results["update_ms"] = best_time(update)
+    results["updated_blocks"] = updated_blocks
+    results["num_blocks"] = incremental.num_blocks
+    results["num_quads"] = len(incremental.mesh(sdf)[2])
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--resolutions", type=int, nargs="+", default=[128, 256])
+    parser.add_argument("--edit-radius", type=int, default=4)
+    parser.add_argument("--num-repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    print(
+        f"{'res':>5} {'quads':>9} {'full ms':>9} {'incremental init ms':>20} "
+        f"{'update ms':>10} {'blocks':>11} {'speedup':>8}"
+    )
+    for resolution in args.resolutions:
+        row = benchmark_dual_contouring(
+            resolution, edit_radius=args.edit_radius, num_repeats=args.num_repeats
+        )
+        blocks = f"{row['updated_blocks']}/{row['num_blocks']}"
+        print(
+            f"{resolution:>5} {row['num_quads']:>9} {row['full_ms']:9.1f} "
+            f"{row['incremental_init_ms']:20.1f} {row['update_ms']:10.1f} "
+            f"{blocks:>11} {row['full_ms'] / row['update_ms']:8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
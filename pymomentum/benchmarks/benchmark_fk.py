@@ -0,0 +1,311 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+# pyre-strict
+"""
+Benchmark skeleton-state forward kinematics: wall time and allocations per call of
+the reusable :class:`pymomentum.backend.skel_state_backend.SkelStateForwardKinematics`
+engine against :func:`pymomentum.backend.skel_state_backend.global_skel_state_from_local_skel_state_impl`,
+for several batch sizes.
+
+Allocations are the tensors created by the aten ops of a call, including the
+returned tensor; views are not counted.
+
+With ``--backward-memory``, instead compare the memory kept for and used by the
+backward pass of :func:`pymomentum.backend.skel_state_backend.global_skel_state_from_local_skel_state`
+with and without recomputation checkpoints.
+
+Usage::
+
+    python pymomentum/benchmarks/benchmark_fk.py --num-joints 100
+    python pymomentum/benchmarks/benchmark_fk.py --batch-sizes 1 64 4096 --device cuda
+    python pymomentum/benchmarks/benchmark_fk.py --backward-memory --batch-sizes 1024
+"""
+
+import argparse
+import time
+import weakref
+from typing import Callable
+
+import pymomentum.geometry as pym_geometry
+import pymomentum.quaternion as pym_quaternion
+import torch
+from pymomentum.backend import skel_state_backend, utils as backend_utils
+from torch.utils._python_dispatch import TorchDispatchMode
+from torch.utils._pytree import tree_flatten
+
+
+def random_local_skel_state(
+    batch_size: int, num_joints: int, device: torch.device
+) -> torch.Tensor:
+    t = torch.normal(0, 2, size=(batch_size, num_joints, 3))
+    q = pym_quaternion.normalize(torch.normal(0, 1, size=(batch_size, num_joints, 4)))
+    s = torch.rand(size=(batch_size, num_joints, 1)) + 0.5
+    return torch.cat([t, q, s], dim=-1).to(device)
+
+
+def _synchronize(device: torch.device) -> None:
+    if device.type == "cuda":
+        torch.cuda.synchronize(device)
+
+
+def milliseconds_per_call(
+    fn: Callable[[], object],
+    device: torch.device,
+    num_warmup: int,
+    num_calls: int,
+) -> float:
+    for _ in range(num_warmup):
+        fn()
+    _synchronize(device)
+    start = time.perf_counter()
+    for _ in range(num_calls):
+        fn()
+    _synchronize(device)
+    return 1000 * (time.perf_counter() - start) / num_calls
+
+
+class _AllocationCounter(TorchDispatchMode):
+    """
+    Counts the tensors with new storage returned by the aten ops, and tracks how many
+    of their bytes are alive.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.count: int = 0
+        self.num_bytes: int = 0
+        self.live_bytes: int = 0
+        self.peak_live_bytes: int = 0
+
+    def _free(self, num_bytes: int) -> None:
+        self.live_bytes -= num_bytes
+
+    def __torch_dispatch__(self, func, types, args=(), kwargs=None):  # pyre-ignore
+        kwargs = kwargs or {}
+        storages = {
+            t.untyped_storage().data_ptr()
+            for t in tree_flatten((args, kwargs))[0]
+            if isinstance(t, torch.Tensor)
+        }
+        result = func(*args, **kwargs)
+        for t in tree_flatten(result)[0]:
+            if not isinstance(t, torch.Tensor):
+                continue
+            storage = t.untyped_storage()
+            if storage.data_ptr() not in storages:
+                storages.add(storage.data_ptr())
+                self.count += 1
+                self.num_bytes += storage.nbytes()
+                self.live_bytes += storage.nbytes()
+                self.peak_live_bytes = max(self.peak_live_bytes, self.live_bytes)
+                weakref.finalize(storage, self._free, storage.nbytes())
+        return result
+
+
+def allocations_per_call(
+    fn: Callable[[], object], num_calls: int
+) -> tuple[float, float]:
+    """
+    :return: The number of tensors allocated by aten ops and their total size in
+        bytes, per call.
+    """
+    fn()
+    with _AllocationCounter() as counter:
+        for _ in range(num_calls):
+            fn()
+    return counter.count / num_calls, counter.num_bytes / num_calls
+
+
+def benchmark_fk_engine(
+    joint_parents: list[int],
+    batch_sizes: list[int],
+    *,
+    device: torch.device,
+    num_warmup: int = 3,
+    num_calls: int = 50,
+) -> list[dict[str, float | int | str]]:
+    """
+    Measure the no-grad forward kinematics of the engine and of the functional
+    implementation.
+
+    :param joint_parents: The parent of each joint, -1 for the roots.
+    :param batch_sizes: The batch sizes to measure.
+    :param device: The device to run on.
+    :param num_warmup: Untimed calls run first; these allocate the engine buffers.
+    :param num_calls: Number of timed and profiled calls.
+    :return: One row per (method, batch size) with the milliseconds, allocations and
+        allocated bytes per call.
+    """
+    prefix_mul_indices = [
+        idx.to(device)
+        for idx in backend_utils.calc_fk_prefix_multiplication_indices(
+            torch.tensor(joint_parents)
+        )
+    ]
+    engine = skel_state_backend.SkelStateForwardKinematics(prefix_mul_indices)
+
+    rows = []
+    for batch_size in batch_sizes:
+        torch.manual_seed(0)
+        local_skel_state = random_local_skel_state(
+            batch_size, len(joint_parents), device
+        )
+
+        def impl() -> torch.Tensor:
+            with torch.no_grad():
+                return skel_state_backend.global_skel_state_from_local_skel_state_impl(
+                    local_skel_state,
+                    prefix_mul_indices,
+                    save_intermediate_results=False,
+                )[0]
+
+        def run_engine() -> torch.Tensor:
+            return engine(local_skel_state)
+
+        for method, fn in [("impl", impl), ("engine", run_engine)]:
+            milliseconds = milliseconds_per_call(fn, device, num_warmup, num_calls)
+            allocations, num_bytes = allocations_per_call(fn, num_calls)
+            rows.append(
+                {
+                    "method": method,
+                    "batch_size": batch_size,
+                    "ms_per_call": milliseconds,
+                    "allocations_per_call": allocations,
+                    "bytes_per_call": num_bytes,
+                }
+            )
+        engine.release()
+    return rows
+
+
+def fk_backward_memory(
+    joint_parents: list[int],
+    batch_size: int,
+    checkpoint_every_values: list[int | None],
+    *,
+    device: torch.device,
+    num_calls: int = 10,
+) -> list[dict[str, float | int | str]]:
+    """
+    Compare the memory of the forward kinematics backward pass with and without
+    recomputation checkpoints.
+
+    :param joint_parents: The parent of each joint, -1 for the roots.
+    :param batch_size: The batch size.
+    :param checkpoint_every_values: The values of ``checkpoint_every`` to measure;
+        None is the default path that saves every level.
+    :param device: The device to run on.
+    :param num_calls: Number of timed forward and backward passes.
+    :return: One row per ``checkpoint_every`` value with the bytes kept alive for the
+        backward pass (including the output), the peak bytes allocated during the
+        forward and backward passes, and the milliseconds per forward and backward
+        pass.
+    """
+    prefix_mul_indices = [
+        idx.to(device)
+        for idx in backend_utils.calc_fk_prefix_multiplication_indices(
+            torch.tensor(joint_parents)
+        )
+    ]
+    torch.manual_seed(0)
+    local_skel_state = random_local_skel_state(
+        batch_size, len(joint_parents), device
+    ).requires_grad_()
+    grad_output = torch.randn_like(local_skel_state)
+
+    rows = []
+    for checkpoint_every in checkpoint_every_values:
+
+        def forward() -> torch.Tensor:
+            return skel_state_backend.global_skel_state_from_local_skel_state(
+                local_skel_state, prefix_mul_indices, checkpoint_every=checkpoint_every
+            )
+
+        def step() -> None:
+            local_skel_state.grad = None
+            forward().backward(grad_output)
+
+        milliseconds = milliseconds_per_call(step, device, 2, num_calls)
+
+        local_skel_state.grad = None
+        with _AllocationCounter() as counter:
+            global_skel_state = forward()
+            saved_bytes = counter.live_bytes
+            global_skel_state.backward(grad_output)
+            del global_skel_state
+        rows.append(
+            {
+                "checkpoint_every": str(checkpoint_every),
+                "saved_bytes": saved_bytes,
+                "peak_bytes": counter.peak_live_bytes,
+                "ms_per_step": milliseconds,
+            }
+        )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-joints", type=int, default=100)
+    parser.add_argument(
+        "--batch-sizes", type=int, nargs="+", default=[1, 16, 256, 4096]
+    )
+    parser.add_argument("--num-calls", type=int, default=50)
+    parser.add_argument("--num-threads", type=int, default=None)
+    parser.add_argument("--device", type=str, default="cpu")
+    parser.add_argument(
+        "--backward-memory",
+        action="store_true",
+        help="Compare the memory of the checkpointed and default backward passes "
+        "at the largest batch size instead.",
+    )
+    args = parser.parse_args()
+
+    if args.num_threads is not None:
+        torch.set_num_threads(args.num_threads)
+
+    character = pym_geometry.create_test_character(num_joints=args.num_joints)
+    device = torch.device(args.device)
+
+    if args.backward_memory:
+        num_levels = len(
+            backend_utils.calc_fk_prefix_multiplication_indices(
+                torch.tensor(character.skeleton.joint_parents)
+            )
+        )
+        rows = fk_backward_memory(
+            character.skeleton.joint_parents,
+            max(args.batch_sizes),
+            [None, 1, 2, 4, num_levels],
+            device=device,
+            num_calls=args.num_calls,
+        )
+        print(f"{'checkpoint':>10} {'saved MB':>10} {'peak MB':>10} {'ms/step':>10}")
+        for row in rows:
+            print(
+                f"{row['checkpoint_every']:>10} {row['saved_bytes'] / 2**20:10.3f} "
+                f"{row['peak_bytes'] / 2**20:10.3f} {row['ms_per_step']:10.3f}"
+            )
+        return
+
+    rows = benchmark_fk_engine(
+        character.skeleton.joint_parents,
+        args.batch_sizes,
+        device=device,
+        num_calls=args.num_calls,
+    )
+    print(
+        f"{'method':>8} {'batch':>6} {'ms/call':>10} {'allocs/call':>12} {'MB/call':>10}"
+    )
+    for row in rows:
+        print(
+            f"{row['method']:>8} {row['batch_size']:>6} {row['ms_per_call']:10.3f} "
+            f"{row['allocations_per_call']:12.1f} {row['bytes_per_call'] / 2**20:10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
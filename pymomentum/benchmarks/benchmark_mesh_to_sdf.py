@@ -0,0 +1,284 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+# pyre-strict
+"""
+Benchmark the propagation modes of :func:`pymomentum.axel.mesh_to_sdf` on the
+test meshes at several grid resolutions, and report how far the two modes
+disagree relative to the voxel size. With ``--sparse``, compare the dense SDF
+against the narrow-band :class:`pymomentum.axel.SparseSignedDistanceField`
+instead: conversion time, memory and query speed.
+
+Usage::
+
+    python pymomentum/benchmarks/benchmark_mesh_to_sdf.py
+    python pymomentum/benchmarks/benchmark_mesh_to_sdf.py --resolutions 64 128 --num-repeats 3
+    python pymomentum/benchmarks/benchmark_mesh_to_sdf.py --sign-mode ScanlineParity
+    python pymomentum/benchmarks/benchmark_mesh_to_sdf.py --sparse
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pymomentum.axel as axel
+import pymomentum.geometry as pym_geometry
+
+PROPAGATION_MODES: dict[str, axel.PropagationMode] = {
+    "fast_marching": axel.PropagationMode.FastMarching,
+    "distance_transform": axel.PropagationMode.DistanceTransform,
+}
+
+
+def benchmark_meshes() -> dict[str, tuple[np.ndarray, np.ndarray]]:
+    """
+    The meshes used by the SDF benchmarks: a tetrahedron, a cube and the mesh of the
+    test character.
+
+    :return: (vertices, triangles) of each mesh, keyed by name.
+    """
+    tetrahedron = (
+        np.array(
+            [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.5, 1.0, 0.0], [0.5, 0.5, 1.0]],
+            dtype=np.float32,
+        ),
+        np.array([[0, 1, 2], [0, 2, 3], [0, 3, 1], [1, 3, 2]], dtype=np.int32),
+    )
+
+    cube = (
+        np.array(
+            [
+                [x, y, z]
+                for x in (-1.0, 1.0)
+                for y in (-1.0, 1.0)
+                for z in (-1.0, 1.0)
+            ],
+            dtype=np.float32,
+        ),
+        np.array(
+            [
+                [0, 2, 1], [1, 2, 3],  # x = -1
+                [4, 5, 6], [5, 7, 6],  # x = +1
+                [0, 1, 4], [1, 5, 4],  # y = -1
+                [2, 6, 3], [3, 6, 7],  # y = +1
+                [0, 4, 2], [2, 4, 6],  # z = -1
+                [1, 3, 5], [3, 7, 5],  # z = +1
+            ],
+            dtype=np.int32,
+        ),
+    )  # fmt: skip
+
+    character = pym_geometry.create_test_character()
+    character_mesh = (
+        np.asarray(character.mesh.vertices, dtype=np.float32),
+        np.asarray(character.mesh.faces, dtype=np.int32),
+    )
+
+    return {"tetrahedron": tetrahedron, "cube": cube, "character": character_mesh}
+
+
+def benchmark_mesh_to_sdf(
+    vertices: np.ndarray,
+    triangles: np.ndarray,
+    resolution: int,
+    *,
+    padding: float = 0.1,
+    num_repeats: int = 1,
+    sign_mode: axel.SignMode = axel.SignMode.RayCasting,
+) -> dict[str, float]:
+    """
+    Time :func:`axel.mesh_to_sdf` with each propagation mode on a cubic grid.
+
+    :param vertices: Vertex positions of shape (num_vertices, 3).
+    :param triangles: Triangle indices of shape (num_triangles, 3).
+    :param resolution: Number of voxels along each axis.
+    :param padding: Relative padding of the grid around the mesh bounds.
+    :param num_repeats: Number of timed conversions per mode; the fastest is kept.
+    :param sign_mode: Sign determination method used with both propagation modes.
+    :return: The time in milliseconds of each mode, keyed by the names in
+        ``PROPAGATION_MODES``, and the maximum absolute difference between the
+        two SDFs at random points in voxels as "max_diff_voxels".
+    """
+    grid_resolution = np.array([resolution] * 3, dtype=np.int64)
+
+    results = {}
+    sdfs = {}
+    for name, mode in PROPAGATION_MODES.items():
+        config = axel.MeshToSdfConfig()
+        config.propagation_mode = mode
+        config.sign_mode = sign_mode
+        best = float("inf")
+        for _ in range(num_repeats):
+            start = time.perf_counter()
+            sdfs[name] = axel.mesh_to_sdf(
+                vertices, triangles, grid_resolution, padding=padding, config=config
+            )
+            best = min(best, time.perf_counter() - start)
+        results[name] = 1000 * best
+
+    # Compare the two SDFs at random points spread over the mesh bounds.
+    rng = np.random.default_rng(0)
+    lo = vertices.min(axis=0)
+    hi = vertices.max(axis=0)
+    points = (lo + (hi - lo) * rng.uniform(0.0, 1.0, size=(10000, 3))).astype(
+        np.float32
+    )
+    fast_marching, distance_transform = (sdfs[name] for name in PROPAGATION_MODES)
+    voxel_size = float(np.max(fast_marching.voxel_size))
+    results["max_diff_voxels"] = (
+        float(
+            np.abs(
+                fast_marching.sample(points) - distance_transform.sample(points)
+            ).max()
+        )
+        / voxel_size
+    )
+    return results
+
+
+def benchmark_sparse_sdf(
+    vertices: np.ndarray,
+    triangles: np.ndarray,
+    resolution: int,
+    *,
+    padding: float = 0.1,
+    num_repeats: int = 1,
+    num_queries: int = 100000,
+) -> dict[str, float]:
+    """
+    Compare :func:`axel.mesh_to_sdf` with :func:`axel.mesh_to_sparse_sdf` on a
+    cubic grid. Both use scanline parity signs; the dense SDF uses the distance
+    transform.
+
+    :param vertices: Vertex positions of shape (num_vertices, 3).
+    :param triangles: Triangle indices of shape (num_triangles, 3).
+    :param resolution: Number of voxels along each axis.
+    :param padding: Relative padding of the grid around the mesh bounds.
+    :param num_repeats: Number of timed runs per measurement; the fastest is kept.
+    :param num_queries: Number of random points sampled for the query timings.
+    :return: Conversion times "dense_ms" and "sparse_ms", memory in megabytes
+        "dense_mb" and "sparse_mb", query times in nanoseconds per point
+        "dense_query_ns" and "sparse_query_ns", and the maximum absolute
+        difference between the two SDFs inside the band in voxels as
+        "max_diff_voxels".
+    """
+    grid_resolution = np.array([resolution] * 3, dtype=np.int64)
+    config = axel.MeshToSdfConfig()
+    config.propagation_mode = axel.PropagationMode.DistanceTransform
+    config.sign_mode = axel.SignMode.ScanlineParity
+
+    def best_time(func) -> float:
+        best = float("inf")
+        for _ in range(num_repeats):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    sdfs = {}
+    results = {}
+    for name, convert in (
+        ("dense", axel.mesh_to_sdf),
+        ("sparse", axel.mesh_to_sparse_sdf),
+    ):
+
+        def run(convert=convert, name=name) -> None:
+            sdfs[name] = convert(
+                vertices, triangles, grid_resolution, padding=padding, config=config
+            )
+
+        results[f"{name}_ms"] = 1000 * best_time(run)
+
+    dense, sparse = sdfs["dense"], sdfs["sparse"]
+    results["dense_mb"] = dense.total_voxels * 4 / 2**20
+    results["sparse_mb"] = sparse.memory_usage / 2**20
+
+    # Query points spread over the grid, so that most of them land in tiles.
+    rng = np.random.default_rng(0)
+    lo = np.asarray(dense.bounds.min, dtype=np.float32)
+    hi = np.asarray(dense.bounds.max, dtype=np.float32)
+    points = (lo + (hi - lo) * rng.uniform(0.0, 1.0, size=(num_queries, 3))).astype(
+        np.float32
+    )
+    for name, sdf in sdfs.items():
+        results[f"{name}_query_ns"] = (
+            1e9 * best_time(lambda sdf=sdf: sdf.sample(points)) / num_queries
+        )
+
+    expected = dense.sample(points)
+    near = np.abs(expected) < 0.5 * sparse.band_width
+    voxel_size = float(np.max(dense.voxel_size))
+    results["max_diff_voxels"] = (
+        float(np.abs(sparse.sample(points)[near] - expected[near]).max(initial=0.0))
+        / voxel_size
+    )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--resolutions", type=int, nargs="+", default=[64, 128, 256])
+    parser.add_argument("--num-repeats", type=int, default=1)
+    parser.add_argument("--padding", type=float, default=0.1)
+    parser.add_argument(
+        "--sign-mode",
+        choices=list(axel.SignMode.__members__),
+        default="RayCasting",
+        help="Sign determination method used with both propagation modes.",
+    )
+    parser.add_argument(
+        "--sparse",
+        action="store_true",
+        help="Compare dense and narrow-band sparse SDFs instead of propagation modes.",
+    )
+    args = parser.parse_args()
+
+    if args.sparse:
+        print(
+            f"{'mesh':>12} {'res':>5} {'dense ms':>9} {'sparse ms':>10} "
+            f"{'dense MB':>9} {'sparse MB':>10} {'dense ns/query':>15} "
+            f"{'sparse ns/query':>16} {'max diff (voxels)':>18}"
+        )
+        for mesh_name, (vertices, triangles) in benchmark_meshes().items():
+            for resolution in args.resolutions:
+                row = benchmark_sparse_sdf(
+                    vertices,
+                    triangles,
+                    resolution,
+                    padding=args.padding,
+                    num_repeats=args.num_repeats,
+                )
+                print(
+                    f"{mesh_name:>12} {resolution:>5} {row['dense_ms']:9.1f} "
+                    f"{row['sparse_ms']:10.1f} {row['dense_mb']:9.2f} "
+                    f"{row['sparse_mb']:10.2f} {row['dense_query_ns']:15.1f} "
+                    f"{row['sparse_query_ns']:16.1f} {row['max_diff_voxels']:18.3f}"
+                )
+        return
+
+    print(
+        f"{'mesh':>12} {'res':>5} {'fast marching ms':>17} "
+        f"{'distance transform ms':>22} {'speedup':>8} {'max diff (voxels)':>18}"
+    )
+    for mesh_name, (vertices, triangles) in benchmark_meshes().items():
+        for resolution in args.resolutions:
+            row = benchmark_mesh_to_sdf(
+                vertices,
+                triangles,
+                resolution,
+                padding=args.padding,
+                num_repeats=args.num_repeats,
+                sign_mode=axel.SignMode.__members__[args.sign_mode],
+            )
+            print(
+                f"{mesh_name:>12} {resolution:>5} {row['fast_marching']:17.1f} "
+                f"{row['distance_transform']:22.1f} "
+                f"{row['fast_marching'] / row['distance_transform']:8.1f} "
+                f"{row['max_diff_voxels']:18.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
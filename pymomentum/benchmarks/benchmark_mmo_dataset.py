@@ -0,0 +1,119 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+# pyre-strict
+"""
+Benchmark serving random windows of frames from many .mmo files with
+:class:`pymomentum.torch.motion_dataset.MmoWindowDataset`, against loading each
+window's whole file, in windows per second.
+
+The files are written to a temporary directory first, so they are usually in the
+page cache; the gap to whole-file loading grows when they are not.
+
+Usage::
+
+    python pymomentum/benchmarks/benchmark_mmo_dataset.py
+    python pymomentum/benchmarks/benchmark_mmo_dataset.py --num-files 1000 --num-frames 20000 --workers 4
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pymomentum.geometry as pym_geometry
+import torch
+from pymomentum.torch.motion_dataset import MmoWindowDataset
+
+
+def write_motions(
+    directory: str, num_files: int, num_frames: int, num_parameters: int
+) -> list[str]:
+    """
+    Write random motions to .mmo files.
+
+    :param directory: The directory to write the files to.
+    :param num_files: The number of files.
+    :param num_frames: The number of frames per file.
+    :param num_parameters: The number of parameters per frame.
+    :return: The paths of the files.
+    """
+    rng = np.random.default_rng(0)
+    parameter_names = [f"param_{i}" for i in range(num_parameters)]
+    joint_names = ["root"]
+    scale = np.zeros(7, dtype=np.float32)
+    paths = []
+    for i in range(num_files):
+        path = os.path.join(directory, f"motion_{i}.mmo")
+        poses = rng.standard_normal((num_frames, num_parameters), dtype=np.float32)
+        pym_geometry.save_mmo(path, poses, scale, parameter_names, joint_names)
+        paths.append(path)
+    return paths
+
+
+def bench_dataset(
+    dataset: MmoWindowDataset, num_windows: int, batch_size: int, workers: int
+) -> float:
+    """
+    :return: The windows per second served by a shuffling DataLoader.
+    """
+    sampler = torch.utils.data.RandomSampler(
+        dataset, replacement=True, num_samples=num_windows
+    )
+    loader = torch.utils.data.DataLoader(
+        dataset, batch_size=batch_size, sampler=sampler, num_workers=workers
+    )
+    start = time.perf_counter()
+    count = 0
+    for batch in loader:
+        count += batch.shape[0]
+    return count / (time.perf_counter() - start)
+
+
+def bench_whole_file(dataset: MmoWindowDataset, num_windows: int) -> float:
+    """
+    :return: The windows per second when each window loads its whole file.
+    """
+    rng = np.random.default_rng(1)
+    start = time.perf_counter()
+    for index in rng.integers(0, len(dataset), num_windows):
+        file_index, first_frame = dataset.locate(int(index))
+        poses = np.array(pym_geometry.MappedMmo(dataset.paths[file_index]).poses)
+        torch.from_numpy(poses[first_frame : first_frame + dataset.window_size].copy())
+    return num_windows / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-files", type=int, default=200)
+    parser.add_argument("--num-frames", type=int, default=10000)
+    parser.add_argument("--num-parameters", type=int, default=100)
+    parser.add_argument("--window-size", type=int, default=64)
+    parser.add_argument("--num-windows", type=int, default=20000)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--workers", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_motions(
+            directory, args.num_files, args.num_frames, args.num_parameters
+        )
+        start = time.perf_counter()
+        dataset = MmoWindowDataset(paths, args.window_size)
+        index_time = time.perf_counter() - start
+        print(
+            f"Indexed {len(paths)} files ({len(dataset)} windows) in {index_time:.3f} s"
+        )
+
+        mapped = bench_dataset(dataset, args.num_windows, args.batch_size, args.workers)
+        print(f"{'mapped windows':<24} {mapped:>12.0f} windows/s")
+        # Whole-file loading is much slower, so fewer windows are timed.
+        whole = bench_whole_file(dataset, max(args.num_windows // 100, 10))
+        print(f"{'whole-file loading':<24} {whole:>12.0f} windows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+# pyre-strict
+"""
+Benchmark the quaternion and skeleton state operations that support
+:mod:`pymomentum.fused_kernels`, with the plain PyTorch implementation against the
+fused kernels, for the forward pass alone and for the forward and backward passes.
+
+Usage::
+
+    python pymomentum/benchmarks/benchmark_quaternion.py
+    python pymomentum/benchmarks/benchmark_quaternion.py --sizes 1000 1000000 --ops multiply
+"""
+
+import argparse
+import time
+from typing import Callable
+
+import torch
+from pymomentum import fused_kernels, quaternion, skel_state
+
+Inputs = tuple[torch.Tensor, ...]
+
+
+def _random_quaternions(n: int, device: torch.device) -> torch.Tensor:
+    return quaternion.normalize(torch.randn(n, 4, device=device))
+
+
+def _random_skel_states(n: int, device: torch.device) -> torch.Tensor:
+    return torch.cat(
+        [
+            torch.randn(n, 3, device=device),
+            _random_quaternions(n, device),
+            torch.rand(n, 1, device=device) + 0.5,
+        ],
+        dim=-1,
+    )
+
+
+# For every benchmarked operation, the operation and a function creating n inputs.
+OPS: dict[
+    str, tuple[Callable[..., torch.Tensor], Callable[[int, torch.device], Inputs]]
+] = {
+    "multiply": (
+        quaternion.multiply,
+        lambda n, device: (
+            _random_quaternions(n, device),
+            _random_quaternions(n, device),
+        ),
+    ),
+    "rotate_vector": (
+        quaternion.rotate_vector,
+        lambda n, device: (
+            _random_quaternions(n, device),
+            torch.randn(n, 3, device=device),
+        ),
+    ),
+    "to_rotation_matrix": (
+        quaternion.to_rotation_matrix,
+        lambda n, device: (_random_quaternions(n, device),),
+    ),
+    "euler_xyz_to_quaternion": (
+        quaternion.euler_xyz_to_quaternion,
+        lambda n, device: (torch.randn(n, 3, device=device),),
+    ),
+    "skel_state_multiply": (
+        skel_state.multiply,
+        lambda n, device: (
+            _random_skel_states(n, device),
+            _random_skel_states(n, device),
+        ),
+    ),
+}
+
+
+def benchmark_op(
+    op: str,
+    n: int,
+    *,
+    fused: bool,
+    backward: bool,
+    device: torch.device,
+    num_repeats: int = 5,
+) -> float:
+    """
+    Time one operation on n elements.
+
+    :param op: Name of the operation in :data:`OPS`.
+    :param n: Number of elements (quaternions, vectors or skeleton states) per input.
+    :param fused: Whether to run the fused kernel instead of the plain implementation.
+    :param backward: Whether to also time the backward pass of the summed output.
+    :param device: Device to run on.
+    :param num_repeats: Number of timed runs after a warm-up run; the fastest is kept.
+    :return: The time of the fastest run in milliseconds.
+    """
+    fn, make_inputs = OPS[op]
+    inputs = tuple(x.requires_grad_(backward) for x in make_inputs(n, device))
+
+    def run() -> None:
+        result = fn(*inputs)
+        if backward:
+            result.sum().backward()
+        if device.type == "cuda":
+            torch.cuda.synchronize()
+
+    was_enabled = fused_kernels.is_enabled()
+    fused_kernels.set_enabled(fused)
+    try:
+        # The warm-up run also compiles the fused kernel.
+        run()
+        best = float("inf")
+        for _ in range(num_repeats):
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        fused_kernels.set_enabled(was_enabled)
+    return 1000 * best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ops", nargs="+", choices=list(OPS), default=list(OPS))
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10**3, 10**4, 10**5, 10**6, 10**7],
+    )
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--num-repeats", type=int, default=5)
+    args = parser.parse_args()
+    device = torch.device(args.device)
+
+    print(
+        f"{'op':>24} {'n':>9} {'pass':>8} {'plain ms':>10} {'fused ms':>10} "
+        f"{'speedup':>8}"
+    )
+    for op in args.ops:
+        for n in args.sizes:
+            for backward in (False, True):
+                times = [
+                    benchmark_op(
+                        op,
+                        n,
+                        fused=fused,
+                        backward=backward,
+                        device=device,
+                        num_repeats=args.num_repeats,
+                    )
+                    for fused in (False, True)
+                ]
+                print(
+                    f"{op:>24} {n:>9} {'fwd+bwd' if backward else 'fwd':>8} "
+                    f"{times[0]:10.3f} {times[1]:10.3f} {times[0] / times[1]:8.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+# pyre-strict
+"""
+Benchmark linear blend skinning with the dense per-influence paths against the
+sparse CSR paths, in milliseconds and peak megabytes per forward and per forward +
+backward pass, for several mesh and batch sizes:
+
+* skel_state: :func:`pymomentum.backend.skel_state_backend.skin_points_from_skel_state`
+  against :func:`pymomentum.backend.skel_state_backend.skin_points_from_skel_state_sparse`.
+* trs: :func:`pymomentum.backend.trs_backend.skinning` against
+  :func:`pymomentum.backend.trs_backend.skinning_sparse`, which blends with
+  :func:`pymomentum.backend.trs_backend.skinning_from_joint_matrices_sparse`.
+
+The skinning weights are random, with a fixed number of influences per vertex.
+
+The peak memory is the most memory allocated at once during a call, including the
+output, above what was allocated before it. On CUDA it comes from
+:func:`torch.cuda.max_memory_allocated`; on the CPU it is tracked from the tensors
+created by the aten ops of the call.
+
+Usage::
+
+    python pymomentum/benchmarks/benchmark_skinning.py
+    python pymomentum/benchmarks/benchmark_skinning.py --num-vertices 100000 --batch-sizes 1 256 --device cuda
+"""
+
+import argparse
+import time
+import weakref
+from typing import Callable
+
+import pymomentum.quaternion as pym_quaternion
+import pymomentum.trs as pym_trs
+import torch
+from pymomentum.backend import skel_state_backend, trs_backend, utils as backend_utils
+from torch.utils._python_dispatch import TorchDispatchMode
+from torch.utils._pytree import tree_flatten
+
+
+def random_skel_state(
+    batch_shape: tuple[int, ...], num_joints: int, device: torch.device
+) -> torch.Tensor:
+    t = torch.normal(0, 1, size=batch_shape + (num_joints, 3))
+    q = pym_quaternion.normalize(torch.normal(0, 1, size=batch_shape + (num_joints, 4)))
+    s = torch.rand(size=batch_shape + (num_joints, 1)) + 0.5
+    return torch.cat([t, q, s], dim=-1).to(device)
+
+
+def random_skinning(
+    num_vertices: int, num_joints: int, num_influences: int, device: torch.device
+) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+    """
+    :return: The flattened (skin indices, skin weights, vertex indices).
+    """
+    skin_indices = torch.randint(0, num_joints, (num_vertices, num_influences))
+    skin_weights = torch.rand(num_vertices, num_influences) + 0.1
+    skin_weights = skin_weights / skin_weights.sum(dim=-1, keepdim=True)
+    return tuple(
+        t.to(device)
+        for t in backend_utils.flatten_skinning_weights_and_indices(
+            skin_weights, skin_indices
+        )
+    )
+
+
+def _milliseconds_per_call(
+    fn: Callable[[], None], device: torch.device, num_warmup: int, num_calls: int
+) -> float:
+    for _ in range(num_warmup):
+        fn()
+    if device.type == "cuda":
+        torch.cuda.synchronize(device)
+    start = time.perf_counter()
+    for _ in range(num_calls):
+        fn()
+    if device.type == "cuda":
+        torch.cuda.synchronize(device)
+    return 1000 * (time.perf_counter() - start) / num_calls
+
+
+class _PeakMemoryTracker(TorchDispatchMode):
+    """
+    Tracks how many bytes of the tensors with new storage returned by the aten ops
+    are alive, and the most that were alive at once.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.live_bytes: int = 0
+        self.peak_live_bytes: int = 0
+
+    def _free(self, num_bytes: int) -> None:
+        self.live_bytes -= num_bytes
+
+    def __torch_dispatch__(self, func, types, args=(), kwargs=None):  # pyre-ignore
+        kwargs = kwargs or {}
+        # Sparse tensors have no storage of their own; the sparse CSR paths allocate
+        # their dense results through aten ops, which are tracked.
+        storages = {
+            t.untyped_storage().data_ptr()
+            for t in tree_flatten((args, kwargs))[0]
+            if isinstance(t, torch.Tensor) and t.layout == torch.strided
+        }
+        result = func(*args, **kwargs)
+        for t in tree_flatten(result)[0]:
+            if not isinstance(t, torch.Tensor) or t.layout != torch.strided:
+                continue
+            storage = t.untyped_storage()
+            if storage.data_ptr() not in storages:
+                storages.add(storage.data_ptr())
+                self.live_bytes += storage.nbytes()
+                self.peak_live_bytes = max(self.peak_live_bytes, self.live_bytes)
+                weakref.finalize(storage, self._free, storage.nbytes())
+        return result
+
+
+def _peak_megabytes_per_call(fn: Callable[[], None], device: torch.device) -> float:
+    if device.type == "cuda":
+        torch.cuda.synchronize(device)
+        torch.cuda.reset_peak_memory_stats(device)
+        start = torch.cuda.memory_allocated(device)
+        fn()
+        torch.cuda.synchronize(device)
+        return (torch.cuda.max_memory_allocated(device) - start) / 2**20
+
+    with _PeakMemoryTracker() as tracker:
+        fn()
+    return tracker.peak_live_bytes / 2**20
+
+
+def benchmark_skinning(
+    num_vertices: int,
+    num_joints: int,
+    batch_size: int,
+    *,
+    num_influences: int = 4,
+    device: torch.device,
+    num_warmup: int = 3,
+    num_calls: int = 10,
+) -> dict[str, float]:
+    """
+    Measure the dense and CSR skinning paths of the skel_state and TRS backends on
+    the same random rig.
+
+    :param num_vertices: Number of mesh vertices.
+    :param num_joints: Number of joints.
+    :param batch_size: Number of poses per call.
+    :param num_influences: Number of joints influencing each vertex.
+    :param device: The device to run on.
+    :param num_warmup: Untimed calls run first.
+    :param num_calls: Number of timed calls.
+    :return: For each "<backend>_<path>" of "skel_state_dense", "skel_state_csr",
+        "trs_dense" and "trs_csr", the milliseconds per call under that name and the
+        peak megabytes under "<name>_mb", and the same for the forward and backward
+        passes together under "<name>_backward" and "<name>_backward_mb". Also the
+        maximum difference between the dense and CSR paths of each backend under
+        "<backend>_max_difference".
+    """
+    torch.manual_seed(0)
+    skin_indices, skin_weights, vert_indices = random_skinning(
+        num_vertices, num_joints, num_influences, device
+    )
+    weights_csr, weights_csr_t = backend_utils.calc_skinning_weights_csr(
+        skin_indices, skin_weights, vert_indices, num_vertices, num_joints
+    )
+    template = torch.normal(0, 1, size=(num_vertices, 3)).to(device)
+    # The TRS backend assumes an inverse bind pose without scale.
+    bind_inv = random_skel_state((), num_joints, device)
+    bind_inv[..., 7] = 1
+    global_skel_state = random_skel_state((batch_size,), num_joints, device)
+    t0, r0, _ = pym_trs.from_skeleton_state(bind_inv)
+    t, r, s = (
+        x.detach().requires_grad_()
+        for x in pym_trs.from_skeleton_state(global_skel_state)
+    )
+    global_skel_state.requires_grad_()
+    grad_output = torch.randn(batch_size, num_vertices, 3, device=device)
+
+    def skel_state_dense() -> torch.Tensor:
+        return skel_state_backend.skin_points_from_skel_state(
+            template,
+            global_skel_state,
+            bind_inv[None],
+            skin_indices,
+            skin_weights,
+            vert_indices,
+        )
+
+    def skel_state_csr() -> torch.Tensor:
+        return skel_state_backend.skin_points_from_skel_state_sparse(
+            template, global_skel_state, bind_inv, weights_csr, weights_csr_t
+        )
+
+    def trs_dense() -> torch.Tensor:
+        return trs_backend.skinning(
+            template.expand(batch_size, -1, -1),
+            t,
+            r,
+            s,
+            t0,
+            r0,
+            skin_indices,
+            skin_weights,
+            vert_indices,
+        )
+
+    def trs_csr() -> torch.Tensor:
+        return trs_backend.skinning_sparse(
+            template.expand(batch_size, -1, -1),
+            t,
+            r,
+            s,
+            t0,
+            r0,
+            weights_csr,
+            weights_csr_t,
+        )
+
+    results = {}
+    for name, skin in [
+        ("skel_state_dense", skel_state_dense),
+        ("skel_state_csr", skel_state_csr),
+        ("trs_dense", trs_dense),
+        ("trs_csr", trs_csr),
+    ]:
+
+        def forward(skin: Callable[[], torch.Tensor] = skin) -> None:
+            with torch.no_grad():
+                skin()
+
+        def backward(skin: Callable[[], torch.Tensor] = skin) -> None:
+            for x in (global_skel_state, t, r, s):
+                x.grad = None
+            skin().backward(grad_output)
+
+        for suffix, fn in [("", forward), ("_backward", backward)]:
+            results[name + suffix] = _milliseconds_per_call(
+                fn, device, num_warmup, num_calls
+            )
+            results[f"{name}{suffix}_mb"] = _peak_megabytes_per_call(fn, device)
+
+    with torch.no_grad():
+        results["skel_state_max_difference"] = float(
+            (skel_state_dense() - skel_state_csr()).abs().max()
+        )
+        results["trs_max_difference"] = float((trs_dense() - trs_csr()).abs().max())
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--num-vertices", type=int, nargs="+", default=[20000, 50000, 100000]
+    )
+    parser.add_argument("--num-joints", type=int, default=100)
+    parser.add_argument("--num-influences", type=int, default=4)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 16, 64, 256])
+    parser.add_argument("--num-calls", type=int, default=10)
+    parser.add_argument("--num-threads", type=int, default=None)
+    parser.add_argument("--device", type=str, default="cpu")
+    args = parser.parse_args()
+
+    if args.num_threads is not None:
+        torch.set_num_threads(args.num_threads)
+
+    print(
+        f"{'backend':>10} {'vertices':>9} {'batch':>6} {'dense':>10} {'csr':>10} "
+        f"{'dense+bwd':>10} {'csr+bwd':>10} {'dense MB':>10} {'csr MB':>10} "
+        f"{'dense+bwd MB':>12} {'csr+bwd MB':>12} {'max diff':>10}"
+    )
+    for num_vertices in args.num_vertices:
+        for batch_size in args.batch_sizes:
+            r = benchmark_skinning(
+                num_vertices,
+                args.num_joints,
+                batch_size,
+                num_influences=args.num_influences,
+                device=torch.device(args.device),
+                num_calls=args.num_calls,
+            )
+            for backend in ["skel_state", "trs"]:
+                dense, csr = f"{backend}_dense", f"{backend}_csr"
+                print(
+                    f"{backend:>10} {num_vertices:>9} {batch_size:>6} "
+                    f"{r[dense]:10.3f} {r[csr]:10.3f} "
+                    f"{r[dense + '_backward']:10.3f} {r[csr + '_backward']:10.3f} "
+                    f"{r[dense + '_mb']:10.2f} {r[csr + '_mb']:10.2f} "
+                    f"{r[dense + '_backward_mb']:12.2f} {r[csr + '_backward_mb']:12.2f} "
+                    f"{r[backend + '_max_difference']:10.2e}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+# pyre-strict
+"""
+Benchmark rebuilding versus refitting a :class:`pymomentum.axel.TriBvh` over the
+skinned mesh of every frame of a motion sequence, including the cost of the
+closest-point queries made against each frame's tree.
+
+Usage::
+
+    python pymomentum/benchmarks/benchmark_tri_bvh.py --num-frames 1000
+    python pymomentum/benchmarks/benchmark_tri_bvh.py --character character.glb
+"""
+
+import argparse
+import math
+import time
+
+import numpy as np
+import pymomentum.axel as axel
+import pymomentum.geometry as pym_geometry
+import torch
+from pymomentum.torch.character import Character
+
+
+def skinned_sequence(
+    character: pym_geometry.Character,
+    num_frames: int,
+    *,
+    amplitude: float = 0.5,
+    chunk_size: int = 16,
+    seed: int = 0,
+) -> np.ndarray:
+    """
+    Skin the character's mesh over a smooth random motion.
+
+    :param character: The character to animate; must have a mesh and skin weights.
+    :param num_frames: Number of frames.
+    :param amplitude: Amplitude of the model parameter oscillations.
+    :param chunk_size: Number of frames skinned at once.
+    :param seed: Random seed for the motion.
+    :return: Float32 array of vertex positions of shape (num_frames, num_vertices, 3).
+    """
+    module = Character(character)
+    num_model_parameters = module.parameter_transform.parameter_transform.shape[1]
+
+    # A few low-frequency sinusoids per parameter, so consecutive frames deform
+    # the mesh gradually as in real motion.
+    generator = torch.Generator().manual_seed(seed)
+    frequencies = torch.rand(3, num_model_parameters, generator=generator) * 4
+    phases = torch.rand(3, num_model_parameters, generator=generator) * 2 * math.pi
+    t = torch.linspace(0, 1, num_frames)[:, None, None]
+    model_parameters = amplitude * torch.sin(
+        2 * math.pi * frequencies * t + phases
+    ).mean(dim=1)
+
+    # Skin in chunks to bound the memory used by the skinning intermediates.
+    with torch.no_grad():
+        vertices = torch.cat(
+            [
+                module.skin_points(module.model_parameters_to_skeleton_state(chunk))
+                for chunk in model_parameters.split(chunk_size)
+            ]
+        )
+    return vertices.numpy().astype(np.float32)
+
+
+def benchmark_tri_bvh_refit(
+    vertices: np.ndarray,
+    triangles: np.ndarray,
+    *,
+    num_queries: int = 1000,
+    rebuild_threshold: float = 1.5,
+    seed: int = 0,
+) -> dict[str, dict[str, float]]:
+    """
+    Track a mesh sequence with a :class:`TriBvh` by rebuilding it every frame, by
+    refitting it every frame, and by refitting with a rebuild threshold.
+
+    :param vertices: Vertex positions of shape (num_frames, num_vertices, 3).
+    :param triangles: Triangle indices of shape (num_triangles, 3).
+    :param num_queries: Number of closest-point queries per frame, sampled around
+        each frame's mesh.
+    :param rebuild_threshold: Rebuild threshold of the "refit_threshold" strategy;
+        see :meth:`TriBvh.refit`.
+    :param seed: Random seed for the query points.
+    :return: For each of "rebuild", "refit" and "refit_threshold", the average
+        update and query time per frame in milliseconds, the number of rebuilds,
+        and the final surface area cost relative to a fresh build.
+    """
+    vertices = np.ascontiguousarray(vertices, dtype=np.float32)
+    triangles = np.ascontiguousarray(triangles, dtype=np.int32)
+    num_frames = vertices.shape[0]
+
+    rng = np.random.default_rng(seed)
+    lo = vertices.min(axis=1, keepdims=True)
+    hi = vertices.max(axis=1, keepdims=True)
+    queries = (
+        lo + (hi - lo) * rng.uniform(-0.1, 1.1, size=(num_frames, num_queries, 3))
+    ).astype(np.float32)
+
+    results = {}
+    for name in ("rebuild", "refit", "refit_threshold"):
+        bvh = axel.TriBvh(vertices[0], triangles)
+        update_time = 0.0
+        query_time = 0.0
+        num_rebuilds = 0
+        for frame in range(num_frames):
+            start = time.perf_counter()
+            if frame > 0:
+                if name == "rebuild":
+                    bvh = axel.TriBvh(vertices[frame], triangles)
+                    num_rebuilds += 1
+                elif name == "refit":
+                    bvh.refit(vertices[frame])
+                else:
+                    num_rebuilds += bvh.refit(
+                        vertices[frame], rebuild_threshold=rebuild_threshold
+                    )
+            update_time += time.perf_counter() - start
+
+            start = time.perf_counter()
+            bvh.closest_surface_point(queries[frame])
+            query_time += time.perf_counter() - start
+
+        fresh_cost = axel.TriBvh(vertices[-1], triangles).surface_area_cost
+        results[name] = {
+            "update_ms": 1000 * update_time / num_frames,
+            "query_ms": 1000 * query_time / num_frames,
+            "rebuilds": num_rebuilds,
+            "relative_cost": bvh.surface_area_cost / fresh_cost,
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-frames", type=int, default=1000)
+    parser.add_argument("--num-joints", type=int, default=100)
+    parser.add_argument("--num-queries", type=int, default=1000)
+    parser.add_argument("--rebuild-threshold", type=float, default=1.5)
+    parser.add_argument(
+        "--character",
+        type=str,
+        default=None,
+        help="A .glb/.gltf character to skin instead of the test character.",
+    )
+    args = parser.parse_args()
+
+    if args.character is not None:
+        character = pym_geometry.Character.load_gltf(args.character)
+    else:
+        character = pym_geometry.create_test_character(num_joints=args.num_joints)
+
+    vertices = skinned_sequence(character, args.num_frames)
+    triangles = np.asarray(character.mesh.faces, dtype=np.int32)
+    print(
+        f"{args.num_frames} frames, {vertices.shape[1]} vertices, "
+        f"{triangles.shape[0]} triangles, {args.num_queries} queries/frame"
+    )
+
+    results = benchmark_tri_bvh_refit(
+        vertices,
+        triangles,
+        num_queries=args.num_queries,
+        rebuild_threshold=args.rebuild_threshold,
+    )
+    print(
+        f"{'strategy':>16} {'update ms':>10} {'query ms':>10} "
+        f"{'rebuilds':>9} {'cost':>6}"
+    )
+    for name, row in results.items():
+        print(
+            f"{name:>16} {row['update_ms']:10.3f} {row['query_ms']:10.3f} "
+            f"{int(row['rebuilds']):9d} {row['relative_cost']:6.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -163,6 +163,10 @@ solver2_sources = [
     "solver2/solver2_utility.cpp",
 ]
 
+fused_kernels_sources = [
+    "fused_kernels.py",
+]
+
 quaternion_sources = [
     "quaternion.py",
 ]
@@ -182,6 +186,14 @@ marker_tracking_sources = [
     "marker_tracking/marker_tracking_pybind.cpp",
 ]
 
+profiler_public_headers = [
+    "profiler/profiler_pybind.h",
+]
+
+profiler_sources = [
+    "profiler/profiler_pybind.cpp",
+]
+
 marker_tracking_extensions_public_headers = [
 ]
 
@@ -191,6 +203,7 @@ marker_tracking_extensions_sources = [
 
 gpu_character_sources = [
     "torch/character.py",
+    "torch/motion_dataset.py",
     "torch/parameter_limits.py",
     "torch/utility.py",
 ]
@@ -202,23 +215,27 @@ character_manager_sources = [
 renderer_public_headers = [
     "renderer/mesh_processing.h",
     "renderer/momentum_render.h",
+    "renderer/ray_cast.h",
     "renderer/software_rasterizer.h",
 ]
 
 renderer_sources = [
     "renderer/mesh_processing.cpp",
     "renderer/momentum_render.cpp",
+    "renderer/ray_cast.cpp",
     "renderer/renderer_pybind.cpp",
     "renderer/software_rasterizer.cpp",
 ]
 
 axel_public_headers = [
     "axel/axel_utility.h",
+    "axel/sdf_sample.h",
     "axel/tri_bvh_pybind.h",
 ]
 
 axel_sources = [
     "axel/axel_pybind.cpp",
     "axel/axel_utility.cpp",
+    "axel/sdf_sample.cpp",
     "axel/tri_bvh_pybind.cpp",
 ]
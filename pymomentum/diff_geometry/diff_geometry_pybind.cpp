@@ -10,6 +10,7 @@
 #include "pymomentum/diff_geometry/diff_character_pybind.h"
 #include "pymomentum/diff_geometry/diff_transform_pybind.h"
 
+#include "pymomentum/profiler/profiler_pybind.h"
 #include "pymomentum/tensor_momentum/tensor_joint_parameters_to_positions.h"
 #include "pymomentum/tensor_momentum/tensor_kd_tree.h"
 #include "pymomentum/tensor_momentum/tensor_skeleton_state.h"
@@ -249,6 +250,7 @@ PYBIND11_MODULE(diff_geometry, m) {
 
   pybind11::module_::import("torch"); // @dep=//caffe2:torch
   pybind11::module_::import("pymomentum.geometry"); // @dep=//pymomentum:geometry
+  pymomentum::useSharedProfiler();
 
   // Define forward kinematics functions
   defForwardKinematics(m);
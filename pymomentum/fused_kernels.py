@@ -0,0 +1,110 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""
+Fused Kernels
+=============
+
+This module provides a global switch that makes the hot elementwise operations in
+:mod:`pymomentum.quaternion` and :mod:`pymomentum.skel_state` run as fused kernels.
+
+Written as plain PyTorch, an operation such as :func:`pymomentum.quaternion.multiply`
+is a chain of small ops (unbind, multiply, add, stack), each of which launches its own
+kernel and allocates its own temporary.  When fused kernels are enabled, these
+operations are instead compiled with :func:`torch.compile` into a single forward kernel.
+There is no hand-written backward: the gradient comes from autograd through the
+compiled function.
+
+The operations that can be fused are:
+
+- :func:`pymomentum.quaternion.multiply`,
+  :func:`pymomentum.quaternion.multiply_assume_normalized`
+- :func:`pymomentum.quaternion.rotate_vector`,
+  :func:`pymomentum.quaternion.rotate_vector_assume_normalized`
+- :func:`pymomentum.quaternion.to_rotation_matrix`,
+  :func:`pymomentum.quaternion.to_rotation_matrix_assume_normalized`
+- :func:`pymomentum.quaternion.euler_xyz_to_quaternion`
+- :func:`pymomentum.skel_state.multiply`,
+  :func:`pymomentum.skel_state.multiply_assume_normalized`
+
+The forward kinematics and skinning functions of
+:mod:`pymomentum.backend.skel_state_backend` are TorchScript functions, and TorchScript
+cannot call the fused kernels.  While fused kernels are enabled, calls to these functions
+from Python run their Python implementation instead, so that the operations above run
+as fused kernels.
+
+Each operation is compiled on its first call, and again for every new combination of
+dtype, device and number of dimensions, which takes a few seconds.  Fused kernels are
+therefore disabled by default and are worth enabling for long-running workloads.
+Compiling for the CPU requires a C++ compiler.  Calls from TorchScript or
+:func:`torch.jit.trace`, and calls that are already being traced by
+:func:`torch.compile`, always use the plain implementation.
+
+Example:
+    Enable fused kernels for the whole process::
+
+        from pymomentum import fused_kernels, quaternion
+
+        fused_kernels.set_enabled(True)
+        q = quaternion.multiply(q1, q2)  # runs the compiled kernel
+"""
+
+from typing import Callable
+
+import torch
+
+# pyre-strict
+
+_enabled: bool = False
+
+_compiled_kernels: dict[Callable[..., torch.Tensor], Callable[..., torch.Tensor]] = {}
+
+
+def set_enabled(enabled: bool) -> None:
+    """
+    Enable or disable fused kernels for all the operations that support them.
+
+    :parameter enabled: Whether the operations should run as fused kernels.
+    """
+    global _enabled
+    _enabled = enabled
+
+
+def is_enabled() -> bool:
+    """
+    Check whether fused kernels are enabled.
+
+    :return: True if the operations that support it run as fused kernels.
+    """
+    return _enabled
+
+
+def should_dispatch() -> bool:
+    """
+    Check whether an operation should dispatch to its fused kernel.
+
+    This is False while :func:`torch.compile` or :func:`torch.jit.trace` traces an
+    operation, so that tracing the kernel (or a larger graph containing it) sees the plain
+    implementation.
+
+    :return: True if fused kernels are enabled and no tracing is in progress.
+    """
+    return _enabled and not torch.compiler.is_compiling() and not torch.jit.is_tracing()
+
+
+def compiled(fn: Callable[..., torch.Tensor]) -> Callable[..., torch.Tensor]:
+    """
+    Get the fused kernel for an operation, compiling it on first use.
+
+    The kernel is compiled with dynamic shapes so that it is reused across batch sizes.
+
+    :parameter fn: The operation to compile.
+    :return: The compiled operation.
+    """
+    kernel = _compiled_kernels.get(fn)
+    if kernel is None:
+        kernel = torch.compile(fn, dynamic=True, fullgraph=True)
+        _compiled_kernels[fn] = kernel
+    return kernel
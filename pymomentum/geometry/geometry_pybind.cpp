@@ -15,6 +15,7 @@
 #include "pymomentum/geometry/parameter_transform_pybind.h"
 #include "pymomentum/geometry/skeleton_pybind.h"
 #include "pymomentum/geometry/skin_weights_pybind.h"
+#include "pymomentum/profiler/profiler_pybind.h"
 #include "pymomentum/tensor_momentum/tensor_blend_shape.h"
 #include "pymomentum/tensor_momentum/tensor_joint_parameters_to_positions.h"
 #include "pymomentum/tensor_momentum/tensor_kd_tree.h"
@@ -38,6 +39,7 @@
 #include <momentum/io/gltf/gltf_io.h>
 #include <momentum/io/legacy_json/legacy_json_io.h>
 #include <momentum/io/marker/coordinate_system.h>
+#include <momentum/io/motion/mmo_io.h>
 #include <momentum/io/shape/blend_shape_io.h>
 #include <momentum/math/intersection.h>
 #include <momentum/math/mesh.h>
@@ -77,6 +79,7 @@ PYBIND11_MODULE(geometry, m) {
   m.attr("__name__") = "pymomentum.geometry";
 
   pybind11::module_::import("torch"); // @dep=//caffe2:torch
+  pymomentum::useSharedProfiler();
 
   m.attr("PARAMETERS_PER_JOINT") = mm::kParametersPerJoint;
 
@@ -183,6 +186,13 @@ PYBIND11_MODULE(geometry, m) {
       "MarkerSequence",
       "A sequence of motion capture marker data over time. Contains marker positions "
       "and occlusion status for each frame, along with frame rate information.");
+  auto columnarMarkerSequenceClass =
+      py::class_<mm::ColumnarMarkerSequence, std::shared_ptr<mm::ColumnarMarkerSequence>>(
+          m,
+          "ColumnarMarkerSequence",
+          "A sequence of motion capture marker data stored as arrays. Contains the marker names, "
+          "a [n_frames x n_markers x 3] position tensor and a [n_frames x n_markers] occlusion "
+          "tensor, along with frame rate information.");
   auto fbxCoordSystemInfoClass = py::class_<mm::FbxCoordSystemInfo>(
       m,
       "FbxCoordSystemInfo",
@@ -497,6 +507,71 @@ The resulting tensors are as follows:
             "MarkerSequence(name='{}', frames={}, fps={})", ms.name, ms.frames.size(), ms.fps);
       });
 
+  // Class ColumnarMarkerSequence, defining the properties:
+  //    name
+  //    marker_names
+  //    positions
+  //    occluded
+  //    fps
+  columnarMarkerSequenceClass
+      .def(
+          py::init(&createColumnarMarkerSequence),
+          R"(Create a columnar marker sequence; the tensor data is copied.
+
+:param name: The name of the subject.
+:param marker_names: The names of the n_markers markers.
+:param positions: A [n_frames x n_markers x 3] tensor containing the marker positions.
+:param occluded: A [n_frames x n_markers] bool tensor, True where a marker is occluded.
+:param fps: The frame rate.)",
+          py::arg("name"),
+          py::arg("marker_names"),
+          py::arg("positions"),
+          py::arg("occluded"),
+          py::arg("fps") = 30.0f)
+      .def_readwrite("name", &mm::ColumnarMarkerSequence::name, "Name of the subject")
+      .def_readonly(
+          "marker_names", &mm::ColumnarMarkerSequence::markerNames, "Names of the markers")
+      .def_readwrite("fps", &mm::ColumnarMarkerSequence::fps, "Frame rate")
+      .def_property_readonly(
+          "num_frames", &mm::ColumnarMarkerSequence::numFrames, "Number of frames")
+      .def_property_readonly(
+          "num_markers", &mm::ColumnarMarkerSequence::numMarkers, "Number of markers")
+      .def_property_readonly(
+          "positions",
+          &getColumnarMarkerPositions,
+          ":return: A [n_frames x n_markers x 3] float tensor of the marker positions. The tensor "
+          "shares memory with the sequence, so no data is copied.")
+      .def_property_readonly(
+          "occluded",
+          &getColumnarMarkerOccluded,
+          ":return: A [n_frames x n_markers] bool tensor, True where a marker is occluded. The "
+          "tensor shares memory with the sequence, so no data is copied.")
+      .def(
+          "to_marker_sequence",
+          &mm::toMarkerSequence,
+          ":return: A :class:`MarkerSequence` with the same data.")
+      .def_static(
+          "from_marker_sequence",
+          [](const mm::MarkerSequence& markerSequence) {
+            return std::make_shared<mm::ColumnarMarkerSequence>(
+                mm::toColumnarMarkerSequence(markerSequence));
+          },
+          R"(Convert a :class:`MarkerSequence` to a columnar marker sequence.
+
+All the frames must contain the same markers in the same order.
+
+:param marker_sequence: The marker sequence to convert.
+:return: A :class:`ColumnarMarkerSequence` with the same data.)",
+          py::arg("marker_sequence"))
+      .def("__repr__", [](const mm::ColumnarMarkerSequence& ms) {
+        return fmt::format(
+            "ColumnarMarkerSequence(name='{}', num_frames={}, num_markers={}, fps={})",
+            ms.name,
+            ms.numFrames(),
+            ms.numMarkers(),
+            ms.fps);
+      });
+
   // =====================================================
   // momentum::FbxCoordSystemInfo
   // - upVector
@@ -762,6 +837,81 @@ you will likely want to retarget the parameters using the :meth:`mapParameters`
       )",
       py::arg("gltf_filename"));
 
+  m.def(
+      "load_motions_batch",
+      &loadMotionsBatch,
+      py::call_guard<py::gil_scoped_release>(),
+      R"(Load the motions of many .glb/.gltf/.fbx files in parallel.
+
+The files are parsed on a thread pool with the GIL released, and each motion is mapped to the model parameters of the character by name; parameters missing from a file are zero.  Files that fail to load are reported in the returned errors instead of raising, and have zero frames.  For .fbx files, the first animation stack is loaded.
+
+:param paths: The motion files.
+:param character: The character to map the motions to.
+:param num_threads: The maximum number of threads to use; defaults to the size of the global thread pool.
+:return: a tuple [motions, lengths, fps, errors], where motions is a zero-padded [nFiles x maxFrames x nParams] tensor, lengths is an [nFiles] int64 tensor with the number of frames of each file, fps is an [nFiles] tensor, and errors is a list with the error message of each file, or None if it loaded.
+      )",
+      py::arg("paths"),
+      py::arg("character"),
+      py::arg("num_threads") = std::optional<uint32_t>{});
+
+  m.def(
+      "save_mmo",
+      &saveMmoToFile,
+      R"(Save a motion to a .mmo file.
+
+:param path: The .mmo file to write.
+:param poses: The motion, a [n_frames x n_parameters] array.
+:param scale: The joint scale parameters, of size 7 * len(joint_names).
+:param parameter_names: The names of the motion parameters.
+:param joint_names: The names of the skeleton joints.
+      )",
+      py::arg("path"),
+      py::arg("poses"),
+      py::arg("scale"),
+      py::arg("parameter_names"),
+      py::arg("joint_names"));
+
+  py::class_<mm::MappedMmo, std::shared_ptr<mm::MappedMmo>>(
+      m,
+      "MappedMmo",
+      py::buffer_protocol(),
+      R"(A .mmo motion file mapped into memory.
+
+Frames are only read from disk when they are accessed, so windows of frames can be taken from many large files without reading them whole.  The poses are exposed without copying through :attr:`poses` or the buffer protocol, e.g. ``np.asarray(mmo)``, as a read-only [n_frames x n_parameters] float32 array.  Slicing and copying a window, e.g. ``torch.from_numpy(mmo.poses[start:end].copy())``, only reads the frames of the window.)")
+      .def(
+          py::init([](const std::string& path) { return std::make_shared<mm::MappedMmo>(path); }),
+          R"(Map a .mmo file into memory.
+
+:param path: The .mmo file.)",
+          py::arg("path"))
+      .def_property_readonly(
+          "parameter_names", &mm::MappedMmo::parameterNames, "The names of the motion parameters.")
+      .def_property_readonly(
+          "joint_names", &mm::MappedMmo::jointNames, "The names of the skeleton joints.")
+      .def_property_readonly("scale", &mm::MappedMmo::scale, "The joint scale parameters.")
+      .def_property_readonly("num_frames", &mm::MappedMmo::numFrames, "The number of frames.")
+      .def_property_readonly(
+          "num_parameters", &mm::MappedMmo::numParameters, "The number of motion parameters.")
+      .def_property_readonly(
+          "poses",
+          [](const py::object& self) { return py::array(self); },
+          "The [n_frames x n_parameters] poses, a read-only view of the mapped file.")
+      .def_buffer([](mm::MappedMmo& self) -> py::buffer_info {
+        // The parameters of each frame are contiguous in the file. The data may be unaligned, which
+        // numpy supports.
+        const auto nFrames = static_cast<py::ssize_t>(self.numFrames());
+        const auto nParams = static_cast<py::ssize_t>(self.numParameters());
+        return py::buffer_info(
+            const_cast<std::byte*>(self.data()),
+            sizeof(float),
+            py::format_descriptor<float>::format(),
+            2,
+            {nFrames, nParams},
+            {static_cast<py::ssize_t>(sizeof(float)) * nParams,
+             static_cast<py::ssize_t>(sizeof(float))},
+            true);
+      });
+
   // loadMarkersFromFile(path, mainSubjectOnly)
   // TODO(T138941756): Expose the loadMarker and loadMarkersForMainSubject
   // APIs separately from markerIO.h loadMarkersFromFile(path,
@@ -780,6 +930,69 @@ you will likely want to retarget the parameters using the :meth:`mapParameters`
       py::arg("main_subject_only") = true,
       py::arg("up") = mm::UpVector::Y);
 
+  py::class_<MarkerStream>(
+      m,
+      "MarkerStream",
+      R"(Iterates over the frames of a .c3d or .trc marker file in chunks, reading only the frames of the current chunk from the file.
+
+Each chunk is a list with one :class:`ColumnarMarkerSequence` per subject, all with the same frames.  Reading releases the GIL.
+
+Example::
+
+  for chunk in pymomentum.geometry.MarkerStream("capture.c3d", chunk_size=1000):
+      positions = chunk[0].positions  # [n_frames x n_markers x 3]
+)")
+      .def(
+          py::init<const std::string&, size_t, size_t, std::optional<size_t>, mm::UpVector>(),
+          R"(Open a marker file for streaming.
+
+:param path: A marker data file: .c3d or .trc.
+:param chunk_size: The maximum number of frames per chunk.
+:param start_frame: The first frame to read.
+:param end_frame: The frame to stop reading at (exclusive); defaults to the end of the file.  Together with start_frame, this allows splitting a file across workers.
+:param up: The up vector to use for the coordinate system, default to Y.)",
+          py::arg("path"),
+          py::arg("chunk_size") = 1024,
+          py::arg("start_frame") = 0,
+          py::arg("end_frame") = std::optional<size_t>{},
+          py::arg("up") = mm::UpVector::Y)
+      .def("__iter__", [](MarkerStream& stream) -> MarkerStream& { return stream; })
+      .def("__next__", &MarkerStream::next)
+      .def(
+          "seek",
+          &MarkerStream::seek,
+          R"(Move to a frame, so that the next chunk starts from it.
+
+:param frame: The frame index, at most :attr:`num_frames`.)",
+          py::arg("frame"))
+      .def_property_readonly(
+          "subjects",
+          &MarkerStream::subjects,
+          "The subjects in the file, as :class:`ColumnarMarkerSequence` objects without frames.")
+      .def_property_readonly(
+          "num_frames", &MarkerStream::numFrames, "The number of frames in the file.")
+      .def_property_readonly(
+          "current_frame", &MarkerStream::currentFrame, "The first frame of the next chunk.")
+      .def_property_readonly(
+          "end_frame", &MarkerStream::endFrame, "The frame at which the iteration stops.");
+
+  m.def(
+      "load_markers_columnar",
+      &loadMarkersColumnarFromFile,
+      R"(Load 3d mocap marker data from file into columnar marker sequences.
+
+The positions and occlusion status of a sequence are exposed as tensors that share memory with the
+sequence, which avoids creating a :class:`Marker` per marker and frame.
+
+:param path: A marker data file: .c3d, .gltf, or .trc.
+:param main_subject_only: True to load only one subject's data.
+:param up: The up vector to use for the coordinate system, default to Y.
+:return: an array of ColumnarMarkerSequence, one per subject in the file.
+      )",
+      py::arg("path"),
+      py::arg("main_subject_only") = true,
+      py::arg("up") = mm::UpVector::Y);
+
   // mapModelParameters_names(motionData, sourceParameterNames,
   // targetCharacter)
   m.def(
@@ -1202,6 +1415,103 @@ Using the normal is a good way to avoid certain kinds of bad matches, such as ma
       py::arg("vertices_target"),
       py::arg("faces_target"));
 
+  py::class_<PointIndex>(
+      m,
+      "PointIndex",
+      R"(A k-d tree over a fixed set of target points that is built once and can then be queried repeatedly, e.g. across the iterations of an ICP loop where the target scan does not change.
+Queries release the GIL and return the same values as :func:`find_closest_points`.  An unbatched index is shared by every batch element of the query points.)")
+      .def(
+          py::init([](at::Tensor points_target, std::optional<at::Tensor> normals_target) {
+            return PointIndex(points_target, normals_target.value_or(at::Tensor()));
+          }),
+          pybind11::call_guard<py::gil_scoped_release>(),
+          R"(Build the index.
+
+:param points_target: [nBatch x nPoints x dim] tensor of target points (dim must be 2 or 3).
+:param normals_target: Optional [nBatch x nPoints x 3] tensor of target normals (must be normalized); required to query with normals.
+        )",
+          py::arg("points_target"),
+          py::arg("normals_target") = std::optional<at::Tensor>{})
+      .def(
+          "find_closest_points",
+          &PointIndex::findClosestPoints,
+          pybind11::call_guard<py::gil_scoped_release>(),
+          R"(For each point in the points_source tensor, find the closest point in the index.  See :func:`find_closest_points`.
+
+:param points_source: [nBatch x nPoints x dim] tensor of source points.
+:param max_dist: Maximum distance to search.  Defaults to FLT_MAX.
+:return: A tuple of three tensors (points, index, valid), as returned by :func:`find_closest_points`.
+        )",
+          py::arg("points_source"),
+          py::arg("max_dist") = std::numeric_limits<float>::max())
+      .def(
+          "find_closest_points",
+          &PointIndex::findClosestPointsWithNormals,
+          pybind11::call_guard<py::gil_scoped_release>(),
+          R"(For each point in the points_source tensor, find the closest point in the index whose normal is compatible (n_source . n_target > max_normal_dot).  The index must have been built with normals.  See :func:`find_closest_points`.
+
+:param points_source: [nBatch x nPoints x 3] tensor of source points.
+:param normals_source: [nBatch x nPoints x 3] tensor of source normals (must be normalized).
+:param max_dist: Maximum distance to search.  Defaults to FLT_MAX.
+:param max_normal_dot: Maximum dot product allowed between the source and target normal.  Defaults to 0.
+:return: A tuple of four tensors (points, normals, index, valid), as returned by :func:`find_closest_points`.
+        )",
+          py::arg("points_source"),
+          py::arg("normals_source"),
+          py::arg("max_dist") = std::numeric_limits<float>::max(),
+          py::arg("max_normal_dot") = 0.0f)
+      .def_property_readonly(
+          "batch_size", &PointIndex::batchSize, "The batch size of the target points.")
+      .def_property_readonly(
+          "num_points", &PointIndex::numPoints, "The number of target points per batch element.")
+      .def_property_readonly(
+          "dimension", &PointIndex::dimension, "The dimension (2 or 3) of the target points.")
+      .def_property_readonly(
+          "has_normals", &PointIndex::hasNormals, "Whether the index was built with normals.");
+
+  py::class_<MeshIndex>(
+      m,
+      "MeshIndex",
+      R"(A BVH over a fixed target mesh that is built once and can then be queried repeatedly.
+Queries release the GIL and return the same values as :func:`find_closest_points_on_mesh`.  For deforming meshes, :meth:`refit` replaces the vertex positions and updates the bounds of the existing trees, which is much cheaper than building a new index.  An unbatched index is shared by every batch element of the query points.)")
+      .def(
+          py::init<at::Tensor, at::Tensor>(),
+          pybind11::call_guard<py::gil_scoped_release>(),
+          R"(Build the index.  The index uses double precision if vertices_target is a double tensor; its queries then return double precision points and barycentric coordinates.
+
+:param vertices_target: [nBatch x nVertices x 3] tensor of target vertices.
+:param faces_target: [nBatch x nFaces x 3] tensor of target faces.
+        )",
+          py::arg("vertices_target"),
+          py::arg("faces_target"))
+      .def(
+          "find_closest_points",
+          &MeshIndex::findClosestPoints,
+          pybind11::call_guard<py::gil_scoped_release>(),
+          R"(For each point in the points_source tensor, find the closest point on the indexed mesh.  See :func:`find_closest_points_on_mesh`.
+
+:param points_source: [nBatch x nPoints x 3] tensor of source points.
+:return: A tuple of four tensors (valid, points, face_index, bary), as returned by :func:`find_closest_points_on_mesh`.
+        )",
+          py::arg("points_source"))
+      .def(
+          "refit",
+          &MeshIndex::refit,
+          pybind11::call_guard<py::gil_scoped_release>(),
+          R"(Replace the vertex positions of the indexed mesh, keeping the faces and the tree topology.
+
+Only the bounds of the tree are updated, so queries get slower as the mesh deforms away from the pose the index was built with; build a new index if the deformation is large.
+
+:param vertices_target: Tensor of new vertices, with the same shape as the vertices the index was built with.
+        )",
+          py::arg("vertices_target"))
+      .def_property_readonly(
+          "batch_size", &MeshIndex::batchSize, "The batch size of the target mesh.")
+      .def_property_readonly(
+          "num_vertices", &MeshIndex::numVertices, "The number of vertices of the target mesh.")
+      .def_property_readonly(
+          "num_faces", &MeshIndex::numFaces, "The number of faces of the target mesh.");
+
   m.def(
       "replace_rest_mesh",
       &replaceRestMesh,
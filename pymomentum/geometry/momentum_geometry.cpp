@@ -794,4 +794,62 @@ std::vector<bool> boolArrayToVector(const pybind11::array_t<bool>& array) {
   return result;
 }
 
+std::shared_ptr<momentum::ColumnarMarkerSequence> createColumnarMarkerSequence(
+    const std::string& name,
+    const std::vector<std::string>& markerNames,
+    at::Tensor positions,
+    at::Tensor occluded,
+    float fps) {
+  const auto nMarkers = static_cast<int64_t>(markerNames.size());
+  MT_THROW_IF(
+      positions.dim() != 3 || positions.size(1) != nMarkers || positions.size(2) != 3,
+      "In ColumnarMarkerSequence(), expected positions to be [n_frames x {} x 3] but got {}",
+      nMarkers,
+      formatTensorSizes(positions));
+  const auto nFrames = positions.size(0);
+  MT_THROW_IF(
+      occluded.dim() != 2 || occluded.size(0) != nFrames || occluded.size(1) != nMarkers,
+      "In ColumnarMarkerSequence(), expected occluded to be [{} x {}] but got {}",
+      nFrames,
+      nMarkers,
+      formatTensorSizes(occluded));
+
+  auto result = std::make_shared<momentum::ColumnarMarkerSequence>();
+  result->name = name;
+  result->markerNames = markerNames;
+  result->fps = fps;
+  result->resize(nFrames);
+
+  positions = positions.detach().to(at::kCPU, at::kFloat).contiguous();
+  occluded = occluded.detach().to(at::kCPU, at::kBool).contiguous();
+  std::copy_n(positions.data_ptr<float>(), positions.numel(), result->positions.data());
+  std::copy_n(occluded.data_ptr<bool>(), occluded.numel(), result->occluded.data());
+  return result;
+}
+
+at::Tensor getColumnarMarkerPositions(
+    const std::shared_ptr<momentum::ColumnarMarkerSequence>& sequence) {
+  // Column f of the positions matrix holds the markers of frame f, so the column-major data is
+  // already laid out as [nFrames x nMarkers x 3].
+  const auto nFrames = static_cast<int64_t>(sequence->numFrames());
+  const auto nMarkers = static_cast<int64_t>(sequence->numMarkers());
+  return torch::from_blob(
+      sequence->positions.data(),
+      {nFrames, nMarkers, 3},
+      [sequence](void*) {},
+      torch::TensorOptions().dtype(at::kFloat));
+}
+
+at::Tensor getColumnarMarkerOccluded(
+    const std::shared_ptr<momentum::ColumnarMarkerSequence>& sequence) {
+  // The occlusion flags are 0 or 1, which is a valid bool representation.
+  const auto nFrames = static_cast<int64_t>(sequence->numFrames());
+  const auto nMarkers = static_cast<int64_t>(sequence->numMarkers());
+  return torch::from_blob(
+      sequence->occluded.data(),
+      {nFrames, nMarkers},
+      [sequence](void*) {},
+      torch::TensorOptions().dtype(at::kBool));
+}
+
 } // namespace pymomentum
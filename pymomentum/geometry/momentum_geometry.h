@@ -8,6 +8,7 @@
 #pragma once
 
 #include <momentum/character/character.h>
+#include <momentum/character/marker.h>
 #include <momentum/math/mppca.h>
 
 #include <ATen/ATen.h>
@@ -211,4 +212,23 @@ std::string formatDimensions(const pybind11::array& array);
 
 std::vector<bool> boolArrayToVector(const pybind11::array_t<bool>& array);
 
+// Create a ColumnarMarkerSequence from a [nFrames x nMarkers x 3] positions tensor and a
+// [nFrames x nMarkers] occlusion tensor; the tensor data is copied.
+std::shared_ptr<momentum::ColumnarMarkerSequence> createColumnarMarkerSequence(
+    const std::string& name,
+    const std::vector<std::string>& markerNames,
+    at::Tensor positions,
+    at::Tensor occluded,
+    float fps);
+
+// Views the marker positions of the sequence as a [nFrames x nMarkers x 3] float tensor without
+// copying; the tensor keeps the sequence alive.
+at::Tensor getColumnarMarkerPositions(
+    const std::shared_ptr<momentum::ColumnarMarkerSequence>& sequence);
+
+// Views the occlusion status of the sequence as a [nFrames x nMarkers] bool tensor without
+// copying; the tensor keeps the sequence alive.
+at::Tensor getColumnarMarkerOccluded(
+    const std::shared_ptr<momentum::ColumnarMarkerSequence>& sequence);
+
 } // namespace pymomentum
@@ -9,6 +9,7 @@
 #include "pymomentum/geometry/momentum_geometry.h"
 
 #include <momentum/character/character.h>
+#include <momentum/character/character_utility.h>
 #include <momentum/character/joint_state.h>
 #include <momentum/character/skeleton_state.h>
 #include <momentum/character/types.h>
@@ -17,6 +18,12 @@
 #include <momentum/io/fbx/fbx_io.h>
 #include <momentum/io/gltf/gltf_io.h>
 #include <momentum/io/marker/marker_io.h>
+#include <momentum/io/motion/mmo_io.h>
+
+#include <dispenso/parallel_for.h> // @manual
+
+#include <algorithm>
+#include <cctype>
 
 namespace pymomentum {
 
@@ -366,6 +373,105 @@ std::vector<int64_t> loadMotionTimestamps(const std::string& gltfFilename) {
   return momentum::loadMotionTimestamps(gltfFilename);
 }
 
+namespace {
+
+// Loads the motion of a file and maps it to the model parameters of the character.
+Eigen::MatrixXf
+loadMotionForCharacter(const std::string& path, const momentum::Character& character, float& fps) {
+  const filesystem::path filepath(path);
+  std::string ext = filepath.extension().string();
+  std::transform(ext.begin(), ext.end(), ext.begin(), ::tolower);
+  if (ext == ".glb" || ext == ".gltf") {
+    const auto [motion, identity, motionFps] = momentum::loadMotion(filepath);
+    fps = motionFps;
+    return momentum::mapMotionToCharacter(motion, character);
+  } else if (ext == ".fbx") {
+    const auto [fileCharacter, motions, motionFps] = momentum::loadFbxCharacterWithMotion(filepath);
+    MT_THROW_IF(motions.empty(), "No motion found in '{}'.", path);
+    fps = motionFps;
+    return momentum::mapMotionToCharacter(
+        {fileCharacter.parameterTransform.name, motions.front()}, character);
+  }
+  MT_THROW("Unsupported motion file type '{}' for '{}'.", ext, path);
+}
+
+} // namespace
+
+std::tuple<at::Tensor, at::Tensor, at::Tensor, std::vector<std::optional<std::string>>>
+loadMotionsBatch(
+    const std::vector<std::string>& paths,
+    const momentum::Character& character,
+    const std::optional<uint32_t> numThreads) {
+  MT_THROW_IF(numThreads.has_value() && *numThreads == 0, "num_threads must be positive.");
+
+  const auto nFiles = static_cast<int64_t>(paths.size());
+  const auto nParams = static_cast<int64_t>(character.parameterTransform.numAllModelParameters());
+  std::vector<Eigen::MatrixXf> motions(paths.size());
+  std::vector<std::optional<std::string>> errors(paths.size());
+
+  at::Tensor lengths = at::zeros({nFiles}, at::kLong);
+  at::Tensor fps = at::zeros({nFiles}, at::kFloat);
+  auto lengthsAccessor = lengths.accessor<int64_t, 1>();
+  auto fpsAccessor = fps.accessor<float, 1>();
+
+  dispenso::ParForOptions options;
+  if (numThreads.has_value()) {
+    options.maxThreads = *numThreads;
+  }
+  // Files vary in size, so they are balanced across the threads dynamically.
+  dispenso::parallel_for(
+      dispenso::makeChunkedRange(0, nFiles, dispenso::ParForChunking::kAuto),
+      [&](const int64_t begin, const int64_t end) {
+        for (int64_t iFile = begin; iFile < end; ++iFile) {
+          try {
+            float fileFps = 0.0f;
+            motions[iFile] = loadMotionForCharacter(paths[iFile], character, fileFps);
+            fpsAccessor[iFile] = fileFps;
+            lengthsAccessor[iFile] = motions[iFile].cols();
+          } catch (const std::exception& e) {
+            errors[iFile] = e.what();
+            motions[iFile].resize(0, 0);
+          } catch (...) {
+            // Nothing may escape the worker threads; record the failure like any other.
+            errors[iFile] = "Unknown error.";
+            motions[iFile].resize(0, 0);
+          }
+        }
+      },
+      options);
+
+  const int64_t maxFrames = nFiles == 0 ? 0 : lengths.max().item<int64_t>();
+  at::Tensor result = at::zeros({nFiles, maxFrames, nParams}, at::kFloat);
+  for (int64_t iFile = 0; iFile < nFiles; ++iFile) {
+    // The column-major [nParams x nFrames] motion is the row-major [nFrames x nParams] slice.
+    const auto& motion = motions[iFile];
+    std::copy_n(
+        motion.data(), motion.size(), result.data_ptr<float>() + iFile * maxFrames * nParams);
+  }
+
+  return {result, lengths, fps, errors};
+}
+
+void saveMmoToFile(
+    const std::string& path,
+    const RowMatrixf& poses,
+    const Eigen::VectorXf& scale,
+    const std::vector<std::string>& parameterNames,
+    const std::vector<std::string>& jointNames) {
+  MT_THROW_IF(
+      poses.cols() != static_cast<Eigen::Index>(parameterNames.size()),
+      "Mismatch between poses with {} parameters and {} parameter names.",
+      poses.cols(),
+      parameterNames.size());
+  MT_THROW_IF(
+      scale.size() != static_cast<Eigen::Index>(jointNames.size() * momentum::kParametersPerJoint),
+      "Expected a scale of size {} for {} joints, got {}.",
+      jointNames.size() * momentum::kParametersPerJoint,
+      jointNames.size(),
+      scale.size());
+  momentum::saveMmo(path, poses.transpose(), scale, parameterNames, jointNames);
+}
+
 std::vector<momentum::MarkerSequence> loadMarkersFromFile(
     const std::string& path,
     const bool mainSubjectOnly,
@@ -382,6 +488,79 @@ std::vector<momentum::MarkerSequence> loadMarkersFromFile(
   }
 }
 
+std::vector<std::shared_ptr<momentum::ColumnarMarkerSequence>> loadMarkersColumnarFromFile(
+    const std::string& path,
+    const bool mainSubjectOnly,
+    const momentum::UpVector up) {
+  std::vector<momentum::ColumnarMarkerSequence> markerSequences;
+  if (mainSubjectOnly) {
+    auto markerSequence = momentum::loadMarkersForMainSubjectColumnar(path, up);
+    if (markerSequence.has_value()) {
+      markerSequences.push_back(std::move(markerSequence.value()));
+    }
+  } else {
+    markerSequences = momentum::loadMarkersColumnar(path, up);
+  }
+
+  std::vector<std::shared_ptr<momentum::ColumnarMarkerSequence>> result;
+  result.reserve(markerSequences.size());
+  for (auto& markerSequence : markerSequences) {
+    result.push_back(std::make_shared<momentum::ColumnarMarkerSequence>(std::move(markerSequence)));
+  }
+  return result;
+}
+
+MarkerStream::MarkerStream(
+    const std::string& path,
+    const size_t chunkSize,
+    const size_t startFrame,
+    const std::optional<size_t> endFrame,
+    const momentum::UpVector up)
+    : reader_(momentum::openMarkerStream(path, up)),
+      chunkSize_(chunkSize),
+      endFrame_(endFrame.value_or(reader_->numFrames())) {
+  MT_THROW_IF(chunkSize_ == 0, "MarkerStream chunk_size must be positive.");
+  MT_THROW_IF(
+      startFrame > endFrame_,
+      "MarkerStream start_frame {} is after end_frame {}.",
+      startFrame,
+      endFrame_);
+  reader_->seek(std::min(startFrame, reader_->numFrames()));
+}
+
+std::vector<std::shared_ptr<momentum::ColumnarMarkerSequence>> MarkerStream::next() {
+  std::vector<momentum::ColumnarMarkerSequence> chunk;
+  {
+    pybind11::gil_scoped_release release;
+    const size_t end = endFrame();
+    if (reader_->currentFrame() < end) {
+      chunk = reader_->read(std::min(chunkSize_, end - reader_->currentFrame()));
+    }
+  }
+  if (chunk.empty() || chunk.front().numFrames() == 0) {
+    throw pybind11::stop_iteration();
+  }
+
+  std::vector<std::shared_ptr<momentum::ColumnarMarkerSequence>> result;
+  result.reserve(chunk.size());
+  for (auto& sequence : chunk) {
+    result.push_back(std::make_shared<momentum::ColumnarMarkerSequence>(std::move(sequence)));
+  }
+  return result;
+}
+
+void MarkerStream::seek(const size_t frame) {
+  reader_->seek(frame);
+}
+
+std::vector<std::shared_ptr<momentum::ColumnarMarkerSequence>> MarkerStream::subjects() const {
+  std::vector<std::shared_ptr<momentum::ColumnarMarkerSequence>> result;
+  for (const auto& subject : reader_->subjects()) {
+    result.push_back(std::make_shared<momentum::ColumnarMarkerSequence>(subject));
+  }
+  return result;
+}
+
 bool isFbxsdkAvailable() {
 #ifdef MOMENTUM_WITH_FBX_SDK
   return true;
@@ -7,12 +7,17 @@
 
 #pragma once
 
+#include <ATen/ATen.h>
 #include <momentum/character/marker.h>
 #include <momentum/character/types.h>
 #include <momentum/io/gltf/gltf_io.h>
 #include <momentum/io/marker/coordinate_system.h>
+#include <momentum/io/marker/marker_stream.h>
 #include <pybind11/numpy.h>
 
+#include <algorithm>
+#include <cstdint>
+#include <memory>
 #include <optional>
 #include <string>
 
@@ -123,11 +128,77 @@ loadMotion(const std::string& gltfFilename);
 /// @return Vector of per-frame timestamps (int64_t). Empty if no timestamps found.
 std::vector<int64_t> loadMotionTimestamps(const std::string& gltfFilename);
 
+/// Loads the motions of many .glb/.gltf/.fbx files in parallel, mapped to the parameters of the
+/// character by name.
+///
+/// @param[in] paths The motion files.
+/// @param[in] character The character whose model parameters the motions are mapped to.
+/// @param[in] numThreads The maximum number of threads to parse files on; nullopt uses the default
+/// thread pool size.
+/// @return A tuple (motions, lengths, fps, errors): motions is a zero-padded
+/// [nFiles x maxFrames x nParams] float tensor, lengths an [nFiles] int64 tensor of frame counts,
+/// fps an [nFiles] float tensor, and errors has the error message of each file that failed to
+/// load, with zero frames, or nullopt.
+std::tuple<at::Tensor, at::Tensor, at::Tensor, std::vector<std::optional<std::string>>>
+loadMotionsBatch(
+    const std::vector<std::string>& paths,
+    const momentum::Character& character,
+    std::optional<uint32_t> numThreads);
+
+// Saves a motion in the .mmo format; poses is (nFrames x nParameters).
+void saveMmoToFile(
+    const std::string& path,
+    const RowMatrixf& poses,
+    const Eigen::VectorXf& scale,
+    const std::vector<std::string>& parameterNames,
+    const std::vector<std::string>& jointNames);
+
 std::vector<momentum::MarkerSequence> loadMarkersFromFile(
     const std::string& path,
     bool mainSubjectOnly = true,
     momentum::UpVector up = momentum::UpVector::Y);
 
+std::vector<std::shared_ptr<momentum::ColumnarMarkerSequence>> loadMarkersColumnarFromFile(
+    const std::string& path,
+    bool mainSubjectOnly = true,
+    momentum::UpVector up = momentum::UpVector::Y);
+
+/// Iterates over the frames [startFrame, endFrame) of a marker file in chunks of chunkSize frames.
+/// Each chunk is a list with one ColumnarMarkerSequence per subject.
+class MarkerStream {
+ public:
+  MarkerStream(
+      const std::string& path,
+      size_t chunkSize,
+      size_t startFrame,
+      std::optional<size_t> endFrame,
+      momentum::UpVector up);
+
+  // Returns the next chunk; throws pybind11::stop_iteration at the end of the frame range.
+  std::vector<std::shared_ptr<momentum::ColumnarMarkerSequence>> next();
+
+  void seek(size_t frame);
+
+  std::vector<std::shared_ptr<momentum::ColumnarMarkerSequence>> subjects() const;
+
+  [[nodiscard]] size_t numFrames() const {
+    return reader_->numFrames();
+  }
+
+  [[nodiscard]] size_t currentFrame() const {
+    return reader_->currentFrame();
+  }
+
+  [[nodiscard]] size_t endFrame() const {
+    return std::min(endFrame_, reader_->numFrames());
+  }
+
+ private:
+  std::unique_ptr<momentum::MarkerStreamReader> reader_;
+  size_t chunkSize_;
+  size_t endFrame_;
+};
+
 /// Utility function to convert pybind11::array_t<float> to SkeletonState vector
 /// This is shared between saveGLTFCharacterToFileFromSkelStates and
 /// GltfBuilder::addSkeletonStates
@@ -11,13 +11,17 @@
 #include <momentum/marker_tracking/tracker_utils.h>
 #include <momentum/math/mesh.h>
 
+#include <pymomentum/profiler/profiler_pybind.h>
+
 #include <pybind11/eigen.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 
 #include <fmt/format.h>
+#include <memory>
 #include <sstream>
 #include <string>
+#include <variant>
 
 namespace py = pybind11;
 
@@ -44,6 +48,21 @@ std::string vectorToString(const Eigen::VectorXf& vec) {
   return ss.str();
 }
 
+// Marker data passed from Python, either as a ColumnarMarkerSequence or as a list of frames of
+// markers.
+using MarkerData = std::variant<
+    std::shared_ptr<momentum::ColumnarMarkerSequence>,
+    std::vector<std::vector<momentum::Marker>>>;
+
+// Helper function to convert marker data to the frames of markers used by the tracker
+std::vector<std::vector<momentum::Marker>> toMarkerFrames(MarkerData markerData) {
+  if (const auto* sequence =
+          std::get_if<std::shared_ptr<momentum::ColumnarMarkerSequence>>(&markerData)) {
+    return momentum::toMarkerSequence(**sequence).frames;
+  }
+  return std::move(std::get<std::vector<std::vector<momentum::Marker>>>(markerData));
+}
+
 // Helper function to convert a boolean to Python-style string representation
 std::string boolToString(bool value) {
   return value ? "True" : "False";
@@ -62,6 +81,7 @@ PYBIND11_MODULE(marker_tracking, m) {
 
   pybind11::module_::import(
       "pymomentum.geometry"); // @dep=fbsource//arvr/libraries/pymomentum:geometry
+  pymomentum::useSharedProfiler();
 
   // Bindings for types defined in marker_tracking/marker_tracker.h
   auto baseConfig =
@@ -382,7 +402,7 @@ PYBIND11_MODULE(marker_tracking, m) {
       "process_markers",
       [](momentum::Character& character,
          const Eigen::VectorXf& identity,
-         const std::vector<std::vector<momentum::Marker>>& markerData,
+         MarkerData markerData,
          const momentum::TrackingConfig& trackingConfig,
          const momentum::CalibrationConfig& calibrationConfig,
          bool calibrate = true,
@@ -397,7 +417,7 @@ PYBIND11_MODULE(marker_tracking, m) {
         Eigen::MatrixXf motion = momentum::processMarkers(
             character,
             params,
-            markerData,
+            toMarkerFrames(std::move(markerData)),
             trackingConfig,
             calibrationConfig,
             calibrate,
@@ -412,7 +432,7 @@ PYBIND11_MODULE(marker_tracking, m) {
 
 :parameter character: Character to be used for tracking
 :parameter identity: Identity parameters, pass in empty array for default identity
-:parameter marker_data: A list of marker data for each frame
+:parameter marker_data: A list of marker data for each frame, or a :class:`pymomentum.geometry.ColumnarMarkerSequence`
 :parameter tracking_config: Tracking config to be used for tracking
 :parameter calibration_config: Calibration config to be used for calibration
 :parameter calibrate: Whether to calibrate the model
@@ -434,10 +454,12 @@ PYBIND11_MODULE(marker_tracking, m) {
          const momentum::Character& character,
          const Eigen::VectorXf& identity,
          Eigen::MatrixXf& motion,
-         const std::vector<std::vector<momentum::Marker>>& markerData,
+         MarkerData markerData,
          const float fps,
          const bool saveMarkerMesh = true) {
         momentum::ModelParameters params(identity);
+        const std::vector<std::vector<momentum::Marker>> markerFrames =
+            toMarkerFrames(std::move(markerData));
 
         if (params.size() == 0) { // If no identity is passed in, use default
           params = momentum::ModelParameters::Zero(character.parameterTransform.name.size());
@@ -450,14 +472,15 @@ PYBIND11_MODULE(marker_tracking, m) {
           Eigen::MatrixXf finalMotion(motion.transpose());
           // note: saveMotion removes identity from the motion matrix
           momentum::saveMotion(
-              outFile, character, params, finalMotion, markerData, fps, saveMarkerMesh);
+              outFile, character, params, finalMotion, markerFrames, fps, saveMarkerMesh);
           // and transpose it back since motion is passed by reference
           motion = finalMotion.transpose();
         } else if (motion.rows() == character.parameterTransform.numAllModelParameters()) {
           // motion matrix is already in cpp format
           // keeping this branch for backward compatibility
           // note: saveMotion removes identity from the motion matrix
-          momentum::saveMotion(outFile, character, params, motion, markerData, fps, saveMarkerMesh);
+          momentum::saveMotion(
+              outFile, character, params, motion, markerFrames, fps, saveMarkerMesh);
         } else {
           throw std::runtime_error(
               "Inconsistent number of parameters in motion matrix with the character parameter transform");
@@ -476,7 +499,7 @@ PYBIND11_MODULE(marker_tracking, m) {
       [](momentum::Character& character,
          const Eigen::VectorXf& identity,
          const Eigen::MatrixXf& motion,
-         const std::vector<std::vector<momentum::Marker>>& markerData,
+         MarkerData markerData,
          const momentum::RefineConfig& refineConfig) {
         // python and cpp have the motion matrix transposed from each other.
         // Let's do that on the way in and out here so it's consistent for both
@@ -491,8 +514,8 @@ PYBIND11_MODULE(marker_tracking, m) {
           momentum::ParameterSet idParamSet = character.parameterTransform.getScalingParameters();
           momentum::fillIdentity(idParamSet, identity, inputMotion);
         }
-        Eigen::MatrixXf finalMotion =
-            momentum::refineMotion(markerData, inputMotion, refineConfig, character);
+        Eigen::MatrixXf finalMotion = momentum::refineMotion(
+            toMarkerFrames(std::move(markerData)), inputMotion, refineConfig, character);
         auto finalMotionTransposed = Eigen::MatrixXf(finalMotion.transpose());
         return finalMotionTransposed;
       },
@@ -0,0 +1,241 @@
+/*
+ * Copyright (c) Meta Platforms, Inc. and affiliates.
+ *
+ * This source code is licensed under the MIT license found in the
+ * LICENSE file in the root directory of this source tree.
+ */
+
+#include <momentum/common/profiler.h>
+
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+
+#include <fmt/format.h>
+
+#include <algorithm>
+#include <optional>
+#include <string>
+
+namespace py = pybind11;
+namespace mp = momentum::profiler;
+
+namespace {
+
+// Zones the Python code opens and closes itself, which the ScopedZones cannot be used for.
+class PyZone {
+ public:
+  explicit PyZone(std::string name) : name_(std::move(name)) {}
+
+  void enter() {
+    mp::Profiler& profiler = mp::Profiler::instance();
+    if (profiler.isEnabled()) {
+      profiler_ = &profiler;
+      internedName_ = profiler.intern(name_);
+      beginNs_ = mp::Profiler::now();
+    }
+  }
+
+  void exit() {
+    if (profiler_ != nullptr) {
+      profiler_->record(internedName_, beginNs_, mp::Profiler::now());
+      profiler_ = nullptr;
+    }
+  }
+
+ private:
+  std::string name_;
+  mp::Profiler* profiler_ = nullptr;
+  const char* internedName_ = nullptr;
+  uint64_t beginNs_ = 0;
+};
+
+std::string formatZoneStats(const std::vector<mp::ZoneStats>& stats) {
+  size_t nameWidth = 4;
+  for (const auto& s : stats) {
+    nameWidth = std::max(nameWidth, s.name.size());
+  }
+
+  std::string result = fmt::format(
+      "{:<{}}  {:>8}  {:>12}  {:>12}  {:>10}  {:>10}  {:>10}\n",
+      "zone",
+      nameWidth,
+      "count",
+      "total (ms)",
+      "self (ms)",
+      "mean (ms)",
+      "min (ms)",
+      "max (ms)");
+  for (const auto& s : stats) {
+    result += fmt::format(
+        "{:<{}}  {:>8}  {:>12.3f}  {:>12.3f}  {:>10.4f}  {:>10.4f}  {:>10.4f}\n",
+        s.name,
+        nameWidth,
+        s.count,
+        s.totalMs,
+        s.selfMs,
+        s.totalMs / static_cast<double>(s.count),
+        s.minMs,
+        s.maxMs);
+  }
+  return result;
+}
+
+} // namespace
+
+PYBIND11_MODULE(profiler, m) {
+  m.attr("__name__") = "pymomentum.profiler";
+  m.doc() =
+      R"(Built-in profiler for the zones momentum records in its solvers, skinning and renderer.
+
+Recording is off by default and costs a single check per zone while off.  Enable it around the code to profile, then inspect the aggregated timings with :func:`zone_stats` or save a trace viewable in chrome://tracing or https://ui.perfetto.dev with :func:`save_chrome_trace`::
+
+    import pymomentum.profiler as profiler
+
+    profiler.enable()
+    solve()
+    profiler.disable()
+    print(profiler.zone_stats_table())
+    profiler.save_chrome_trace("solve.json")
+
+The zones of all the pymomentum modules are recorded into the same profiler.  Each thread keeps its most recent zones in a ring buffer of :func:`buffer_capacity` zones.)";
+
+  // Shared with the other extension modules; see pymomentum/profiler/profiler_pybind.h.
+  m.attr("_instance") = py::capsule(&mp::Profiler::instance());
+
+  py::class_<mp::ZoneEvent>(m, "ZoneEvent", "A recorded profiling zone.")
+      .def_property_readonly(
+          "name", [](const mp::ZoneEvent& e) { return std::string(e.name); }, "Name of the zone.")
+      .def_readonly(
+          "begin_ns",
+          &mp::ZoneEvent::beginNs,
+          "Start time in nanoseconds, relative to an arbitrary epoch.")
+      .def_readonly("duration_ns", &mp::ZoneEvent::durationNs, "Duration in nanoseconds.")
+      .def_readonly("thread_id", &mp::ZoneEvent::threadId, "Small integer identifying the thread.")
+      .def("__repr__", [](const mp::ZoneEvent& e) {
+        return fmt::format(
+            "ZoneEvent(name={}, begin_ns={}, duration_ns={}, thread_id={})",
+            e.name,
+            e.beginNs,
+            e.durationNs,
+            e.threadId);
+      });
+
+  py::class_<mp::ZoneStats>(m, "ZoneStats", "Timings of all the recorded zones with one name.")
+      .def_readonly("name", &mp::ZoneStats::name, "Name of the zones.")
+      .def_readonly("count", &mp::ZoneStats::count, "Number of recorded zones.")
+      .def_readonly("total_ms", &mp::ZoneStats::totalMs, "Total time in milliseconds.")
+      .def_readonly(
+          "self_ms",
+          &mp::ZoneStats::selfMs,
+          "Total time in milliseconds, excluding the zones nested in them.")
+      .def_readonly("min_ms", &mp::ZoneStats::minMs, "Shortest zone in milliseconds.")
+      .def_readonly("max_ms", &mp::ZoneStats::maxMs, "Longest zone in milliseconds.")
+      .def("__repr__", [](const mp::ZoneStats& s) {
+        return fmt::format(
+            "ZoneStats(name={}, count={}, total_ms={:.4f}, self_ms={:.4f}, min_ms={:.4f}, "
+            "max_ms={:.4f})",
+            s.name,
+            s.count,
+            s.totalMs,
+            s.selfMs,
+            s.minMs,
+            s.maxMs);
+      });
+
+  py::class_<PyZone>(
+      m,
+      "Zone",
+      R"(A profiling zone for Python code, used as a context manager::
+
+    with profiler.Zone("load_data"):
+        ...)")
+      .def(py::init<std::string>(), py::arg("name"))
+      .def(
+          "__enter__",
+          [](PyZone& zone) -> PyZone& {
+            zone.enter();
+            return zone;
+          },
+          py::return_value_policy::reference_internal)
+      .def("__exit__", [](PyZone& zone, const py::args& /*args*/) { zone.exit(); });
+
+  m.def(
+      "enable",
+      []() { mp::Profiler::instance().setEnabled(true); },
+      "Start recording profiling zones.");
+
+  m.def(
+      "disable",
+      []() { mp::Profiler::instance().setEnabled(false); },
+      "Stop recording profiling zones; the recorded zones are kept.");
+
+  m.def(
+      "is_enabled",
+      []() { return mp::Profiler::instance().isEnabled(); },
+      "Whether profiling zones are being recorded.");
+
+  m.def("clear", []() { mp::Profiler::instance().clear(); }, "Discard the recorded zones.");
+
+  m.def(
+      "buffer_capacity",
+      []() { return mp::Profiler::instance().bufferCapacity(); },
+      "The maximum number of zones kept per thread.");
+
+  m.def(
+      "set_buffer_capacity",
+      [](size_t capacity) { mp::Profiler::instance().setBufferCapacity(capacity); },
+      R"(Set the maximum number of zones kept per thread, beyond which the oldest zones are overwritten.  Discards the recorded zones.
+
+:param capacity: The number of zones, which must be positive.)",
+      py::arg("capacity"));
+
+  m.def(
+      "set_thread_name",
+      [](const std::string& name) { mp::Profiler::instance().setThreadName(name); },
+      "Name the calling thread in the Chrome trace.",
+      py::arg("name"));
+
+  m.def(
+      "events",
+      []() { return mp::Profiler::instance().events(); },
+      ":return: The recorded zones of all threads, sorted by start time.");
+
+  m.def(
+      "dropped_events",
+      []() { return mp::Profiler::instance().droppedEvents(); },
+      ":return: The number of zones overwritten because a thread's buffer was full since the last :func:`clear`.");
+
+  m.def(
+      "zone_stats",
+      []() { return mp::Profiler::instance().zoneStats(); },
+      ":return: The aggregated timings of the recorded zones per zone name, sorted by decreasing total time.");
+
+  m.def(
+      "zone_stats_table",
+      [](std::optional<size_t> maxRows) {
+        auto stats = mp::Profiler::instance().zoneStats();
+        if (maxRows.has_value() && stats.size() > *maxRows) {
+          stats.resize(*maxRows);
+        }
+        return formatZoneStats(stats);
+      },
+      R"(Format :func:`zone_stats` as a table.
+
+:param max_rows: The maximum number of zones to list; all if None.
+:return: The table, one zone per line.)",
+      py::arg("max_rows") = std::optional<size_t>{});
+
+  m.def(
+      "chrome_trace",
+      []() { return mp::Profiler::instance().chromeTrace(); },
+      ":return: The recorded zones as a Chrome trace event JSON string.");
+
+  m.def(
+      "save_chrome_trace",
+      [](const std::string& path) { mp::Profiler::instance().saveChromeTrace(path); },
+      R"(Save the recorded zones as a Chrome trace event JSON file, viewable in chrome://tracing or https://ui.perfetto.dev.
+
+:param path: The file to write.)",
+      py::arg("path"),
+      py::call_guard<py::gil_scoped_release>());
+}
@@ -0,0 +1,29 @@
+/*
+ * Copyright (c) Meta Platforms, Inc. and affiliates.
+ *
+ * This source code is licensed under the MIT license found in the
+ * LICENSE file in the root directory of this source tree.
+ */
+
+#pragma once
+
+#include <momentum/common/profiler.h>
+
+#include <pybind11/pybind11.h>
+
+namespace pymomentum {
+
+/// Makes the profiling zones of the calling extension module record into the profiler controlled
+/// by pymomentum.profiler.
+///
+/// Each extension module links its own copy of the momentum libraries, and hence has its own
+/// momentum::profiler::Profiler::instance(); call this when initializing every module that
+/// records zones.
+inline void useSharedProfiler() {
+  const auto profiler = pybind11::module_::import(
+      "pymomentum.profiler"); // @dep=fbsource//arvr/libraries/pymomentum:profiler
+  const auto instance = profiler.attr("_instance").cast<pybind11::capsule>();
+  momentum::profiler::Profiler::setInstance(instance.get_pointer<momentum::profiler::Profiler>());
+}
+
+} // namespace pymomentum
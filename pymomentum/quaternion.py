@@ -66,6 +66,7 @@ Note:
 from typing import Sequence, Tuple
 
 import torch
+from pymomentum import fused_kernels
 
 # pyre-strict
 
@@ -102,6 +103,10 @@ def multiply(q1: torch.Tensor, q2: torch.Tensor) -> torch.Tensor:
     :param q2: A quaternion ((x, y, z), w)).
     :return: The normalized product q1*q2.
     """
+    if not torch.jit.is_scripting():
+        if fused_kernels.should_dispatch():
+            return fused_kernels.compiled(multiply)(q1, q2)
+
     return multiply_assume_normalized(normalize(q1), normalize(q2))
 
 
@@ -117,6 +122,10 @@ def multiply_assume_normalized(q1: torch.Tensor, q2: torch.Tensor) -> torch.Tens
     :param q2: A normalized quaternion ((x, y, z), w)).
     :return: The product q1*q2.
     """
+    if not torch.jit.is_scripting():
+        if fused_kernels.should_dispatch():
+            return fused_kernels.compiled(multiply_assume_normalized)(q1, q2)
+
     check(q1)
     check(q2)
 
@@ -209,6 +218,10 @@ def rotate_vector(q: torch.Tensor, v: torch.Tensor) -> torch.Tensor:
     :param v: (nBatch x k x 3) vector.
     :return: (nBatch x k x 3) rotated vectors.
     """
+    if not torch.jit.is_scripting():
+        if fused_kernels.should_dispatch():
+            return fused_kernels.compiled(rotate_vector)(q, v)
+
     return rotate_vector_assume_normalized(normalize(q), v)
 
 
@@ -224,6 +237,10 @@ def rotate_vector_assume_normalized(q: torch.Tensor, v: torch.Tensor) -> torch.T
     :param v: (nBatch x k x 3) vector.
     :return: (nBatch x k x 3) rotated vectors.
     """
+    if not torch.jit.is_scripting():
+        if fused_kernels.should_dispatch():
+            return fused_kernels.compiled(rotate_vector_assume_normalized)(q, v)
+
     check(q)
     r, axis = split(q)
     av = torch.cross(axis, v, -1)
@@ -238,6 +255,10 @@ def to_rotation_matrix_assume_normalized(q: torch.Tensor) -> torch.Tensor:
     :parameter q: (nBatch x k x 4) tensor with the quaternions in ((x, y, z), w) format.
     :return: (nBatch x k x 3 x 3) tensor with 3x3 rotation matrices.
     """
+    if not torch.jit.is_scripting():
+        if fused_kernels.should_dispatch():
+            return fused_kernels.compiled(to_rotation_matrix_assume_normalized)(q)
+
     check(q)
     qx = q.select(-1, 0).unsqueeze(-1)
     qy = q.select(-1, 1).unsqueeze(-1)
@@ -277,6 +298,10 @@ def to_rotation_matrix(q: torch.Tensor) -> torch.Tensor:
     :parameter q: (nBatch x k x 4) tensor with the quaternions in ((x, y, z), w) format.
     :return: (nBatch x k x 3 x 3) tensor with 3x3 rotation matrices.
     """
+    if not torch.jit.is_scripting():
+        if fused_kernels.should_dispatch():
+            return fused_kernels.compiled(to_rotation_matrix)(q)
+
     return to_rotation_matrix_assume_normalized(normalize(q))
 
 
@@ -329,6 +354,10 @@ def euler_xyz_to_quaternion(euler_xyz: torch.Tensor) -> torch.Tensor:
                          in order [roll, pitch, yaw].
     :return: A tensor of shape (..., 4) representing the quaternion in ((x, y, z), w) format.
     """
+    if not torch.jit.is_scripting():
+        if fused_kernels.should_dispatch():
+            return fused_kernels.compiled(euler_xyz_to_quaternion)(euler_xyz)
+
     roll, pitch, yaw = euler_xyz.unbind(-1)
 
     cy = torch.cos(yaw * 0.5)
@@ -502,29 +531,119 @@ def check_and_normalize_weights(
     return weights / weight_sum.expand_as(weights)
 
 
+# Number of times the blend matrix is squared by the "power" blend method.  Each
+# squaring squares the ratio between its two largest eigenvalues.
+_BLEND_NUM_SQUARINGS: int = 6
+
+
+def _blend_eigh(qtq: torch.Tensor) -> torch.Tensor:
+    _, eigenvectors = torch.linalg.eigh(qtq)
+    return eigenvectors.select(dim=-1, index=3)
+
+
+def _blend_power(
+    quaternions: torch.Tensor, weights: torch.Tensor, qtq: torch.Tensor
+) -> torch.Tensor:
+    batch_shape = qtq.shape[:-2]
+    num_quaternions = quaternions.size(-2)
+    quaternions = quaternions.expand(batch_shape + (num_quaternions, 4)).reshape(
+        -1, num_quaternions, 4
+    )
+    weights = weights.expand(batch_shape + (num_quaternions,)).reshape(
+        -1, num_quaternions
+    )
+    qtq = qtq.reshape(-1, 4, 4)
+    tiny = torch.finfo(qtq.dtype).tiny
+
+    # Repeatedly squaring the matrix drives it towards lambda * u * u^T, with u the
+    # dominant eigenvector; renormalizing the trace keeps the entries bounded.  The
+    # batch is moved to the last dimension so that each product is a handful of wide
+    # elementwise operations rather than a batched matmul of tiny matrices.
+    m = qtq.permute(1, 2, 0).contiguous()
+    m = m / (m[0, 0] + m[1, 1] + m[2, 2] + m[3, 3]).clamp(min=tiny)
+    for _ in range(_BLEND_NUM_SQUARINGS):
+        squared = m[:, 0:1] * m[0:1, :]
+        for j in range(1, 4):
+            squared.addcmul_(m[:, j : j + 1], m[j : j + 1, :])
+        m = squared / (
+            squared[0, 0] + squared[1, 1] + squared[2, 2] + squared[3, 3]
+        ).clamp(min=tiny)
+
+    # Once m has converged every column is a multiple of u.  The one with the largest
+    # diagonal entry u_i^2 >= 1/4 cannot vanish, so it is the one that gets normalized.
+    result = m[:, 0]
+    largest_diagonal = m[0, 0]
+    for j in range(1, 4):
+        larger = m[j, j] > largest_diagonal
+        result = torch.where(larger, m[:, j], result)
+        largest_diagonal = torch.where(larger, m[j, j], largest_diagonal)
+    result = result / (
+        result[0].square()
+        + result[1].square()
+        + result[2].square()
+        + result[3].square()
+    ).sqrt().clamp(min=tiny)
+
+    # The trace of m is one, so its Rayleigh quotient at u falls short of one by the sum
+    # of the other (powered) eigenvalues.  Inputs whose two largest eigenvalues are too
+    # close for the squaring to separate them fall back to eigh.
+    m_result = sum(m[:, j] * result[j] for j in range(4))
+    rayleigh = sum(result[i] * m_result[i] for i in range(4))
+    result = result.t()
+    tolerance = 64 * torch.finfo(qtq.dtype).eps
+    degenerate = ~(1 - rayleigh <= tolerance)
+    if bool(degenerate.any()):
+        result = result.index_put((degenerate,), _blend_eigh(qtq[degenerate]))
+
+    # Pick the sign of the result in the hemisphere of the most heavily weighted
+    # quaternion.
+    reference = torch.gather(
+        quaternions, -2, weights.argmax(dim=-1)[:, None, None].expand(-1, 1, 4)
+    ).squeeze(-2)
+    result = torch.where(
+        (result * reference).sum(-1, keepdim=True) < 0, -result, result
+    )
+    return result.reshape(batch_shape + (4,))
+
+
 def blend(
-    quaternions: torch.Tensor, weights_in: torch.Tensor | None = None
+    quaternions: torch.Tensor,
+    weights_in: torch.Tensor | None = None,
+    method: str = "power",
 ) -> torch.Tensor:
     """
     Blend multiple quaternions together using the method described in
     https://stackoverflow.com/questions/12374087/average-of-multiple-quaternions
     and http://www.acsu.buffalo.edu/~johnc/ave_quat07.pdf.
 
+    The blended quaternion is the dominant eigenvector of the weighted sum of the outer
+    products of the quaternions.  The default "power" method finds it by repeatedly
+    squaring that 4x4 matrix, fully vectorized over the batch; inputs where the two
+    largest eigenvalues are too close for it to converge fall back to
+    :func:`torch.linalg.eigh`.  The "eigh" method always runs the eigendecomposition.
+
     :parameter quaternions: A tensor of shape (..., k, 4) representing the quaternions to blend.
     :parameter weights_in: An optional tensor of shape (..., k) representing the weights for each quaternion.
                        If not provided, all quaternions will be weighted equally.
+    :parameter method: Either "power" or "eigh".  With "power" the result lies in the
+                       same hemisphere as the most heavily weighted quaternion; the sign
+                       of the "eigh" result is arbitrary.
     :return: A tensor of shape (..., 4) representing the blended quaternion.
     """
+    if method not in ("power", "eigh"):
+        raise ValueError(f"Expected blend method 'power' or 'eigh'; got '{method}'")
+
     # If no weights, then assume evenly weighted:
     weights = check_and_normalize_weights(quaternions, weights_in)
 
     # Find average rotation by means described in the references above
     check(quaternions)
-    outer_prod = torch.einsum("...i,...k->...ik", [quaternions, quaternions])
-    QtQ = (weights.unsqueeze(-1).unsqueeze(-1) * outer_prod).sum(dim=-3)
-    _, eigenvectors = torch.linalg.eigh(QtQ)
-    result = eigenvectors.select(dim=-1, index=3)
-    return result
+    QtQ = torch.matmul(
+        (weights.unsqueeze(-1) * quaternions).transpose(-1, -2), quaternions
+    )
+    if method == "eigh":
+        return _blend_eigh(QtQ)
+    return _blend_power(quaternions, weights, QtQ)
 
 
 def slerp(q0: torch.Tensor, q1: torch.Tensor, t: torch.Tensor) -> torch.Tensor:
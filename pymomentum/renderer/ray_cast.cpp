@@ -0,0 +1,211 @@
+/*
+ * Copyright (c) Meta Platforms, Inc. and affiliates.
+ *
+ * This source code is licensed under the MIT license found in the
+ * LICENSE file in the root directory of this source tree.
+ */
+
+#include "pymomentum/renderer/ray_cast.h"
+
+#include "pymomentum/tensor_utility/tensor_utility.h"
+
+#include <axel/Ray.h>
+#include <momentum/common/exception.h>
+
+#include <dispenso/parallel_for.h>
+#include <pybind11/pybind11.h>
+
+#include <algorithm>
+#include <span>
+
+namespace pymomentum {
+
+namespace {
+
+// Pixels are traced in square tiles whose rays traverse the BVH together as one packet; neighboring
+// pixels tend to visit the same nodes, so the node visits are shared by the whole tile.
+constexpr int32_t kTileSize = 8;
+
+// Generates the world-space ray through each pixel of the camera, in row-major order. The ray
+// directions have unit eye-space z, so the ray parameter of a hit is its eye-space depth.
+std::vector<axel::Ray3f>
+generateCameraRays(const momentum::rasterizer::Camera& camera, float nearClip, float farClip) {
+  const int32_t width = camera.imageWidth();
+  const int32_t height = camera.imageHeight();
+  const Eigen::Affine3f worldFromEye = camera.worldFromEye();
+  const Eigen::Vector3f origin = worldFromEye.translation();
+  const auto intrinsics = camera.intrinsicsModel();
+
+  std::vector<axel::Ray3f> rays(static_cast<size_t>(width) * height);
+  dispenso::parallel_for(0, height, [&](int32_t y) {
+    for (int32_t x = 0; x < width; ++x) {
+      // Pixel (x, y) is sampled at integer coordinates, consistent with the rasterizer.
+      const auto [eyeDirection, valid] = intrinsics->unproject(Eigen::Vector3f(x, y, 1.0f));
+      // Pixels that can't be unprojected get an empty range so they never hit anything.
+      rays[static_cast<size_t>(y) * width + x] = axel::Ray3f(
+          origin, worldFromEye.linear() * eyeDirection, valid ? farClip : 0.0f, nearClip);
+    }
+  });
+  return rays;
+}
+
+std::tuple<at::Tensor, at::Tensor, at::Tensor> rayCastImpl(
+    std::span<const axel::TriBvh<float>* const> bvhs,
+    const std::vector<momentum::rasterizer::Camera>& cameras,
+    float nearClip,
+    float farClip) {
+  MT_THROW_IF(cameras.empty(), "ray_cast: expected at least one camera.");
+  MT_THROW_IF(nearClip <= 0, "ray_cast: near_clip should be positive.");
+  MT_THROW_IF(farClip <= nearClip, "ray_cast: far_clip should be greater than near_clip.");
+
+  const int32_t width = cameras.front().imageWidth();
+  const int32_t height = cameras.front().imageHeight();
+  for (const auto& camera : cameras) {
+    MT_THROW_IF(
+        camera.imageWidth() != width || camera.imageHeight() != height,
+        "ray_cast: all cameras must have the same image size; got {}x{} and {}x{}.",
+        width,
+        height,
+        camera.imageWidth(),
+        camera.imageHeight());
+  }
+  for (const auto* bvh : bvhs) {
+    MT_THROW_IF(bvh == nullptr, "ray_cast: expected a TriBvh for every mesh, got None.");
+  }
+
+  const auto nMeshes = static_cast<int64_t>(bvhs.size());
+  const auto nCameras = static_cast<int64_t>(cameras.size());
+
+  at::Tensor depth = at::full({nMeshes, nCameras, height, width}, farClip, at::kFloat);
+  at::Tensor triangleIndex = at::full({nMeshes, nCameras, height, width}, -1, at::kInt);
+  at::Tensor barycentric = at::zeros({nMeshes, nCameras, height, width, 3}, at::kFloat);
+
+  // The rays only depend on the camera, so they are shared by all meshes.
+  std::vector<std::vector<axel::Ray3f>> cameraRays;
+  cameraRays.reserve(cameras.size());
+  for (const auto& camera : cameras) {
+    cameraRays.push_back(generateCameraRays(camera, nearClip, farClip));
+  }
+
+  float* depthData = depth.data_ptr<float>();
+  int* triangleIndexData = triangleIndex.data_ptr<int>();
+  float* barycentricData = barycentric.data_ptr<float>();
+
+  const int64_t nTilesX = (width + kTileSize - 1) / kTileSize;
+  const int64_t nTilesY = (height + kTileSize - 1) / kTileSize;
+  const int64_t nTilesPerImage = nTilesX * nTilesY;
+  const int64_t nPixelsPerImage = static_cast<int64_t>(width) * height;
+
+  dispenso::parallel_for(0, nMeshes * nCameras * nTilesPerImage, [&](int64_t iTask) {
+    const int64_t iImage = iTask / nTilesPerImage;
+    const int64_t iTile = iTask % nTilesPerImage;
+    const auto& bvh = *bvhs[iImage / nCameras];
+    const auto& rays = cameraRays[iImage % nCameras];
+
+    const int32_t xBegin = static_cast<int32_t>(iTile % nTilesX) * kTileSize;
+    const int32_t yBegin = static_cast<int32_t>(iTile / nTilesX) * kTileSize;
+    const int32_t xEnd = std::min(xBegin + kTileSize, width);
+    const int32_t yEnd = std::min(yBegin + kTileSize, height);
+
+    std::vector<axel::Ray3f> tileRays;
+    tileRays.reserve(kTileSize * kTileSize);
+    for (int32_t y = yBegin; y < yEnd; ++y) {
+      for (int32_t x = xBegin; x < xEnd; ++x) {
+        tileRays.push_back(rays[static_cast<size_t>(y) * width + x]);
+      }
+    }
+
+    const auto hits = bvh.closestHits(tileRays);
+    size_t iRay = 0;
+    for (int32_t y = yBegin; y < yEnd; ++y) {
+      for (int32_t x = xBegin; x < xEnd; ++x, ++iRay) {
+        const auto& hit = hits[iRay];
+        if (!hit.has_value()) {
+          continue;
+        }
+
+        const int64_t iPixel = iImage * nPixelsPerImage + static_cast<int64_t>(y) * width + x;
+        depthData[iPixel] = hit->hitDistance;
+        triangleIndexData[iPixel] = hit->triangleId;
+        Eigen::Map<Eigen::Vector3f>(barycentricData + 3 * iPixel) = hit->baryCoords;
+      }
+    }
+  });
+
+  return {depth, triangleIndex, barycentric};
+}
+
+} // namespace
+
+std::tuple<at::Tensor, at::Tensor, at::Tensor> rayCastMeshes(
+    at::Tensor positions,
+    at::Tensor triangles,
+    const std::vector<momentum::rasterizer::Camera>& cameras,
+    float nearClip,
+    float farClip) {
+  pybind11::gil_scoped_release release;
+
+  const int nVertsBindingID = -1;
+  const int nTrisBindingID = -2;
+
+  TensorChecker checker("ray_cast");
+  bool squeeze = false;
+  positions = checker.validateAndFixTensor(
+      positions,
+      "vertex_positions",
+      {nVertsBindingID, 3},
+      {"nVertices", "xyz"},
+      at::kFloat,
+      true,
+      false,
+      &squeeze);
+  triangles = checker.validateAndFixTensor(
+      triangles, "triangles", {nTrisBindingID, 3}, {"nTriangles", "xyz"}, at::kInt, true, false);
+
+  const int64_t nBatch = checker.getBatchSize();
+  const int64_t nVertices = checker.getBoundValue(nVertsBindingID);
+  const int64_t nTriangles = checker.getBoundValue(nTrisBindingID);
+  MT_THROW_IF(
+      nTriangles > 0 &&
+          (triangles.min().item<int>() < 0 || triangles.max().item<int>() >= nVertices),
+      "ray_cast: triangle indices must be in the range [0, {}).",
+      nVertices);
+
+  std::vector<axel::TriBvh<float>> bvhs(nBatch);
+  dispenso::parallel_for(0, nBatch, [&](int64_t iBatch) {
+    const at::Tensor positions_cur = positions.select(0, iBatch).contiguous();
+    const at::Tensor triangles_cur = triangles.select(0, iBatch).contiguous();
+    Eigen::MatrixX3f positions_mat =
+        Eigen::Map<const Eigen::Matrix<float, Eigen::Dynamic, 3, Eigen::RowMajor>>(
+            positions_cur.data_ptr<float>(), nVertices, 3);
+    Eigen::MatrixX3i triangles_mat =
+        Eigen::Map<const Eigen::Matrix<int, Eigen::Dynamic, 3, Eigen::RowMajor>>(
+            triangles_cur.data_ptr<int>(), nTriangles, 3);
+    bvhs[iBatch] = axel::TriBvh<float>(std::move(positions_mat), std::move(triangles_mat));
+  });
+
+  std::vector<const axel::TriBvh<float>*> bvhPtrs;
+  bvhPtrs.reserve(bvhs.size());
+  for (const auto& bvh : bvhs) {
+    bvhPtrs.push_back(&bvh);
+  }
+
+  auto [depth, triangleIndex, barycentric] = rayCastImpl(bvhPtrs, cameras, nearClip, farClip);
+  if (squeeze) {
+    depth = depth.squeeze(0);
+    triangleIndex = triangleIndex.squeeze(0);
+    barycentric = barycentric.squeeze(0);
+  }
+  return {depth, triangleIndex, barycentric};
+}
+
+std::tuple<at::Tensor, at::Tensor, at::Tensor> rayCastBvhs(
+    const std::vector<const axel::TriBvh<float>*>& bvhs,
+    const std::vector<momentum::rasterizer::Camera>& cameras,
+    float nearClip,
+    float farClip) {
+  pybind11::gil_scoped_release release;
+  return rayCastImpl(bvhs, cameras, nearClip, farClip);
+}
+
+} // namespace pymomentum
@@ -0,0 +1,38 @@
+/*
+ * Copyright (c) Meta Platforms, Inc. and affiliates.
+ *
+ * This source code is licensed under the MIT license found in the
+ * LICENSE file in the root directory of this source tree.
+ */
+
+#pragma once
+
+#include <axel/TriBvh.h>
+#include <momentum/rasterizer/camera.h>
+
+#include <ATen/ATen.h>
+
+#include <tuple>
+#include <vector>
+
+namespace pymomentum {
+
+// Casts one ray through every pixel of every camera against every mesh, tracing square tiles of
+// pixels as coherent ray packets with the (mesh, camera, tile) triples processed in parallel.
+// Returns the eye-space depth, triangle index and barycentric coordinates of the closest hit of
+// each pixel as [nMeshes x nCameras x height x width (x 3)] tensors.
+std::tuple<at::Tensor, at::Tensor, at::Tensor> rayCastMeshes(
+    at::Tensor positions,
+    at::Tensor triangles,
+    const std::vector<momentum::rasterizer::Camera>& cameras,
+    float nearClip,
+    float farClip);
+
+// Same as above, but for meshes that are already stored in bounding volume hierarchies.
+std::tuple<at::Tensor, at::Tensor, at::Tensor> rayCastBvhs(
+    const std::vector<const axel::TriBvh<float>*>& bvhs,
+    const std::vector<momentum::rasterizer::Camera>& cameras,
+    float nearClip,
+    float farClip);
+
+} // namespace pymomentum
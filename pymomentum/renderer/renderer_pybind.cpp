@@ -5,8 +5,10 @@
  * LICENSE file in the root directory of this source tree.
  */
 
+#include <pymomentum/profiler/profiler_pybind.h>
 #include <pymomentum/renderer/mesh_processing.h>
 #include <pymomentum/renderer/momentum_render.h>
+#include <pymomentum/renderer/ray_cast.h>
 #include <pymomentum/renderer/software_rasterizer.h>
 #include <pymomentum/tensor_momentum/tensor_parameter_transform.h>
 #include <pymomentum/tensor_momentum/tensor_skeleton_state.h>
@@ -38,6 +40,8 @@ PYBIND11_MODULE(renderer, m) {
   pybind11::module_::import("torch"); // @dep=//caffe2:torch
   pybind11::module_::import(
       "pymomentum.geometry"); // @dep=fbsource//arvr/libraries/pymomentum:geometry
+  pybind11::module_::import("pymomentum.axel"); // @dep=fbsource//arvr/libraries/pymomentum:axel
+  pymomentum::useSharedProfiler();
 
   // Bind IntrinsicsModel and its derived classes
   py::class_<
@@ -890,6 +894,46 @@ Notes:
       py::arg("depth_offset") = 0.0f,
       py::arg("image_offset") = std::optional<Eigen::Vector2f>{});
 
+  m.def(
+      "ray_cast",
+      &rayCastMeshes,
+      R"(Ray cast a batch of triangle meshes from a list of cameras, with one ray through every pixel.  This produces the same depth as :meth:`rasterize_mesh` but renders all meshes and cameras in a single call, which is useful for e.g. computing per-pixel visibility for many characters and views at once.
+
+Each mesh is stored in a bounding volume hierarchy, and square tiles of pixels are traced as coherent ray packets; the (mesh, camera, tile) combinations are processed in parallel.  Unlike the rasterizer buffers, the returned buffers are not padded.
+
+:param vertex_positions: (nBatch x nVert x 3) or (nVert x 3) Tensor of vertex positions.
+:param triangles: (nTri x 3) Tensor of triangles.
+:param cameras: List of cameras to render from.  All cameras must have the same image size.
+:param near_clip: Ignore any hits closer than this depth.  Defaults to 0.1.
+:param far_clip: Ignore any hits farther than this depth; also the depth of pixels that hit nothing.
+
+:return: A tuple (depth, triangle_index, barycentric) of buffers of shape (nBatch x nCameras x height x width), (nBatch x nCameras x height x width), and (nBatch x nCameras x height x width x 3), where the nBatch dimension is dropped if the vertex positions are unbatched.  depth is the eye-space depth of the closest hit, triangle_index is the index of the hit triangle or -1 if the pixel hits nothing, and barycentric holds the barycentric coordinates of the hit within its triangle.
+)",
+      py::arg("vertex_positions"),
+      py::arg("triangles"),
+      py::arg("cameras"),
+      py::kw_only(),
+      py::arg("near_clip") = 0.1f,
+      py::arg("far_clip") = FLT_MAX);
+
+  m.def(
+      "ray_cast",
+      &rayCastBvhs,
+      R"(Ray cast a list of prebuilt :class:`pymomentum.axel.TriBvh` meshes from a list of cameras, with one ray through every pixel.  Avoids rebuilding the trees, e.g. for meshes that are refitted every frame with :meth:`pymomentum.axel.TriBvh.refit`.
+
+:param bvhs: List of meshes to render.
+:param cameras: List of cameras to render from.  All cameras must have the same image size.
+:param near_clip: Ignore any hits closer than this depth.  Defaults to 0.1.
+:param far_clip: Ignore any hits farther than this depth; also the depth of pixels that hit nothing.
+
+:return: A tuple (depth, triangle_index, barycentric) of buffers of shape (nBvhs x nCameras x height x width), (nBvhs x nCameras x height x width), and (nBvhs x nCameras x height x width x 3); see the tensor overload for details.
+)",
+      py::arg("bvhs"),
+      py::arg("cameras"),
+      py::kw_only(),
+      py::arg("near_clip") = 0.1f,
+      py::arg("far_clip") = FLT_MAX);
+
   m.def(
       "rasterize_wireframe",
       &rasterizeWireframe,
@@ -55,7 +55,7 @@ Note:
 from typing import Sequence
 
 import torch
-from pymomentum import quaternion
+from pymomentum import fused_kernels, quaternion
 
 # pyre-strict
 
@@ -250,6 +250,10 @@ def multiply(s1: torch.Tensor, s2: torch.Tensor) -> torch.Tensor:
     :return: The product of the two skeleton states.
     :rtype: torch.Tensor
     """
+    if not torch.jit.is_scripting():
+        if fused_kernels.should_dispatch():
+            return fused_kernels.compiled(multiply)(s1, s2)
+
     check(s1)
     check(s2)
     while s1.ndim < s2.ndim:
@@ -273,6 +277,10 @@ def multiply_assume_normalized(s1: torch.Tensor, s2: torch.Tensor) -> torch.Tens
     :return: The product of the two skeleton states.
     :rtype: torch.Tensor
     """
+    if not torch.jit.is_scripting():
+        if fused_kernels.should_dispatch():
+            return fused_kernels.compiled(multiply_assume_normalized)(s1, s2)
+
     while s1.ndim < s2.ndim:
         s1 = s1.unsqueeze(0)
 
@@ -382,7 +390,9 @@ def identity(
 
 
 def blend(
-    skel_states: torch.Tensor, weights: torch.Tensor | None = None
+    skel_states: torch.Tensor,
+    weights: torch.Tensor | None = None,
+    method: str = "power",
 ) -> torch.Tensor:
     """
     Blend k skeleton states with the passed-in weights.
@@ -390,12 +400,13 @@ def blend(
     :parameter skel_states: The skeleton states to blend.
     :type skel_states: torch.Tensor
     :parameter weights: The weights to use, if not provided, weights are assumed to be all 1s
+    :parameter method: The quaternion blend method; see :func:`pymomentum.quaternion.blend`.
     :return: The blended skeleton state.
     """
     t, q, s = split(skel_states)
     weights = quaternion.check_and_normalize_weights(q, weights)
     t_blend = (weights.unsqueeze(-1).expand_as(t) * t).sum(-2)
-    q_blend = quaternion.blend(q, weights)
+    q_blend = quaternion.blend(q, weights, method=method)
     s_blend = (weights.unsqueeze(-1).expand_as(s) * s).sum(-2)
     return torch.cat((t_blend, q_blend, s_blend), -1)
 
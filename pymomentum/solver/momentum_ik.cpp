@@ -1088,6 +1088,253 @@ torch::Tensor solveBodyIKProblem(
       denullify(vertexProjCons_projections))[0];
 }
 
+IKSolver::IKSolver(
+    py::object characters,
+    at::Tensor activeParameters,
+    std::vector<ErrorFunctionType> activeErrorFunctions,
+    SolverOptions options,
+    py::object posePrior_model,
+    momentum::VertexConstraintType vertexCons_type)
+    : _characters(std::move(characters)),
+      _activeParameters(std::move(activeParameters)),
+      _activeErrorFunctions(std::move(activeErrorFunctions)),
+      _options(options),
+      _posePriorModel(std::move(posePrior_model)),
+      _vertexConsType(vertexCons_type) {
+  // Validate the character argument up front rather than on the first solve.
+  anyCharacter(_characters.ptr(), "IKSolver()");
+
+  // The pose prior is fixed, so unpack it once while we hold the GIL.
+  TensorMppcaModel mppcaModel = extractMppcaModel(_posePriorModel);
+  _mppcaPi = mppcaModel.pi;
+  _mppcaMu = mppcaModel.mu;
+  _mppcaW = mppcaModel.W;
+  _mppcaSigma = mppcaModel.sigma;
+  _mppcaParameterIndices = mppcaModel.parameterIndices;
+  if (mppcaModel.mppca && !mppcaModel.mppca.is_none()) {
+    _mppca = py::cast<const momentum::Mppca*>(mppcaModel.mppca);
+  }
+}
+
+IKSolver::~IKSolver() = default;
+
+// All the methods that take the mutex release the GIL first: a thread blocked
+// on the mutex must not hold the GIL that the thread owning the mutex may need.
+
+void IKSolver::reset() {
+  py::gil_scoped_release release;
+  std::lock_guard<std::mutex> lock(_mutex);
+  _modelParameters = at::Tensor();
+}
+
+std::optional<at::Tensor> IKSolver::modelParameters() const {
+  py::gil_scoped_release release;
+  std::lock_guard<std::mutex> lock(_mutex);
+  if (!_modelParameters.defined()) {
+    return {};
+  }
+  return _squeezeOutput ? _modelParameters.squeeze(0) : _modelParameters;
+}
+
+std::optional<std::tuple<at::Tensor, at::Tensor, at::Tensor>> IKSolver::batchStatistics() const {
+  py::gil_scoped_release release;
+  std::lock_guard<std::mutex> lock(_mutex);
+  if (!_batchStatistics.has_value()) {
+    return {};
+  }
+  return batchSolveStatisticsToTensors(*_batchStatistics);
+}
+
+at::Tensor IKSolver::solve(
+    at::Tensor errorFunctionWeights,
+    std::optional<at::Tensor> modelParameters_init,
+    std::optional<at::Tensor> positionCons_parents,
+    std::optional<at::Tensor> positionCons_offsets,
+    std::optional<at::Tensor> positionCons_weights,
+    std::optional<at::Tensor> positionCons_targets,
+    std::optional<at::Tensor> orientation_parents,
+    std::optional<at::Tensor> orientation_offsets,
+    std::optional<at::Tensor> orientation_weights,
+    std::optional<at::Tensor> orientation_targets,
+    std::optional<at::Tensor> motion_targets,
+    std::optional<at::Tensor> motion_weights,
+    std::optional<at::Tensor> projectionCons_projections,
+    std::optional<at::Tensor> projectionCons_parents,
+    std::optional<at::Tensor> projectionCons_offsets,
+    std::optional<at::Tensor> projectionCons_weights,
+    std::optional<at::Tensor> projectionCons_targets,
+    std::optional<at::Tensor> distanceCons_origins,
+    std::optional<at::Tensor> distanceCons_parents,
+    std::optional<at::Tensor> distanceCons_offsets,
+    std::optional<at::Tensor> distanceCons_weights,
+    std::optional<at::Tensor> distanceCons_targets,
+    std::optional<at::Tensor> vertexCons_vertices,
+    std::optional<at::Tensor> vertexCons_weights,
+    std::optional<at::Tensor> vertexCons_target_positions,
+    std::optional<at::Tensor> vertexCons_target_normals,
+    std::optional<at::Tensor> vertexProjCons_vertices,
+    std::optional<at::Tensor> vertexProjCons_weights,
+    std::optional<at::Tensor> vertexProjCons_target_positions,
+    std::optional<at::Tensor> vertexProjCons_projections) {
+  py::gil_scoped_release release;
+  std::lock_guard<std::mutex> lock(_mutex);
+
+  // Warm start from the previous solution unless the caller overrides it.
+  at::Tensor modelParams_init;
+  bool squeeze = _squeezeOutput;
+  if (modelParameters_init.has_value() && !isEmpty(*modelParameters_init)) {
+    modelParams_init = *modelParameters_init;
+    squeeze = (modelParams_init.ndimension() == 1);
+    if (squeeze) {
+      modelParams_init = modelParams_init.unsqueeze(0);
+    }
+  } else {
+    MT_THROW_IF(
+        !_modelParameters.defined(),
+        "IKSolver.solve(): model_parameters_init is required for the first solve (or after reset()).");
+    modelParams_init = _modelParameters;
+  }
+  MT_THROW_IF(
+      modelParams_init.ndimension() != 2,
+      "IKSolver.solve(): expected model_parameters_init of size [nBatch] x nModelParams; got {}",
+      formatTensorSizes(modelParams_init));
+
+  const int64_t nBatch = modelParams_init.size(0);
+  std::vector<const momentum::Character*> characters;
+  {
+    py::gil_scoped_acquire acquire;
+    characters = toCharacterList(_characters.ptr(), nBatch, "IKSolver.solve()");
+  }
+
+  const at::Tensor positionParents = denullify(positionCons_parents);
+  const at::Tensor positionOffsets = denullify(positionCons_offsets);
+  const at::Tensor positionWeights = denullify(positionCons_weights);
+  const at::Tensor positionTargets = denullify(positionCons_targets);
+  const at::Tensor orientationParents = denullify(orientation_parents);
+  const at::Tensor orientationOffsets = denullify(orientation_offsets);
+  const at::Tensor orientationWeights = denullify(orientation_weights);
+  const at::Tensor orientationTargets = denullify(orientation_targets);
+  const at::Tensor motionTargets = denullify(motion_targets);
+  const at::Tensor motionWeights = denullify(motion_weights);
+  const at::Tensor projectionProjections = denullify(std::move(projectionCons_projections));
+  const at::Tensor projectionParents = denullify(projectionCons_parents);
+  const at::Tensor projectionOffsets = denullify(projectionCons_offsets);
+  const at::Tensor projectionWeights = denullify(projectionCons_weights);
+  const at::Tensor projectionTargets = denullify(projectionCons_targets);
+  const at::Tensor distanceOrigins = denullify(std::move(distanceCons_origins));
+  const at::Tensor distanceParents = denullify(distanceCons_parents);
+  const at::Tensor distanceOffsets = denullify(distanceCons_offsets);
+  const at::Tensor distanceWeights = denullify(distanceCons_weights);
+  const at::Tensor distanceTargets = denullify(distanceCons_targets);
+  const at::Tensor vertexVertices = denullify(vertexCons_vertices);
+  const at::Tensor vertexWeights = denullify(vertexCons_weights);
+  const at::Tensor vertexTargetPositions = denullify(vertexCons_target_positions);
+  const at::Tensor vertexTargetNormals = denullify(vertexCons_target_normals);
+  const at::Tensor vertexProjVertices = denullify(vertexProjCons_vertices);
+  const at::Tensor vertexProjWeights = denullify(vertexProjCons_weights);
+  const at::Tensor vertexProjTargetPositions = denullify(vertexProjCons_target_positions);
+  const at::Tensor vertexProjProjections = denullify(vertexProjCons_projections);
+
+  const auto solveWith = [&]<typename T>(std::unique_ptr<TensorIKSolver<T>>& solver) {
+    // The per-batch-element solver state depends only on the characters, so
+    // it only needs rebuilding when the batch changes.
+    if (!solver || solver->characters() != characters) {
+      solver = std::make_unique<TensorIKSolver<T>>(
+          characters,
+          tensorToParameterSet(
+              characters[0]->parameterTransform, _activeParameters, DefaultParameterSet::ALL_ONES),
+          _options);
+    }
+
+    const auto [errorFunctions, errorWeightsMap] = createIKProblem<T>(
+        characters,
+        nBatch,
+        0,
+        _activeErrorFunctions,
+        positionParents,
+        positionOffsets,
+        positionWeights,
+        positionTargets,
+        orientationParents,
+        orientationOffsets,
+        orientationWeights,
+        orientationTargets,
+        _mppcaPi,
+        _mppcaMu,
+        _mppcaW,
+        _mppcaSigma,
+        _mppcaParameterIndices,
+        _mppca,
+        motionTargets,
+        motionWeights,
+        projectionProjections,
+        projectionParents,
+        projectionOffsets,
+        projectionWeights,
+        projectionTargets,
+        distanceOrigins,
+        distanceParents,
+        distanceOffsets,
+        distanceWeights,
+        distanceTargets,
+        vertexVertices,
+        vertexWeights,
+        vertexTargetPositions,
+        vertexTargetNormals,
+        _vertexConsType,
+        vertexProjVertices,
+        vertexProjWeights,
+        vertexProjTargetPositions,
+        vertexProjProjections);
+
+    at::Tensor result = solver->solve(
+        modelParams_init,
+        errorFunctions,
+        errorFunctionWeights,
+        _activeErrorFunctions.size(),
+        errorWeightsMap);
+    _batchStatistics = solver->lastBatchStatistics();
+    return result;
+  };
+
+  at::Tensor result;
+  if (hasFloat64(
+          modelParams_init,
+          errorFunctionWeights,
+          positionOffsets,
+          positionWeights,
+          positionTargets,
+          orientationOffsets,
+          orientationWeights,
+          orientationTargets,
+          motionTargets,
+          motionWeights,
+          projectionProjections,
+          projectionOffsets,
+          projectionWeights,
+          projectionTargets,
+          distanceOrigins,
+          distanceOffsets,
+          distanceWeights,
+          distanceTargets,
+          vertexWeights,
+          vertexTargetPositions,
+          vertexTargetNormals,
+          vertexProjWeights,
+          vertexProjTargetPositions,
+          vertexProjProjections)) {
+    result = solveWith(_solverDouble);
+  } else {
+    result = solveWith(_solverFloat);
+  }
+
+  throwIfNaNOrINF(result, "IKSolver.solve()", "result");
+
+  _modelParameters = result;
+  _squeezeOutput = squeeze;
+  return squeeze ? result.squeeze(0) : result;
+}
+
 torch::Tensor computeGradient(
     py::object characters,
     at::Tensor modelParameters,
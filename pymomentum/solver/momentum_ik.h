@@ -8,6 +8,7 @@
 #pragma once
 
 #include <pymomentum/tensor_ik/solver_options.h>
+#include <pymomentum/tensor_ik/tensor_ik.h>
 
 #include <momentum/character_solver/vertex_error_function.h>
 #include <momentum/math/mppca.h>
@@ -17,7 +18,10 @@
 #include <torch/extension.h> // @manual=//caffe2:torch_extension
 #include <torch/torch.h>
 
+#include <memory>
+#include <mutex>
 #include <optional>
+#include <tuple>
 
 namespace pymomentum {
 
@@ -223,6 +227,108 @@ at::Tensor solveBodySequenceIKProblem(
     std::optional<at::Tensor> vertexProjCons_target_positions,
     std::optional<at::Tensor> vertexProjCons_projections);
 
+// Stateful, reusable version of solveBodyIKProblem() for repeatedly solving
+// problems with the same structure, e.g. one solve per frame in a tracking
+// loop.  The characters, active parameters, error function layout, pose prior
+// and vertex constraint type are fixed at construction; solve() only takes
+// the error function weights and the constraint tensors and warm-starts from
+// the previous result.  See TensorIKSolver for what gets reused; the pose
+// prior is unpacked once at construction, while the TensorErrorFunctions that
+// wrap the constraint tensors are recreated by every solve().
+//
+// Unlike solveBodyIKProblem(), the solve is not differentiable.  Concurrent
+// calls on the same IKSolver are serialized.
+class IKSolver {
+ public:
+  IKSolver(
+      pybind11::object characters,
+      at::Tensor activeParameters,
+      std::vector<ErrorFunctionType> activeErrorFunctions,
+      SolverOptions options,
+      pybind11::object posePrior_model,
+      momentum::VertexConstraintType vertexCons_type);
+  ~IKSolver();
+
+  at::Tensor solve(
+      at::Tensor errorFunctionWeights,
+      std::optional<at::Tensor> modelParameters_init,
+      std::optional<at::Tensor> positionCons_parents,
+      std::optional<at::Tensor> positionCons_offsets,
+      std::optional<at::Tensor> positionCons_weights,
+      std::optional<at::Tensor> positionCons_targets,
+      std::optional<at::Tensor> orientation_parents,
+      std::optional<at::Tensor> orientation_offsets,
+      std::optional<at::Tensor> orientation_weights,
+      std::optional<at::Tensor> orientation_targets,
+      std::optional<at::Tensor> motion_targets,
+      std::optional<at::Tensor> motion_weights,
+      std::optional<at::Tensor> projectionCons_projections,
+      std::optional<at::Tensor> projectionCons_parents,
+      std::optional<at::Tensor> projectionCons_offsets,
+      std::optional<at::Tensor> projectionCons_weights,
+      std::optional<at::Tensor> projectionCons_targets,
+      std::optional<at::Tensor> distanceCons_origins,
+      std::optional<at::Tensor> distanceCons_parents,
+      std::optional<at::Tensor> distanceCons_offsets,
+      std::optional<at::Tensor> distanceCons_weights,
+      std::optional<at::Tensor> distanceCons_targets,
+      std::optional<at::Tensor> vertexCons_vertices,
+      std::optional<at::Tensor> vertexCons_weights,
+      std::optional<at::Tensor> vertexCons_target_positions,
+      std::optional<at::Tensor> vertexCons_target_normals,
+      std::optional<at::Tensor> vertexProjCons_vertices,
+      std::optional<at::Tensor> vertexProjCons_weights,
+      std::optional<at::Tensor> vertexProjCons_target_positions,
+      std::optional<at::Tensor> vertexProjCons_projections);
+
+  // Drop the warm-start state; the next solve() needs model parameters again.
+  void reset();
+
+  // Result of the most recent solve(), if any.
+  [[nodiscard]] std::optional<at::Tensor> modelParameters() const;
+
+  // Per-element statistics of the most recent solve(), if any; see
+  // batchSolveStatisticsToTensors().
+  [[nodiscard]] std::optional<std::tuple<at::Tensor, at::Tensor, at::Tensor>> batchStatistics()
+      const;
+
+  [[nodiscard]] const std::vector<ErrorFunctionType>& activeErrorFunctions() const {
+    return _activeErrorFunctions;
+  }
+
+  [[nodiscard]] const SolverOptions& options() const {
+    return _options;
+  }
+
+ private:
+  pybind11::object _characters;
+  at::Tensor _activeParameters;
+  std::vector<ErrorFunctionType> _activeErrorFunctions;
+  SolverOptions _options;
+  pybind11::object _posePriorModel;
+  momentum::VertexConstraintType _vertexConsType;
+
+  // Unpacked _posePriorModel; _mppca points into it if it is an Mppca object.
+  at::Tensor _mppcaPi;
+  at::Tensor _mppcaMu;
+  at::Tensor _mppcaW;
+  at::Tensor _mppcaSigma;
+  at::Tensor _mppcaParameterIndices;
+  const momentum::Mppca* _mppca = nullptr;
+
+  // Solver state, created on first use for the scalar type of the inputs.
+  std::unique_ptr<TensorIKSolver<float>> _solverFloat;
+  std::unique_ptr<TensorIKSolver<double>> _solverDouble;
+
+  // Batched (nBatch x nModelParams) result of the last solve, used to
+  // warm-start the next one.
+  at::Tensor _modelParameters;
+  bool _squeezeOutput = false;
+  std::optional<BatchSolveStatistics> _batchStatistics;
+
+  mutable std::mutex _mutex;
+};
+
 at::Tensor transformPose(
     const momentum::Character& character,
     at::Tensor modelParams,
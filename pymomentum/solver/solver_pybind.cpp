@@ -5,6 +5,7 @@
  * LICENSE file in the root directory of this source tree.
  */
 
+#include "pymomentum/profiler/profiler_pybind.h"
 #include "pymomentum/solver/momentum_ik.h"
 #include "pymomentum/tensor_ik/solver_options.h"
 #include "pymomentum/tensor_ik/tensor_ik.h"
@@ -33,6 +34,7 @@ PYBIND11_MODULE(solver, m) {
       "pymomentum.geometry"); // @dep=fbsource//arvr/libraries/pymomentum:geometry
   auto solver2 = pybind11::module_::import(
       "pymomentum.solver2"); // @dep=fbsource//arvr/libraries/pymomentum:solver2
+  pymomentum::useSharedProfiler();
 
   m.attr("VertexConstraintType") = solver2.attr("VertexConstraintType").attr("Position");
 
@@ -68,7 +70,12 @@ PYBIND11_MODULE(solver, m) {
                         float threshold,
                         bool lineSearch,
                         float sequenceSmoothingWeight,
-                        bool verbose) {
+                        bool verbose,
+                        size_t batchChunkSize,
+                        float timeBudget,
+                        size_t iterationBudget,
+                        size_t sequenceWindowSize,
+                        size_t sequenceWindowOverlap) {
             return SolverOptions{
                 linearSolverType,
                 levmar_lambda,
@@ -77,7 +84,12 @@ PYBIND11_MODULE(solver, m) {
                 threshold,
                 lineSearch,
                 sequenceSmoothingWeight,
-                verbose};
+                verbose,
+                batchChunkSize,
+                timeBudget,
+                iterationBudget,
+                sequenceWindowSize,
+                sequenceWindowOverlap};
           }),
           py::arg("linear_solver") = LinearSolverType::QR,
           py::arg("levmar_lambda") = 0.01f,
@@ -86,7 +98,12 @@ PYBIND11_MODULE(solver, m) {
           py::arg("threshold") = 10.0f,
           py::arg("line_search") = true,
           py::arg("sequence_smoothing_weight") = 0.0f,
-          py::arg("verbose") = false)
+          py::arg("verbose") = false,
+          py::arg("batch_chunk_size") = 0,
+          py::arg("time_budget") = 0.0f,
+          py::arg("iteration_budget") = 0,
+          py::arg("sequence_window_size") = 0,
+          py::arg("sequence_window_overlap") = 0)
       .def_readwrite(
           "linear_solver",
           &SolverOptions::linearSolverType,
@@ -113,16 +130,41 @@ PYBIND11_MODULE(solver, m) {
           "Whether or not to use a line search; note that only the QR solver actually uses this (default: true).")
       .def_readwrite(
           "verbose", &SolverOptions::verbose, "Flag to print out solver progress (default: false).")
+      .def_readwrite(
+          "batch_chunk_size",
+          &SolverOptions::batchChunkSize,
+          "If nonzero, batch elements are handed out to the worker threads dynamically in chunks of this size, so threads that finish early pick up the remaining work; 0 uses one task per batch element (default: 0).")
+      .def_readwrite(
+          "time_budget",
+          &SolverOptions::timeBudget,
+          "Wall-clock budget in seconds shared by all the batch elements of a single solve; once used up, every element stops after its current iteration.  0 means unlimited (default: 0).")
+      .def_readwrite(
+          "iteration_budget",
+          &SolverOptions::iterationBudget,
+          "Total number of solver iterations shared by all the batch elements of a single solve; once used up, every element stops after its current iteration.  0 means unlimited (default: 0).")
+      .def_readwrite(
+          "sequence_window_size",
+          &SolverOptions::sequenceWindowSize,
+          "Only used by :meth:`solve_sequence_ik`: if nonzero, the sequence is solved as overlapping windows of this many frames in parallel, which are then blended across the overlap; shared parameters are set to their average over the stitched sequence, and the windows are then solved again for the per-frame parameters with the shared ones fixed.  Memory use is bounded by the window size rather than the sequence length.  0 solves the whole sequence at once (default: 0).")
+      .def_readwrite(
+          "sequence_window_overlap",
+          &SolverOptions::sequenceWindowOverlap,
+          "Only used by :meth:`solve_sequence_ik`: number of frames shared by neighboring windows, see sequence_window_size; must be smaller than the window size (default: 0).")
       .def("__repr__", [](const SolverOptions& options) {
         return fmt::format(
-            "SolverOptions(linear_solver=LinearSolverType.{}, levmar_lambda={}, min_iter={}, max_iter={}, threshold={}, line_search={}, verbose={})",
+            "SolverOptions(linear_solver=LinearSolverType.{}, levmar_lambda={}, min_iter={}, max_iter={}, threshold={}, line_search={}, verbose={}, batch_chunk_size={}, time_budget={}, iteration_budget={}, sequence_window_size={}, sequence_window_overlap={})",
             toString(options.linearSolverType),
             options.levmar_lambda,
             options.minIter,
             options.maxIter,
             options.threshold,
             (options.lineSearch ? "True" : "False"),
-            (options.verbose ? "True" : "False"));
+            (options.verbose ? "True" : "False"),
+            options.batchChunkSize,
+            options.timeBudget,
+            options.iterationBudget,
+            options.sequenceWindowSize,
+            options.sequenceWindowOverlap);
       });
 
   m.def(
@@ -425,6 +467,10 @@ The constraints are the same ones available in :meth:`solve_ik`, except that ins
 per-batch and per-frame dimension (if you want to share parents across all frames and the entire batch) but you cannot skip one or the other unless nBatch is 1.
 This is to prevent confusing ambiguities in whether you meant sharing across the batch dimension or the frame dimension.
 
+By default the whole sequence is solved as a single problem, so cost and memory grow with nFrames.  For long sequences, set
+:attr:`SolverOptions.sequence_window_size` and :attr:`SolverOptions.sequence_window_overlap` to solve overlapping windows in parallel
+and blend them across the overlap.
+
 :param character: Character or list of nBatch Characters to use in the solve.
 :param activeParameters: boolean-valued torch.Tensor with dimension (k), which selects all the parameters (both shared and per-frame) to be active during the solve.
 :param sharedParameters: boolean-valued torch.Tensor with dimension (k), which selects all the parameters to be shared across the frames (typically this would be scale or shape parameters).
@@ -470,6 +516,98 @@ This is to prevent confusing ambiguities in whether you meant sharing across the
       py::arg("vertex_proj_cons_target_positions") = std::optional<at::Tensor>{},
       py::arg("vertex_proj_cons_projections") = std::optional<at::Tensor>{});
 
+  py::class_<IKSolver>(
+      m,
+      "IKSolver",
+      R"(Reusable batched IK solver for repeatedly solving problems with the same structure, e.g. one :meth:`solve_ik`-style solve per video frame in a tracking loop.
+
+The character(s), active parameters, error function layout, pose prior and vertex constraint type are fixed when the solver is created.  The per-batch-element solver state (parameter transform, solver function, solver and its work buffers, and error functions that don't depend on any tensor input such as limits and collisions) is built once and reused, so each call to :meth:`solve` only pays for building the constraints and the actual optimization.  By default each solve is initialized from the previous result.
+
+The GIL is released while solving.  Concurrent calls on the same solver are serialized; use one solver per thread to solve in parallel.
+
+Unlike :meth:`solve_ik`, the solve is not differentiable.)")
+      .def(
+          py::init<
+              py::object,
+              at::Tensor,
+              std::vector<ErrorFunctionType>,
+              SolverOptions,
+              py::object,
+              momentum::VertexConstraintType>(),
+          R"(Create a reusable IK solver.
+
+:param character: Character or list of nBatch Characters to use in the solve.
+:param active_parameters: boolean-valued torch.Tensor with dimension (k), which selects the parameters to be active during the solve.
+:param active_error_functions: list of pymomentum.ErrorFunctionType which gives the order of input error function types; this also fixes the order of the columns in error_function_weights passed to :meth:`solve`.
+:param options: Solver options, see :class:`SolverOptions`.
+:param pose_prior_model: Mixture-PCA model used by the pose prior, see :meth:`solve_ik`.
+:param vertex_cons_type: Type of vertex constraint, see :meth:`solve_ik`.)",
+          py::arg("character"),
+          py::arg("active_parameters"),
+          py::arg("active_error_functions"),
+          py::arg("options") = SolverOptions(),
+          py::arg("pose_prior_model") = std::optional<at::Tensor>{},
+          py::arg("vertex_cons_type") = momentum::VertexConstraintType::Position)
+      .def(
+          "solve",
+          &IKSolver::solve,
+          R"(Solve the IK problem for the given constraints.
+
+All constraint arguments have the same meaning and dimensions as in :meth:`solve_ik`.
+
+:param error_function_weights: float-valued torch.Tensor with dimension (nBatch x len(active_error_functions)) which contains a global weight for each active error function.
+:param model_parameters_init: Optional (nBatch x nModelParameters) initial model parameters.  If omitted, the solve is initialized from the result of the previous call; it is required for the first solve and after :meth:`reset`.
+:return: The model parameters that (locally) minimize the error function, as a (nBatch x nModelParams)-dimension torch.Tensor.)",
+          py::arg("error_function_weights"),
+          py::arg("model_parameters_init") = std::optional<at::Tensor>{},
+          py::arg("position_cons_parents") = std::optional<at::Tensor>{},
+          py::arg("position_cons_offsets") = std::optional<at::Tensor>{},
+          py::arg("position_cons_weights") = std::optional<at::Tensor>{},
+          py::arg("position_cons_targets") = std::optional<at::Tensor>{},
+          py::arg("orientation_cons_parents") = std::optional<at::Tensor>{},
+          py::arg("orientation_cons_offsets") = std::optional<at::Tensor>{},
+          py::arg("orientation_cons_weights") = std::optional<at::Tensor>{},
+          py::arg("orientation_cons_targets") = std::optional<at::Tensor>{},
+          py::arg("motion_targets") = std::optional<at::Tensor>{},
+          py::arg("motion_weights") = std::optional<at::Tensor>{},
+          py::arg("projection_cons_projections") = std::optional<at::Tensor>{},
+          py::arg("projection_cons_parents") = std::optional<at::Tensor>{},
+          py::arg("projection_cons_offsets") = std::optional<at::Tensor>{},
+          py::arg("projection_cons_weights") = std::optional<at::Tensor>{},
+          py::arg("projection_cons_targets") = std::optional<at::Tensor>{},
+          py::arg("distance_cons_origins") = std::optional<at::Tensor>{},
+          py::arg("distance_cons_parents") = std::optional<at::Tensor>{},
+          py::arg("distance_cons_offsets") = std::optional<at::Tensor>{},
+          py::arg("distance_cons_weights") = std::optional<at::Tensor>{},
+          py::arg("distance_cons_targets") = std::optional<at::Tensor>{},
+          py::arg("vertex_cons_vertices") = std::optional<at::Tensor>{},
+          py::arg("vertex_cons_weights") = std::optional<at::Tensor>{},
+          py::arg("vertex_cons_target_positions") = std::optional<at::Tensor>{},
+          py::arg("vertex_cons_target_normals") = std::optional<at::Tensor>{},
+          py::arg("vertex_proj_cons_vertices") = std::optional<at::Tensor>{},
+          py::arg("vertex_proj_cons_weights") = std::optional<at::Tensor>{},
+          py::arg("vertex_proj_cons_target_positions") = std::optional<at::Tensor>{},
+          py::arg("vertex_proj_cons_projections") = std::optional<at::Tensor>{})
+      .def(
+          "reset",
+          &IKSolver::reset,
+          R"(Forget the previous solution; the next :meth:`solve` must be given model_parameters_init.)")
+      .def_property_readonly(
+          "model_parameters",
+          &IKSolver::modelParameters,
+          "The result of the most recent :meth:`solve`, or None.")
+      .def_property_readonly(
+          "batch_statistics",
+          &IKSolver::batchStatistics,
+          R"(Per-element statistics of the most recent :meth:`solve`, or None.
+
+:return: a tuple (iterations, converged, solve_time) of tensors of size [nBatch], as returned by :meth:`get_last_solve_ik_batch_statistics`.)")
+      .def_property_readonly(
+          "active_error_functions",
+          &IKSolver::activeErrorFunctions,
+          "The error function types and their order in error_function_weights.")
+      .def_property_readonly("options", &IKSolver::options, "The solver options.");
+
   m.def(
       "get_solve_ik_statistics",
       &getSolveIKStatistics,
@@ -481,6 +619,18 @@ then the input is likely not in a good shape.
 :return: a pair [nTotalSolveIK, nTotalSolveIKIterations].
         )");
 
+  m.def(
+      "get_last_solve_ik_batch_statistics",
+      &getLastSolveIKBatchStatistics,
+      R"(Return per-element statistics for the most recent batched solve in the forward pass of :meth:`solve_ik` made by the calling thread.  Use :attr:`IKSolver.batch_statistics` for the solves of an :class:`IKSolver`.
+
+Unlike :meth:`get_solve_ik_statistics`, this makes the tail latency of a batch visible, e.g. a single badly-conditioned
+element that runs all the way to max_iter.
+
+:return: a tuple (iterations, converged, solve_time) of tensors of size [nBatch], holding the number of solver iterations,
+         whether the solver converged before hitting max_iter or the budget, and the wall-clock solve time in seconds.
+        )");
+
   m.def(
       "reset_solve_ik_statistics",
       &resetSolveIKStatistics,
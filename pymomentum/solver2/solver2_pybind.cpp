@@ -25,6 +25,7 @@
 #include <pybind11/stl.h>
 #include <Eigen/Core>
 
+#include <pymomentum/profiler/profiler_pybind.h>
 #include <pymomentum/solver2/solver2_error_functions.h>
 #include <pymomentum/solver2/solver2_sequence_error_functions.h>
 #include <pymomentum/solver2/solver2_utility.h>
@@ -46,6 +47,7 @@ PYBIND11_MODULE(solver2, m) {
 
   pybind11::module_::import(
       "pymomentum.geometry"); // @dep=fbsource//arvr/libraries/pymomentum:geometry
+  pymomentum::useSharedProfiler();
 
   // Error functions:
   py::class_<mm::SkeletonErrorFunction, std::shared_ptr<mm::SkeletonErrorFunction>>(
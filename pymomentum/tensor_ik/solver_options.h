@@ -35,11 +35,33 @@ struct SolverOptions {
   // Temporal smoothing of model parameters (only for the sequence solver)
   float sequenceSmoothingWeight = 0.0f;
   bool verbose = false;
+  // Batched solves only: if nonzero, batch elements are handed out to the
+  // worker threads dynamically in chunks of this many elements, so threads
+  // that finish early take over the remaining work.  0 uses one task per
+  // batch element.
+  size_t batchChunkSize = 0;
+  // Batched solves only: wall-clock budget (in seconds) and total iteration
+  // budget shared by all batch elements of a single call; 0 means unlimited.
+  // Once a budget is used up, every solve stops after its current iteration,
+  // so each batch element still gets at least one iteration.
+  float timeBudget = 0.0f;
+  size_t iterationBudget = 0;
+  // Sequence solver only: if nonzero, the sequence is solved in overlapping
+  // windows of this many frames, in parallel, and the windows are blended
+  // across the overlap.  Memory use is then bounded by the window size
+  // rather than by the sequence length.  0 solves the whole sequence at once.
+  size_t sequenceWindowSize = 0;
+  // Number of frames shared by neighboring windows; must be smaller than
+  // sequenceWindowSize.
+  size_t sequenceWindowOverlap = 0;
 
   bool operator==(const SolverOptions& rhs) const {
     return linearSolverType == rhs.linearSolverType && levmar_lambda == rhs.levmar_lambda &&
         minIter == rhs.minIter && maxIter == rhs.maxIter && threshold == rhs.threshold &&
-        lineSearch == rhs.lineSearch;
+        lineSearch == rhs.lineSearch && batchChunkSize == rhs.batchChunkSize &&
+        timeBudget == rhs.timeBudget && iterationBudget == rhs.iterationBudget &&
+        sequenceWindowSize == rhs.sequenceWindowSize &&
+        sequenceWindowOverlap == rhs.sequenceWindowOverlap;
   }
 };
 
@@ -25,6 +25,8 @@
 #include <momentum/solver/subset_gauss_newton_solver.h>
 
 #include <atomic>
+#include <chrono>
+#include <mutex>
 
 namespace pymomentum {
 
@@ -44,12 +46,34 @@ std::atomic<size_t> nTotalGradient{0};
 std::atomic<size_t> nGradientPrintouts{0};
 constexpr float gradientRMSEThreshold = 0.01;
 const size_t MAX_GRADIENT_PRINTOUTS = 10;
+
+// Per-element statistics of the most recent solveTensorIKProblem() call of
+// each thread, so that concurrent solves don't overwrite each other's.
+thread_local BatchSolveStatistics lastBatchStatistics;
 } // namespace
 
 std::pair<size_t, size_t> getSolveIKStatistics() {
   return {nTotalSolveIK, nTotalSolveIKIter};
 }
 
+std::tuple<at::Tensor, at::Tensor, at::Tensor> batchSolveStatisticsToTensors(
+    const BatchSolveStatistics& statistics) {
+  const auto nBatch = static_cast<int64_t>(statistics.iterations.size());
+  at::Tensor iterations = at::zeros({nBatch}, at::kLong);
+  at::Tensor converged = at::zeros({nBatch}, at::kBool);
+  at::Tensor solveTime = at::zeros({nBatch}, at::kDouble);
+  for (int64_t iBatch = 0; iBatch < nBatch; ++iBatch) {
+    iterations[iBatch] = statistics.iterations[iBatch];
+    converged[iBatch] = static_cast<bool>(statistics.converged[iBatch]);
+    solveTime[iBatch] = statistics.solveTime[iBatch];
+  }
+  return {iterations, converged, solveTime};
+}
+
+std::tuple<at::Tensor, at::Tensor, at::Tensor> getLastSolveIKBatchStatistics() {
+  return batchSolveStatisticsToTensors(lastBatchStatistics);
+}
+
 void resetSolveIKStatistics() {
   nTotalSolveIK = 0;
   nTotalSolveIKIter = 0;
@@ -88,6 +112,166 @@ class ThreadSafeExceptionWrapper {
   std::exception_ptr _ptr;
 };
 
+template <typename T>
+std::unique_ptr<momentum::SolverT<T>> createSolver(
+    const SolverOptions& solverOptions,
+    momentum::SkeletonSolverFunctionT<T>* solverFunction) {
+  momentum::SolverOptions momentumSolverOptions;
+  momentumSolverOptions.minIterations = solverOptions.minIter;
+  momentumSolverOptions.maxIterations = solverOptions.maxIter;
+  momentumSolverOptions.threshold = solverOptions.threshold;
+  // momentumSolverOptions.regularization = solverOptions.levmar_lambda;
+  // momentumSolverOptions.doLineSearch = solverOptions.lineSearch;
+  momentumSolverOptions.verbose = solverOptions.verbose;
+
+  if (solverOptions.linearSolverType == LinearSolverType::Cholesky) {
+    auto derivedSolverOptions = momentum::SubsetGaussNewtonSolverOptions(momentumSolverOptions);
+    derivedSolverOptions.regularization = solverOptions.levmar_lambda;
+    derivedSolverOptions.doLineSearch = solverOptions.lineSearch;
+    return std::make_unique<momentum::SubsetGaussNewtonSolverT<T>>(
+        derivedSolverOptions, solverFunction);
+  } else if (solverOptions.linearSolverType == LinearSolverType::TrustRegionQR) {
+    return std::make_unique<momentum::TrustRegionQRT<T>>(momentumSolverOptions, solverFunction);
+  } else {
+    auto derivedSolverOptions = momentum::GaussNewtonSolverQROptions(momentumSolverOptions);
+    derivedSolverOptions.regularization = solverOptions.levmar_lambda;
+    derivedSolverOptions.doLineSearch = solverOptions.lineSearch;
+    return std::make_unique<momentum::GaussNewtonSolverQRT<T>>(
+        derivedSolverOptions, solverFunction);
+  }
+}
+
+// Whether the momentum error function built from errf is the same on every
+// solve, i.e. it doesn't read any actual tensor data.
+template <typename T>
+bool isStaticErrorFunction(const TensorErrorFunction<T>& errf) {
+  for (const auto& input : errf.tensorInputs()) {
+    if (input.targetType != TensorType::TYPE_SENTINEL) {
+      return false;
+    }
+  }
+  return true;
+}
+
+// Writes the solution for one batch element, reverting to the initial
+// parameters if the solve produced NaN/INF values.  Returns false in that case.
+template <typename T>
+bool storeSolution(
+    const Eigen::VectorX<T>& parameters_opt,
+    at::Tensor modelParameters_init_cur,
+    at::Tensor modelParameters_final_cur) {
+  if (parameters_opt.array().isNaN().any() || parameters_opt.array().isInf().any()) {
+    toEigenMap<T>(modelParameters_final_cur) = toEigenMap<T>(modelParameters_init_cur);
+    return false;
+  }
+  toEigenMap<T>(modelParameters_final_cur) = parameters_opt;
+  return true;
+}
+
+// Budget shared by all the batch elements of a single batched solve; see
+// SolverOptions::timeBudget and SolverOptions::iterationBudget.
+class SolveBudget {
+ public:
+  explicit SolveBudget(const SolverOptions& options)
+      : _timeBudget(options.timeBudget),
+        _iterationBudget(options.iterationBudget),
+        _start(std::chrono::steady_clock::now()) {}
+
+  [[nodiscard]] bool unlimited() const {
+    return _timeBudget <= 0 && _iterationBudget == 0;
+  }
+
+  // Record one solver iteration; returns false once the budget is used up.
+  bool consumeIteration() {
+    const size_t nIter = ++_iterations;
+    if (_iterationBudget > 0 && nIter >= _iterationBudget) {
+      return false;
+    }
+    if (_timeBudget > 0) {
+      const std::chrono::duration<double> elapsed = std::chrono::steady_clock::now() - _start;
+      if (elapsed.count() >= _timeBudget) {
+        return false;
+      }
+    }
+    return true;
+  }
+
+ private:
+  const double _timeBudget;
+  const size_t _iterationBudget;
+  const std::chrono::steady_clock::time_point _start;
+  std::atomic<size_t> _iterations{0};
+};
+
+struct BatchElementResult {
+  size_t iterations = 0;
+  bool converged = false;
+};
+
+// Runs solveElement(iBatch, solveBudget) for every batch element in
+// parallel, using the scheduling selected by SolverOptions::batchChunkSize,
+// and returns the per-element statistics.  solveElement should install
+// budgetCallback() on its solver.
+template <typename SolveElementFn>
+BatchSolveStatistics solveBatch(
+    int64_t nBatch,
+    const SolverOptions& options,
+    ThreadSafeExceptionWrapper& exception,
+    SolveElementFn&& solveElement) {
+  SolveBudget budget(options);
+  BatchSolveStatistics statistics;
+  statistics.iterations.resize(nBatch, 0);
+  statistics.converged.resize(nBatch, 0);
+  statistics.solveTime.resize(nBatch, 0.0);
+
+  const auto solveOne = [&](int64_t iBatch) {
+    const auto start = std::chrono::steady_clock::now();
+    try {
+      const BatchElementResult result = solveElement(iBatch, budget);
+      statistics.iterations[iBatch] = static_cast<int64_t>(result.iterations);
+      statistics.converged[iBatch] = result.converged ? 1 : 0;
+      nTotalSolveIKIter += result.iterations;
+    } catch (...) {
+      exception.set(std::current_exception());
+    }
+    const std::chrono::duration<double> elapsed = std::chrono::steady_clock::now() - start;
+    statistics.solveTime[iBatch] = elapsed.count();
+  };
+
+  if (options.batchChunkSize > 0) {
+    // Chunks are claimed dynamically, so threads that finish early keep
+    // pulling work instead of waiting on a slow element's neighbors.
+    dispenso::parallel_for(
+        dispenso::makeChunkedRange(int64_t(0), nBatch, options.batchChunkSize),
+        [&](int64_t begin, int64_t end) {
+          for (int64_t iBatch = begin; iBatch < end; ++iBatch) {
+            solveOne(iBatch);
+          }
+        });
+  } else {
+    dispenso::parallel_for(int64_t(0), nBatch, solveOne);
+  }
+  nTotalSolveIK += nBatch;
+  return statistics;
+}
+
+// Iteration callback enforcing the shared budget; empty if it is unlimited.
+template <typename T>
+typename momentum::SolverT<T>::IterationCallback budgetCallback(SolveBudget& budget) {
+  if (budget.unlimited()) {
+    return {};
+  }
+  return
+      [&budget](size_t /* iteration */, double /* error */) { return budget.consumeIteration(); };
+}
+
+void warnNaNs(uint32_t numNaNs) {
+  if (numNaNs > 0) {
+    std::cerr << "WARNING: Detected" << numNaNs
+              << "NAN/INF values in outputs from solve_ik.  Reverting to initial parameters.";
+  }
+}
+
 } // namespace
 
 template <typename T>
@@ -108,14 +292,6 @@ at::Tensor solveTensorIKProblem(
       "solveTensorIKProblem()");
   const auto nBatch = modelParams_init.size(0);
 
-  momentum::SolverOptions momentumSolverOptions;
-  momentumSolverOptions.minIterations = solverOptions.minIter;
-  momentumSolverOptions.maxIterations = solverOptions.maxIter;
-  momentumSolverOptions.threshold = solverOptions.threshold;
-  // momentumSolverOptions.regularization = solverOptions.levmar_lambda;
-  // momentumSolverOptions.doLineSearch = solverOptions.lineSearch;
-  momentumSolverOptions.verbose = solverOptions.verbose;
-
   const auto nParams = characters.front()->parameterTransform.numAllModelParameters();
 
   at::Tensor modelParameters_final = at::zeros({nBatch, (int)nParams}, toScalarType<T>());
@@ -123,63 +299,159 @@ at::Tensor solveTensorIKProblem(
   ThreadSafeExceptionWrapper exception;
 
   std::atomic<uint32_t> numNaNs = 0;
-  dispenso::parallel_for(0, nBatch, [&](size_t iBatch) {
-    try {
-      const auto& character = *characters[iBatch];
-      const momentum::ParameterTransformT<T> parameterTransform =
-          character.parameterTransform.cast<T>();
+  const auto solveElement = [&](int64_t iBatch, SolveBudget& budget) {
+    const auto& character = *characters[iBatch];
+    const momentum::ParameterTransformT<T> parameterTransform =
+        character.parameterTransform.cast<T>();
 
-      at::Tensor modelParameters_init_cur = modelParams_init.select(0, iBatch);
-      at::Tensor modelParameters_final_cur = modelParameters_final.select(0, iBatch);
+    at::Tensor modelParameters_init_cur = modelParams_init.select(0, iBatch);
+    at::Tensor modelParameters_final_cur = modelParameters_final.select(0, iBatch);
 
-      const std::vector<std::shared_ptr<momentum::SkeletonErrorFunctionT<T>>> errorFunctions_cur =
-          buildMomentumErrorFunctions(
-              characters, errorFunctions, errorFunctionWeights, weightsMap, iBatch);
-      momentum::SkeletonSolverFunctionT<T> solverFunction =
-          buildSolverFunction(*characters[iBatch], parameterTransform, errorFunctions_cur);
+    const std::vector<std::shared_ptr<momentum::SkeletonErrorFunctionT<T>>> errorFunctions_cur =
+        buildMomentumErrorFunctions(
+            characters, errorFunctions, errorFunctionWeights, weightsMap, iBatch);
+    momentum::SkeletonSolverFunctionT<T> solverFunction =
+        buildSolverFunction(*characters[iBatch], parameterTransform, errorFunctions_cur);
 
-      std::unique_ptr<momentum::SolverT<T>> solver;
-      if (solverOptions.linearSolverType == LinearSolverType::Cholesky) {
-        auto derivedSolverOptions = momentum::SubsetGaussNewtonSolverOptions(momentumSolverOptions);
-        derivedSolverOptions.regularization = solverOptions.levmar_lambda;
-        derivedSolverOptions.doLineSearch = solverOptions.lineSearch;
-        solver = std::make_unique<momentum::SubsetGaussNewtonSolverT<T>>(
-            derivedSolverOptions, &solverFunction);
-      } else if (solverOptions.linearSolverType == LinearSolverType::TrustRegionQR) {
-        solver =
-            std::make_unique<momentum::TrustRegionQRT<T>>(momentumSolverOptions, &solverFunction);
-      } else {
-        auto derivedSolverOptions = momentum::GaussNewtonSolverQROptions(momentumSolverOptions);
-        derivedSolverOptions.regularization = solverOptions.levmar_lambda;
-        derivedSolverOptions.doLineSearch = solverOptions.lineSearch;
-        solver = std::make_unique<momentum::GaussNewtonSolverQRT<T>>(
-            derivedSolverOptions, &solverFunction);
-      }
-      solver->setEnabledParameters(activeParams);
+    std::unique_ptr<momentum::SolverT<T>> solver = createSolver<T>(solverOptions, &solverFunction);
+    solver->setEnabledParameters(activeParams);
+    solver->setIterationCallback(budgetCallback<T>(budget));
 
-      Eigen::VectorX<T> parameters_opt = toEigenMap<T>(modelParameters_init_cur);
-      solver->solve(parameters_opt);
+    Eigen::VectorX<T> parameters_opt = toEigenMap<T>(modelParameters_init_cur);
+    solver->solve(parameters_opt);
+
+    if (!storeSolution<T>(parameters_opt, modelParameters_init_cur, modelParameters_final_cur)) {
+      ++numNaNs;
+    }
+    return BatchElementResult{solver->getErrorHistory().size(), solver->hasConverged()};
+  };
+  lastBatchStatistics = solveBatch(nBatch, solverOptions, exception, solveElement);
+
+  warnNaNs(numNaNs);
+
+  exception.maybeThrow();
+
+  return modelParameters_final;
+}
+
+template <typename T>
+struct TensorIKSolver<T>::BatchSolver {
+  BatchSolver(
+      const momentum::Character& character,
+      const momentum::ParameterSet& activeParams,
+      const SolverOptions& options)
+      : parameterTransform(character.parameterTransform.cast<T>()),
+        solverFunction(character, parameterTransform),
+        solver(createSolver<T>(options, &solverFunction)) {
+    solver->setEnabledParameters(activeParams);
+  }
 
-      // Record iteration count.
-      const std::vector<double>& iterHistory = solver->getErrorHistory();
-      nTotalSolveIKIter += iterHistory.size();
+  // solverFunction keeps a reference to parameterTransform, so BatchSolver
+  // must not be moved.
+  const momentum::ParameterTransformT<T> parameterTransform;
+  momentum::SkeletonSolverFunctionT<T> solverFunction;
+  std::unique_ptr<momentum::SolverT<T>> solver;
 
-      if (parameters_opt.array().isNaN().any() || parameters_opt.array().isInf().any()) {
-        ++numNaNs;
-        toEigenMap<T>(modelParameters_final_cur) = toEigenMap<T>(modelParameters_init_cur);
-      } else {
-        toEigenMap<T>(modelParameters_final_cur) = parameters_opt;
+  // Error functions that don't depend on per-solve tensors, indexed like the
+  // TensorErrorFunctions; nullptr for the ones that are rebuilt every solve.
+  std::vector<std::shared_ptr<momentum::SkeletonErrorFunctionT<T>>> staticErrorFunctions;
+};
+
+template <typename T>
+TensorIKSolver<T>::TensorIKSolver(
+    const std::vector<const momentum::Character*>& characters,
+    const momentum::ParameterSet& activeParams,
+    const SolverOptions& options)
+    : _characters(characters), _activeParams(activeParams), _options(options) {
+  MT_THROW_IF(_characters.empty(), "TensorIKSolver: expected at least one character.");
+  _batchSolvers.resize(_characters.size());
+  dispenso::parallel_for(0, _characters.size(), [&](size_t iBatch) {
+    _batchSolvers[iBatch] =
+        std::make_unique<BatchSolver>(*_characters[iBatch], _activeParams, options);
+  });
+}
+
+template <typename T>
+TensorIKSolver<T>::~TensorIKSolver() = default;
+
+template <typename T>
+at::Tensor TensorIKSolver<T>::solve(
+    at::Tensor modelParams_init,
+    const std::vector<std::unique_ptr<TensorErrorFunction<T>>>& errorFunctions,
+    at::Tensor errorFunctionWeights,
+    size_t numActiveErrorFunctions,
+    const std::vector<int>& weightsMap) {
+  std::tie(modelParams_init, errorFunctionWeights) = checkIKInputs<T>(
+      _characters,
+      modelParams_init,
+      errorFunctionWeights,
+      numActiveErrorFunctions,
+      "TensorIKSolver::solve()");
+  const auto nBatch = modelParams_init.size(0);
+  MT_THROW_IF(
+      nBatch != _batchSolvers.size(),
+      "TensorIKSolver::solve(): expected batch size {}, got {}.",
+      _batchSolvers.size(),
+      nBatch);
+  MT_THROW_IF(
+      errorFunctions.size() > weightsMap.size(),
+      "TensorIKSolver::solve(): {} error functions exceed weightsMap size {}",
+      errorFunctions.size(),
+      weightsMap.size());
+
+  const auto nParams = _characters.front()->parameterTransform.numAllModelParameters();
+  at::Tensor modelParameters_final = at::zeros({nBatch, (int)nParams}, toScalarType<T>());
+
+  ThreadSafeExceptionWrapper exception;
+
+  std::atomic<uint32_t> numNaNs = 0;
+  const auto solveElement = [&](int64_t iBatch, SolveBudget& budget) {
+    BatchSolver& batchSolver = *_batchSolvers[iBatch];
+    const auto& character = *_characters[iBatch];
+    at::Tensor weights_cur = errorFunctionWeights.select(0, iBatch);
+
+    if (batchSolver.staticErrorFunctions.size() != errorFunctions.size()) {
+      // First solve (or a different layout): nothing can be reused.
+      batchSolver.staticErrorFunctions.assign(errorFunctions.size(), nullptr);
+    }
+
+    batchSolver.solverFunction.clearErrorFunctions();
+    for (size_t iErr = 0; iErr < errorFunctions.size(); ++iErr) {
+      const auto& errf = errorFunctions[iErr];
+      std::shared_ptr<momentum::SkeletonErrorFunctionT<T>> errf_momentum =
+          batchSolver.staticErrorFunctions[iErr];
+      if (!errf_momentum) {
+        errf_momentum = errf->createErrorFunction(character, iBatch, SIZE_MAX);
+        errf_momentum->setEnabledParameters(_activeParams);
+        if (isStaticErrorFunction(*errf)) {
+          batchSolver.staticErrorFunctions[iErr] = errf_momentum;
+        }
       }
-    } catch (...) {
-      exception.set(std::current_exception());
+      // weightsMap maps error type order in the enum to order in input
+      // errorFunctionWeights.
+      errf_momentum->setWeight(
+          weightsMap[iErr] < 0 ? T(0) : toEigenMap<T>(weights_cur)[weightsMap[iErr]]);
+      batchSolver.solverFunction.addErrorFunction(std::move(errf_momentum));
     }
-  });
-  nTotalSolveIK += nBatch;
 
-  if (numNaNs > 0) {
-    std::cerr << "WARNING: Detected" << static_cast<uint32_t>(numNaNs)
-              << "NAN/INF values in outputs from solve_ik.  Reverting to initial parameters.";
-  }
+    at::Tensor modelParameters_init_cur = modelParams_init.select(0, iBatch);
+    at::Tensor modelParameters_final_cur = modelParameters_final.select(0, iBatch);
+
+    batchSolver.solver->setIterationCallback(budgetCallback<T>(budget));
+    Eigen::VectorX<T> parameters_opt = toEigenMap<T>(modelParameters_init_cur);
+    batchSolver.solver->solve(parameters_opt);
+    // The callback refers to this call's budget.
+    batchSolver.solver->setIterationCallback({});
+
+    if (!storeSolution<T>(parameters_opt, modelParameters_init_cur, modelParameters_final_cur)) {
+      ++numNaNs;
+    }
+    return BatchElementResult{
+        batchSolver.solver->getErrorHistory().size(), batchSolver.solver->hasConverged()};
+  };
+  _lastBatchStatistics = solveBatch(nBatch, _options, exception, solveElement);
+
+  warnNaNs(numNaNs);
 
   exception.maybeThrow();
 
@@ -338,6 +610,65 @@ std::tuple<at::Tensor, torch::autograd::variable_list> d_solveTensorIKProblem(
   return {grad_errorFunctionWeights, toTensors(errorFunctions, grad_inputs)};
 }
 
+namespace {
+
+// Frame range [begin, end) covered by one window of a sequence solve.
+struct SequenceWindow {
+  int64_t begin = 0;
+  int64_t end = 0;
+};
+
+// Splits nFrames into windows of windowSize frames where neighboring windows
+// share (at least) overlap frames; the last window is shifted back to end on
+// the last frame.  A windowSize of 0 gives a single window.
+std::vector<SequenceWindow>
+computeSequenceWindows(int64_t nFrames, size_t windowSize, size_t overlap) {
+  if (windowSize == 0 || static_cast<int64_t>(windowSize) >= nFrames) {
+    return {SequenceWindow{0, nFrames}};
+  }
+
+  MT_THROW_IF(
+      overlap >= windowSize,
+      "Sequence window overlap ({}) must be smaller than the window size ({}).",
+      overlap,
+      windowSize);
+
+  const auto size = static_cast<int64_t>(windowSize);
+  const auto stride = static_cast<int64_t>(windowSize - overlap);
+  std::vector<SequenceWindow> result;
+  for (int64_t begin = 0;; begin += stride) {
+    if (begin + size >= nFrames) {
+      result.push_back({nFrames - size, nFrames});
+      break;
+    }
+    result.push_back({begin, begin + size});
+  }
+  return result;
+}
+
+// Weight of iFrame in windows[iWindow]: a linear ramp across the frames shared
+// with the previous and next windows, 1 elsewhere.
+double
+sequenceWindowWeight(const std::vector<SequenceWindow>& windows, size_t iWindow, int64_t iFrame) {
+  const SequenceWindow& window = windows[iWindow];
+  double result = 1.0;
+  if (iWindow > 0) {
+    const int64_t nShared = windows[iWindow - 1].end - window.begin;
+    if (nShared > 0) {
+      result = std::min(result, double(iFrame - window.begin + 1) / double(nShared + 1));
+    }
+  }
+  if (iWindow + 1 < windows.size()) {
+    const int64_t nShared = window.end - windows[iWindow + 1].begin;
+    if (nShared > 0) {
+      result = std::min(result, double(window.end - iFrame) / double(nShared + 1));
+    }
+  }
+  return result;
+}
+
+} // namespace
+
 template <typename T>
 at::Tensor solveTensorSequenceIKProblem(
     const std::vector<const momentum::Character*>& characters,
@@ -369,60 +700,128 @@ at::Tensor solveTensorSequenceIKProblem(
 
   const auto nParams = characters.front()->parameterTransform.numAllModelParameters();
 
-  at::Tensor modelParameters_final = at::zeros({nBatch, nFrames, (int)nParams}, toScalarType<T>());
+  // Long sequences are solved as overlapping windows; each (batch element,
+  // window) pair is an independent sequence solve, and the solved windows are
+  // blended into the result across their overlap.
+  const std::vector<SequenceWindow> windows = computeSequenceWindows(
+      nFrames, solverOptions.sequenceWindowSize, solverOptions.sequenceWindowOverlap);
+  const auto nWindows = static_cast<int64_t>(windows.size());
+
+  // Normalizes the blend weights of frames covered by more than two windows.
+  std::vector<double> frameWeightSums(nFrames, 0.0);
+  for (size_t iWindow = 0; iWindow < windows.size(); ++iWindow) {
+    for (int64_t iFrame = windows[iWindow].begin; iFrame < windows[iWindow].end; ++iFrame) {
+      frameWeightSums[iFrame] += sequenceWindowWeight(windows, iWindow, iFrame);
+    }
+  }
 
   ThreadSafeExceptionWrapper exception;
-
   std::atomic<uint32_t> numNaNs = 0;
-  dispenso::parallel_for(0, nBatch, [&](size_t iBatch) {
-    try {
-      const auto& character = *characters[iBatch];
-      const momentum::ParameterTransformT<T> parameterTransform =
-          character.parameterTransform.cast<T>();
 
-      at::Tensor modelParameters_init_cur = modelParams_init.select(0, iBatch);
-      at::Tensor modelParameters_final_cur = modelParameters_final.select(0, iBatch);
+  // Solves every (batch element, window) pair from init with only
+  // enabledParams free and blends the windows into the result.
+  const auto solveWindows = [&](at::Tensor init, const momentum::ParameterSet& enabledParams) {
+    at::Tensor result = at::zeros({nBatch, nFrames, (int)nParams}, toScalarType<T>());
+    // Guards the accumulation of overlapping windows into result.
+    std::vector<std::mutex> batchMutexes(nBatch);
+
+    dispenso::parallel_for(0, nBatch * nWindows, [&](int64_t iTask) {
+      try {
+        const int64_t iBatch = iTask / nWindows;
+        const size_t iWindow = iTask % nWindows;
+        const SequenceWindow& window = windows[iWindow];
+        const int64_t nWindowFrames = window.end - window.begin;
+
+        const auto& character = *characters[iBatch];
+        const momentum::ParameterTransformT<T> parameterTransform =
+            character.parameterTransform.cast<T>();
+
+        at::Tensor modelParameters_init_cur =
+            init.select(0, iBatch).narrow(0, window.begin, nWindowFrames);
+        at::Tensor modelParameters_final_cur =
+            result.select(0, iBatch).narrow(0, window.begin, nWindowFrames);
+
+        std::unique_ptr<momentum::SequenceSolverFunctionT<T>> solverFunction =
+            buildSequenceSolverFunction(
+                *characters[iBatch],
+                parameterTransform,
+                modelParameters_init_cur,
+                sharedParams,
+                errorFunctions,
+                errorFunctionWeights.select(0, iBatch).narrow(0, window.begin, nWindowFrames),
+                weightsMap,
+                iBatch,
+                window.begin);
+
+        if (solverOptions.sequenceSmoothingWeight > 0.f) {
+          auto modelParamsSequenceSmoothingErrFunc =
+              std::make_shared<momentum::ModelParametersSequenceErrorFunctionT<T>>(character);
+          modelParamsSequenceSmoothingErrFunc->setWeight(solverOptions.sequenceSmoothingWeight);
+          solverFunction->addSequenceErrorFunction(
+              momentum::kAllFrames, modelParamsSequenceSmoothingErrFunc);
+        }
 
-      std::unique_ptr<momentum::SequenceSolverFunctionT<T>> solverFunction =
-          buildSequenceSolverFunction(
-              *characters[iBatch],
-              parameterTransform,
-              modelParameters_init_cur,
-              sharedParams,
-              errorFunctions,
-              errorFunctionWeights.select(0, iBatch),
-              weightsMap,
-              iBatch);
-
-      if (solverOptions.sequenceSmoothingWeight > 0.f) {
-        auto modelParamsSequenceSmoothingErrFunc =
-            std::make_shared<momentum::ModelParametersSequenceErrorFunctionT<T>>(character);
-        modelParamsSequenceSmoothingErrFunc->setWeight(solverOptions.sequenceSmoothingWeight);
-        solverFunction->addSequenceErrorFunction(
-            momentum::kAllFrames, modelParamsSequenceSmoothingErrFunc);
-      }
+        momentum::SequenceSolverT<T> solver(momentumSolverOptions, solverFunction.get());
+        solver.setEnabledParameters(enabledParams);
 
-      momentum::SequenceSolverT<T> solver(momentumSolverOptions, solverFunction.get());
-      solver.setEnabledParameters(activeParams);
+        Eigen::VectorX<T> parameters_opt = solverFunction->getJoinedParameterVector();
+        solver.solve(parameters_opt);
 
-      Eigen::VectorX<T> parameters_opt = solverFunction->getJoinedParameterVector();
-      solver.solve(parameters_opt);
+        // Nan in result, back out the solve:
+        const bool hasNaN =
+            parameters_opt.array().isNaN().any() || parameters_opt.array().isInf().any();
+        if (hasNaN) {
+          ++numNaNs;
+        }
 
-      // Nan in result, back out the solve:
-      if (parameters_opt.array().isNaN().any() || parameters_opt.array().isInf().any()) {
-        ++numNaNs;
-        toEigenMap<T>(modelParameters_final_cur) = toEigenMap<T>(modelParameters_init_cur);
-        return;
+        Eigen::MatrixX<T> weightedParameters(nParams, nWindowFrames);
+        dispenso::parallel_for((int64_t)0, nWindowFrames, [&](int64_t jFrame) {
+          const int64_t iFrame = window.begin + jFrame;
+          const T weight =
+              T(sequenceWindowWeight(windows, iWindow, iFrame) / frameWeightSums[iFrame]);
+          if (hasNaN) {
+            weightedParameters.col(jFrame) =
+                weight * toEigenMap<T>(modelParameters_init_cur.select(0, jFrame));
+          } else {
+            weightedParameters.col(jFrame) = weight * solverFunction->getFrameParameters(jFrame).v;
+          }
+        });
+
+        // Not parallelized: the lock must not be held while waiting on other tasks.
+        std::lock_guard<std::mutex> lock(batchMutexes[iBatch]);
+        for (int64_t jFrame = 0; jFrame < nWindowFrames; ++jFrame) {
+          at::Tensor modelParameters_final_frame = modelParameters_final_cur.select(0, jFrame);
+          toEigenMap<T>(modelParameters_final_frame) += weightedParameters.col(jFrame);
+        }
+      } catch (...) {
+        exception.set(std::current_exception());
       }
+    });
+    return result;
+  };
 
-      dispenso::parallel_for((size_t)0, nFrames, [&](size_t iFrame) {
+  at::Tensor modelParameters_final = solveWindows(modelParams_init, activeParams);
+
+  if (nWindows > 1) {
+    // Each window solves for its own copy of the shared parameters; use their
+    // blended average over the whole sequence so they stay shared, then
+    // re-solve the per-frame parameters against the averaged values.
+    dispenso::parallel_for((int64_t)0, nBatch, [&](int64_t iBatch) {
+      at::Tensor modelParameters_final_cur = modelParameters_final.select(0, iBatch);
+      const Eigen::VectorX<T> mean = toEigenMap<T>(modelParameters_final_cur.mean(0)).eval();
+      for (int64_t iFrame = 0; iFrame < nFrames; ++iFrame) {
         at::Tensor modelParameters_final_frame = modelParameters_final_cur.select(0, iFrame);
-        toEigenMap<T>(modelParameters_final_frame) = solverFunction->getFrameParameters(iFrame).v;
-      });
-    } catch (...) {
-      exception.set(std::current_exception());
-    }
-  });
+        auto frameParams = toEigenMap<T>(modelParameters_final_frame);
+        for (Eigen::Index k = 0; k < frameParams.size(); ++k) {
+          if (sharedParams.test(k)) {
+            frameParams(k) = mean(k);
+          }
+        }
+      }
+    });
+
+    modelParameters_final = solveWindows(modelParameters_final, activeParams & ~sharedParams);
+  }
 
   if (numNaNs > 0) {
     std::cerr << "WARNING: Detected" << static_cast<uint32_t>(numNaNs)
@@ -493,4 +892,7 @@ template at::Tensor solveTensorSequenceIKProblem<double>(
     const std::vector<int>& weightsMap,
     const SolverOptions& solverOptions);
 
+template class TensorIKSolver<float>;
+template class TensorIKSolver<double>;
+
 } // namespace pymomentum
@@ -99,6 +99,78 @@ std::tuple<at::Tensor, torch::autograd::variable_list> d_solveTensorIKProblem(
     size_t numActiveErrorFunctions,
     const std::vector<int>& weightsMap);
 
+// Per-element statistics of a batched solve.
+struct BatchSolveStatistics {
+  std::vector<int64_t> iterations;
+  std::vector<uint8_t> converged;
+  // Wall-clock time of each element's solve in seconds.
+  std::vector<double> solveTime;
+};
+
+// Returns the statistics as the tuple
+//   (iterations [nBatch] int64, converged [nBatch] bool, solveTime [nBatch] double)
+std::tuple<at::Tensor, at::Tensor, at::Tensor> batchSolveStatisticsToTensors(
+    const BatchSolveStatistics& statistics);
+
+// Persistent version of solveTensorIKProblem() for solving many batched IK
+// problems that share the same structure, e.g. one solve per video frame.
+//
+// The per-batch-element state that solveTensorIKProblem() rebuilds on every
+// call (the cast ParameterTransform, the SkeletonSolverFunction and the
+// solver with its work buffers) is created once in the constructor and
+// reused by every call to solve().  Momentum error functions that do not
+// depend on any per-solve tensor input (e.g. limits and collisions) are
+// created on the first solve and reused afterwards; only their weights are
+// updated.  All other error functions are recreated from the passed-in
+// TensorErrorFunctions since their constraint data changes between solves.
+//
+// The caller must pass TensorErrorFunctions with the same layout (types and
+// order) on every call.  The solve is not differentiable; use
+// solveTensorIKProblem()/d_solveTensorIKProblem() when gradients are needed.
+template <typename T>
+class TensorIKSolver {
+ public:
+  TensorIKSolver(
+      const std::vector<const momentum::Character*>& characters,
+      const momentum::ParameterSet& activeParams,
+      const SolverOptions& options);
+  ~TensorIKSolver();
+
+  TensorIKSolver(const TensorIKSolver&) = delete;
+  TensorIKSolver& operator=(const TensorIKSolver&) = delete;
+
+  // Same arguments and result as solveTensorIKProblem(); modelParams_init
+  // must have batch size batchSize().
+  at::Tensor solve(
+      at::Tensor modelParams_init,
+      const std::vector<std::unique_ptr<TensorErrorFunction<T>>>& errorFunctions,
+      at::Tensor errorFunctionWeights,
+      size_t numActiveErrorFunctions,
+      const std::vector<int>& weightsMap);
+
+  [[nodiscard]] size_t batchSize() const {
+    return _characters.size();
+  }
+
+  [[nodiscard]] const std::vector<const momentum::Character*>& characters() const {
+    return _characters;
+  }
+
+  // Per-element statistics of the most recent solve().
+  [[nodiscard]] const BatchSolveStatistics& lastBatchStatistics() const {
+    return _lastBatchStatistics;
+  }
+
+ private:
+  struct BatchSolver;
+
+  std::vector<const momentum::Character*> _characters;
+  momentum::ParameterSet _activeParams;
+  SolverOptions _options;
+  std::vector<std::unique_ptr<BatchSolver>> _batchSolvers;
+  BatchSolveStatistics _lastBatchStatistics;
+};
+
 template <typename T>
 at::Tensor solveTensorSequenceIKProblem(
     const std::vector<const momentum::Character*>& characters,
@@ -114,6 +186,10 @@ at::Tensor solveTensorSequenceIKProblem(
 // Get the number of ik problems solved and total solver iterations recorded so
 // far.
 std::pair<size_t, size_t> getSolveIKStatistics();
+// Per-element statistics of the most recent solveTensorIKProblem() call made
+// by the calling thread, see batchSolveStatisticsToTensors().  Each
+// TensorIKSolver keeps its own in TensorIKSolver::lastBatchStatistics().
+std::tuple<at::Tensor, at::Tensor, at::Tensor> getLastSolveIKBatchStatistics();
 // Reset SolveIKProblem statistics.
 void resetSolveIKStatistics();
 // Get the number of non-zero IK problem gradients and total gradients computed
@@ -192,7 +192,8 @@ std::unique_ptr<momentum::SequenceSolverFunctionT<T>> buildSequenceSolverFunctio
     const std::vector<std::unique_ptr<TensorErrorFunction<T>>>& errorFunctions,
     at::Tensor errorFunctionWeights,
     const std::vector<int>& weightsMap,
-    const int64_t iBatch) {
+    const int64_t iBatch,
+    const int64_t frameOffset) {
   assert(modelParams_init.ndimension() == 2);
   assert(modelParams_init.size(-1) == parameterTransform.numAllModelParameters());
   const auto nFrames = modelParams_init.size(0);
@@ -209,7 +210,7 @@ std::unique_ptr<momentum::SequenceSolverFunctionT<T>> buildSequenceSolverFunctio
 
     for (size_t iErr = 0; iErr < errorFunctions.size(); ++iErr) {
       const auto& errf = errorFunctions[iErr];
-      auto errf_momentum = errf->createErrorFunction(character, iBatch, jFrame);
+      auto errf_momentum = errf->createErrorFunction(character, iBatch, frameOffset + jFrame);
       // weightsMap maps error type order in the enum to order in input
       // errorFunctionWeights.
       MT_THROW_IF(
@@ -375,7 +376,8 @@ buildSequenceSolverFunction<float>(
     const std::vector<std::unique_ptr<TensorErrorFunction<float>>>& errorFunctions,
     at::Tensor errorFunctionWeights,
     const std::vector<int>& weightsMap,
-    const int64_t iBatch);
+    const int64_t iBatch,
+    const int64_t frameOffset);
 template std::unique_ptr<momentum::SequenceSolverFunctionT<double>>
 buildSequenceSolverFunction<double>(
     const momentum::Character& character,
@@ -385,7 +387,8 @@ buildSequenceSolverFunction<double>(
     const std::vector<std::unique_ptr<TensorErrorFunction<double>>>& errorFunctions,
     at::Tensor errorFunctionWeights,
     const std::vector<int>& weightsMap,
-    const int64_t iBatch);
+    const int64_t iBatch,
+    const int64_t frameOffset);
 
 template std::vector<ErrorFunctionInput<float>> buildErrorFunctionInputs(
     const std::vector<std::unique_ptr<TensorErrorFunction<float>>>& errorFunctions,
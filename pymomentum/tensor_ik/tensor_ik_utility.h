@@ -58,6 +58,9 @@ momentum::SkeletonSolverFunctionT<T> buildSolverFunction(
     const momentum::ParameterTransformT<T>& parameterTransform,
     const std::vector<std::shared_ptr<momentum::SkeletonErrorFunctionT<T>>>& errorFunctions);
 
+// modelParams_init and errorFunctionWeights may cover a subrange of the
+// frames, starting at frameOffset; frame j of the solver function then uses
+// the error function inputs of frame (frameOffset + j).
 template <typename T>
 std::unique_ptr<momentum::SequenceSolverFunctionT<T>> buildSequenceSolverFunction(
     const momentum::Character& character,
@@ -67,7 +70,8 @@ std::unique_ptr<momentum::SequenceSolverFunctionT<T>> buildSequenceSolverFunctio
     const std::vector<std::unique_ptr<TensorErrorFunction<T>>>& errorFunctions,
     at::Tensor errorFunctionWeights,
     const std::vector<int>& weightsMap,
-    int64_t iBatch);
+    int64_t iBatch,
+    int64_t frameOffset = 0);
 
 // This struct is to keep track of where the individual inputs are wrt the
 // single longer list of inputs that we return from the ::backward() function.
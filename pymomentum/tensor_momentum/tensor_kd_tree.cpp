@@ -9,22 +9,21 @@
 
 #include "pymomentum/tensor_utility/tensor_utility.h"
 
-#include <axel/SimdKdTree.h>
-#include <axel/TriBvh.h>
+#include <momentum/common/exception.h>
+#include <momentum/common/log.h>
+
 #include <dispenso/parallel_for.h> // @manual
-#include <pybind11/pybind11.h>
 
 #include <cfloat>
 #include <cstdint>
 
-namespace py = pybind11;
-
 namespace pymomentum {
 
 namespace {
 
 template <int Dimension>
 void findClosestPoints_imp(
+    const axel::SimdKdTreef<Dimension>& kdTree_target,
     at::Tensor points_source,
     at::Tensor points_target,
     float maxSqrDist,
@@ -33,12 +32,8 @@ void findClosestPoints_imp(
   using Vec = typename axel::SimdKdTreef<Dimension>::Vec;
   assert(points_source.size(1) == Dimension);
   assert(points_target.size(1) == Dimension);
-  const Vec* pts_tgt_ptr = (const Vec*)points_target.data_ptr();
 
   const int64_t nSrcPts = points_source.size(0);
-  const int64_t nTgtPts = points_target.size(0);
-
-  const axel::SimdKdTreef<Dimension> kdTree_target({pts_tgt_ptr, pts_tgt_ptr + nTgtPts});
 
   Eigen::Map<Eigen::VectorXf> pts_src_map = toEigenMap<float>(points_source);
   Eigen::Map<Eigen::VectorXf> pts_tgt_map = toEigenMap<float>(points_target);
@@ -64,6 +59,7 @@ void findClosestPoints_imp(
 }
 
 void findClosestPointsWithNormal_imp(
+    const axel::SimdKdTreef<3>& kdTree_target,
     at::Tensor points_source,
     at::Tensor normals_source,
     at::Tensor points_target,
@@ -75,14 +71,8 @@ void findClosestPointsWithNormal_imp(
     at::Tensor result_indices) {
   assert(points_source.size(1) == 3);
   assert(points_target.size(1) == 3);
-  const Eigen::Vector3f* pts_tgt_ptr = (const Eigen::Vector3f*)points_target.data_ptr();
-  const Eigen::Vector3f* normals_tgt_ptr = (const Eigen::Vector3f*)normals_target.data_ptr();
 
   const int64_t nSrcPts = points_source.size(0);
-  const int64_t nTgtPts = points_target.size(0);
-
-  const axel::SimdKdTreef<3> kdTree_target(
-      {pts_tgt_ptr, pts_tgt_ptr + nTgtPts}, {normals_tgt_ptr, normals_tgt_ptr + nTgtPts});
 
   Eigen::Map<Eigen::VectorXf> pts_src_map = toEigenMap<float>(points_source);
   Eigen::Map<Eigen::VectorXf> pts_tgt_map = toEigenMap<float>(points_target);
@@ -136,58 +126,188 @@ bool isNormalized(at::Tensor t) {
   return true;
 }
 
+template <int Dimension>
+std::unique_ptr<axel::SimdKdTreef<Dimension>> buildKdTree(
+    at::Tensor points_target,
+    at::Tensor normals_target) {
+  using Vec = typename axel::SimdKdTreef<Dimension>::Vec;
+  const Vec* pts_tgt_ptr = (const Vec*)points_target.data_ptr();
+  const int64_t nTgtPts = points_target.size(0);
+  if (!normals_target.defined()) {
+    return std::make_unique<axel::SimdKdTreef<Dimension>>(
+        std::span<const Vec>{pts_tgt_ptr, pts_tgt_ptr + nTgtPts});
+  }
+
+  const Vec* normals_tgt_ptr = (const Vec*)normals_target.data_ptr();
+  return std::make_unique<axel::SimdKdTreef<Dimension>>(
+      std::span<const Vec>{pts_tgt_ptr, pts_tgt_ptr + nTgtPts},
+      std::span<const Vec>{normals_tgt_ptr, normals_tgt_ptr + nTgtPts});
+}
+
+// Validates the source tensor against the batch size of an index.  Unbatched (shared) indices
+// match any source batch size.
+void checkIndexBatchSize(
+    const char* functionName,
+    int64_t indexBatchSize,
+    bool shared,
+    int64_t sourceBatchSize) {
+  MT_THROW_IF(
+      !shared && indexBatchSize != sourceBatchSize,
+      "In {}, mismatch in batch sizes; the index was built with a batch size of {} but points_source has a batch size of {}",
+      functionName,
+      indexBatchSize,
+      sourceBatchSize);
+}
+
+template <typename S>
+Eigen::MatrixX3<S> toVertexMatrix(at::Tensor vertices) {
+  const int64_t nVertices = vertices.size(0);
+  Eigen::MatrixX3<S> result(nVertices, 3);
+  Eigen::Map<Eigen::VectorX<S>> vertices_map = toEigenMap<S>(vertices);
+  for (int64_t i = 0; i < nVertices; ++i) {
+    result.row(i) = vertices_map.template segment<3>(3 * i);
+  }
+  return result;
+}
+
+template <typename S>
+void findClosestPointsOnMesh_imp(
+    const axel::TriBvh<S, axel::kNativeLaneWidth<S>>& targetTree,
+    at::Tensor points_source,
+    at::Tensor result_points,
+    at::Tensor result_face_index,
+    at::Tensor result_barycentric) {
+  const int64_t nSrcPts = points_source.size(0);
+
+  Eigen::Map<Eigen::VectorX<S>> pts_src_map = toEigenMap<S>(points_source);
+  Eigen::Map<Eigen::VectorXi> result_face_indices_map = toEigenMap<int>(result_face_index);
+  Eigen::Map<Eigen::VectorX<S>> result_points_map = toEigenMap<S>(result_points);
+  Eigen::Map<Eigen::VectorX<S>> result_bary_map = toEigenMap<S>(result_barycentric);
+
+  dispenso::parallel_for(
+      dispenso::makeChunkedRange(0, nSrcPts), [&](int64_t srcStart, int64_t srcEnd) {
+        for (int64_t k = srcStart; k < srcEnd; ++k) {
+          const Eigen::Vector3<S> p_src = pts_src_map.template segment<3>(3 * k);
+          const auto queryResult = targetTree.closestSurfacePoint(p_src);
+          if (queryResult.triangleIdx == axel::kInvalidTriangleIdx) {
+            result_face_indices_map(k) = -1;
+          } else {
+            result_face_indices_map[k] = queryResult.triangleIdx;
+            result_points_map.template segment<3>(3 * k) = queryResult.point;
+            if (queryResult.baryCoords) {
+              result_bary_map.template segment<3>(3 * k) = *queryResult.baryCoords;
+            }
+          }
+        }
+      });
+}
+
 } // anonymous namespace
 
-std::tuple<at::Tensor, at::Tensor, at::Tensor>
-findClosestPoints(at::Tensor points_source, at::Tensor points_target, float maxDist) {
-  TensorChecker checker("find_closest_points");
+PointIndex::PointIndex(at::Tensor points_target, at::Tensor normals_target) {
+  TensorChecker checker("PointIndex");
+
+  const int nTgtPtsIndex = -1;
+  const int dimIdx = -2;
+  points_target_ = checker.validateAndFixTensor(
+      points_target,
+      "points_target",
+      {nTgtPtsIndex, dimIdx},
+      {"nTgtPts", "xyz"},
+      at::kFloat,
+      true,
+      false,
+      &shared_);
+  // The queries read the target points back with the GIL released, so the index keeps its own copy
+  // rather than sharing storage with a tensor the caller may modify in place.
+  points_target_ = points_target_.clone();
+
+  const auto dim = checker.getBoundValue(dimIdx);
+  MT_THROW_IF(
+      dim != 2 && dim != 3,
+      "In PointIndex, points_target must be 2- or 3-dimensional but got dimension {}",
+      dim);
+
+  if (normals_target.defined() && !isEmpty(normals_target)) {
+    MT_THROW_IF(dim != 3, "In PointIndex, normals are only supported for 3-dimensional points");
+    normals_target_ = checker.validateAndFixTensor(
+        normals_target,
+        "normals_target",
+        {nTgtPtsIndex, 3},
+        {"nTgtPts", "xyz"},
+        at::kFloat,
+        true,
+        false,
+        nullptr);
+    normals_target_ = normals_target_.clone();
+
+    if (!isNormalized(normals_target_)) {
+      MT_LOGW(
+          "Inside PointIndex, the tensor of target normals does not appear to be normalized.  This likely indicates a bug.");
+    }
+  }
+
+  const auto nBatch = checker.getBatchSize();
+  const at::Tensor normals = hasNormals() ? normals_target_ : at::Tensor();
+  if (dim == 2) {
+    trees2d_.resize(nBatch);
+  } else {
+    trees3d_.resize(nBatch);
+  }
+
+  dispenso::parallel_for((int64_t)0, nBatch, [&](int64_t iBatch) {
+    const at::Tensor normals_cur = normals.defined() ? normals.select(0, iBatch) : at::Tensor();
+    if (dim == 2) {
+      trees2d_[iBatch] = buildKdTree<2>(points_target_.select(0, iBatch), normals_cur);
+    } else {
+      trees3d_[iBatch] = buildKdTree<3>(points_target_.select(0, iBatch), normals_cur);
+    }
+  });
+}
+
+std::tuple<at::Tensor, at::Tensor, at::Tensor> PointIndex::findClosestPoints(
+    at::Tensor points_source,
+    float maxDist) const {
+  TensorChecker checker("PointIndex.find_closest_points");
 
   bool squeeze_src = false;
 
   const float maxSqrDist = (maxDist == FLT_MAX) ? FLT_MAX : maxDist * maxDist;
 
+  const int64_t dim = dimension();
   const int nSrcPtsIndex = -1;
-  const int nTgtPtsIndex = -2;
-  const int dimIdx = -3;
   points_source = checker.validateAndFixTensor(
       points_source,
       "points_source",
-      {nSrcPtsIndex, dimIdx},
+      {nSrcPtsIndex, (int)dim},
       {"nSrcPoints", "xyz"},
       at::kFloat,
       true,
       false,
       &squeeze_src);
 
-  points_target = checker.validateAndFixTensor(
-      points_target,
-      "points_target",
-      {nTgtPtsIndex, dimIdx},
-      {"nTgtPts", "xyz"},
-      at::kFloat,
-      true,
-      false,
-      nullptr);
-
   const auto nBatch = checker.getBatchSize();
-  const auto dim = checker.getBoundValue(dimIdx);
   const auto nSrcPts = checker.getBoundValue(nSrcPtsIndex);
+  checkIndexBatchSize("PointIndex.find_closest_points", batchSize(), shared_, nBatch);
 
   at::Tensor result_index = at::zeros({nBatch, nSrcPts}, at::CPU(toScalarType<int>()));
   at::Tensor result_points = at::zeros({nBatch, nSrcPts, dim}, at::CPU(toScalarType<float>()));
 
   dispenso::parallel_for((int64_t)0, nBatch, [&](int64_t iBatch) {
+    const int64_t iTree = treeIndex(iBatch);
     if (dim == 2) {
       findClosestPoints_imp<2>(
+          *trees2d_[iTree],
           points_source.select(0, iBatch),
-          points_target.select(0, iBatch),
+          points_target_.select(0, iTree),
           maxSqrDist,
           result_points.select(0, iBatch),
           result_index.select(0, iBatch));
-    } else if (dim == 3) {
+    } else {
       findClosestPoints_imp<3>(
+          *trees3d_[iTree],
           points_source.select(0, iBatch),
-          points_target.select(0, iBatch),
+          points_target_.select(0, iTree),
           maxSqrDist,
           result_points.select(0, iBatch),
           result_index.select(0, iBatch));
@@ -202,21 +322,22 @@ findClosestPoints(at::Tensor points_source, at::Tensor points_target, float maxD
   return {result_points, result_index, result_index >= 0};
 }
 
-std::tuple<at::Tensor, at::Tensor, at::Tensor, at::Tensor> findClosestPointsWithNormals(
+std::tuple<at::Tensor, at::Tensor, at::Tensor, at::Tensor> PointIndex::findClosestPointsWithNormals(
     at::Tensor points_source,
     at::Tensor normals_source,
-    at::Tensor points_target,
-    at::Tensor normals_target,
     float maxDist,
-    float maxNormalDot) {
-  TensorChecker checker("find_closest_points");
+    float maxNormalDot) const {
+  MT_THROW_IF(
+      !hasNormals(),
+      "In PointIndex.find_closest_points, source normals were passed but the index was built without target normals");
+
+  TensorChecker checker("PointIndex.find_closest_points");
 
   bool squeeze_src = false;
 
   const float maxSqrDist = (maxDist == FLT_MAX) ? FLT_MAX : maxDist * maxDist;
 
   const int nSrcPtsIndex = -1;
-  const int nTgtPtsIndex = -2;
   points_source = checker.validateAndFixTensor(
       points_source,
       "points_source",
@@ -237,49 +358,27 @@ std::tuple<at::Tensor, at::Tensor, at::Tensor, at::Tensor> findClosestPointsWith
       false,
       nullptr);
 
-  points_target = checker.validateAndFixTensor(
-      points_target,
-      "points_target",
-      {nTgtPtsIndex, 3},
-      {"nTgtPts", "xyz"},
-      at::kFloat,
-      true,
-      false,
-      nullptr);
-
-  normals_target = checker.validateAndFixTensor(
-      normals_target,
-      "normals_target",
-      {nTgtPtsIndex, 3},
-      {"nTgtPts", "xyz"},
-      at::kFloat,
-      true,
-      false,
-      nullptr);
-
   if (!isNormalized(normals_source)) {
-    py::print(
+    MT_LOGW(
         "Inside find_closest_points, the tensor of source normals does not appear to be normalized.  This likely indicates a bug.");
   }
 
-  if (!isNormalized(normals_target)) {
-    py::print(
-        "Inside find_closest_points, the tensor of target normals does not appear to be normalized.  This likely indicates a bug.");
-  }
-
   const auto nBatch = checker.getBatchSize();
   const auto nSrcPts = checker.getBoundValue(nSrcPtsIndex);
+  checkIndexBatchSize("PointIndex.find_closest_points", batchSize(), shared_, nBatch);
 
   at::Tensor result_index = at::zeros({nBatch, nSrcPts}, at::CPU(toScalarType<int>()));
   at::Tensor result_points = at::zeros({nBatch, nSrcPts, 3}, at::CPU(toScalarType<float>()));
   at::Tensor result_normals = at::zeros({nBatch, nSrcPts, 3}, at::CPU(toScalarType<float>()));
 
   dispenso::parallel_for((int64_t)0, nBatch, [&](int64_t iBatch) {
+    const int64_t iTree = treeIndex(iBatch);
     findClosestPointsWithNormal_imp(
+        *trees3d_[iTree],
         points_source.select(0, iBatch),
         normals_source.select(0, iBatch),
-        points_target.select(0, iBatch),
-        normals_target.select(0, iBatch),
+        points_target_.select(0, iTree),
+        normals_target_.select(0, iTree),
         maxSqrDist,
         maxNormalDot,
         result_points.select(0, iBatch),
@@ -296,65 +395,162 @@ std::tuple<at::Tensor, at::Tensor, at::Tensor, at::Tensor> findClosestPointsWith
   return {result_points, result_normals, result_index, result_index >= 0};
 }
 
-template <typename S>
-void findClosestPointsOnMesh_imp(
+std::tuple<at::Tensor, at::Tensor, at::Tensor>
+findClosestPoints(at::Tensor points_source, at::Tensor points_target, float maxDist) {
+  return PointIndex(points_target).findClosestPoints(points_source, maxDist);
+}
+
+std::tuple<at::Tensor, at::Tensor, at::Tensor, at::Tensor> findClosestPointsWithNormals(
     at::Tensor points_source,
-    at::Tensor vertices_target,
-    at::Tensor faces_target,
-    at::Tensor result_points,
-    at::Tensor result_face_index,
-    at::Tensor result_barycentric) {
-  using TriBvh = typename axel::TriBvh<S, axel::kNativeLaneWidth<S>>;
+    at::Tensor normals_source,
+    at::Tensor points_target,
+    at::Tensor normals_target,
+    float maxDist,
+    float maxNormalDot) {
+  return PointIndex(points_target, normals_target)
+      .findClosestPointsWithNormals(points_source, normals_source, maxDist, maxNormalDot);
+}
 
-  const int64_t nSrcPts = points_source.size(0);
-  const int64_t nTgtVertices = vertices_target.size(0);
-  const int64_t nTgtFaces = faces_target.size(0);
+MeshIndex::MeshIndex(at::Tensor vertices_target, at::Tensor faces_target) {
+  TensorChecker checker("MeshIndex");
 
-  if (faces_target.size(1) != 3 || vertices_target.size(1) != 3) {
-    throw std::runtime_error(
-        "find_closest_points_on_mesh: vertices_target and faces_target must have 3 columns");
-  }
+  const auto dtype = (vertices_target.dtype() == toScalarType<double>()) ? toScalarType<double>()
+                                                                         : toScalarType<float>();
+
+  const int nTgtVerticesIndex = -1;
+  const int nTargetFacesIndex = -2;
+  bool squeeze_vertices = false;
+  vertices_target = checker.validateAndFixTensor(
+      vertices_target,
+      "vertices_target",
+      {nTgtVerticesIndex, 3},
+      {"nTgtVertices", "xyz"},
+      dtype,
+      true,
+      false,
+      &squeeze_vertices);
 
-  if (faces_target.max().item<int>() >= nTgtVertices) {
-    throw std::runtime_error(
-        "find_closest_points_on_mesh: faces_target contains an index >= nTgtVertices");
+  faces_target = checker.validateAndFixTensor(
+      faces_target,
+      "faces_target",
+      {nTargetFacesIndex, 3},
+      {"nTgtFaces", "xyz"},
+      toScalarType<int>(),
+      true,
+      false,
+      nullptr);
+
+  batchSize_ = checker.getBatchSize();
+  nVertices_ = checker.getBoundValue(nTgtVerticesIndex);
+  nFaces_ = checker.getBoundValue(nTargetFacesIndex);
+  // An unbatched mesh is shared by every batch element of the source.
+  shared_ = squeeze_vertices;
+
+  MT_THROW_IF(
+      faces_target.min().item<int>() < 0 || faces_target.max().item<int>() >= nVertices_,
+      "In MeshIndex, faces_target contains an index outside [0, nTgtVertices)");
+
+  const auto buildTrees = [&](auto& trees, auto scalar) {
+    using S = decltype(scalar);
+    trees.resize(batchSize_);
+    dispenso::parallel_for((int64_t)0, batchSize_, [&](int64_t iBatch) {
+      Eigen::MatrixX3i targetFacesMat(nFaces_, 3);
+      Eigen::Map<Eigen::VectorXi> faces_tgt_map = toEigenMap<int>(faces_target.select(0, iBatch));
+      for (int64_t i = 0; i < nFaces_; ++i) {
+        targetFacesMat.row(i) = faces_tgt_map.segment<3>(3 * i);
+      }
+      trees[iBatch] = TriBvh<S>(
+          toVertexMatrix<S>(vertices_target.select(0, iBatch)), std::move(targetFacesMat));
+    });
+  };
+
+  if (dtype == toScalarType<double>()) {
+    buildTrees(treesDouble_, double{});
+  } else {
+    buildTrees(treesFloat_, float{});
   }
+}
+
+std::tuple<at::Tensor, at::Tensor, at::Tensor, at::Tensor> MeshIndex::findClosestPoints(
+    at::Tensor points_source) const {
+  TensorChecker checker("MeshIndex.find_closest_points");
+
+  bool squeeze_src = false;
+
+  const int nSrcPtsIndex = -1;
+  points_source = checker.validateAndFixTensor(
+      points_source,
+      "points_source",
+      {nSrcPtsIndex, 3},
+      {"nSrcPoints", "xyz"},
+      isDouble() ? toScalarType<double>() : toScalarType<float>(),
+      true,
+      false,
+      &squeeze_src);
 
-  Eigen::MatrixX3<S> targetVerticesMat(nTgtVertices, 3);
-  Eigen::Map<Eigen::VectorX<S>> vertices_tgt_map = toEigenMap<S>(vertices_target);
-  for (int64_t i = 0; i < nTgtVertices; ++i) {
-    targetVerticesMat.row(i) = vertices_tgt_map.template segment<3>(3 * i);
+  const auto nBatch = checker.getBatchSize();
+  const auto nSrcPts = checker.getBoundValue(nSrcPtsIndex);
+  checkIndexBatchSize("MeshIndex.find_closest_points", batchSize_, shared_, nBatch);
+
+  // The points and barycentric coordinates have the precision of the index.
+  const auto dtype = isDouble() ? toScalarType<double>() : toScalarType<float>();
+  at::Tensor result_closest_points = at::zeros({nBatch, nSrcPts, 3}, at::CPU(dtype));
+  at::Tensor result_face_index = at::zeros({nBatch, nSrcPts}, at::CPU(toScalarType<int>()));
+  at::Tensor result_barycentric = at::zeros({nBatch, nSrcPts, 3}, at::CPU(dtype));
+
+  for (int64_t iBatch = 0; iBatch < nBatch; ++iBatch) {
+    if (isDouble()) {
+      findClosestPointsOnMesh_imp<double>(
+          treesDouble_[treeIndex(iBatch)],
+          points_source.select(0, iBatch),
+          result_closest_points.select(0, iBatch),
+          result_face_index.select(0, iBatch),
+          result_barycentric.select(0, iBatch));
+    } else {
+      findClosestPointsOnMesh_imp<float>(
+          treesFloat_[treeIndex(iBatch)],
+          points_source.select(0, iBatch),
+          result_closest_points.select(0, iBatch),
+          result_face_index.select(0, iBatch),
+          result_barycentric.select(0, iBatch));
+    }
   }
 
-  Eigen::MatrixX3i targetFacesMat(nTgtFaces, 3);
-  Eigen::Map<Eigen::VectorXi> faces_tgt_map = toEigenMap<int>(faces_target);
-  for (int64_t i = 0; i < nTgtFaces; ++i) {
-    targetFacesMat.row(i) = faces_tgt_map.segment<3>(3 * i);
+  if (squeeze_src) {
+    result_closest_points = result_closest_points.squeeze(0);
+    result_face_index = result_face_index.squeeze(0);
+    result_barycentric = result_barycentric.squeeze(0);
   }
 
-  const TriBvh targetTree(std::move(targetVerticesMat), std::move(targetFacesMat));
+  return {result_face_index >= 0, result_closest_points, result_face_index, result_barycentric};
+}
 
-  Eigen::Map<Eigen::VectorX<S>> pts_src_map = toEigenMap<S>(points_source);
-  Eigen::Map<Eigen::VectorXi> result_face_indices_map = toEigenMap<int>(result_face_index);
-  Eigen::Map<Eigen::VectorX<S>> result_points_map = toEigenMap<S>(result_points);
-  Eigen::Map<Eigen::VectorX<S>> result_bary_map = toEigenMap<S>(result_barycentric);
+void MeshIndex::refit(at::Tensor vertices_target) {
+  TensorChecker checker("MeshIndex.refit");
 
-  dispenso::parallel_for(
-      dispenso::makeChunkedRange(0, nSrcPts), [&](int64_t srcStart, int64_t srcEnd) {
-        for (int64_t k = srcStart; k < srcEnd; ++k) {
-          const Eigen::Vector3<S> p_src = pts_src_map.template segment<3>(3 * k);
-          const auto queryResult = targetTree.closestSurfacePoint(p_src);
-          if (queryResult.triangleIdx == axel::kInvalidTriangleIdx) {
-            result_face_indices_map(k) = -1;
-          } else {
-            result_face_indices_map[k] = queryResult.triangleIdx;
-            result_points_map.template segment<3>(3 * k) = queryResult.point;
-            if (queryResult.baryCoords) {
-              result_bary_map.template segment<3>(3 * k) = *queryResult.baryCoords;
-            }
-          }
-        }
-      });
+  const int64_t nTrees = shared_ ? 1 : batchSize_;
+  vertices_target = checker.validateAndFixTensor(
+      vertices_target,
+      "vertices_target",
+      {(int)nVertices_, 3},
+      {"nTgtVertices", "xyz"},
+      isDouble() ? toScalarType<double>() : toScalarType<float>(),
+      true,
+      false,
+      nullptr);
+  MT_THROW_IF(
+      checker.getBatchSize() != nTrees,
+      "In MeshIndex.refit, expected vertices_target with a batch size of {} but got {}",
+      nTrees,
+      checker.getBatchSize());
+
+  dispenso::parallel_for((int64_t)0, nTrees, [&](int64_t iBatch) {
+    if (isDouble()) {
+      treesDouble_[iBatch].refit(toVertexMatrix<double>(vertices_target.select(0, iBatch)));
+    } else {
+      treesFloat_[iBatch].refit(toVertexMatrix<float>(vertices_target.select(0, iBatch)));
+    }
+  });
 }
 
 std::tuple<at::Tensor, at::Tensor, at::Tensor, at::Tensor> findClosestPointsOnMesh(
@@ -371,6 +567,7 @@ std::tuple<at::Tensor, at::Tensor, at::Tensor, at::Tensor> findClosestPointsOnMe
     dtype = toScalarType<double>();
   }
 
+  // Validate points_source first so that its batch size is the one the mesh gets broadcast to.
   const int nSrcPtsIndex = -1;
   const int nTgtVerticesIndex = -2;
   const int nTargetFacesIndex = -3;
@@ -404,42 +601,18 @@ std::tuple<at::Tensor, at::Tensor, at::Tensor, at::Tensor> findClosestPointsOnMe
       false,
       nullptr);
 
-  const auto nBatch = checker.getBatchSize();
-  const auto nSrcPts = checker.getBoundValue(nSrcPtsIndex);
-
-  at::Tensor result_closest_points = at::zeros({nBatch, nSrcPts, 3}, at::CPU(at::kFloat));
-  at::Tensor result_face_index = at::zeros({nBatch, nSrcPts}, at::CPU(toScalarType<int>()));
-  at::Tensor result_barycentric = at::zeros({nBatch, nSrcPts, 3}, at::CPU(toScalarType<float>()));
-
-  if (dtype == toScalarType<double>()) {
-    for (int64_t iBatch = 0; iBatch < nBatch; ++iBatch) {
-      findClosestPointsOnMesh_imp<double>(
-          points_source.select(0, iBatch),
-          vertices_target.select(0, iBatch),
-          faces_target.select(0, iBatch),
-          result_closest_points.select(0, iBatch),
-          result_face_index.select(0, iBatch),
-          result_barycentric.select(0, iBatch));
-    }
-  } else {
-    for (int64_t iBatch = 0; iBatch < nBatch; ++iBatch) {
-      findClosestPointsOnMesh_imp<float>(
-          points_source.select(0, iBatch),
-          vertices_target.select(0, iBatch),
-          faces_target.select(0, iBatch),
-          result_closest_points.select(0, iBatch),
-          result_face_index.select(0, iBatch),
-          result_barycentric.select(0, iBatch));
-    }
-  }
+  auto [valid, closest_points, face_index, barycentric] =
+      MeshIndex(vertices_target, faces_target).findClosestPoints(points_source);
 
   if (squeeze_src) {
-    result_closest_points = result_closest_points.squeeze(0);
-    result_face_index = result_face_index.squeeze(0);
-    result_barycentric = result_barycentric.squeeze(0);
+    valid = valid.squeeze(0);
+    closest_points = closest_points.squeeze(0);
+    face_index = face_index.squeeze(0);
+    barycentric = barycentric.squeeze(0);
   }
 
-  return {result_face_index >= 0, result_closest_points, result_face_index, result_barycentric};
+  // Unlike MeshIndex, this function always returns single precision points and barycentrics.
+  return {valid, closest_points.to(at::kFloat), face_index, barycentric.to(at::kFloat)};
 }
 
 } // namespace pymomentum
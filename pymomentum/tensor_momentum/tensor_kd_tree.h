@@ -8,8 +8,12 @@
 #pragma once
 
 #include <ATen/ATen.h>
+#include <axel/SimdKdTree.h>
+#include <axel/TriBvh.h>
 
+#include <memory>
 #include <tuple>
+#include <vector>
 
 namespace pymomentum {
 
@@ -30,4 +34,105 @@ std::tuple<at::Tensor, at::Tensor, at::Tensor, at::Tensor> findClosestPointsOnMe
     at::Tensor vertices_target,
     at::Tensor faces_target);
 
+// A k-d tree over a fixed [nBatch] x nTgtPts x dim set of target points (with optional normals)
+// that is built once and can then be queried repeatedly with different source points.  An
+// unbatched target is shared by every batch element of the source.
+class PointIndex {
+ public:
+  explicit PointIndex(at::Tensor points_target, at::Tensor normals_target = at::Tensor());
+
+  // Same semantics and return values as findClosestPoints().
+  std::tuple<at::Tensor, at::Tensor, at::Tensor> findClosestPoints(
+      at::Tensor points_source,
+      float maxDist) const;
+
+  // Same semantics and return values as findClosestPointsWithNormals(); requires the index to have
+  // been built with target normals.
+  std::tuple<at::Tensor, at::Tensor, at::Tensor, at::Tensor> findClosestPointsWithNormals(
+      at::Tensor points_source,
+      at::Tensor normals_source,
+      float maxDist,
+      float maxNormalDot) const;
+
+  [[nodiscard]] int64_t batchSize() const {
+    return points_target_.size(0);
+  }
+
+  [[nodiscard]] int64_t numPoints() const {
+    return points_target_.size(1);
+  }
+
+  [[nodiscard]] int64_t dimension() const {
+    return points_target_.size(2);
+  }
+
+  [[nodiscard]] bool hasNormals() const {
+    return normals_target_.defined();
+  }
+
+ private:
+  // Returns the batch index of the tree to use for the given batch element of the source.
+  [[nodiscard]] int64_t treeIndex(int64_t iBatch) const {
+    return shared_ ? 0 : iBatch;
+  }
+
+  // [nBatch x nTgtPts x dim]; the trees only store indices, so the points are needed to
+  // return the closest points.
+  at::Tensor points_target_;
+  at::Tensor normals_target_;
+  bool shared_ = false;
+
+  std::vector<std::unique_ptr<axel::SimdKdTreef<2>>> trees2d_;
+  std::vector<std::unique_ptr<axel::SimdKdTreef<3>>> trees3d_;
+};
+
+// A BVH over a fixed [nBatch] x (nTgtVertices x 3, nTgtFaces x 3) target mesh that is built once
+// and can then be queried repeatedly.  For deforming meshes, refit() updates the vertex positions
+// and the bounds of the existing trees without rebuilding them.
+class MeshIndex {
+ public:
+  MeshIndex(at::Tensor vertices_target, at::Tensor faces_target);
+
+  // Same semantics and return values as findClosestPointsOnMesh(), except that the points and
+  // barycentric coordinates have the precision of the index.
+  std::tuple<at::Tensor, at::Tensor, at::Tensor, at::Tensor> findClosestPoints(
+      at::Tensor points_source) const;
+
+  // Replaces the vertex positions, keeping the faces and the tree topology.  The new vertices must
+  // have the same shape as the ones the index was built with.
+  void refit(at::Tensor vertices_target);
+
+  [[nodiscard]] int64_t batchSize() const {
+    return batchSize_;
+  }
+
+  [[nodiscard]] int64_t numVertices() const {
+    return nVertices_;
+  }
+
+  [[nodiscard]] int64_t numFaces() const {
+    return nFaces_;
+  }
+
+  [[nodiscard]] bool isDouble() const {
+    return !treesDouble_.empty();
+  }
+
+ private:
+  template <typename S>
+  using TriBvh = axel::TriBvh<S, axel::kNativeLaneWidth<S>>;
+
+  [[nodiscard]] int64_t treeIndex(int64_t iBatch) const {
+    return shared_ ? 0 : iBatch;
+  }
+
+  int64_t batchSize_ = 0;
+  int64_t nVertices_ = 0;
+  int64_t nFaces_ = 0;
+  bool shared_ = false;
+
+  std::vector<TriBvh<float>> treesFloat_;
+  std::vector<TriBvh<double>> treesDouble_;
+};
+
 } // namespace pymomentum
@@ -7,6 +7,7 @@ import unittest
 
 import numpy as np
 import pymomentum.axel as axel
+import torch
 
 
 class TestAxel(unittest.TestCase):
@@ -163,6 +164,72 @@ class TestAxel(unittest.TestCase):
         sampled_value = sdf.sample(sample_pos)
         self.assertAlmostEqual(sampled_value, 1.0, places=3)
 
+    def _sphere_sdf(self, center, radius, resolution):
+        """Create an SDF of a sphere on a grid padded around it."""
+        center = np.asarray(center, dtype=np.float32)
+        bbox = axel.BoundingBox(center - 2 * radius, center + 2 * radius)
+        axes = [
+            np.linspace(-2 * radius, 2 * radius, n, dtype=np.float32)
+            for n in resolution
+        ]
+        # Voxel data is stored with x varying fastest.
+        z, y, x = np.meshgrid(axes[2], axes[1], axes[0], indexing="ij")
+        data = np.sqrt(x**2 + y**2 + z**2) - radius
+        return axel.SignedDistanceField(
+            bbox, np.array(resolution), data.reshape(-1).tolist()
+        )
+
+    def test_sdf_sample_torch(self):
+        """Test sdf_sample against SignedDistanceField.sample and .gradient."""
+        sdfs = [
+            self._sphere_sdf([0.0, 0.0, 0.0], 0.5, [16, 16, 16]),
+            self._sphere_sdf([1.0, 2.0, 0.5], 1.0, [12, 10, 14]),
+        ]
+        torch.manual_seed(0)
+        points = torch.rand(2, 200, 3) * 5 - 2
+
+        # Unbatched points with a single SDF.
+        distances = axel.sdf_sample(points[0], sdfs[0])
+        self.assertEqual(distances.shape, (200,))
+        np.testing.assert_allclose(
+            distances.numpy(), sdfs[0].sample(points[0].numpy()), atol=1e-6
+        )
+
+        # One SDF per batch entry, with different bounds and resolutions.
+        points.requires_grad_()
+        distances = axel.sdf_sample(points, sdfs)
+        self.assertEqual(distances.shape, (2, 200))
+        distances.sum().backward()
+        for b, sdf in enumerate(sdfs):
+            np.testing.assert_allclose(
+                distances[b].detach().numpy(),
+                sdf.sample(points[b].detach().numpy()),
+                atol=1e-6,
+            )
+            np.testing.assert_allclose(
+                points.grad[b].numpy(),
+                sdf.gradient(points[b].detach().numpy()),
+                atol=1e-5,
+            )
+
+        # A single SDF is shared by all batch entries.
+        self.assertEqual(axel.sdf_sample(points, sdfs[:1]).shape, (2, 200))
+
+        with self.assertRaises(Exception):
+            axel.sdf_sample(points, sdfs + sdfs)
+
+    def test_sdf_sample_gradcheck(self):
+        """Test that sdf_sample backpropagates the gradient of the interpolation."""
+        sdf = self._sphere_sdf([0.0, 0.0, 0.0], 0.5, [16, 16, 16])
+        torch.manual_seed(0)
+        points = torch.rand(2, 10, 3, dtype=torch.float64) * 1.6 - 0.8
+        points.requires_grad_()
+        self.assertTrue(
+            torch.autograd.gradcheck(
+                lambda p: axel.sdf_sample(p, sdf), (points,), eps=1e-4, atol=1e-3
+            )
+        )
+
     def test_sdf_repr(self):
         """Test string representation of SDF."""
         min_corner = np.array([0.0, 0.0, 0.0])
@@ -403,6 +470,120 @@ class TestAxel(unittest.TestCase):
             outside_distance, 0, "Point outside cube should have positive distance"
         )
 
+    def test_mesh_to_sdf_propagation_modes(self):
+        """Test that both propagation modes produce matching SDFs."""
+        vertices = np.array(
+            [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.5, 1.0, 0.0], [0.5, 0.5, 1.0]],
+            dtype=np.float32,
+        )
+        triangles = np.array(
+            [[0, 1, 2], [0, 2, 3], [0, 3, 1], [1, 3, 2]], dtype=np.int32
+        )
+        resolution = np.array([20, 20, 20], dtype=np.int64)
+
+        config = axel.MeshToSdfConfig()
+        self.assertEqual(config.propagation_mode, axel.PropagationMode.FastMarching)
+        fast_marching = axel.mesh_to_sdf(vertices, triangles, resolution, config=config)
+
+        config.propagation_mode = axel.PropagationMode.DistanceTransform
+        self.assertIn("DistanceTransform", repr(config))
+        distance_transform = axel.mesh_to_sdf(
+            vertices, triangles, resolution, config=config
+        )
+
+        grid = np.stack(
+            np.meshgrid(*[np.linspace(-0.1, 1.1, 9)] * 3, indexing="ij"), axis=-1
+        ).reshape(-1, 3)
+        grid = grid.astype(np.float32)
+        expected = fast_marching.sample(grid)
+        actual = distance_transform.sample(grid)
+        np.testing.assert_array_equal(actual < 0, expected < 0)
+        np.testing.assert_allclose(
+            actual, expected, atol=float(np.max(fast_marching.voxel_size))
+        )
+
+    def test_mesh_to_sdf_sign_modes(self):
+        """Test that scanline parity classifies voxels like per-voxel ray casting."""
+        vertices = np.array(
+            [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.5, 1.0, 0.0], [0.5, 0.5, 1.0]],
+            dtype=np.float32,
+        )
+        triangles = np.array(
+            [[0, 1, 2], [0, 2, 3], [0, 3, 1], [1, 3, 2]], dtype=np.int32
+        )
+        resolution = np.array([21, 18, 19], dtype=np.int64)
+
+        config = axel.MeshToSdfConfig()
+        self.assertEqual(config.sign_mode, axel.SignMode.RayCasting)
+        ray_casting = axel.mesh_to_sdf(vertices, triangles, resolution, config=config)
+
+        config.sign_mode = axel.SignMode.ScanlineParity
+        self.assertIn("ScanlineParity", repr(config))
+        scanline = axel.mesh_to_sdf(vertices, triangles, resolution, config=config)
+
+        # Only compare points clearly away from the surface, where the sign matters.
+        grid = np.stack(
+            np.meshgrid(*[np.linspace(-0.1, 1.1, 13)] * 3, indexing="ij"), axis=-1
+        ).reshape(-1, 3)
+        grid = grid.astype(np.float32)
+        expected = ray_casting.sample(grid)
+        actual = scanline.sample(grid)
+        far = np.abs(expected) > float(np.max(ray_casting.voxel_size))
+        self.assertTrue(np.any(far & (expected < 0)))
+        np.testing.assert_array_equal(actual[far] < 0, expected[far] < 0)
+
+    def test_sparse_sdf(self):
+        """Test narrow-band sparse SDFs against their dense counterparts."""
+        dense = self._sphere_sdf([0.0, 0.0, 0.0], 0.5, [40, 40, 40])
+        band_width = 0.2
+        sparse = axel.SparseSignedDistanceField.from_dense(dense, band_width)
+        self.assertAlmostEqual(sparse.band_width, band_width)
+        self.assertGreater(sparse.allocated_blocks, 0)
+        self.assertLess(sparse.memory_usage, dense.total_voxels * 4)
+
+        # Inside the band sampling matches the dense field; outside it is clamped.
+        points = np.random.default_rng(0).uniform(-0.9, 0.9, (500, 3))
+        points = points.astype(np.float32)
+        expected = dense.sample(points)
+        actual = sparse.sample(points)
+        near = np.abs(expected) < 0.1
+        self.assertTrue(np.any(near))
+        np.testing.assert_allclose(actual[near], expected[near], atol=1e-5)
+        np.testing.assert_allclose(
+            actual, np.clip(actual, -band_width, band_width), atol=1e-6
+        )
+        np.testing.assert_allclose(
+            sparse.gradient(points)[near], dense.gradient(points)[near], atol=1e-4
+        )
+        np.testing.assert_allclose(sparse.to_dense().sample(points), actual, atol=1e-6)
+
+        # mesh_to_sparse_sdf agrees in sign with the dense conversion.
+        vertices = np.array(
+            [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.5, 1.0, 0.0], [0.5, 0.5, 1.0]],
+            dtype=np.float32,
+        )
+        triangles = np.array(
+            [[0, 1, 2], [0, 2, 3], [0, 3, 1], [1, 3, 2]], dtype=np.int32
+        )
+        resolution = np.array([64, 60, 62], dtype=np.int64)
+        config = axel.MeshToSdfConfig()
+        config.sign_mode = axel.SignMode.ScanlineParity
+        sparse = axel.mesh_to_sparse_sdf(vertices, triangles, resolution, config=config)
+        dense = axel.mesh_to_sdf(vertices, triangles, resolution, config=config)
+        self.assertLess(sparse.allocated_blocks, 8 * 8 * 8 // 2)
+
+        grid = np.stack(
+            np.meshgrid(*[np.linspace(-0.05, 1.05, 12)] * 3, indexing="ij"), axis=-1
+        ).reshape(-1, 3)
+        grid = grid.astype(np.float32)
+        expected = dense.sample(grid)
+        actual = sparse.sample(grid)
+        far = np.abs(expected) > float(np.max(dense.voxel_size))
+        self.assertTrue(np.any(far & (expected < 0)))
+        np.testing.assert_array_equal(actual[far] < 0, expected[far] < 0)
+        near = np.abs(expected) < 0.5 * sparse.band_width
+        np.testing.assert_allclose(actual[near], expected[near], atol=1e-4)
+
     def test_mesh_to_sdf_invalid_inputs(self):
         """Test mesh_to_sdf with invalid inputs."""
         # Valid base case
@@ -725,6 +906,50 @@ class TestAxel(unittest.TestCase):
                 f"Mean distance {mean_distance:.3f} too far outside sphere",
             )
 
+    def test_incremental_dual_contouring(self):
+        """Test that incremental updates give the same mesh as full extraction."""
+        sdf = self._create_sphere_sdf(center=(0, 0, 0), radius=1.0, resolution=40)
+        incremental = axel.IncrementalDualContouring(sdf, isovalue=0.0)
+        self.assertEqual(incremental.num_blocks, 3 * 3 * 3)
+
+        def sorted_quads(vertices, quads):
+            # Quads as the positions of their vertices, independent of the ordering.
+            corners = vertices[quads].reshape(len(quads), 12)
+            return corners[np.lexsort(corners.T[::-1])]
+
+        def assert_same_mesh(expected, actual):
+            np.testing.assert_array_equal(
+                sorted_quads(expected[0], expected[2]),
+                sorted_quads(actual[0], actual[2]),
+            )
+
+        assert_same_mesh(axel.dual_contouring(sdf), incremental.mesh(sdf))
+
+        # Add a bump on the +x side of the sphere. For a cubic grid the buffer is
+        # indexed as [k, j, i].
+        sdf_array = np.asarray(sdf)
+        min_voxel = np.array([28, 15, 16])
+        max_voxel = np.array([36, 23, 24])
+        for k in range(min_voxel[2], max_voxel[2] + 1):
+            for j in range(min_voxel[1], max_voxel[1] + 1):
+                for i in range(min_voxel[0], max_voxel[0] + 1):
+                    world_pos = sdf.grid_to_world(np.array([i, j, k], dtype=np.float32))
+                    bump = np.linalg.norm(world_pos - np.array([1.0, 0.0, 0.0])) - 0.4
+                    sdf_array[k, j, i] = min(sdf_array[k, j, i], bump)
+
+        num_updated = incremental.update(sdf, min_voxel, max_voxel)
+        self.assertGreater(num_updated, 0)
+        self.assertLess(num_updated, incremental.num_blocks)
+        vertices, normals, triangles = incremental.mesh(sdf, triangulate=True)
+        self.assertGreater(vertices[:, 0].max(), 1.2)
+        self.assertEqual(normals.shape, vertices.shape)
+        self.assertEqual(triangles.shape[1], 3)
+        assert_same_mesh(axel.dual_contouring(sdf), incremental.mesh(sdf))
+
+        wrong_resolution = self._create_sphere_sdf(resolution=20)
+        with self.assertRaises(ValueError):
+            incremental.update(wrong_resolution, min_voxel, max_voxel)
+
     def test_smooth_mesh_laplacian(self):
         """Test basic mesh smoothing functionality."""
         print("Testing triangle mesh smoothing...")
@@ -1131,6 +1356,44 @@ class TestAxel(unittest.TestCase):
         self.assertEqual(triangle_ids[0], -1)
         self.assertGreaterEqual(triangle_ids[1], 0)
 
+    def test_tribvh_refit(self):
+        """Test refitting a TriBvh to new vertex positions."""
+        vertices = np.array(
+            [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.5, 1.0, 0.0], [0.5, 0.5, 1.0]],
+            dtype=np.float32,
+        )
+        triangles = np.array(
+            [[0, 1, 2], [0, 2, 3], [0, 3, 1], [1, 3, 2]], dtype=np.int32
+        )
+
+        bvh = axel.TriBvh(vertices, triangles)
+        node_count = bvh.node_count
+        built_cost = bvh.surface_area_cost
+
+        # Move the mesh; a refitted tree must give the same answers as a new one.
+        moved = vertices * 2.0 + np.array([1.0, 0.0, 0.0], dtype=np.float32)
+        self.assertFalse(bvh.refit(moved))
+        self.assertEqual(bvh.node_count, node_count)
+        self.assertAlmostEqual(bvh.surface_area_cost, built_cost, places=4)
+
+        queries = np.array(
+            [[0.0, 0.0, 0.0], [2.0, 1.0, 2.0], [3.0, 3.0, -1.0]], dtype=np.float32
+        )
+        rebuilt = axel.TriBvh(moved, triangles)
+        _, points, _, _ = bvh.closest_surface_point(queries)
+        _, expected_points, _, _ = rebuilt.closest_surface_point(queries)
+        np.testing.assert_allclose(points, expected_points, atol=1e-5)
+
+        origins = np.array([[2.0, 0.6, 2.0]], dtype=np.float32)
+        directions = np.array([[0.0, 0.0, -1.0]], dtype=np.float32)
+        self.assertTrue(bvh.any_hit(origins, directions)[0])
+
+        # A threshold below the current cost forces a rebuild.
+        self.assertTrue(bvh.refit(moved, rebuild_threshold=0.5))
+
+        with self.assertRaises(RuntimeError):
+            bvh.refit(moved[:3])
+
 
 if __name__ == "__main__":
     unittest.main()
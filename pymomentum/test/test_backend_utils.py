@@ -0,0 +1,82 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+# pyre-strict
+
+import unittest
+
+import pymomentum.geometry as pym_geometry
+import torch
+from pymomentum.backend import utils as backend_utils
+
+
+def _reference_prefix_multiplication_indices(
+    joint_parents: list[int],
+) -> list[list[list[int]]]:
+    # Straightforward chain-walking version of the schedule.
+    kc_joints = []
+    for idx_joint in range(len(joint_parents)):
+        kc = [idx_joint]
+        while joint_parents[idx_joint] >= 0:
+            idx_joint = joint_parents[idx_joint]
+            kc.append(idx_joint)
+        kc_joints.append(kc[::-1])
+
+    levels = []
+    while True:
+        level = len(levels)
+        source = []
+        target = []
+        for kc in kc_joints:
+            idx = len(kc) - 1
+            if (idx >> level) & 1:
+                source.append(kc[idx])
+                target.append(kc[((idx >> level) << level) - 1])
+        if not source:
+            break
+        levels.append([source, target])
+    return levels
+
+
+class TestBackendUtils(unittest.TestCase):
+    def _check_schedule(self, joint_parents: list[int]) -> None:
+        actual = backend_utils.calc_fk_prefix_multiplication_indices(
+            torch.tensor(joint_parents, dtype=torch.int32)
+        )
+        expected = _reference_prefix_multiplication_indices(joint_parents)
+        self.assertEqual([level.tolist() for level in actual], expected)
+        for level in actual:
+            self.assertEqual(level.dtype, torch.long)
+
+    def test_prefix_multiplication_indices(self) -> None:
+        self._check_schedule([-1])
+        self._check_schedule([-1, 0, 1, 2, 3, 4, 5, 6, 7])
+        self._check_schedule([-1, 0, 0, 1, 1, 2, 2, 3, 3, 4, 4])
+        # Multiple roots.
+        self._check_schedule([-1, 0, -1, 2, 3, 0])
+        self._check_schedule(
+            pym_geometry.create_test_character().skeleton.joint_parents
+        )
+
+        torch.manual_seed(0)
+        joint_parents = [-1] + [int(torch.randint(0, i, (1,))) for i in range(1, 300)]
+        self._check_schedule(joint_parents)
+
+    def test_prefix_multiplication_indices_cache(self) -> None:
+        joint_parents = torch.tensor([-1, 0, 1, 1, 3])
+        first = backend_utils.calc_fk_prefix_multiplication_indices(joint_parents)
+        # Mutating the result must not leak into the cached schedule.
+        first[0].fill_(-5)
+        second = backend_utils.calc_fk_prefix_multiplication_indices(
+            joint_parents.clone()
+        )
+        self.assertEqual(
+            [level.tolist() for level in second],
+            _reference_prefix_multiplication_indices(joint_parents.tolist()),
+        )
+
+    def test_prefix_multiplication_indices_cycle(self) -> None:
+        with self.assertRaises(ValueError):
+            backend_utils.calc_fk_prefix_multiplication_indices(torch.tensor([1, 2, 0]))
@@ -118,3 +118,128 @@ class TestClosestPoints(unittest.TestCase):
         )
         self.assertFalse(torch.any(closest_valid_2))
         self.assertFalse(torch.any(closest_idx_2 >= 0))
+
+    def test_point_index(self) -> None:
+        torch.manual_seed(0)  # ensure repeatability
+
+        n_batch = 2
+        tgt_pts = torch.rand(n_batch, 50, 3)
+        tgt_normals = torch.nn.functional.normalize(
+            torch.abs(torch.rand(n_batch, 50, 3)), dim=-1
+        )
+        index = geometry.PointIndex(tgt_pts, tgt_normals)
+        self.assertEqual(index.batch_size, n_batch)
+        self.assertEqual(index.num_points, 50)
+        self.assertEqual(index.dimension, 3)
+        self.assertTrue(index.has_normals)
+
+        # The same index can be queried repeatedly and matches the one-shot function.
+        for _ in range(3):
+            src_pts = torch.rand(n_batch, 10, 3)
+            closest_pts, closest_idx, closest_valid = index.find_closest_points(src_pts)
+            gt_closest_pts, gt_closest_idx, gt_closest_valid = (
+                geometry.find_closest_points(src_pts, tgt_pts)
+            )
+            self.assertTrue(torch.equal(closest_pts, gt_closest_pts))
+            self.assertTrue(torch.equal(closest_idx, gt_closest_idx))
+            self.assertTrue(torch.equal(closest_valid, gt_closest_valid))
+
+        src_normals = torch.nn.functional.normalize(
+            torch.abs(torch.rand(n_batch, 10, 3)), dim=-1
+        )
+        _, closest_normals, closest_idx, closest_valid = index.find_closest_points(
+            src_pts, src_normals
+        )
+        _, gt_closest_normals, gt_closest_idx, _ = geometry.find_closest_points(
+            src_pts, src_normals, tgt_pts, tgt_normals
+        )
+        self.assertTrue(torch.all(closest_valid))
+        self.assertTrue(torch.equal(closest_normals, gt_closest_normals))
+        self.assertTrue(torch.equal(closest_idx, gt_closest_idx))
+
+        # An unbatched index is shared across the batch of source points.
+        shared_index = geometry.PointIndex(tgt_pts[0])
+        _, closest_idx, _ = shared_index.find_closest_points(src_pts)
+        _, gt_closest_idx, _ = geometry.find_closest_points(src_pts, tgt_pts[0])
+        self.assertTrue(torch.equal(closest_idx, gt_closest_idx))
+
+        with self.assertRaises(RuntimeError):
+            index.find_closest_points(torch.rand(n_batch + 1, 10, 3))
+
+        # The index keeps its own copy of the targets, so editing them in place has no effect.
+        _, gt_closest_idx, _ = index.find_closest_points(src_pts)
+        tgt_pts.zero_()
+        closest_pts, closest_idx, _ = index.find_closest_points(src_pts)
+        self.assertTrue(torch.equal(closest_idx, gt_closest_idx))
+        self.assertFalse(torch.any(closest_pts == 0))
+
+    def test_mesh_index_refit(self) -> None:
+        torch.manual_seed(0)  # ensure repeatability
+
+        # A 10x10 grid of quads in the xy plane:
+        n = 11
+        x, y = torch.meshgrid(
+            torch.linspace(0, 1, n), torch.linspace(0, 1, n), indexing="ij"
+        )
+        vertices = torch.stack([x, y, torch.zeros_like(x)], dim=-1).reshape(-1, 3)
+        quads = [
+            (i * n + j, (i + 1) * n + j, (i + 1) * n + j + 1, i * n + j + 1)
+            for i in range(n - 1)
+            for j in range(n - 1)
+        ]
+        faces = torch.tensor(
+            [f for a, b, c, d in quads for f in ((a, b, c), (a, c, d))],
+            dtype=torch.int32,
+        )
+
+        index = geometry.MeshIndex(vertices, faces)
+        self.assertEqual(index.num_vertices, n * n)
+        self.assertEqual(index.num_faces, faces.size(0))
+
+        src_pts = torch.rand(2, 20, 3)
+        for result, gt_result in zip(
+            index.find_closest_points(src_pts),
+            geometry.find_closest_points_on_mesh(src_pts, vertices, faces),
+        ):
+            self.assertTrue(torch.allclose(result, gt_result))
+
+        # Deform the mesh and refit; the results should match a freshly built index.
+        deformed = vertices.clone()
+        deformed[:, 2] = 0.3 * torch.sin(3 * deformed[:, 0]) + 0.5 * deformed[:, 1]
+        index.refit(deformed)
+        valid, points, face_index, bary = index.find_closest_points(src_pts)
+        gt_valid, gt_points, _, _ = geometry.find_closest_points_on_mesh(
+            src_pts, deformed, faces
+        )
+        self.assertTrue(torch.equal(valid, gt_valid))
+        self.assertTrue(torch.allclose(points, gt_points, atol=1e-5))
+        self.assertTrue(
+            torch.allclose(
+                points,
+                torch.einsum(
+                    "bnij,bni->bnj", deformed[faces[face_index.long()].long()], bary
+                ),
+                atol=1e-5,
+            )
+        )
+
+        with self.assertRaises(RuntimeError):
+            index.refit(deformed[:-1])
+
+        # A double precision index returns double precision points.
+        double_index = geometry.MeshIndex(deformed.double(), faces)
+        _, double_points, _, double_bary = double_index.find_closest_points(
+            src_pts.double()
+        )
+        self.assertEqual(double_points.dtype, torch.float64)
+        self.assertEqual(double_bary.dtype, torch.float64)
+        self.assertTrue(torch.allclose(double_points.float(), gt_points, atol=1e-5))
+
+        # The one-shot function always returns single precision, and broadcasts an unbatched mesh
+        # to the batch size of the source points even when the faces are batched.
+        _, legacy_points, _, legacy_bary = geometry.find_closest_points_on_mesh(
+            src_pts.double(), deformed, faces.expand(2, -1, -1)
+        )
+        self.assertEqual(legacy_points.dtype, torch.float32)
+        self.assertEqual(legacy_bary.dtype, torch.float32)
+        self.assertTrue(torch.allclose(legacy_points, gt_points, atol=1e-5))
@@ -0,0 +1,140 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+# pyre-strict
+
+import unittest
+from typing import Callable
+from unittest import mock
+
+import torch
+from pymomentum import fused_kernels, quaternion, skel_state
+from pymomentum.backend import skel_state_backend, utils as backend_utils
+
+
+def _random_skel_states(n: int) -> torch.Tensor:
+    return torch.cat(
+        [
+            torch.randn(n, 3, dtype=torch.float64),
+            torch.randn(n, 4, dtype=torch.float64),
+            torch.rand(n, 1, dtype=torch.float64) + 0.5,
+        ],
+        dim=-1,
+    )
+
+
+class TestFusedKernels(unittest.TestCase):
+    def tearDown(self) -> None:
+        fused_kernels.set_enabled(False)
+
+    def _check_matches_plain(
+        self, fn: Callable[..., torch.Tensor], inputs: list[torch.Tensor]
+    ) -> None:
+        inputs = [x.requires_grad_(True) for x in inputs]
+
+        def evaluate(fused: bool) -> tuple[torch.Tensor, tuple[torch.Tensor, ...]]:
+            fused_kernels.set_enabled(fused)
+            result = fn(*inputs)
+            grad_output = torch.linspace(
+                -1, 1, result.numel(), dtype=result.dtype
+            ).view_as(result)
+            return result, torch.autograd.grad(result, inputs, grad_output)
+
+        plain_result, plain_grads = evaluate(False)
+        fused_result, fused_grads = evaluate(True)
+        self.assertTrue(torch.allclose(plain_result, fused_result, atol=1e-12))
+        for plain_grad, fused_grad in zip(plain_grads, fused_grads):
+            self.assertTrue(torch.allclose(plain_grad, fused_grad, atol=1e-12))
+
+    def test_quaternion_ops(self) -> None:
+        torch.manual_seed(0)
+        n = 50
+        q1 = torch.randn(n, 4, dtype=torch.float64)
+        q2 = torch.randn(n, 4, dtype=torch.float64)
+        v = torch.randn(n, 3, dtype=torch.float64)
+        euler = torch.randn(n, 3, dtype=torch.float64)
+
+        self._check_matches_plain(quaternion.multiply, [q1, q2])
+        self._check_matches_plain(quaternion.rotate_vector, [q1, v])
+        self._check_matches_plain(quaternion.to_rotation_matrix, [q1])
+        self._check_matches_plain(quaternion.euler_xyz_to_quaternion, [euler])
+
+    def test_skel_state_multiply(self) -> None:
+        torch.manual_seed(0)
+        s1 = _random_skel_states(20)
+        s2 = _random_skel_states(20)
+        self._check_matches_plain(skel_state.multiply, [s1, s2])
+
+        # The kernel is compiled with dynamic shapes, and broadcasts like the plain op.
+        s2 = _random_skel_states(7).view(7, 1, 8).expand(7, 3, 8)
+        self._check_matches_plain(skel_state.multiply, [s1[:3], s2])
+
+    def test_forward_kinematics_and_skinning(self) -> None:
+        torch.manual_seed(0)
+        joint_parents = torch.tensor([-1, 0, 1, 2, 1, 4, 0, 6])
+        num_joints = joint_parents.shape[0]
+        prefix_mul_indices = backend_utils.calc_fk_prefix_multiplication_indices(
+            joint_parents
+        )
+        local_skel_state = _random_skel_states(3 * num_joints).view(3, num_joints, 8)
+
+        num_vertices = 20
+        vert_indices = torch.arange(num_vertices).repeat_interleave(2)
+        skin_indices = torch.randint(0, num_joints, (2 * num_vertices,))
+        skin_weights = torch.rand(2 * num_vertices, dtype=torch.float64)
+        bind_inv = _random_skel_states(num_joints).expand(3, num_joints, 8)
+        template = torch.randn(num_vertices, 3, dtype=torch.float64)
+
+        def forward_kinematics(state: torch.Tensor) -> torch.Tensor:
+            return skel_state_backend.global_skel_state_from_local_skel_state(
+                state, prefix_mul_indices
+            )
+
+        def skin(state: torch.Tensor) -> torch.Tensor:
+            return skel_state_backend.skin_points_from_skel_state(
+                template,
+                forward_kinematics(state),
+                bind_inv,
+                skin_indices,
+                skin_weights,
+                vert_indices,
+            )
+
+        def skin_dual_quaternion(state: torch.Tensor) -> torch.Tensor:
+            return skel_state_backend.skin_points_from_skel_state_dual_quaternion(
+                template,
+                forward_kinematics(state),
+                bind_inv,
+                skin_indices,
+                skin_weights,
+                vert_indices,
+            )
+
+        # The scripted backends run their Python implementation, so their ops
+        # dispatch to the fused kernels.
+        for fn in [forward_kinematics, skin, skin_dual_quaternion]:
+            with mock.patch.object(
+                fused_kernels, "compiled", wraps=fused_kernels.compiled
+            ) as compiled:
+                self._check_matches_plain(fn, [local_skel_state.clone()])
+            kernels = {call.args[0] for call in compiled.call_args_list}
+            self.assertIn(skel_state.multiply, kernels)
+
+    def test_torchscript_uses_plain_implementation(self) -> None:
+        @torch.jit.script
+        def scripted_multiply(q1: torch.Tensor, q2: torch.Tensor) -> torch.Tensor:
+            return quaternion.multiply(q1, q2)
+
+        fused_kernels.set_enabled(True)
+        self.assertTrue(fused_kernels.is_enabled())
+        q1 = torch.randn(5, 4)
+        q2 = torch.randn(5, 4)
+        self.assertTrue(
+            torch.allclose(scripted_multiply(q1, q2), quaternion.multiply(q1, q2))
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
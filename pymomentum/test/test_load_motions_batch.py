@@ -0,0 +1,91 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+# pyre-strict
+
+import os
+import pkgutil
+import tempfile
+import unittest
+
+import numpy as np
+import pymomentum.geometry as pym_geometry
+import torch
+
+
+class TestLoadMotionsBatch(unittest.TestCase):
+    def setUp(self) -> None:
+        self.character = pym_geometry.create_test_character()
+        torch.manual_seed(0)  # ensure repeatability
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def _save_gltf(self, name: str, num_frames: int, fps: float) -> np.ndarray:
+        n_params = self.character.parameter_transform.size
+        motion = pym_geometry.uniform_random_to_model_parameters(
+            self.character, torch.rand(num_frames, n_params)
+        ).numpy()
+        pym_geometry.Character.save(
+            path=os.path.join(self.temp_dir.name, name),
+            character=self.character,
+            fps=fps,
+            motion=motion,
+        )
+        return motion
+
+    def test_gltf(self) -> None:
+        first = self._save_gltf("first.glb", 4, 30)
+        second = self._save_gltf("second.glb", 7, 60)
+        paths = [
+            os.path.join(self.temp_dir.name, name)
+            for name in ["first.glb", "missing.glb", "second.glb", "motion.txt"]
+        ]
+
+        motions, lengths, fps, errors = pym_geometry.load_motions_batch(
+            paths, self.character, num_threads=2
+        )
+        n_params = self.character.parameter_transform.size
+        self.assertEqual(motions.shape, (4, 7, n_params))
+        self.assertEqual(lengths.tolist(), [4, 0, 7, 0])
+        self.assertEqual(fps.tolist(), [30, 0, 60, 0])
+        self.assertIsNone(errors[0])
+        self.assertIsNotNone(errors[1])
+        self.assertIsNone(errors[2])
+        self.assertIn("Unsupported", errors[3])
+
+        self.assertTrue(np.allclose(motions[0, :4].numpy(), first, atol=1e-5))
+        self.assertTrue(torch.all(motions[0, 4:] == 0))
+        self.assertTrue(torch.all(motions[1] == 0))
+        self.assertTrue(np.allclose(motions[2].numpy(), second, atol=1e-5))
+
+        # The result does not depend on the number of threads.
+        single = pym_geometry.load_motions_batch(paths, self.character, num_threads=1)
+        self.assertTrue(torch.equal(single[0], motions))
+
+    def test_fbx(self) -> None:
+        fbx_bytes = pkgutil.get_data(__package__, "resources/animation_test.fbx")
+        assert fbx_bytes is not None
+        path = os.path.join(self.temp_dir.name, "animation_test.fbx")
+        with open(path, "wb") as f:
+            f.write(fbx_bytes)
+
+        character, animations, fps = pym_geometry.Character.load_fbx_with_motion(path)
+        motions, lengths, batch_fps, errors = pym_geometry.load_motions_batch(
+            [path], character
+        )
+        self.assertEqual(errors, [None])
+        self.assertEqual(lengths.tolist(), [animations[0].shape[0]])
+        self.assertEqual(batch_fps.tolist(), [fps])
+        self.assertTrue(np.allclose(motions[0].numpy(), animations[0]))
+
+    def test_empty(self) -> None:
+        motions, lengths, fps, errors = pym_geometry.load_motions_batch(
+            [], self.character
+        )
+        self.assertEqual(motions.shape, (0, 0, self.character.parameter_transform.size))
+        self.assertEqual(lengths.shape, (0,))
+        self.assertEqual(errors, [])
@@ -0,0 +1,102 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+# pyre-strict
+
+import os
+import pickle
+import tempfile
+import unittest
+
+import numpy as np
+import pymomentum.geometry as pym_geometry
+import torch
+from pymomentum.torch.motion_dataset import MmoWindowDataset
+
+
+class TestMotionDataset(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.rng = np.random.default_rng(0)
+        self.scale = np.zeros(7, dtype=np.float32)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def _save(self, name: str, num_frames: int, parameter_names: list[str]) -> str:
+        path = os.path.join(self.temp_dir.name, name)
+        poses = self.rng.standard_normal(
+            (num_frames, len(parameter_names)), dtype=np.float32
+        )
+        pym_geometry.save_mmo(path, poses, self.scale, parameter_names, ["root"])
+        return path
+
+    def test_mapped_mmo(self) -> None:
+        # Name lengths that leave the poses unaligned in the file.
+        parameter_names = ["a", "bb", "ccc"]
+        path = self._save("motion.mmo", 5, parameter_names)
+
+        mmo = pym_geometry.MappedMmo(path)
+        self.assertEqual(mmo.num_frames, 5)
+        self.assertEqual(mmo.num_parameters, 3)
+        self.assertEqual(mmo.parameter_names, parameter_names)
+        self.assertEqual(mmo.joint_names, ["root"])
+        self.assertEqual(mmo.poses.shape, (5, 3))
+        self.assertEqual(mmo.poses.dtype, np.float32)
+        self.assertFalse(mmo.poses.flags.writeable)
+        self.assertTrue(np.array_equal(np.asarray(mmo), mmo.poses))
+
+        with self.assertRaises(RuntimeError):
+            pym_geometry.MappedMmo(os.path.join(self.temp_dir.name, "missing.mmo"))
+
+    def test_windows(self) -> None:
+        parameter_names = ["a", "b", "c"]
+        paths = [
+            self._save("first.mmo", 10, parameter_names),
+            self._save("short.mmo", 2, parameter_names),
+            self._save("second.mmo", 7, parameter_names),
+        ]
+        dataset = MmoWindowDataset(paths, window_size=4, stride=2)
+
+        # Windows start at frames 0, 2, 4, 6 of the first file and 0, 2 of the
+        # last one; the short file has none.
+        self.assertEqual(len(dataset), 6)
+        self.assertEqual(dataset.locate(3), (0, 6))
+        self.assertEqual(dataset.locate(5), (2, 2))
+        self.assertEqual(dataset.locate(-1), (2, 2))
+        with self.assertRaises(IndexError):
+            dataset[6]
+
+        window = dataset[5]
+        self.assertEqual(window.shape, (4, 3))
+        self.assertEqual(window.dtype, torch.float32)
+        expected = pym_geometry.MappedMmo(paths[2]).poses[2:6]
+        self.assertTrue(np.array_equal(window.numpy(), expected))
+
+        # The dataset can be sent to DataLoader worker processes.
+        copy = pickle.loads(pickle.dumps(dataset))
+        self.assertTrue(torch.equal(copy[5], window))
+
+        batch = next(iter(torch.utils.data.DataLoader(dataset, batch_size=6)))
+        self.assertEqual(batch.shape, (6, 4, 3))
+
+    def test_parameter_mapping(self) -> None:
+        paths = [
+            self._save("first.mmo", 3, ["a", "b"]),
+            self._save("second.mmo", 3, ["b", "c"]),
+        ]
+        dataset = MmoWindowDataset(paths, window_size=3, parameter_names=["a", "b"])
+        self.assertEqual(dataset.parameter_names, ["a", "b"])
+
+        window = dataset[1].numpy()
+        poses = pym_geometry.MappedMmo(paths[1]).poses
+        self.assertTrue(np.array_equal(window[:, 0], np.zeros(3, dtype=np.float32)))
+        self.assertTrue(np.array_equal(window[:, 1], poses[:, 0]))
+
+    def test_invalid_arguments(self) -> None:
+        with self.assertRaises(ValueError):
+            MmoWindowDataset([], window_size=0)
+        with self.assertRaises(ValueError):
+            MmoWindowDataset([], window_size=1, stride=0)
@@ -12,6 +12,7 @@ import unittest
 import numpy as np
 
 import pymomentum.geometry as pym_geometry
+import torch
 
 from pymomentum.marker_tracking import (
     CalibrationConfig,
@@ -164,6 +165,134 @@ class TestMarkerTracker(unittest.TestCase):
             self.assertEqual(ref_motion.shape[0], num_frames)
             self.assertEqual(ref_motion.shape[1], character.parameter_transform.size)
 
+    def test_columnar_marker_data(self) -> None:
+        character = pym_geometry.create_test_character()
+        identity = np.zeros(0, dtype=np.float32)
+
+        marker_sequence = pym_geometry.MarkerSequence()
+        num_frames = 10
+        marker_sequence.frames = [
+            [
+                pym_geometry.Marker(
+                    loc.name,
+                    np.array([frame_i, 0.0, 0.0] + loc.offset),
+                    frame_i % 4 == 0 and loc_i == 0,
+                )
+                for loc_i, loc in enumerate(character.locators)
+            ]
+            for frame_i in range(num_frames)
+        ]
+        marker_sequence.fps = 60
+
+        columnar = pym_geometry.ColumnarMarkerSequence.from_marker_sequence(
+            marker_sequence
+        )
+        num_markers = len(character.locators)
+        self.assertEqual(columnar.num_frames, num_frames)
+        self.assertEqual(columnar.num_markers, num_markers)
+        self.assertEqual(columnar.fps, 60)
+        self.assertEqual(
+            columnar.marker_names, [loc.name for loc in character.locators]
+        )
+        self.assertEqual(columnar.positions.shape, (num_frames, num_markers, 3))
+        self.assertEqual(columnar.positions.dtype, torch.float32)
+        self.assertEqual(columnar.occluded.shape, (num_frames, num_markers))
+        self.assertEqual(columnar.occluded.dtype, torch.bool)
+        self.assertTrue(columnar.occluded[4, 0])
+        self.assertFalse(columnar.occluded[5, 0])
+        self.assertAlmostEqual(
+            columnar.positions[3, 1, 0].item(),
+            3.0 + character.locators[1].offset[0],
+            places=5,
+        )
+
+        # The tensors share memory with the sequence.
+        columnar.positions[0, 0, 1] = 5.0
+        self.assertEqual(columnar.positions[0, 0, 1].item(), 5.0)
+        round_trip = columnar.to_marker_sequence()
+        self.assertEqual(len(round_trip.frames), num_frames)
+        self.assertAlmostEqual(round_trip.frames[0][0].pos[1], 5.0)
+
+        # The tensors stay valid after the sequence is released.
+        positions = columnar.positions
+        del columnar
+        self.assertEqual(positions[0, 0, 1].item(), 5.0)
+
+        # Constructing from tensors copies the data.
+        copy = pym_geometry.ColumnarMarkerSequence(
+            "copy",
+            [marker.name for marker in round_trip.frames[0]],
+            positions,
+            torch.zeros(num_frames, num_markers, dtype=torch.bool),
+        )
+        self.assertEqual(copy.name, "copy")
+        self.assertFalse(copy.occluded.any())
+        self.assertTrue(torch.equal(copy.positions, positions))
+        with self.assertRaises(RuntimeError):
+            pym_geometry.ColumnarMarkerSequence(
+                "bad", copy.marker_names, positions[:, :1], copy.occluded
+            )
+
+        # The marker tracking entry points accept the columnar form directly.
+        motion = process_markers(
+            character,
+            identity,
+            pym_geometry.ColumnarMarkerSequence.from_marker_sequence(marker_sequence),
+            TrackingConfig(),
+            CalibrationConfig(),
+        )
+        self.assertEqual(motion.shape[0], num_frames)
+        self.assertEqual(motion.shape[1], character.parameter_transform.size)
+
+    def test_stream_markers(self) -> None:
+        num_frames = 25
+        marker_names = ["a", "b"]
+        lines = [
+            "PathFileType\t4\t(X/Y/Z)\tmarkers.trc",
+            "DataRate\tCameraRate\tNumFrames\tNumMarkers\tUnits\tOrigDataRate"
+            "\tOrigDataStartFrame\tOrigNumFrames",
+            f"120\t120\t{num_frames}\t2\tmm\t120\t1\t{num_frames}",
+            "Frame#\tTime\ta\t\t\tb\t\t",
+            "\t\tX1\tY1\tZ1\tX2\tY2\tZ2",
+        ]
+        for frame_i in range(num_frames):
+            b = "\t\t" if frame_i % 5 == 0 else f"{frame_i}\t1\t2"
+            lines.append(f"{frame_i + 1}\t{frame_i / 120}\t{frame_i}\t0\t0\t{b}")
+
+        with tempfile.NamedTemporaryFile(suffix=".trc", mode="w") as temp_file:
+            temp_file.write("\n".join(lines) + "\n")
+            temp_file.flush()
+
+            full = pym_geometry.load_markers_columnar(temp_file.name)[0]
+            stream = pym_geometry.MarkerStream(temp_file.name, chunk_size=10)
+            self.assertEqual(stream.num_frames, num_frames)
+            self.assertEqual(stream.subjects[0].marker_names, marker_names)
+            self.assertEqual(stream.subjects[0].num_frames, 0)
+
+            chunks = [chunk[0] for chunk in stream]
+            self.assertEqual([chunk.num_frames for chunk in chunks], [10, 10, 5])
+            self.assertTrue(
+                torch.equal(
+                    torch.cat([chunk.occluded for chunk in chunks]), full.occluded
+                )
+            )
+            self.assertTrue(
+                torch.allclose(
+                    torch.cat([chunk.positions for chunk in chunks]), full.positions
+                )
+            )
+
+            # Iterate over a frame range and seek back to its start.
+            stream = pym_geometry.MarkerStream(
+                temp_file.name, chunk_size=4, start_frame=12, end_frame=18
+            )
+            chunks = [chunk[0] for chunk in stream]
+            self.assertEqual([chunk.num_frames for chunk in chunks], [4, 2])
+            self.assertTrue(torch.allclose(chunks[0].positions, full.positions[12:16]))
+            stream.seek(12)
+            self.assertEqual(stream.current_frame, 12)
+            self.assertTrue(torch.equal(next(stream)[0].occluded, full.occluded[12:16]))
+
 
 if __name__ == "__main__":
     unittest.main()
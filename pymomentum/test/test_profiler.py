@@ -0,0 +1,97 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+# pyre-strict
+
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pymomentum.geometry as pym_geometry
+import pymomentum.profiler as profiler
+
+
+class TestProfiler(unittest.TestCase):
+    def setUp(self) -> None:
+        profiler.clear()
+
+    def tearDown(self) -> None:
+        profiler.disable()
+        profiler.clear()
+
+    def test_enable(self) -> None:
+        self.assertFalse(profiler.is_enabled())
+        with profiler.Zone("disabled"):
+            pass
+        self.assertEqual(profiler.events(), [])
+
+        profiler.enable()
+        self.assertTrue(profiler.is_enabled())
+        with profiler.Zone("outer"):
+            with profiler.Zone("inner"):
+                pass
+        profiler.disable()
+
+        events = profiler.events()
+        self.assertEqual([e.name for e in events], ["outer", "inner"])
+        outer, inner = events
+        self.assertGreaterEqual(inner.begin_ns, outer.begin_ns)
+        self.assertLessEqual(
+            inner.begin_ns + inner.duration_ns, outer.begin_ns + outer.duration_ns
+        )
+
+        stats = {s.name: s for s in profiler.zone_stats()}
+        self.assertEqual(stats["outer"].count, 1)
+        self.assertLessEqual(stats["outer"].self_ms, stats["outer"].total_ms)
+        self.assertIn("outer", profiler.zone_stats_table())
+
+    def test_zones_of_other_modules(self) -> None:
+        # Skinning is profiled in the geometry module, which records into the
+        # profiler of this one.
+        character = pym_geometry.create_test_character()
+        joint_params = np.zeros(
+            pym_geometry.PARAMETERS_PER_JOINT * character.skeleton.size,
+            dtype=np.float32,
+        )
+        profiler.enable()
+        character.pose_mesh(joint_params)
+        profiler.disable()
+        self.assertGreater(len(profiler.events()), 0)
+
+    def test_buffer_capacity(self) -> None:
+        capacity = profiler.buffer_capacity()
+        try:
+            profiler.set_buffer_capacity(2)
+            profiler.enable()
+            for _ in range(5):
+                with profiler.Zone("zone"):
+                    pass
+            self.assertEqual(len(profiler.events()), 2)
+            self.assertEqual(profiler.dropped_events(), 3)
+            with self.assertRaises(RuntimeError):
+                profiler.set_buffer_capacity(0)
+        finally:
+            profiler.set_buffer_capacity(capacity)
+
+    def test_chrome_trace(self) -> None:
+        profiler.enable()
+        profiler.set_thread_name("main")
+        with profiler.Zone('quoted "zone"'):
+            pass
+        profiler.disable()
+
+        trace = json.loads(profiler.chrome_trace())
+        complete = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+        self.assertEqual(len(complete), 1)
+        self.assertEqual(complete[0]["name"], 'quoted "zone"')
+        self.assertGreaterEqual(complete[0]["dur"], 0)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "trace.json")
+            profiler.save_chrome_trace(path)
+            with open(path) as f:
+                self.assertEqual(json.load(f), trace)
@@ -194,6 +194,66 @@ class TestQuaternion(unittest.TestCase):
             "quaternion blending of single-axis Euler rotation should be the midway rotation.",
         )
 
+    def test_blend_power_matches_eigh(self) -> None:
+        torch.manual_seed(0)  # ensure repeatability
+        nBatch = 200
+        nBlend = 5
+        # Include tightly clustered blends as well as widely spread ones.
+        q = quaternion.normalize(
+            torch.normal(mean=0, std=1, size=(nBatch, nBlend, 4), dtype=torch.float64)
+            * torch.tensor([0.1, 0.1, 0.1, 1.0], dtype=torch.float64)
+        )
+        q = torch.cat([q, generateRandomQuats(nBatch * nBlend).view(nBatch, nBlend, 4)])
+        weights = torch.rand(2 * nBatch, nBlend, dtype=torch.float64)
+
+        q_power = quaternion.blend(q, weights, method="power")
+        q_eigh = quaternion.blend(q, weights, method="eigh")
+        self.assertLess(
+            torch.norm(
+                quaternion.to_rotation_matrix(q_power)
+                - quaternion.to_rotation_matrix(q_eigh)
+            ),
+            1e-8,
+        )
+
+        # The power blend is in the hemisphere of the most heavily weighted quaternion.
+        heaviest = q.gather(
+            -2, weights.argmax(dim=-1)[:, None, None].expand(-1, 1, 4)
+        ).squeeze(-2)
+        self.assertTrue(torch.all((q_power * heaviest).sum(-1) >= 0))
+
+    def test_blend_power_degenerate(self) -> None:
+        # Two rotations 180 degrees apart with equal weights have no unique blend; the
+        # power method falls back to eigh and still returns a unit quaternion.
+        q = torch.tensor([[[0.0, 0.0, 0.0, 1.0], [1.0, 0.0, 0.0, 0.0]]])
+        q_blend = quaternion.blend(q)
+        self.assertTrue(torch.allclose(q_blend.norm(dim=-1), torch.ones(1)))
+
+        # Antipodal copies of the same rotation represent the same rotation.
+        q = generateRandomQuats(4).detach()
+        q_antipodal = torch.stack([q, -q], dim=-2)
+        q_blend = quaternion.blend(q_antipodal)
+        self.assertLess(
+            torch.norm(
+                quaternion.to_rotation_matrix(q_blend)
+                - quaternion.to_rotation_matrix(q)
+            ),
+            1e-8,
+        )
+
+    def test_blend_power_gradient(self) -> None:
+        torch.manual_seed(0)  # ensure repeatability
+        q = (
+            torch.normal(mean=0, std=1, size=(3, 4, 4), dtype=torch.float64)
+            * torch.tensor([0.3, 0.3, 0.3, 1.0], dtype=torch.float64)
+        ).requires_grad_(True)
+        weights = torch.rand(3, 4, dtype=torch.float64, requires_grad=True)
+        torch.autograd.gradcheck(
+            lambda q, w: quaternion.blend(quaternion.normalize(q), w),
+            [q, weights],
+            raise_exception=True,
+        )
+
     def test_from_two_vectors(self) -> None:
         # Test with two random vectors
         n_batch = 5
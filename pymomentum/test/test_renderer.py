@@ -8,6 +8,7 @@
 import unittest
 
 import numpy as np
+import pymomentum.axel as pym_axel
 import pymomentum.geometry as pym_geometry
 import pymomentum.renderer as pym_renderer
 import torch
@@ -121,6 +122,105 @@ class TestRendering(unittest.TestCase):
         #  `float`.
         self.assertGreater(torch.mean(right_lighting[:, image_width // 2 :]), 0.1)
 
+    def test_ray_cast(self) -> None:
+        """Test that ray casting matches rasterization, for tensors and prebuilt BVHs."""
+        character = pym_geometry.create_test_character()
+        positions = torch.from_numpy(character.mesh.vertices).float()
+        triangles = torch.from_numpy(character.mesh.faces).int()
+        batched_positions = torch.stack(
+            [positions, positions + torch.tensor([0.1, 0.2, 0.0])]
+        )
+
+        image_width, image_height = 40, 30
+        base_camera = pym_renderer.Camera(
+            pym_renderer.PinholeIntrinsicsModel(
+                image_width=image_width, image_height=image_height
+            )
+        )
+        center = positions.mean(dim=0).numpy()
+        cameras = [
+            base_camera.look_at(
+                position=center + np.asarray(direction, dtype=np.float32),
+                target=center,
+            ).frame(batched_positions.flatten(0, 1).numpy())
+            for direction in ([0, 0, 10], [10, 0, 0])
+        ]
+
+        depth, triangle_index, barycentric = pym_renderer.ray_cast(
+            batched_positions, triangles, cameras
+        )
+        self.assertEqual(depth.shape, (2, 2, image_height, image_width))
+        self.assertEqual(triangle_index.shape, (2, 2, image_height, image_width))
+        self.assertEqual(barycentric.shape, (2, 2, image_height, image_width, 3))
+
+        for i_mesh in range(2):
+            for i_camera, camera in enumerate(cameras):
+                z_buffer = pym_renderer.create_z_buffer(camera)
+                triangle_buffer = pym_renderer.create_index_buffer(camera)
+                pym_renderer.rasterize_mesh(
+                    batched_positions[i_mesh],
+                    None,
+                    triangles,
+                    camera,
+                    z_buffer,
+                    triangle_index_buffer=triangle_buffer,
+                    back_face_culling=False,
+                )
+                z_buffer = z_buffer[:, :image_width]
+                triangle_buffer = triangle_buffer[:, :image_width]
+
+                # Only pixels on silhouette edges may disagree on whether they are hit.
+                hit = triangle_index[i_mesh, i_camera] >= 0
+                self.assertGreater(hit.sum(), 0)
+                self.assertLess((hit != (triangle_buffer >= 0)).float().mean(), 0.05)
+                same = triangle_index[i_mesh, i_camera] == triangle_buffer
+                self.assertGreater(same[hit].float().mean(), 0.9)
+                torch.testing.assert_close(
+                    depth[i_mesh, i_camera][same & hit],
+                    z_buffer[same & hit],
+                    rtol=1e-4,
+                    atol=1e-4,
+                )
+
+        # The barycentric coordinates interpolate the hit point at the returned depth.
+        hit = triangle_index >= 0
+        bary = barycentric[hit]
+        torch.testing.assert_close(bary.sum(dim=-1), torch.ones(bary.shape[0]))
+        self.assertGreaterEqual(bary.min(), -1e-5)
+        i_mesh, i_camera, _, _ = torch.nonzero(hit, as_tuple=True)
+        hit_triangles = triangles[triangle_index[hit]].long()
+        hit_points = (
+            batched_positions[i_mesh[:, None], hit_triangles] * bary[..., None]
+        ).sum(dim=1)
+        eye_from_world = torch.stack(
+            [torch.from_numpy(c.T_eye_from_world) for c in cameras]
+        )[i_camera]
+        eye_z = (eye_from_world[:, 2, :3] * hit_points).sum(-1) + eye_from_world[
+            :, 2, 3
+        ]
+        torch.testing.assert_close(eye_z, depth[hit], rtol=1e-4, atol=1e-4)
+
+        # Prebuilt BVHs give the same depth; rays through shared triangle edges may
+        # report either triangle.
+        bvhs = [
+            pym_axel.TriBvh(p.numpy(), triangles.numpy()) for p in batched_positions
+        ]
+        bvh_depth, bvh_triangle_index, _ = pym_renderer.ray_cast(bvhs, cameras)
+        torch.testing.assert_close(bvh_depth, depth)
+        self.assertTrue(torch.equal(bvh_triangle_index >= 0, hit))
+        self.assertGreater(
+            (bvh_triangle_index == triangle_index)[hit].float().mean(), 0.9
+        )
+
+        # Unbatched positions drop the mesh dimension.
+        unbatched_depth, _, _ = pym_renderer.ray_cast(
+            positions, triangles, cameras, far_clip=1e4
+        )
+        self.assertEqual(unbatched_depth.shape, (2, image_height, image_width))
+        torch.testing.assert_close(
+            unbatched_depth, depth[0].clamp(max=1e4), rtol=1e-4, atol=1e-4
+        )
+
     def test_subdivide_uneven(self) -> None:
         """Check that we can do uneven subdivision where only some edges are split."""
 
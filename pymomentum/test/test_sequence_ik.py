@@ -105,6 +105,167 @@ class TestSolver(unittest.TestCase):
             )
         )
 
+    def test_sequence_ik_windowed(self) -> None:
+        """Test solve_sequence_ik() solving overlapping windows of a longer sequence."""
+
+        character = pym_geometry.create_test_character()
+
+        n_joints = character.skeleton.size
+        n_params = character.parameter_transform.size
+
+        n_frames = 11
+
+        torch.manual_seed(0)
+        model_params_target = torch.rand(n_frames, n_params, dtype=torch.float64)
+
+        scaling_params = character.parameter_transform.scaling_parameters
+        avg_parameters = model_params_target.mean(0)
+        model_params_target[:, scaling_params] = avg_parameters.unsqueeze(0).expand_as(
+            model_params_target
+        )[:, scaling_params]
+
+        pos_cons_parents = torch.arange(0, n_joints, 1)
+        pos_cons_offsets = torch.zeros(n_frames, n_joints, 3)
+        pos_cons_targets = pym_geometry.model_parameters_to_positions(
+            character, model_params_target, pos_cons_parents, pos_cons_offsets
+        ).detach()
+
+        orient_cons_parents = torch.arange(n_joints)
+        orient_cons_targets = pym_geometry.model_parameters_to_skeleton_state(
+            character, model_params_target
+        ).index_select(1, orient_cons_parents)[:, :, 3:7]
+
+        active_error_functions = [
+            ErrorFunctionType.Position,
+            ErrorFunctionType.Orientation,
+        ]
+        error_function_weights = 100 * torch.ones(
+            n_frames,
+            len(active_error_functions),
+            dtype=torch.float64,
+        )
+
+        options = pym_solver.SolverOptions(
+            sequence_window_size=4, sequence_window_overlap=2
+        )
+        model_params_final = pym_solver.solve_sequence_ik(
+            character=character,
+            active_parameters=character.parameter_transform.all_parameters,
+            shared_parameters=scaling_params,
+            model_parameters_init=torch.zeros(n_frames, n_params),
+            active_error_functions=active_error_functions,
+            error_function_weights=error_function_weights,
+            options=options,
+            position_cons_parents=pos_cons_parents,
+            position_cons_offsets=pos_cons_offsets,
+            position_cons_targets=pos_cons_targets,
+            orientation_cons_parents=orient_cons_parents,
+            orientation_cons_targets=orient_cons_targets,
+        ).detach()
+
+        self.assertEqual(model_params_final.shape, (n_frames, n_params))
+        self.assertTrue(
+            pym_geometry.model_parameters_to_positions(
+                character, model_params_final, pos_cons_parents, pos_cons_offsets
+            ).allclose(pos_cons_targets, atol=1e-4)
+        )
+        # The shared parameters are stitched to a single consensus value.
+        final_scale = model_params_final[:, scaling_params]
+        self.assertTrue(final_scale.allclose(final_scale[:1].expand_as(final_scale)))
+        self.assertTrue(
+            final_scale.allclose(model_params_target[:, scaling_params], atol=1e-5)
+        )
+
+        with self.assertRaises(RuntimeError):
+            pym_solver.solve_sequence_ik(
+                character=character,
+                active_parameters=character.parameter_transform.all_parameters,
+                shared_parameters=scaling_params,
+                model_parameters_init=torch.zeros(n_frames, n_params),
+                active_error_functions=active_error_functions,
+                error_function_weights=error_function_weights,
+                options=pym_solver.SolverOptions(
+                    sequence_window_size=4, sequence_window_overlap=4
+                ),
+                position_cons_parents=pos_cons_parents,
+                position_cons_offsets=pos_cons_offsets,
+                position_cons_targets=pos_cons_targets,
+            )
+
+    def test_sequence_ik_windowed_continuity(self) -> None:
+        """Test that windowed solve_sequence_ik() has no jumps at the window boundaries."""
+
+        character = pym_geometry.create_test_character()
+
+        n_joints = character.skeleton.size
+        n_params = character.parameter_transform.size
+
+        n_frames = 11
+        window_size = 4
+        window_overlap = 2
+
+        # Targets that move smoothly over time, with a fixed scale.
+        torch.manual_seed(0)
+        pose_begin = torch.rand(n_params, dtype=torch.float64)
+        pose_end = torch.rand(n_params, dtype=torch.float64)
+        t = torch.linspace(0, 1, n_frames, dtype=torch.float64).unsqueeze(-1)
+        model_params_target = (1 - t) * pose_begin + t * pose_end
+
+        scaling_params = character.parameter_transform.scaling_parameters
+        model_params_target[:, scaling_params] = pose_begin[scaling_params]
+
+        pos_cons_parents = torch.arange(0, n_joints, 1)
+        pos_cons_offsets = torch.zeros(n_frames, n_joints, 3)
+        pos_cons_targets = pym_geometry.model_parameters_to_positions(
+            character, model_params_target, pos_cons_parents, pos_cons_offsets
+        ).detach()
+
+        orient_cons_parents = torch.arange(n_joints)
+        orient_cons_targets = pym_geometry.model_parameters_to_skeleton_state(
+            character, model_params_target
+        ).index_select(1, orient_cons_parents)[:, :, 3:7]
+
+        active_error_functions = [
+            ErrorFunctionType.Position,
+            ErrorFunctionType.Orientation,
+        ]
+        error_function_weights = 100 * torch.ones(
+            n_frames,
+            len(active_error_functions),
+            dtype=torch.float64,
+        )
+
+        model_params_final = pym_solver.solve_sequence_ik(
+            character=character,
+            active_parameters=character.parameter_transform.all_parameters,
+            shared_parameters=scaling_params,
+            model_parameters_init=torch.zeros(n_frames, n_params),
+            active_error_functions=active_error_functions,
+            error_function_weights=error_function_weights,
+            options=pym_solver.SolverOptions(
+                sequence_window_size=window_size,
+                sequence_window_overlap=window_overlap,
+            ),
+            position_cons_parents=pos_cons_parents,
+            position_cons_offsets=pos_cons_offsets,
+            position_cons_targets=pos_cons_targets,
+            orientation_cons_parents=orient_cons_parents,
+            orientation_cons_targets=orient_cons_targets,
+        ).detach()
+
+        # Every frame, including the ones where the windows meet, reaches its
+        # target with the stitched shared parameters.
+        final_positions = pym_geometry.model_parameters_to_positions(
+            character, model_params_final, pos_cons_parents, pos_cons_offsets
+        )
+        self.assertTrue(final_positions.allclose(pos_cons_targets, atol=1e-4))
+
+        # The steps between consecutive frames follow the targets' steps, so
+        # there is no jump where one window hands over to the next.
+        final_steps = final_positions[1:] - final_positions[:-1]
+        target_steps = pos_cons_targets[1:] - pos_cons_targets[:-1]
+        self.assertTrue(final_steps.allclose(target_steps, atol=1e-4))
+
 
 if __name__ == "__main__":
     unittest.main()
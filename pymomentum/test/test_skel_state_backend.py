@@ -0,0 +1,475 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+# pyre-strict
+
+import concurrent.futures
+import copy
+import unittest
+
+import pymomentum.geometry as pym_geometry
+import pymomentum.quaternion as pym_quaternion
+import torch
+from pymomentum.backend import (
+    skel_state_backend,
+    trs_backend,
+    utils as backend_utils,
+)
+from pymomentum.torch.character import Character
+
+
+def _random_local_skel_state(
+    batch_shape: tuple[int, ...], num_joints: int
+) -> torch.Tensor:
+    t = torch.normal(mean=0, std=2, size=batch_shape + (num_joints, 3))
+    q = pym_quaternion.normalize(torch.normal(0, 1, size=batch_shape + (num_joints, 4)))
+    s = torch.rand(size=batch_shape + (num_joints, 1)) + 0.5
+    return torch.cat([t, q, s], dim=-1)
+
+
+def _random_skinning(
+    num_vertices: int, num_joints: int, max_influences: int = 4
+) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+    skin_indices = torch.randint(0, num_joints, (num_vertices, max_influences))
+    skin_weights = torch.rand(num_vertices, max_influences)
+    # Leave some influence slots empty.
+    skin_weights[skin_weights < 0.2] = 0
+    skin_weights = skin_weights / skin_weights.sum(dim=-1, keepdim=True).clamp(min=1e-5)
+    return backend_utils.flatten_skinning_weights_and_indices(
+        skin_weights, skin_indices
+    )
+
+
+class TestSkelStateBackend(unittest.TestCase):
+    def setUp(self) -> None:
+        torch.manual_seed(0)
+        self.character: pym_geometry.Character = pym_geometry.create_test_character()
+        self.prefix_mul_indices: list[torch.Tensor] = (
+            backend_utils.calc_fk_prefix_multiplication_indices(
+                torch.tensor(self.character.skeleton.joint_parents)
+            )
+        )
+
+    def test_forward_kinematics_engine_matches_impl(self) -> None:
+        fk = skel_state_backend.SkelStateForwardKinematics(self.prefix_mul_indices)
+        num_joints = self.character.skeleton.size
+        for batch_shape in [(), (5,), (2, 3)]:
+            local_skel_state = _random_local_skel_state(batch_shape, num_joints)
+            expected, expected_intermediate = (
+                skel_state_backend.global_skel_state_from_local_skel_state_impl(
+                    local_skel_state, self.prefix_mul_indices
+                )
+            )
+            actual, actual_intermediate = fk.forward(
+                local_skel_state, save_intermediate_results=True
+            )
+            self.assertEqual(actual.shape, expected.shape)
+            self.assertEqual(actual.dtype, local_skel_state.dtype)
+            self.assertTrue(torch.allclose(actual, expected, atol=1e-6))
+            self.assertEqual(len(actual_intermediate), len(expected_intermediate))
+            for a, e in zip(actual_intermediate, expected_intermediate):
+                self.assertTrue(torch.allclose(a, e, atol=1e-6))
+
+    def test_forward_kinematics_engine_reuses_buffers(self) -> None:
+        fk = skel_state_backend.SkelStateForwardKinematics(self.prefix_mul_indices)
+        num_joints = self.character.skeleton.size
+        state_a = _random_local_skel_state((4,), num_joints)
+        state_b = _random_local_skel_state((4,), num_joints)
+
+        result_a = fk(state_a)
+        workspace = fk._local.workspace
+        result_b = fk(state_b)
+        # Same shape: the work buffers must be reused, and earlier results must not
+        # be overwritten by later calls.
+        self.assertIs(fk._local.workspace, workspace)
+        self.assertTrue(torch.allclose(result_a, fk(state_a)))
+        self.assertFalse(torch.allclose(result_a, result_b))
+
+        # Copies allocate their own buffers.
+        fk_copy = copy.deepcopy(fk)
+        self.assertTrue(torch.allclose(fk_copy(state_a), result_a))
+        self.assertIsNot(fk_copy._local.workspace, workspace)
+
+    def test_forward_kinematics_engine_threads(self) -> None:
+        fk = skel_state_backend.SkelStateForwardKinematics(self.prefix_mul_indices)
+        num_joints = self.character.skeleton.size
+        states = [_random_local_skel_state((16,), num_joints) for _ in range(4)]
+        expected = [fk(state) for state in states]
+
+        # Concurrent calls with the same batch shape use separate work buffers.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            for _ in range(5):
+                results = list(executor.map(fk, states))
+                for result, e in zip(results, expected):
+                    self.assertTrue(torch.equal(result, e))
+
+    def test_checkpointed_backward_matches_default(self) -> None:
+        num_joints = self.character.skeleton.size
+        local_skel_state = _random_local_skel_state((3,), num_joints).requires_grad_()
+        grad_output = torch.normal(0, 1, size=(3, num_joints, 8))
+
+        def compute_grad(checkpoint_every: int | None) -> torch.Tensor:
+            local_skel_state.grad = None
+            global_skel_state = (
+                skel_state_backend.global_skel_state_from_local_skel_state(
+                    local_skel_state,
+                    self.prefix_mul_indices,
+                    checkpoint_every=checkpoint_every,
+                )
+            )
+            (global_skel_state * grad_output).sum().backward()
+            grad = local_skel_state.grad
+            assert grad is not None
+            return grad.clone()
+
+        expected = compute_grad(None)
+        num_levels = len(self.prefix_mul_indices)
+        for checkpoint_every in [1, 2, num_levels]:
+            self.assertTrue(
+                torch.allclose(compute_grad(checkpoint_every), expected, atol=1e-4)
+            )
+
+        with self.assertRaises(ValueError):
+            compute_grad(0)
+
+    def test_checkpointed_gradcheck(self) -> None:
+        num_joints = self.character.skeleton.size
+        local_skel_state = (
+            _random_local_skel_state((2,), num_joints).double().requires_grad_()
+        )
+        torch.autograd.gradcheck(
+            lambda s: skel_state_backend.global_skel_state_from_local_skel_state(
+                s, self.prefix_mul_indices, checkpoint_every=1
+            ),
+            [local_skel_state],
+            raise_exception=True,
+        )
+
+    def test_character_fk_checkpoint_every(self) -> None:
+        character = Character(self.character, fk_checkpoint_every=1)
+        self.assertEqual(character.skeleton.fk_checkpoint_every, 1)
+
+        num_joints = self.character.skeleton.size
+        local_skel_state = _random_local_skel_state((2,), num_joints).requires_grad_()
+        actual = character.local_skeleton_state_to_skeleton_state(local_skel_state)
+        expected = Character(self.character).local_skeleton_state_to_skeleton_state(
+            local_skel_state
+        )
+        self.assertTrue(torch.allclose(actual, expected, atol=1e-5))
+
+    def test_fk_precision(self) -> None:
+        num_joints = self.character.skeleton.size
+        local_skel_state = _random_local_skel_state((4,), num_joints)
+        local_skel_state[..., 0, :3] += 1000.0
+        expected = skel_state_backend.global_skel_state_from_local_skel_state(
+            local_skel_state.double(), self.prefix_mul_indices
+        )
+        grad_output = torch.normal(0, 1, size=(4, num_joints, 8))
+
+        grads = {}
+        for precision in skel_state_backend.FK_PRECISIONS:
+            for checkpoint_every in [None, 1]:
+                local = local_skel_state.clone().requires_grad_()
+                actual = skel_state_backend.global_skel_state_from_local_skel_state(
+                    local,
+                    self.prefix_mul_indices,
+                    checkpoint_every=checkpoint_every,
+                    precision=precision,
+                )
+                self.assertEqual(actual.dtype, torch.float32)
+                self.assertTrue(
+                    torch.allclose(actual.double(), expected, rtol=1e-5, atol=1e-3)
+                )
+                (actual * grad_output).sum().backward()
+                grads[(precision, checkpoint_every)] = local.grad
+
+        reference_grad = grads[("float64", None)]
+        for grad in grads.values():
+            self.assertTrue(torch.allclose(grad, reference_grad, atol=1e-3))
+
+        with self.assertRaises(ValueError):
+            skel_state_backend.global_skel_state_from_local_skel_state(
+                local_skel_state, self.prefix_mul_indices, precision="float16"
+            )
+
+    def test_compensated_forward_kinematics_gradcheck(self) -> None:
+        num_joints = self.character.skeleton.size
+        local_skel_state = (
+            _random_local_skel_state((2,), num_joints).double().requires_grad_()
+        )
+        torch.autograd.gradcheck(
+            lambda s: skel_state_backend.global_skel_state_from_local_skel_state(
+                s, self.prefix_mul_indices, precision="compensated_float32"
+            ),
+            [local_skel_state],
+            raise_exception=True,
+        )
+
+    def test_functional_forward_kinematics(self) -> None:
+        num_joints = self.character.skeleton.size
+        local_skel_state = _random_local_skel_state((3,), num_joints).requires_grad_()
+        grad_output = torch.normal(0, 1, size=(3, num_joints, 8))
+
+        expected = skel_state_backend.global_skel_state_from_local_skel_state(
+            local_skel_state, self.prefix_mul_indices
+        )
+        (expected * grad_output).sum().backward()
+        expected_grad = local_skel_state.grad
+        assert expected_grad is not None
+        expected_grad = expected_grad.clone()
+        local_skel_state.grad = None
+
+        # fullgraph=True fails on any graph break.
+        fk = torch.compile(
+            skel_state_backend.global_skel_state_from_local_skel_state_functional,
+            backend="eager",
+            fullgraph=True,
+        )
+        actual = fk(local_skel_state, self.prefix_mul_indices)
+        (actual * grad_output).sum().backward()
+        self.assertTrue(torch.allclose(actual, expected, atol=1e-5))
+        actual_grad = local_skel_state.grad
+        assert actual_grad is not None
+        self.assertTrue(torch.allclose(actual_grad, expected_grad, atol=1e-4))
+
+    def test_sparse_skinning_matches_dense(self) -> None:
+        num_joints = self.character.skeleton.size
+        num_vertices = 50
+        skin_indices, skin_weights, vert_indices = _random_skinning(
+            num_vertices, num_joints
+        )
+        weights_csr, weights_csr_t = backend_utils.calc_skinning_weights_csr(
+            skin_indices, skin_weights, vert_indices, num_vertices, num_joints
+        )
+        bind_inv = _random_local_skel_state((), num_joints)
+        template = torch.normal(0, 1, size=(num_vertices, 3))
+
+        for batch_shape in [(1,), (3,), (2, 3)]:
+            global_skel_state = _random_local_skel_state(
+                batch_shape, num_joints
+            ).requires_grad_()
+            grad_output = torch.normal(0, 1, size=batch_shape + (num_vertices, 3))
+
+            expected = skel_state_backend.skin_points_from_skel_state(
+                template,
+                global_skel_state,
+                bind_inv.expand(global_skel_state.shape),
+                skin_indices,
+                skin_weights,
+                vert_indices,
+            )
+            (expected_grad,) = torch.autograd.grad(
+                (expected * grad_output).sum(), global_skel_state
+            )
+            actual = skel_state_backend.skin_points_from_skel_state_sparse(
+                template, global_skel_state, bind_inv, weights_csr, weights_csr_t
+            )
+            (actual_grad,) = torch.autograd.grad(
+                (actual * grad_output).sum(), global_skel_state
+            )
+            self.assertEqual(actual.shape, expected.shape)
+            self.assertTrue(torch.allclose(actual, expected, atol=1e-4))
+            self.assertTrue(torch.allclose(actual_grad, expected_grad, atol=1e-3))
+
+        # TRS backend.
+        global_skel_state = _random_local_skel_state((3,), num_joints)
+        t, r, s = (
+            global_skel_state[..., :3],
+            pym_quaternion.to_rotation_matrix(global_skel_state[..., 3:7]),
+            global_skel_state[..., 7:],
+        )
+        t0, r0 = bind_inv[..., :3], pym_quaternion.to_rotation_matrix(
+            bind_inv[..., 3:7]
+        )
+        template = template.expand(3, -1, -1)
+        expected = trs_backend.skinning(
+            template, t, r, s, t0, r0, skin_indices, skin_weights, vert_indices
+        )
+        actual = trs_backend.skinning_sparse(
+            template, t, r, s, t0, r0, weights_csr, weights_csr_t
+        )
+        self.assertTrue(torch.allclose(actual, expected, atol=1e-4))
+
+    def test_sparse_skinning_weights_not_in_state_dict(self) -> None:
+        dense = Character(self.character)
+        sparse = Character(self.character, use_sparse_weights=True)
+        # The CSR weights are derived from the flattened weights, so checkpoints
+        # do not depend on the skinning path.
+        state_dict = sparse.state_dict()
+        self.assertFalse(any("weights_csr" in key for key in state_dict))
+        self.assertEqual(state_dict.keys(), dense.state_dict().keys())
+        dense.load_state_dict(state_dict, strict=True)
+
+    def test_sparse_skinning_weights_built_on_demand(self) -> None:
+        # The dense path does not build the CSR weights.
+        dense = Character(self.character)
+        lbs = dense.linear_blend_skinning
+        self.assertNotIn("weights_csr_values", lbs._buffers)
+
+        skel_state = dense.bind_pose()
+        expected = dense.skin_points(skel_state)
+        lbs.use_sparse_weights = True
+        self.assertTrue(torch.allclose(dense.skin_points(skel_state), expected))
+        self.assertIn("weights_csr_values", lbs._buffers)
+
+        # Loading different weights rebuilds the CSR weights.
+        sparse = Character(self.character, use_sparse_weights=True)
+        state_dict = sparse.state_dict()
+        key = "linear_blend_skinning.skin_weights_flattened"
+        state_dict[key] = state_dict[key] * 2
+        sparse.load_state_dict(state_dict)
+        self.assertTrue(
+            torch.allclose(sparse.skin_points(skel_state), 2 * expected, atol=1e-4)
+        )
+
+    def test_sparse_skinning_gradcheck(self) -> None:
+        num_joints = self.character.skeleton.size
+        num_vertices = 10
+        skin_indices, skin_weights, vert_indices = _random_skinning(
+            num_vertices, num_joints
+        )
+        weights_csr, weights_csr_t = backend_utils.calc_skinning_weights_csr(
+            skin_indices, skin_weights, vert_indices, num_vertices, num_joints
+        )
+        joint_matrices = torch.normal(
+            0, 1, size=(2, num_joints, 3, 4), dtype=torch.float64
+        ).requires_grad_()
+        template = torch.normal(
+            0, 1, size=(2, num_vertices, 3), dtype=torch.float64
+        ).requires_grad_()
+        torch.autograd.gradcheck(
+            lambda m, x: trs_backend.skinning_from_joint_matrices_sparse(
+                x, m, weights_csr, weights_csr_t
+            ),
+            [joint_matrices, template],
+            raise_exception=True,
+        )
+
+    def test_dual_quaternion_skinning(self) -> None:
+        num_joints = self.character.skeleton.size
+        num_vertices = 40
+        skin_indices, skin_weights, vert_indices = _random_skinning(
+            num_vertices, num_joints
+        )
+        bind_inv = _random_local_skel_state((), num_joints)
+        template = torch.normal(0, 1, size=(num_vertices, 3))
+        global_skel_state = _random_local_skel_state((2, 3), num_joints)
+
+        actual = skel_state_backend.skin_points_from_skel_state_dual_quaternion(
+            template,
+            global_skel_state,
+            bind_inv,
+            skin_indices,
+            skin_weights,
+            vert_indices,
+        )
+        self.assertEqual(actual.shape, (2, 3, num_vertices, 3))
+
+        # Quaternion sign must not matter.
+        flipped = global_skel_state.clone()
+        flipped[..., ::2, 3:7] *= -1
+        self.assertTrue(
+            torch.allclose(
+                skel_state_backend.skin_points_from_skel_state_dual_quaternion(
+                    template,
+                    flipped,
+                    bind_inv,
+                    skin_indices,
+                    skin_weights,
+                    vert_indices,
+                ),
+                actual,
+                atol=1e-4,
+            )
+        )
+
+        # With one influence per vertex, DQS and LBS are the same rigid transform.
+        rigid_indices = torch.randint(0, num_joints, (num_vertices,))
+        rigid_weights = torch.ones(num_vertices)
+        rigid_verts = torch.arange(num_vertices)
+        bind_inv_batched = bind_inv.expand(global_skel_state.shape)
+        self.assertTrue(
+            torch.allclose(
+                skel_state_backend.skin_points_from_skel_state_dual_quaternion(
+                    template,
+                    global_skel_state,
+                    bind_inv_batched,
+                    rigid_indices,
+                    rigid_weights,
+                    rigid_verts,
+                ),
+                skel_state_backend.skin_points_from_skel_state(
+                    template,
+                    global_skel_state,
+                    bind_inv_batched,
+                    rigid_indices,
+                    rigid_weights,
+                    rigid_verts,
+                ),
+                atol=1e-4,
+            )
+        )
+
+    def test_dual_quaternion_skinning_preserves_volume(self) -> None:
+        # Two joints along x, the second twisted by 180 degrees: LBS collapses a
+        # 50/50 weighted vertex onto the axis, DQS keeps its distance to the axis.
+        joint_state = torch.tensor(
+            [
+                [
+                    [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0],
+                    [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0],
+                ]
+            ]
+        )
+        bind_inv = torch.tensor([[[0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0]] * 2])
+        template = torch.tensor([[[0.5, 1.0, 0.0]]])
+        skin_indices = torch.tensor([0, 1])
+        skin_weights = torch.tensor([0.5, 0.5])
+        vert_indices = torch.tensor([0, 0])
+
+        lbs = skel_state_backend.skin_points_from_skel_state(
+            template, joint_state, bind_inv, skin_indices, skin_weights, vert_indices
+        )
+        dqs = skel_state_backend.skin_points_from_skel_state_dual_quaternion(
+            template, joint_state, bind_inv, skin_indices, skin_weights, vert_indices
+        )
+        self.assertAlmostEqual(lbs[0, 0, 1:].norm().item(), 0.0, places=5)
+        self.assertAlmostEqual(dqs[0, 0, 1:].norm().item(), 1.0, places=5)
+        self.assertAlmostEqual(dqs[0, 0, 0].item(), 0.5, places=5)
+
+    def test_character_dual_quaternion_skinning(self) -> None:
+        character = Character(self.character, use_dual_quaternion=True)
+        self.assertTrue(character.linear_blend_skinning.use_dual_quaternion)
+        skinned = character.skin_points(character.bind_pose())
+        self.assertTrue(
+            torch.allclose(skinned[0], character.mesh.rest_vertices, atol=1e-4)
+        )
+
+        with self.assertRaises(ValueError):
+            Character(self.character, use_sparse_weights=True, use_dual_quaternion=True)
+
+    def test_dual_quaternion_skinning_gradcheck(self) -> None:
+        num_joints = self.character.skeleton.size
+        num_vertices = 10
+        skin_indices, skin_weights, vert_indices = _random_skinning(
+            num_vertices, num_joints
+        )
+        bind_inv = _random_local_skel_state((), num_joints).double()
+        template = torch.normal(0, 1, size=(num_vertices, 3), dtype=torch.float64)
+        global_skel_state = (
+            _random_local_skel_state((2,), num_joints).double().requires_grad_()
+        )
+        torch.autograd.gradcheck(
+            lambda g: skel_state_backend.skin_points_from_skel_state_dual_quaternion(
+                template,
+                g,
+                bind_inv,
+                skin_indices,
+                skin_weights.double(),
+                vert_indices,
+            ),
+            [global_skel_state],
+            raise_exception=True,
+        )
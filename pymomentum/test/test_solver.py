@@ -624,6 +624,34 @@ class TestSolver(unittest.TestCase):
         self.assertEqual(n_solve, 2)
         self.assertEqual(n_solve_iter, 6)
 
+        iterations, converged, solve_time = (
+            pym_solver.get_last_solve_ik_batch_statistics()
+        )
+        self.assertEqual(iterations.tolist(), [3, 3])
+        self.assertFalse(converged.any())
+        self.assertEqual(solve_time.shape, (batch_size,))
+        self.assertTrue((solve_time >= 0).all())
+
+        # A shared iteration budget stops every element after its first
+        # iteration, regardless of the scheduling.
+        solverOptions.batch_chunk_size = 1
+        solverOptions.iteration_budget = 1
+        pym_solver.solve_ik(
+            options=solverOptions,
+            character=character,
+            active_parameters=active_params,
+            model_parameters_init=model_params_init,
+            active_error_functions=active_error_functions,
+            error_function_weights=error_function_weights,
+            position_cons_parents=pos_cons_parents,
+            position_cons_offsets=pos_cons_offsets,
+            position_cons_weights=5.0 * pos_cons_weights,
+            position_cons_targets=pos_cons_targets,
+        )
+        iterations, converged, _ = pym_solver.get_last_solve_ik_batch_statistics()
+        self.assertEqual(iterations.tolist(), [1, 1])
+        self.assertFalse(converged.any())
+
     def test_transform_pose(self) -> None:
         character = pym_geometry.create_test_character()
         torch.manual_seed(0)  # ensure repeatability
@@ -789,6 +817,79 @@ class TestSolver(unittest.TestCase):
             torch.allclose(residual[0, :2], vertex_residual.to(torch.double))
         )
 
+    def test_ik_solver_handle(self) -> None:
+        """IKSolver should match solve_ik() and warm-start from its last result."""
+        character = pym_geometry.create_test_character()
+        n_joints = character.skeleton.size
+        n_params = character.parameter_transform.size
+        batch_size = 2
+
+        torch.manual_seed(0)
+        model_params_init = torch.zeros(batch_size, n_params, dtype=torch.float64)
+        pos_cons_parents = torch.arange(0, n_joints)
+        pos_cons_weights = torch.ones(batch_size, n_joints, dtype=torch.float64)
+        active_error_functions = [
+            ErrorFunctionType.Limit,
+            ErrorFunctionType.Position,
+        ]
+        error_function_weights = torch.ones(
+            batch_size, len(active_error_functions), dtype=torch.float64
+        )
+
+        ik_solver = pym_solver.IKSolver(
+            character=character,
+            active_parameters=character.parameter_transform.all_parameters,
+            active_error_functions=active_error_functions,
+        )
+        self.assertIsNone(ik_solver.model_parameters)
+        self.assertIsNone(ik_solver.batch_statistics)
+        with self.assertRaises(RuntimeError):
+            # Nothing to warm-start from yet.
+            ik_solver.solve(error_function_weights=error_function_weights)
+
+        for i_frame in range(3):
+            model_params_target = torch.linspace(
+                start=-1, end=1, steps=n_params, dtype=torch.float64
+            ) * (0.1 * (i_frame + 1))
+            pos_cons_targets = pym_geometry.model_parameters_to_positions(
+                character,
+                model_params_target,
+                pos_cons_parents,
+                torch.zeros(n_joints, 3, dtype=torch.float64),
+            ).detach()
+
+            previous = ik_solver.model_parameters
+            expected = pym_solver.solve_ik(
+                character=character,
+                active_parameters=character.parameter_transform.all_parameters,
+                model_parameters_init=(
+                    model_params_init if previous is None else previous
+                ),
+                active_error_functions=active_error_functions,
+                error_function_weights=error_function_weights,
+                position_cons_parents=pos_cons_parents,
+                position_cons_weights=pos_cons_weights,
+                position_cons_targets=pos_cons_targets,
+            )
+            actual = ik_solver.solve(
+                error_function_weights=error_function_weights,
+                model_parameters_init=(model_params_init if i_frame == 0 else None),
+                position_cons_parents=pos_cons_parents,
+                position_cons_weights=pos_cons_weights,
+                position_cons_targets=pos_cons_targets,
+            )
+            self.assertEqual(actual.shape, (batch_size, n_params))
+            self.assertTrue(torch.allclose(actual, expected, atol=1e-6))
+            self.assertTrue(torch.equal(ik_solver.model_parameters, actual))
+
+            iterations, converged, solve_time = ik_solver.batch_statistics
+            self.assertEqual(iterations.shape, (batch_size,))
+            self.assertEqual(converged.shape, (batch_size,))
+            self.assertTrue((solve_time >= 0).all())
+
+        ik_solver.reset()
+        self.assertIsNone(ik_solver.model_parameters)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -526,6 +526,39 @@ class TestTRS(unittest.TestCase):
         # Rotation should be a weighted blend of the two different rotations
         self.assertFalse(torch.allclose(r_blend, torch.eye(3), atol=1e-2))
 
+    def test_blend_batched(self) -> None:
+        """Test blending batched transforms with weights shared across the batch."""
+        torch.manual_seed(0)
+        nBatch = 6
+        trs_list = [
+            pym_trs.from_skeleton_state(
+                torch.cat(
+                    [
+                        torch.randn(nBatch, 3),
+                        pym_quaternion.normalize(torch.randn(nBatch, 4)),
+                        torch.rand(nBatch, 1) + 0.5,
+                    ],
+                    dim=-1,
+                )
+            )
+            for _ in range(3)
+        ]
+        weights = torch.tensor([0.2, 0.3, 0.5])
+
+        t_blend, r_blend, s_blend = pym_trs.blend(trs_list, weights)
+        self.assertEqual(t_blend.shape, (nBatch, 3))
+        self.assertEqual(r_blend.shape, (nBatch, 3, 3))
+        self.assertEqual(s_blend.shape, (nBatch, 1))
+
+        # Every batch entry should match blending that entry on its own.
+        for i in range(nBatch):
+            t_i, r_i, s_i = pym_trs.blend(
+                [(t[i], r[i], s[i]) for t, r, s in trs_list], weights, method="eigh"
+            )
+            self.assertTrue(torch.allclose(t_blend[i], t_i, atol=1e-6))
+            self.assertTrue(torch.allclose(r_blend[i], r_i, atol=1e-4))
+            self.assertTrue(torch.allclose(s_blend[i], s_i, atol=1e-6))
+
     def test_blend_single_transform(self) -> None:
         """Test that blending a single transform returns the transform itself."""
         trs_single = pym_trs.from_translation(torch.tensor([1.0, 2.0, 3.0]))
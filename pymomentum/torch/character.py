@@ -5,7 +5,7 @@
 
 # pyre-strict
 
-from typing import Tuple
+from typing import Any, Dict, List, Tuple
 
 import pymomentum.geometry as pym_geometry
 import pymomentum.quaternion as pym_quaternion
@@ -25,8 +25,30 @@ class Skeleton(torch.nn.Module):
         character: pym_geometry.Character,
         *,
         dtype: torch.dtype = torch.float32,
+        fk_checkpoint_every: int | None = None,
+        fk_precision: str = "float64",
     ) -> None:
+        """
+        :param character: The character whose skeleton to use.
+        :param dtype: The dtype of the skeleton buffers.
+        :param fk_checkpoint_every: Memory/compute trade-off for backpropagating through
+            forward kinematics; see
+            :func:`pymomentum.backend.skel_state_backend.global_skel_state_from_local_skel_state`.
+            None saves every intermediate level; smaller values save more level
+            boundaries and recompute less in the backward pass.
+        :param fk_precision: Precision policy for forward kinematics: "float64",
+            "float32" or "compensated_float32"; see
+            :func:`pymomentum.backend.skel_state_backend.fk_precision_flags`.
+            The TRS methods treat "compensated_float32" as "float32".
+        """
         super().__init__()
+        self.fk_checkpoint_every: int | None = fk_checkpoint_every
+        use_double_precision, compensated = skel_state_backend.fk_precision_flags(
+            fk_precision
+        )
+        self.fk_precision: str = fk_precision
+        self._fk_use_double_precision: bool = use_double_precision
+        self._fk_compensated: bool = compensated
 
         self.register_buffer(
             "joint_translation_offsets",
@@ -51,6 +73,13 @@ class Skeleton(torch.nn.Module):
         self._pmi_buffer_sizes: list[int] = [
             t.shape[1] for t in prefix_multiplication_indices
         ]
+        # Reusable no-grad FK engine; its work buffers are allocated on first use.
+        self._forward_kinematics: skel_state_backend.SkelStateForwardKinematics = (
+            skel_state_backend.SkelStateForwardKinematics(
+                prefix_multiplication_indices,
+                use_double_precision=use_double_precision,
+            )
+        )
 
         self.joint_names: list[str] = character.skeleton.joint_names
         self.register_buffer(
@@ -183,6 +212,7 @@ class Skeleton(torch.nn.Module):
                     dim=1,
                 )
             ),
+            use_double_precision=self._fk_use_double_precision,
         )
 
     def local_trs_to_global_trs(
@@ -222,6 +252,7 @@ class Skeleton(torch.nn.Module):
                     dim=1,
                 )
             ),
+            use_double_precision=self._fk_use_double_precision,
         )
 
     def global_trs_to_local_trs(
@@ -264,11 +295,36 @@ class Skeleton(torch.nn.Module):
                     dim=1,
                 )
             ),
+            use_double_precision=self._fk_use_double_precision,
         )
 
     def local_skeleton_state_to_skeleton_state(
         self, local_skel_state: torch.Tensor
     ) -> torch.Tensor:
+        if torch.compiler.is_compiling():
+            # Plain differentiable ops on the registered schedule buffer, so that
+            # torch.compile can trace FK into the surrounding graph.
+            return (
+                skel_state_backend.global_skel_state_from_local_skel_state_functional(
+                    local_skel_state=local_skel_state,
+                    prefix_mul_indices=list(
+                        self.pmi.split(
+                            split_size=self._pmi_buffer_sizes,
+                            dim=1,
+                        )
+                    ),
+                    use_double_precision=self._fk_use_double_precision,
+                    compensated=self._fk_compensated,
+                )
+            )
+        if not (
+            self._fk_compensated
+            or torch.jit.is_scripting()
+            or torch.jit.is_tracing()
+            or (torch.is_grad_enabled() and local_skel_state.requires_grad)
+        ):
+            # Inference path: reuse the preallocated FK work buffers.
+            return self._forward_kinematics(local_skel_state)
         return skel_state_backend.global_skel_state_from_local_skel_state(
             local_skel_state=local_skel_state,
             prefix_mul_indices=list(
@@ -277,6 +333,8 @@ class Skeleton(torch.nn.Module):
                     dim=1,
                 )
             ),
+            checkpoint_every=self.fk_checkpoint_every,
+            precision=self.fk_precision,
         )
 
     def skeleton_state_to_local_skeleton_state(
@@ -351,9 +409,33 @@ class LinearBlendSkinning(torch.nn.Module):
         character: pym_geometry.Character,
         *,
         dtype: torch.dtype = torch.float32,
+        use_sparse_weights: bool = False,
+        use_dual_quaternion: bool = False,
     ) -> None:
+        """
+        Args:
+            character: Character providing the inverse bind pose and skinning weights.
+            dtype: Floating point type of the registered buffers.
+            use_sparse_weights: If True, skinning blends the per-joint transforms with
+                a sparse (CSR) weight matrix instead of gathering a transform per
+                (vertex, joint) influence. This is typically faster and uses less
+                memory for large meshes and batches; results match the dense path
+                up to floating point round-off.
+            use_dual_quaternion: If True, use dual quaternion skinning instead of
+                linear blending; see
+                :func:`~pymomentum.backend.skel_state_backend.skin_points_from_skel_state_dual_quaternion`.
+                This avoids the volume loss of linear blending around twisting
+                joints. Cannot be combined with ``use_sparse_weights``.
+        """
         super().__init__()
 
+        if use_sparse_weights and use_dual_quaternion:
+            raise ValueError(
+                "use_sparse_weights and use_dual_quaternion cannot be combined."
+            )
+        self.use_sparse_weights: bool = use_sparse_weights
+        self.use_dual_quaternion: bool = use_dual_quaternion
+
         self.register_buffer(
             "inverse_bind_pose",
             pym_skel_state.from_matrix(
@@ -384,6 +466,74 @@ class LinearBlendSkinning(torch.nn.Module):
             "vert_indices_flattened", vert_indices_flattened.detach().clone()
         )
 
+        # The CSR matrices are only needed by the sparse path; they are built here
+        # when it is selected, and otherwise on the first sparse call.
+        if use_sparse_weights:
+            self._build_skinning_weights_csr()
+
+    def _build_skinning_weights_csr(self) -> None:
+        # The CSR matrices are stored as their dense components so that the module
+        # can be moved and cast like any other; see _skinning_weights_csr. They are
+        # derived from the flattened weights, so they are not part of the state dict.
+        weights_csr, weights_csr_t = backend_utils.calc_skinning_weights_csr(
+            self.skin_indices_flattened,
+            self.skin_weights_flattened,
+            self.vert_indices_flattened,
+            self.num_vertices,
+            self.inverse_bind_pose.shape[-2],
+        )
+        for name, tensor in [
+            ("weights_csr_crow_indices", weights_csr.crow_indices()),
+            ("weights_csr_col_indices", weights_csr.col_indices()),
+            ("weights_csr_values", weights_csr.values()),
+            ("weights_csr_t_crow_indices", weights_csr_t.crow_indices()),
+            ("weights_csr_t_col_indices", weights_csr_t.col_indices()),
+            ("weights_csr_t_values", weights_csr_t.values()),
+        ]:
+            self.register_buffer(name, tensor, persistent=False)
+
+    def _load_from_state_dict(
+        self,
+        state_dict: Dict[str, Any],
+        prefix: str,
+        local_metadata: Dict[str, Any],
+        strict: bool,
+        missing_keys: List[str],
+        unexpected_keys: List[str],
+        error_msgs: List[str],
+    ) -> None:
+        super()._load_from_state_dict(
+            state_dict,
+            prefix,
+            local_metadata,
+            strict,
+            missing_keys,
+            unexpected_keys,
+            error_msgs,
+        )
+        # The loaded weights may differ from the ones the CSR matrices were built
+        # from.
+        if "weights_csr_values" in self._buffers:
+            self._build_skinning_weights_csr()
+
+    def _skinning_weights_csr(self) -> Tuple[torch.Tensor, torch.Tensor]:
+        if "weights_csr_values" not in self._buffers:
+            self._build_skinning_weights_csr()
+        num_joints = self.inverse_bind_pose.shape[-2]
+        weights_csr = torch.sparse_csr_tensor(
+            self.weights_csr_crow_indices,
+            self.weights_csr_col_indices,
+            self.weights_csr_values,
+            (self.num_vertices, num_joints),
+        )
+        weights_csr_t = torch.sparse_csr_tensor(
+            self.weights_csr_t_crow_indices,
+            self.weights_csr_t_col_indices,
+            self.weights_csr_t_values,
+            (num_joints, self.num_vertices),
+        )
+        return weights_csr, weights_csr_t
+
     def forward(
         self,
         skel_state: torch.Tensor,
@@ -392,10 +542,32 @@ class LinearBlendSkinning(torch.nn.Module):
         assert rest_vertex_positions.shape[-1] == 3
         assert rest_vertex_positions.shape[-2] == self.num_vertices
 
+        # Sparse tensors aren't supported by torch.compile; the dense path gives the
+        # same result.
+        if self.use_sparse_weights and not torch.compiler.is_compiling():
+            weights_csr, weights_csr_t = self._skinning_weights_csr()
+            return skel_state_backend.skin_points_from_skel_state_sparse(
+                template=rest_vertex_positions,
+                global_skel_state=skel_state,
+                binded_skel_state_inv=self.inverse_bind_pose,
+                weights_csr=weights_csr,
+                weights_csr_t=weights_csr_t,
+            )
+
         inverse_bind_pose = self.inverse_bind_pose
         while inverse_bind_pose.ndim < skel_state.ndim:
             inverse_bind_pose = inverse_bind_pose.unsqueeze(0)
 
+        if self.use_dual_quaternion:
+            return skel_state_backend.skin_points_from_skel_state_dual_quaternion(
+                template=rest_vertex_positions,
+                global_skel_state=skel_state,
+                binded_skel_state_inv=inverse_bind_pose,
+                skin_indices_flattened=self.skin_indices_flattened,
+                skin_weights_flattened=self.skin_weights_flattened,
+                vert_indices_flattened=self.vert_indices_flattened,
+            )
+
         return skel_state_backend.skin_points_from_skel_state(
             template=rest_vertex_positions,
             global_skel_state=skel_state,
@@ -430,14 +602,42 @@ class LinearBlendSkinning(torch.nn.Module):
 
         Note:
             This method uses the TRS backend skinning function for efficient computation.
+            In dual quaternion mode the rotations are converted to quaternions and
+            skinning goes through :meth:`forward`.
         """
         global_state_t, global_state_r, global_state_s = global_trs
 
+        if self.use_dual_quaternion:
+            return self.forward(
+                torch.cat(
+                    [
+                        global_state_t,
+                        pym_quaternion.from_rotation_matrix(global_state_r),
+                        global_state_s,
+                    ],
+                    dim=-1,
+                ),
+                rest_vertex_positions,
+            )
+
         inv_bind_pose_rot: torch.Tensor = pym_quaternion.to_rotation_matrix(
             self.inverse_bind_pose[..., 3:7]
         )
         inv_bind_pose_trans: torch.Tensor = self.inverse_bind_pose[..., 0:3]
 
+        if self.use_sparse_weights:
+            weights_csr, weights_csr_t = self._skinning_weights_csr()
+            return trs_backend.skinning_sparse(
+                template=rest_vertex_positions,
+                t=global_state_t,
+                r=global_state_r,
+                s=global_state_s,
+                t0=inv_bind_pose_trans,
+                r0=inv_bind_pose_rot,
+                weights_csr=weights_csr,
+                weights_csr_t=weights_csr_t,
+            )
+
         return trs_backend.skinning(
             template=rest_vertex_positions,
             t=global_state_t,
@@ -794,11 +994,20 @@ class Character(torch.nn.Module):
         has_skinning: bool = True,
         has_limits: bool = True,
         dtype: torch.dtype = torch.float32,
+        fk_checkpoint_every: int | None = None,
+        fk_precision: str = "float64",
+        use_sparse_weights: bool = False,
+        use_dual_quaternion: bool = False,
     ) -> None:
         super().__init__()
 
         if has_skeleton:
-            self.skeleton: Skeleton = Skeleton(character, dtype=dtype)
+            self.skeleton: Skeleton = Skeleton(
+                character,
+                dtype=dtype,
+                fk_checkpoint_every=fk_checkpoint_every,
+                fk_precision=fk_precision,
+            )
 
         if has_rest_mesh:
             self.mesh: Mesh = Mesh(character, dtype=dtype)
@@ -810,7 +1019,10 @@ class Character(torch.nn.Module):
 
         if has_skinning:
             self.linear_blend_skinning: LinearBlendSkinning = LinearBlendSkinning(
-                character, dtype=dtype
+                character,
+                dtype=dtype,
+                use_sparse_weights=use_sparse_weights,
+                use_dual_quaternion=use_dual_quaternion,
             )
 
         if has_limits:
@@ -0,0 +1,134 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+# pyre-strict
+
+import bisect
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import Any, Optional
+
+import numpy as np
+import pymomentum.geometry as pym_geometry
+import torch
+
+
+class MmoWindowDataset(torch.utils.data.Dataset):
+    """Fixed-length windows of frames from many .mmo motion files.
+
+    The files are memory-mapped with :class:`pymomentum.geometry.MappedMmo`, so
+    a window only reads its own frames from disk.  Constructing the dataset
+    reads just the header of each file.  Shuffling the dataset, e.g. with
+    ``torch.utils.data.DataLoader(dataset, shuffle=True)``, serves random
+    windows.
+
+    Each item is a [window_size x len(parameter_names)] float32 tensor.
+    Parameters that a file does not have are zero.
+    """
+
+    def __init__(
+        self,
+        paths: Sequence[str],
+        window_size: int,
+        stride: int = 1,
+        parameter_names: Optional[Sequence[str]] = None,
+        max_open_files: int = 1024,
+    ) -> None:
+        """
+        :param paths: The .mmo files.
+        :param window_size: The number of frames in a window.
+        :param stride: The number of frames between the starts of consecutive
+            windows of a file.
+        :param parameter_names: The parameters of the windows; defaults to the
+            parameters of the first file.
+        :param max_open_files: The maximum number of files kept mapped at once.
+        """
+        if window_size < 1:
+            raise ValueError(f"window_size must be positive, got {window_size}")
+        if stride < 1:
+            raise ValueError(f"stride must be positive, got {stride}")
+        if max_open_files < 1:
+            raise ValueError(f"max_open_files must be positive, got {max_open_files}")
+
+        self.paths: list[str] = list(paths)
+        self.window_size = window_size
+        self.stride = stride
+        self.max_open_files = max_open_files
+
+        # _window_offsets[i] is the index of the first window of file i.
+        self._window_offsets: list[int] = [0]
+        # Per file, the source column of each parameter (-1 if missing), or None
+        # if the file has exactly the dataset parameters.
+        self._columns: list[Optional[np.ndarray]] = []
+        self.parameter_names: list[str] = (
+            list(parameter_names) if parameter_names is not None else []
+        )
+        for i, path in enumerate(self.paths):
+            mmo = pym_geometry.MappedMmo(path)
+            if parameter_names is None and i == 0:
+                self.parameter_names = list(mmo.parameter_names)
+            self._columns.append(self._column_map(mmo.parameter_names))
+            num_windows = 0
+            if mmo.num_frames >= window_size:
+                num_windows = (mmo.num_frames - window_size) // stride + 1
+            self._window_offsets.append(self._window_offsets[-1] + num_windows)
+
+        self._open_files: OrderedDict[int, pym_geometry.MappedMmo] = OrderedDict()
+
+    def _column_map(self, file_parameter_names: Sequence[str]) -> Optional[np.ndarray]:
+        if list(file_parameter_names) == self.parameter_names:
+            return None
+        index = {name: i for i, name in enumerate(file_parameter_names)}
+        return np.array(
+            [index.get(name, -1) for name in self.parameter_names], dtype=np.int64
+        )
+
+    def _mapped_file(self, file_index: int) -> pym_geometry.MappedMmo:
+        mmo = self._open_files.get(file_index)
+        if mmo is not None:
+            self._open_files.move_to_end(file_index)
+            return mmo
+
+        mmo = pym_geometry.MappedMmo(self.paths[file_index])
+        self._open_files[file_index] = mmo
+        if len(self._open_files) > self.max_open_files:
+            self._open_files.popitem(last=False)
+        return mmo
+
+    def locate(self, index: int) -> tuple[int, int]:
+        """
+        :param index: The index of a window.
+        :return: The index of the window's file and the window's first frame.
+        """
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError(f"Window {index} is out of range for {len(self)} windows")
+        file_index = bisect.bisect_right(self._window_offsets, index) - 1
+        return file_index, (index - self._window_offsets[file_index]) * self.stride
+
+    def __len__(self) -> int:
+        return self._window_offsets[-1]
+
+    def __getitem__(self, index: int) -> torch.Tensor:
+        file_index, start = self.locate(index)
+        poses = self._mapped_file(file_index).poses[start : start + self.window_size]
+        columns = self._columns[file_index]
+        if columns is None:
+            window = np.array(poses, dtype=np.float32)
+        else:
+            window = np.zeros(
+                (self.window_size, len(self.parameter_names)), dtype=np.float32
+            )
+            found = columns >= 0
+            window[:, found] = poses[:, columns[found]]
+        return torch.from_numpy(window)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Mapped files cannot be pickled, e.g. to DataLoader worker processes;
+        # each process maps the files it reads.
+        state = self.__dict__.copy()
+        state["_open_files"] = OrderedDict()
+        return state
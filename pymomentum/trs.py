@@ -400,7 +400,9 @@ def slerp(trs0: TRSTransform, trs1: TRSTransform, t: torch.Tensor) -> TRSTransfo
 
 
 def blend(
-    trs_transforms: Sequence[TRSTransform], weights: torch.Tensor | None = None
+    trs_transforms: Sequence[TRSTransform],
+    weights: torch.Tensor | None = None,
+    method: str = "power",
 ) -> TRSTransform:
     """
     Blend multiple TRS transforms with the given weights.
@@ -410,6 +412,8 @@ def blend(
     :parameter weights: The weights to use for blending. If not provided, equal weights are used.
                         Should have shape [num_transforms] or [..., num_transforms].
     :type weights: torch.Tensor, optional
+    :parameter method: The quaternion blend method; see :func:`pymomentum.quaternion.blend`.
+    :type method: str
     :return: The blended TRS transform.
     :rtype: TRSTransform
     """
@@ -441,10 +445,10 @@ def blend(
     s_blend = (weights.unsqueeze(-1) * scales).sum(dim=-2)
 
     # Blend rotations via quaternions
-    quaternions = torch.stack(
-        [quaternion.from_rotation_matrix(r) for r in rotations], dim=-2
+    quaternions = quaternion.from_rotation_matrix(rotations)
+    q_blend = quaternion.blend(
+        quaternions, weights.expand(quaternions.shape[:-1]), method=method
     )
-    q_blend = quaternion.blend(quaternions, weights)
     r_blend = quaternion.to_rotation_matrix(q_blend)
 
     return t_blend, r_blend, s_blend